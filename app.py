@@ -4,14 +4,26 @@ Rando Cal - Flask Application
 Main entry point for the bot. Runs Flask web server with WebSocket
 support for admin UI, and manages the bot worker greenlet that handles
 game operations using eventlet for async I/O.
+
+Set BOT_SESSIONS (comma-separated bot names from BOT_FLEET, default
+configs/fleet.json) to also play those accounts' games from this process,
+each in its own greenlet with its own game session.
 """
 
+import os
+if os.environ.get('BOT_SESSIONS'):
+    # Several bot workers share this process; their blocking HTTP calls
+    # must yield to each other
+    import eventlet
+    eventlet.monkey_patch()
+
 from flask import Flask, render_template
 from flask_socketio import SocketIO, emit
 import logging
-import os
 import time
 import requests
+from contextlib import nullcontext
+from typing import List
 import xml.etree.ElementTree as ET
 from config import config
 from engine.state import GameState
@@ -20,11 +32,14 @@ from engine.decision_handler import DecisionHandler, DecisionResult
 from engine.network_coordinator import NetworkCoordinator
 from engine.board_state import BoardState
 from engine.event_processor import EventProcessor
+from engine.speculative_planner import get_speculative_planner, reset_speculative_planner
 from engine.strategy_controller import StrategyController
 from engine.table_manager import TableManager, TableManagerConfig, ConnectionMonitor
 from engine.decision_logger import rotate_decision_log
 from engine.game_state_logger import rotate_game_state_log
 from engine.strategy_config import get_config as get_strategy_config
+from engine.game_session import AccountSettings, GameSession, SessionLogFilter, use_session
+from engine.tracing import TraceFilter, begin_game as begin_game_trace, get_tracer
 from brain import StaticBrain
 from brain.astrogator_brain import AstrogatorBrain
 from brain.achievements import AchievementTracker
@@ -38,6 +53,9 @@ os.makedirs(config.LOG_DIR, exist_ok=True)
 _log_username = os.environ.get('GEMP_USERNAME', 'rando')
 LOG_FILE_PATH = os.path.join(config.LOG_DIR, f'{_log_username}.log')
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+if os.environ.get('BOT_SESSIONS'):
+    # Tag every line with the game session (account) that logged it
+    LOG_FORMAT = '%(asctime)s - [%(session)s] - %(name)s - %(levelname)s - %(message)s'
 
 logging.basicConfig(
     level=logging.INFO,
@@ -47,7 +65,12 @@ logging.basicConfig(
         logging.StreamHandler()
     ]
 )
+for _handler in logging.getLogger().handlers:
+    _handler.addFilter(SessionLogFilter(_log_username))
+    _handler.addFilter(TraceFilter())
 logger = logging.getLogger(__name__)
+# Per-event lines of the event loop (sampled per game, see engine.tracing)
+event_trace = get_tracer('events', logging.getLogger('app.events'))
 
 
 def rotate_game_log(opponent_name: str = None, won: bool = None):
@@ -102,6 +125,8 @@ def rotate_game_log(opponent_name: str = None, won: bool = None):
             new_handler = logging.FileHandler(LOG_FILE_PATH)
             new_handler.setFormatter(logging.Formatter(LOG_FORMAT))
             new_handler.setLevel(logging.INFO)
+            new_handler.addFilter(SessionLogFilter(_log_username))
+            new_handler.addFilter(TraceFilter())
 
             # Add the new handler
             root_logger.addHandler(new_handler)
@@ -145,17 +170,29 @@ socketio = SocketIO(app, cors_allowed_origins="*", async_mode='eventlet')
 
 class BotState:
     """
-    Global bot state.
+    State for one bot account.
 
-    This will be expanded in later phases with game client,
-    board state, brain, etc.
+    The primary bot is this process's own account (GEMP_USERNAME) and
+    drives the admin UI. Extra bots (BOT_SESSIONS) run in their own
+    greenlets with their own GameSession, so their per-game engine state
+    (trackers, strategy caches, logs) never mixes with the primary's.
     """
 
-    def __init__(self):
+    def __init__(self, settings: AccountSettings = None, primary: bool = True):
         self.state = GameState.STOPPED
         self.config = config
         self.last_error = None
 
+        # Account settings; extra bots get a game session of their own
+        self.settings = settings or AccountSettings.from_env(
+            default_username=config.GEMP_USERNAME,
+            default_password=config.GEMP_PASSWORD,
+            default_table_prefix=config.TABLE_NAME,
+        )
+        self.primary = primary
+        self.session = None if primary else GameSession(
+            self.settings.username, self.settings, strategy_config_path=self.settings.strategy_config)
+
         # Will be populated in later phases
         self.client = None
         self.running = False
@@ -193,6 +230,9 @@ class BotState:
         self.board_state = None
         self.event_processor = None
 
+        # Green task doing speculative deploy planning during game polls
+        self.speculation_task = None
+
         # Game state (Phase 2+)
         self.current_tables = []
         self.current_table_id = None
@@ -230,22 +270,22 @@ class BotState:
         """Initialize table manager after client is ready"""
         if self.client and not self.table_manager:
             # Check for joiner mode (for bot-vs-bot testing)
-            joiner_mode = os.environ.get('BOT_JOINER_MODE', 'false').lower() == 'true'
+            joiner_mode = self.settings.joiner_mode
             if joiner_mode:
                 logger.info("🔗 Joiner mode enabled - will join existing tables instead of creating")
 
             # Check for max games limit
-            max_games = int(os.environ.get('MAX_GAMES', '0'))
+            max_games = self.settings.max_games
             if max_games > 0:
                 logger.info(f"🎮 Max games limit set to {max_games}")
 
             # Table name prefix for creator mode (allows multiple bot pairs)
             # Default: "Bot Table" -> creates tables like "Bot Table: Astrogation Chart XXXX"
-            table_prefix = os.environ.get('BOT_TABLE_PREFIX', config.TABLE_NAME)
+            table_prefix = self.settings.table_prefix
 
             # Joiner target prefix for joiner mode (only join tables with this prefix)
             # Allows multiple bot pairs to run in parallel without joining wrong tables
-            joiner_target = os.environ.get('BOT_JOINER_TARGET', '')
+            joiner_target = self.settings.joiner_target
             if joiner_target:
                 logger.info(f"🎯 Joiner target prefix: '{joiner_target}' (will only join matching tables)")
 
@@ -256,6 +296,7 @@ class BotState:
                 joiner_mode=joiner_mode,
                 joiner_target_prefix=joiner_target,
                 max_games=max_games,
+                fixed_deck_name=self.settings.fixed_deck_name,
             )
             self.table_manager = TableManager(self.client, table_config)
             self.connection_monitor = ConnectionMonitor(self.client)
@@ -278,7 +319,7 @@ class BotState:
             self.command_handler = CommandHandler(
                 client=self.client,
                 stats_repo=self.stats_repo,
-                bot_username=config.GEMP_USERNAME
+                bot_username=self.settings.username
             )
             logger.info("🎮 CommandHandler initialized")
 
@@ -288,6 +329,19 @@ class BotState:
             self.coordinator = NetworkCoordinator(self.client, config=self.config)
             logger.info("📡 NetworkCoordinator initialized")
 
+    def emit(self, event: str, data: dict, namespace: str = '/'):
+        """Send an update to the admin UI (which only shows the primary bot)."""
+        if self.primary:
+            socketio.emit(event, data, namespace=namespace)
+
+    def rotate_logs(self, opponent_name: str = None, won: bool = None):
+        """Rotate this bot's game logs after a game ends."""
+        if self.primary:
+            # The process log is shared by all bots; it follows the primary's games
+            rotate_game_log(opponent_name=opponent_name, won=won)
+        rotate_decision_log(opponent_name=opponent_name, won=won)
+        rotate_game_state_log(opponent_name=opponent_name, won=won)
+
     def to_dict(self):
         """Convert state to dictionary for JSON serialization"""
         # Get strategy config values
@@ -430,7 +484,30 @@ class BotState:
 bot_state = BotState()
 
 
-def process_events_iteratively(initial_events, game_id, initial_channel_number, client, event_processor=None, max_iterations=100):
+def _load_extra_bots() -> List[BotState]:
+    """Bots named in BOT_SESSIONS, configured from the fleet file."""
+    names = [name.strip() for name in os.environ.get('BOT_SESSIONS', '').split(',') if name.strip()]
+    if not names:
+        return []
+
+    from supervisor import DEFAULT_FLEET_PATH, load_fleet
+    fleet = load_fleet(os.environ.get('BOT_FLEET', DEFAULT_FLEET_PATH), only=names)
+    bots = []
+    for spec in fleet.bots:
+        env = dict(spec.env)
+        env.setdefault('GEMP_PASSWORD', config.GEMP_PASSWORD)
+        settings = AccountSettings.from_env(env, default_table_prefix=config.TABLE_NAME)
+        bots.append(BotState(settings, primary=False))
+        logger.info(f"🧩 Extra game session: {settings.username}")
+    return bots
+
+
+# Extra accounts played from this process (BOT_SESSIONS)
+extra_bot_states = _load_extra_bots()
+
+
+def process_events_iteratively(initial_events, game_id, initial_channel_number, client, event_processor=None, max_iterations=100,
+                               *, bot_state: 'BotState'):
     """
     Process game events iteratively, handling decisions that lead to more events.
     Uses a loop instead of recursion to avoid stack overflow and detect infinite loops.
@@ -446,6 +523,7 @@ def process_events_iteratively(initial_events, game_id, initial_channel_number,
             draw phase) can easily exceed 25 iterations without being an actual loop.
             Real loops are detected much faster by DecisionHandler.should_concede_due_to_loop()
             which tracks repeating decision patterns.
+        bot_state: The bot whose game this is
 
     Returns:
         Updated channel number
@@ -460,15 +538,17 @@ def process_events_iteratively(initial_events, game_id, initial_channel_number,
         iteration += 1
         current_events = events_to_process
         events_to_process = []
+        # GS events a later GS in this batch overwrites (only their force deltas are tracked)
+        superseded_gs = event_processor.find_superseded_gs(current_events) if event_processor else set()
 
         for i, event in enumerate(current_events):
             event_type = event.get('type', 'unknown')
 
             # Log important events at INFO, others at DEBUG
             if event_type in ['D', 'TC', 'GPC']:
-                logger.info(f"  [Iter {iteration}] Event {i+1}/{len(current_events)}: type={event_type}")
+                event_trace.info(lambda: f"  [Iter {iteration}] Event {i+1}/{len(current_events)}: type={event_type}")
             elif i < 3:
-                logger.debug(f"  [Iter {iteration}] Event {i+1}/{len(current_events)}: type={event_type}")
+                event_trace.debug(lambda: f"  [Iter {iteration}] Event {i+1}/{len(current_events)}: type={event_type}")
 
             if event_type == 'D':
                 # Decision event - handle it
@@ -549,7 +629,7 @@ def process_events_iteratively(initial_events, game_id, initial_channel_number,
                 if loop_severity != 'none':
                     logger.warning(f"🔄 Loop status: {loop_severity} ({loop_count} repeats)")
 
-                logger.info(f"  [Iter {iteration}] Event {i+1}: DECISION {decision_type} - '{decision_text[:80]}...'")
+                event_trace.info(lambda: f"  [Iter {iteration}] Event {i+1}: DECISION {decision_type} - '{decision_text[:80]}...'")
 
                 # Get decision response - GUARANTEED to return a DecisionResult (never None)
                 decision_result = DecisionHandler.handle_decision(
@@ -590,7 +670,7 @@ def process_events_iteratively(initial_events, game_id, initial_channel_number,
                         raise requests.RequestException(f"Decision post failed after {max_decision_retries} retries")
 
                 if response_xml:
-                    logger.debug(f"  [Iter {iteration}] 📦 Decision response: {len(response_xml)} bytes")
+                    event_trace.debug(lambda: f"  [Iter {iteration}] 📦 Decision response: {len(response_xml)} bytes")
                     # Log the XML for debugging when there might be issues
                     if repeat_count > 0 or iteration > 3:
                         logger.warning(f"  [Iter {iteration}] XML Response (first 500 chars): {response_xml[:500]}")
@@ -600,26 +680,26 @@ def process_events_iteratively(initial_events, game_id, initial_channel_number,
                             # Update channel number
                             new_cn = int(resp_root.get('cn', current_cn))
                             if new_cn != current_cn:
-                                logger.info(f"  [Iter {iteration}] 📈 Channel number: {current_cn} -> {new_cn}")
+                                event_trace.info(lambda: f"  [Iter {iteration}] 📈 Channel number: {current_cn} -> {new_cn}")
                                 current_cn = new_cn
                             else:
-                                logger.debug(f"  [Iter {iteration}] Channel number unchanged: {current_cn}")
+                                event_trace.debug(lambda: f"  [Iter {iteration}] Channel number unchanged: {current_cn}")
 
                             # Get new events from response - add to queue for next iteration
                             resp_events = resp_root.findall('.//ge')
                             if len(resp_events) > 0:
-                                logger.debug(f"  [Iter {iteration}] 🔄 Adding {len(resp_events)} events to queue...")
+                                event_trace.debug(lambda: f"  [Iter {iteration}] 🔄 Adding {len(resp_events)} events to queue...")
                                 events_to_process.extend(resp_events)
                     except Exception as e:
                         logger.error(f"  [Iter {iteration}] Error parsing decision response: {e}")
             else:
                 # Non-decision event - process through EventProcessor
                 if event_processor:
-                    event_processor.process_event(event)
+                    event_processor.process_event(event, superseded=i in superseded_gs)
 
                 # Log important events
                 if i < 3 or event_type in ['M', 'GS', 'PCIP', 'RCIP', 'MCIP', 'GPC', 'TC']:
-                    logger.debug(f"  [Iter {iteration}] Event {i+1}: {event_type}")
+                    event_trace.debug(lambda: f"  [Iter {iteration}] Event {i+1}: {event_type}")
 
     if iteration >= max_iterations:
         logger.error(f"⚠️  Hit max iterations ({max_iterations}) in event processing!")
@@ -652,7 +732,7 @@ def process_events_iteratively(initial_events, game_id, initial_channel_number,
 
 
 # Bot worker greenlet
-def bot_worker():
+def bot_worker(worker_state: BotState = None):
     """
     Background worker greenlet for bot operations.
 
@@ -661,7 +741,24 @@ def bot_worker():
     - Polling for hall tables
     - Creating/joining games (Phase 3+)
     - Playing games (Phase 4+)
+
+    Args:
+        worker_state: The bot to run (default: the primary bot). Extra bots
+            run with their game session bound to this greenlet.
     """
+    worker_state = worker_state or bot_state
+    with use_session(worker_state.session) if worker_state.session else nullcontext():
+        _run_bot_worker(worker_state)
+
+
+def _speculate_during_poll(bot_state: BotState, speculative):
+    """Green task: speculative deploy planning within the planner's idle budget."""
+    with use_session(bot_state.session) if bot_state.session else nullcontext():
+        speculative.run_idle(bot_state.board_state, pause=lambda: socketio.sleep(0))
+
+
+def _run_bot_worker(bot_state: BotState):
+    """Worker loop for one bot (see bot_worker())."""
     logger.info("🤖 Bot worker greenlet started")
 
     while bot_state.running:
@@ -672,8 +769,8 @@ def bot_worker():
                 bot_state.state = GameState.ERROR
                 bot_state.last_error = "Rate limit exceeded - bot stopped for safety"
                 bot_state.running = False
-                socketio.emit('state_update', bot_state.to_dict(), namespace='/')
-                socketio.emit('log_message', {
+                bot_state.emit('state_update', bot_state.to_dict(), namespace='/')
+                bot_state.emit('log_message', {
                     'message': '🚨 RATE LIMIT EXCEEDED - Bot stopped for safety. Check logs.',
                     'level': 'error'
                 }, namespace='/')
@@ -684,8 +781,8 @@ def bot_worker():
                 # Attempt login
                 logger.info(f"Connecting to GEMP at {config.GEMP_SERVER_URL}")
                 success = bot_state.client.login(
-                    config.GEMP_USERNAME,
-                    config.GEMP_PASSWORD
+                    bot_state.settings.username,
+                    bot_state.settings.password
                 )
 
                 if success:
@@ -693,8 +790,8 @@ def bot_worker():
                     bot_state.last_error = None
 
                     # Emit immediate state update (namespace required for background threads)
-                    socketio.emit('state_update', bot_state.to_dict(), namespace='/')
-                    socketio.emit('log_message', {'message': '✅ Connected to GEMP server', 'level': 'success'}, namespace='/')
+                    bot_state.emit('state_update', bot_state.to_dict(), namespace='/')
+                    bot_state.emit('log_message', {'message': '✅ Connected to GEMP server', 'level': 'success'}, namespace='/')
 
                     # Initialize network coordinator FIRST so all requests are logged
                     bot_state.initialize_coordinator()
@@ -709,6 +806,10 @@ def bot_worker():
                         bot_state.user_decks = bot_state.client.get_user_decks()
                     logger.info(f"Loaded {len(bot_state.library_decks)} library decks, {len(bot_state.user_decks)} user decks")
 
+                    # Precompute deck profiles in the background so game start serves them from cache
+                    from engine.deck_profiles import warm_deck_profiles
+                    warm_deck_profiles([deck.name for deck in bot_state.library_decks + bot_state.user_decks])
+
                     # Initialize table manager with decks
                     bot_state.initialize_table_manager()
                     if bot_state.table_manager:
@@ -721,14 +822,14 @@ def bot_worker():
                     bot_state.initialize_command_handler()
 
                     # Emit updated state with decks
-                    socketio.emit('state_update', bot_state.to_dict(), namespace='/')
-                    socketio.emit('log_message', {'message': f'📚 Loaded {len(bot_state.library_decks)} library decks, {len(bot_state.user_decks)} user decks', 'level': 'info'}, namespace='/')
+                    bot_state.emit('state_update', bot_state.to_dict(), namespace='/')
+                    bot_state.emit('log_message', {'message': f'📚 Loaded {len(bot_state.library_decks)} library decks, {len(bot_state.user_decks)} user decks', 'level': 'info'}, namespace='/')
                     logger.info("✅ Entered lobby")
                 else:
                     bot_state.state = GameState.ERROR
                     bot_state.last_error = "Login failed - check credentials"
-                    socketio.emit('state_update', bot_state.to_dict(), namespace='/')
-                    socketio.emit('log_message', {'message': '❌ Login failed', 'level': 'error'}, namespace='/')
+                    bot_state.emit('state_update', bot_state.to_dict(), namespace='/')
+                    bot_state.emit('log_message', {'message': '❌ Login failed', 'level': 'error'}, namespace='/')
                     bot_state.running = False
 
             elif bot_state.state == GameState.IN_LOBBY:
@@ -743,7 +844,7 @@ def bot_worker():
                     if bot_state.hall_channel_number != channel_number:
                         logger.info(f"📡 Hall channel number: {bot_state.hall_channel_number} -> {channel_number}")
                     bot_state.hall_channel_number = channel_number
-                socketio.emit('state_update', bot_state.to_dict(), namespace='/')
+                bot_state.emit('state_update', bot_state.to_dict(), namespace='/')
 
                 # Log table count periodically (every 5 polls = 15 seconds)
                 if not hasattr(bot_state, '_poll_count'):
@@ -757,7 +858,7 @@ def bot_worker():
                 my_table = None
                 for table in tables:
                     # Check if we're in this table
-                    if any(p.name == config.GEMP_USERNAME for p in table.players):
+                    if any(p.name == bot_state.settings.username for p in table.players):
                         # Skip finished tables - don't rejoin them!
                         if table.status == 'finished':
                             logger.debug(f"Skipping finished table {table.table_id}")
@@ -774,45 +875,45 @@ def bot_worker():
                     bot_state.current_table_id = my_table.table_id
 
                     # Check if we have an opponent
-                    opponent = my_table.get_opponent(config.GEMP_USERNAME)
+                    opponent = my_table.get_opponent(bot_state.settings.username)
                     if opponent:
                         is_new_opponent = bot_state.opponent_name != opponent.name
                         bot_state.opponent_name = opponent.name
 
                         if is_new_table or is_new_opponent:
                             logger.info(f"🎮 Rejoined table {my_table.table_id} with opponent: {opponent.name}")
-                            socketio.emit('log_message', {'message': f'🎮 Rejoined table with {opponent.name}', 'level': 'success'}, namespace='/')
+                            bot_state.emit('log_message', {'message': f'🎮 Rejoined table with {opponent.name}', 'level': 'success'}, namespace='/')
 
                         # If game is started, we'd join it (Phase 3+)
                         if my_table.game_id:
                             if is_new_table:
                                 logger.info(f"Game in progress: {my_table.game_id} (Phase 3: will join)")
-                                socketio.emit('log_message', {'message': 'Game in progress - Phase 3 will handle this', 'level': 'warning'}, namespace='/')
+                                bot_state.emit('log_message', {'message': 'Game in progress - Phase 3 will handle this', 'level': 'warning'}, namespace='/')
 
                         bot_state.state = GameState.WAITING_FOR_OPPONENT
-                        socketio.emit('state_update', bot_state.to_dict(), namespace='/')
+                        bot_state.emit('state_update', bot_state.to_dict(), namespace='/')
                     else:
                         # Still waiting for opponent
                         if is_new_table:
                             logger.info(f"⏳ Waiting for opponent at table {my_table.table_id}")
-                            socketio.emit('log_message', {'message': '⏳ Waiting for opponent to join', 'level': 'info'}, namespace='/')
+                            bot_state.emit('log_message', {'message': '⏳ Waiting for opponent to join', 'level': 'info'}, namespace='/')
 
                         bot_state.state = GameState.WAITING_FOR_OPPONENT
-                        socketio.emit('state_update', bot_state.to_dict(), namespace='/')
+                        bot_state.emit('state_update', bot_state.to_dict(), namespace='/')
                 else:
                     # No table found - auto-create one!
                     if bot_state.current_table_id is not None:
                         logger.info("Table no longer exists in hall")
-                        socketio.emit('log_message', {'message': 'Table closed', 'level': 'info'}, namespace='/')
+                        bot_state.emit('log_message', {'message': 'Table closed', 'level': 'info'}, namespace='/')
                         bot_state.current_table_id = None
                         bot_state.opponent_name = None
 
                     # Use TableManager to auto-create or join a table
                     if bot_state.table_manager:
-                        action = bot_state.table_manager.get_required_action(tables, config.GEMP_USERNAME)
+                        action = bot_state.table_manager.get_required_action(tables, bot_state.settings.username)
                         if action == 'create_table':
                             logger.info("🔄 Auto-creating table...")
-                            socketio.emit('log_message', {'message': '🔄 Auto-creating table...', 'level': 'info'}, namespace='/')
+                            bot_state.emit('log_message', {'message': '🔄 Auto-creating table...', 'level': 'info'}, namespace='/')
 
                             # Small delay before creating
                             socketio.sleep(2)
@@ -822,19 +923,19 @@ def bot_worker():
                                 bot_state.current_table_id = table_id
                                 bot_state.state = GameState.WAITING_FOR_OPPONENT
                                 logger.info(f"✅ Table created: {table_id}")
-                                socketio.emit('log_message', {
+                                bot_state.emit('log_message', {
                                     'message': f'✅ Table created with deck: {bot_state.table_manager.state.current_deck_name}',
                                     'level': 'success'
                                 }, namespace='/')
                             else:
                                 logger.warning(f"Table creation failed (attempt {bot_state.table_manager.state.consecutive_failures})")
-                                socketio.emit('log_message', {
+                                bot_state.emit('log_message', {
                                     'message': f'⚠️ Table creation failed, will retry...',
                                     'level': 'warning'
                                 }, namespace='/')
                         elif action == 'join_table':
                             logger.info("🔄 Joining existing table...")
-                            socketio.emit('log_message', {'message': '🔄 Joining existing table...', 'level': 'info'}, namespace='/')
+                            bot_state.emit('log_message', {'message': '🔄 Joining existing table...', 'level': 'info'}, namespace='/')
 
                             # Small delay before joining
                             socketio.sleep(1)
@@ -844,23 +945,23 @@ def bot_worker():
                                 bot_state.current_table_id = table_id
                                 bot_state.state = GameState.WAITING_FOR_OPPONENT
                                 logger.info(f"✅ Joined table: {table_id}")
-                                socketio.emit('log_message', {
+                                bot_state.emit('log_message', {
                                     'message': f'✅ Joined table with deck: {bot_state.table_manager.state.current_deck_name}',
                                     'level': 'success'
                                 }, namespace='/')
                             else:
                                 logger.warning(f"Table join failed")
-                                socketio.emit('log_message', {
+                                bot_state.emit('log_message', {
                                     'message': f'⚠️ Table join failed, will retry...',
                                     'level': 'warning'
                                 }, namespace='/')
                         elif action == 'stop':
                             logger.info("🛑 Max games reached, stopping bot")
-                            socketio.emit('log_message', {'message': '🛑 Max games reached, stopping bot', 'level': 'info'}, namespace='/')
+                            bot_state.emit('log_message', {'message': '🛑 Max games reached, stopping bot', 'level': 'info'}, namespace='/')
                             bot_state.running = False
                             bot_state.state = GameState.STOPPED
 
-                    socketio.emit('state_update', bot_state.to_dict(), namespace='/')
+                    bot_state.emit('state_update', bot_state.to_dict(), namespace='/')
 
                 socketio.sleep(config.HALL_POLL_INTERVAL)
 
@@ -883,13 +984,13 @@ def bot_worker():
                 if my_table:
                     # Check if opponent joined
                     if len(my_table.players) >= 2:
-                        opponent = my_table.get_opponent(config.GEMP_USERNAME)
+                        opponent = my_table.get_opponent(bot_state.settings.username)
                         if opponent and bot_state.opponent_name != opponent.name:
                             # New opponent joined!
                             bot_state.opponent_name = opponent.name
                             logger.info(f"🎮 Opponent joined: {opponent.name}")
-                            socketio.emit('log_message', {'message': f'🎮 Opponent {opponent.name} joined!', 'level': 'success'}, namespace='/')
-                            socketio.emit('state_update', bot_state.to_dict(), namespace='/')
+                            bot_state.emit('log_message', {'message': f'🎮 Opponent {opponent.name} joined!', 'level': 'success'}, namespace='/')
+                            bot_state.emit('state_update', bot_state.to_dict(), namespace='/')
 
                     # Check if game started (has gameId)
                     # CRITICAL: Also check that this isn't a stale game_id from a recently-ended game
@@ -902,12 +1003,12 @@ def bot_worker():
                             bot_state.current_table_id = None
                             bot_state.opponent_name = None
                             bot_state.state = GameState.IN_LOBBY
-                            socketio.emit('log_message', {'message': '⚠️ Detected stale game from server - creating fresh table', 'level': 'warning'}, namespace='/')
-                            socketio.emit('state_update', bot_state.to_dict(), namespace='/')
+                            bot_state.emit('log_message', {'message': '⚠️ Detected stale game from server - creating fresh table', 'level': 'warning'}, namespace='/')
+                            bot_state.emit('state_update', bot_state.to_dict(), namespace='/')
                             continue
 
                         logger.info(f"🎲 Game started! Game ID: {my_table.game_id}")
-                        socketio.emit('log_message', {'message': f'🎲 Game started vs {bot_state.opponent_name}!', 'level': 'success'}, namespace='/')
+                        bot_state.emit('log_message', {'message': f'🎲 Game started vs {bot_state.opponent_name}!', 'level': 'success'}, namespace='/')
 
                         # Join the game (through coordinator for logging)
                         if bot_state.coordinator:
@@ -920,9 +1021,13 @@ def bot_worker():
                             # Initialize board state tracking
                             # NOTE: my_side starts as None and will be detected from HAND cards
                             # (see event_processor.py SIDE DETECTION section)
-                            bot_state.board_state = BoardState(my_player_name=config.GEMP_USERNAME)
+                            begin_game_trace(my_table.game_id)
+                            bot_state.board_state = BoardState(my_player_name=bot_state.settings.username)
                             bot_state.board_state.strategy_controller = bot_state.strategy_controller
                             bot_state.event_processor = EventProcessor(bot_state.board_state)
+                            bot_state.event_processor.register_board_changed_callback(
+                                reset_speculative_planner().on_board_event
+                            )
                             bot_state.strategy_controller.setup()  # Reset for new game
                             logger.info(f"🎮 Board state tracking initialized (side will be detected from cards)")
 
@@ -947,6 +1052,7 @@ def bot_worker():
                             reset_shield_tracker()
 
                             # Initialize deck strategy based on deck archetype
+                            from engine.deck_profiles import get_deck_profile
                             from engine.deck_analyzer import DeckAnalyzer
                             from engine.archetype_detector import detect_archetype
                             from engine.strategy_profile import set_deck_strategy, clear_deck_strategy
@@ -955,24 +1061,30 @@ def bot_worker():
                             deck_name_for_analysis = None
                             if bot_state.table_manager and bot_state.table_manager.state.current_deck_name:
                                 deck_name_for_analysis = bot_state.table_manager.state.current_deck_name
-                            elif os.environ.get('FIXED_DECK_NAME'):
+                            elif bot_state.settings.fixed_deck_name:
                                 # Fallback: use FIXED_DECK_NAME env var if table_manager deck name not available
                                 # (This can happen when table ID extraction fails)
-                                deck_name_for_analysis = os.environ.get('FIXED_DECK_NAME')
+                                deck_name_for_analysis = bot_state.settings.fixed_deck_name
                                 logger.info(f"📋 Using FIXED_DECK_NAME env var for deck analysis: {deck_name_for_analysis}")
 
                             if deck_name_for_analysis:
                                 try:
-                                    analyzer = DeckAnalyzer()
-                                    composition = analyzer.analyze_deck_by_name(deck_name_for_analysis)
+                                    # Cached profile (analyzed at login); analyze now if there is none
+                                    profile = get_deck_profile(deck_name_for_analysis)
+                                    if profile:
+                                        composition = profile.composition
+                                        archetype, goals = profile.archetype, profile.strategy_goals()
+                                    else:
+                                        composition = DeckAnalyzer().analyze_deck_by_name(deck_name_for_analysis)
+                                        if composition:
+                                            archetype, goals = detect_archetype(composition)
                                     if composition:
-                                        archetype, goals = detect_archetype(composition)
                                         set_deck_strategy(goals)
                                         logger.info(f"🎯 Deck strategy initialized: {archetype.value} "
                                                   f"(domain={goals.primary_domain}, "
                                                   f"space_bonus={goals.space_location_bonus}, "
                                                   f"ground_bonus={goals.ground_location_bonus})")
-                                        socketio.emit('log_message', {
+                                        bot_state.emit('log_message', {
                                             'message': f'🎯 Deck archetype: {archetype.value} ({goals.primary_domain} focused)',
                                             'level': 'info'
                                         }, namespace='/')
@@ -988,7 +1100,7 @@ def bot_worker():
                                             )
                                             bot_state.board_state.game_plan = game_plan
                                             logger.info(f"🎯 GamePlan ENABLED: win_path={game_plan.win_path.value}")
-                                            socketio.emit('log_message', {
+                                            bot_state.emit('log_message', {
                                                 'message': f'🎯 GamePlan: {game_plan.win_path.value} strategy',
                                                 'level': 'info'
                                             }, namespace='/')
@@ -1067,7 +1179,8 @@ def bot_worker():
                                             bot_state.game_id,
                                             bot_state.channel_number,
                                             bot_state.client,
-                                            bot_state.event_processor
+                                            bot_state.event_processor,
+                                            bot_state=bot_state
                                         )
                                         bot_state.event_processor.catching_up = False
                                         logger.info(f"✅ Initial events processed, cn: {bot_state.channel_number} -> {new_cn}")
@@ -1089,7 +1202,7 @@ def bot_worker():
                                 logger.info(f"   Reason: {bot_state.board_state.game_win_reason}")
 
                                 # Determine if we won
-                                bot_won = (bot_state.board_state.game_winner == config.GEMP_USERNAME or
+                                bot_won = (bot_state.board_state.game_winner == bot_state.settings.username or
                                           bot_state.board_state.game_winner == bot_state.board_state.my_player_name)
 
                                 # Notify table manager
@@ -1097,18 +1210,7 @@ def bot_worker():
                                     bot_state.table_manager.on_game_ended()
 
                                 # Rotate log files BEFORE clearing state
-                                rotate_game_log(
-                                    opponent_name=bot_state.opponent_name,
-                                    won=bot_won
-                                )
-                                rotate_decision_log(
-                                    opponent_name=bot_state.opponent_name,
-                                    won=bot_won
-                                )
-                                rotate_game_state_log(
-                                    opponent_name=bot_state.opponent_name,
-                                    won=bot_won
-                                )
+                                bot_state.rotate_logs(opponent_name=bot_state.opponent_name, won=bot_won)
 
                                 # Clear game state and return to lobby
                                 # CRITICAL: Remember this game_id to prevent rejoining stale games
@@ -1120,12 +1222,12 @@ def bot_worker():
                                 bot_state.game_id = None
                                 bot_state.channel_number = 0
                                 bot_state.state = GameState.IN_LOBBY
-                                socketio.emit('state_update', bot_state.to_dict(), namespace='/')
-                                socketio.emit('log_message', {'message': f'🏁 Game already finished - returning to lobby', 'level': 'info'}, namespace='/')
+                                bot_state.emit('state_update', bot_state.to_dict(), namespace='/')
+                                bot_state.emit('log_message', {'message': f'🏁 Game already finished - returning to lobby', 'level': 'info'}, namespace='/')
                             else:
                                 # Game is active - enter PLAYING state
                                 bot_state.state = GameState.PLAYING
-                                socketio.emit('state_update', bot_state.to_dict(), namespace='/')
+                                bot_state.emit('state_update', bot_state.to_dict(), namespace='/')
                                 logger.info("✅ In game session")
 
                                 # Register with chat system for this game (through coordinator for logging)
@@ -1179,11 +1281,11 @@ def bot_worker():
                 else:
                     # Table disappeared - back to lobby
                     logger.info("Table no longer exists - returning to lobby")
-                    socketio.emit('log_message', {'message': 'Table closed - back in lobby', 'level': 'info'}, namespace='/')
+                    bot_state.emit('log_message', {'message': 'Table closed - back in lobby', 'level': 'info'}, namespace='/')
                     bot_state.current_table_id = None
                     bot_state.opponent_name = None
                     bot_state.state = GameState.IN_LOBBY
-                    socketio.emit('state_update', bot_state.to_dict(), namespace='/')
+                    bot_state.emit('state_update', bot_state.to_dict(), namespace='/')
 
                 socketio.sleep(config.HALL_POLL_INTERVAL)
 
@@ -1193,6 +1295,13 @@ def bot_worker():
 
                 # Poll for game updates
                 if bot_state.game_id:
+                    # Plan our next deploy phase in a green task while the long-poll waits
+                    speculative = get_speculative_planner()
+                    if speculative.enabled and (bot_state.speculation_task is None
+                                                or bot_state.speculation_task.dead):
+                        bot_state.speculation_task = socketio.start_background_task(
+                            _speculate_during_poll, bot_state, speculative)
+
                     logger.debug(f"⏱️  Polling game update (cn={bot_state.channel_number})")
 
                     # Skip delay during fast action phases (draw/activate)
@@ -1218,11 +1327,11 @@ def bot_worker():
                             bot_state.connection_monitor.record_failure("Session expired")
 
                         logger.warning("🔄 Session expired, re-logging in...")
-                        socketio.emit('log_message', {'message': '🔄 Session expired, re-logging in...', 'level': 'warning'}, namespace='/')
+                        bot_state.emit('log_message', {'message': '🔄 Session expired, re-logging in...', 'level': 'warning'}, namespace='/')
 
                         # Re-login through coordinator for proper delay
-                        login_success = (bot_state.coordinator.login(config.GEMP_USERNAME, config.GEMP_PASSWORD)
-                                        if bot_state.coordinator else bot_state.client.login(config.GEMP_USERNAME, config.GEMP_PASSWORD))
+                        login_success = (bot_state.coordinator.login(bot_state.settings.username, bot_state.settings.password)
+                                        if bot_state.coordinator else bot_state.client.login(bot_state.settings.username, bot_state.settings.password))
                         if login_success:
                             logger.info("✅ Re-login successful, re-joining game...")
                             if bot_state.connection_monitor:
@@ -1250,7 +1359,7 @@ def bot_worker():
                             # Try recovery via ConnectionMonitor
                             if bot_state.connection_monitor:
                                 socketio.sleep(5)  # Wait before retry
-                                if bot_state.connection_monitor.attempt_recovery(config.GEMP_USERNAME, config.GEMP_PASSWORD):
+                                if bot_state.connection_monitor.attempt_recovery(bot_state.settings.username, bot_state.settings.password):
                                     logger.info("✅ Connection recovered via monitor")
                                 else:
                                     bot_state.state = GameState.STOPPED
@@ -1266,7 +1375,7 @@ def bot_worker():
                         # HTTP 404 means game doesn't exist anymore - treat as game ended, NOT connection failure
                         if "404" in error_reason:
                             logger.info(f"🏁 Game no longer exists (HTTP 404) - returning to lobby")
-                            socketio.emit('log_message', {'message': '🏁 Game ended (no longer on server)', 'level': 'info'}, namespace='/')
+                            bot_state.emit('log_message', {'message': '🏁 Game ended (no longer on server)', 'level': 'info'}, namespace='/')
 
                             # Notify table manager
                             if bot_state.table_manager:
@@ -1290,7 +1399,7 @@ def bot_worker():
                             bot_state.game_id = None
                             bot_state.channel_number = 0
                             bot_state.state = GameState.IN_LOBBY
-                            socketio.emit('state_update', bot_state.to_dict(), namespace='/')
+                            bot_state.emit('state_update', bot_state.to_dict(), namespace='/')
                         else:
                             # Other failures - track and attempt recovery
                             if bot_state.connection_monitor:
@@ -1298,19 +1407,19 @@ def bot_worker():
 
                                 if should_recover:
                                     logger.warning("🔄 Multiple failures detected, attempting recovery...")
-                                    socketio.emit('log_message', {'message': '🔄 Connection issues, attempting recovery...', 'level': 'warning'}, namespace='/')
+                                    bot_state.emit('log_message', {'message': '🔄 Connection issues, attempting recovery...', 'level': 'warning'}, namespace='/')
 
                                     # Use exponential backoff delay from monitor
                                     delay = bot_state.connection_monitor.get_recovery_delay()
                                     logger.info(f"⏳ Waiting {delay:.1f}s before recovery attempt...")
                                     socketio.sleep(delay)
 
-                                    if bot_state.connection_monitor.attempt_recovery(config.GEMP_USERNAME, config.GEMP_PASSWORD):
+                                    if bot_state.connection_monitor.attempt_recovery(bot_state.settings.username, bot_state.settings.password):
                                         logger.info("✅ Connection recovered")
-                                        socketio.emit('log_message', {'message': '✅ Connection recovered', 'level': 'success'}, namespace='/')
+                                        bot_state.emit('log_message', {'message': '✅ Connection recovered', 'level': 'success'}, namespace='/')
                                     else:
                                         logger.error("❌ Recovery failed")
-                                        socketio.emit('log_message', {'message': '❌ Recovery failed', 'level': 'error'}, namespace='/')
+                                        bot_state.emit('log_message', {'message': '❌ Recovery failed', 'level': 'error'}, namespace='/')
                             else:
                                 logger.warning(f"⚠️  Game update failed: {error_reason}")
 
@@ -1353,7 +1462,8 @@ def bot_worker():
                                         bot_state.game_id,
                                         bot_state.channel_number,
                                         bot_state.client,
-                                        bot_state.event_processor
+                                        bot_state.event_processor,
+                                        bot_state=bot_state
                                     )
                                     logger.debug(f"✅ Events processed, channel number: {bot_state.channel_number}")
 
@@ -1425,15 +1535,15 @@ def bot_worker():
                     # Also check for stuck state - if no success for too long, force recovery
                     if bot_state.connection_monitor.should_force_recovery():
                         logger.warning("🚨 Stuck detected - forcing recovery attempt")
-                        socketio.emit('log_message', {'message': '🚨 Connection stuck - forcing recovery...', 'level': 'warning'}, namespace='/')
+                        bot_state.emit('log_message', {'message': '🚨 Connection stuck - forcing recovery...', 'level': 'warning'}, namespace='/')
                         delay = bot_state.connection_monitor.get_recovery_delay()
                         socketio.sleep(delay)
-                        if bot_state.connection_monitor.attempt_recovery(config.GEMP_USERNAME, config.GEMP_PASSWORD):
+                        if bot_state.connection_monitor.attempt_recovery(bot_state.settings.username, bot_state.settings.password):
                             logger.info("✅ Forced recovery successful")
-                            socketio.emit('log_message', {'message': '✅ Connection recovered', 'level': 'success'}, namespace='/')
+                            bot_state.emit('log_message', {'message': '✅ Connection recovered', 'level': 'success'}, namespace='/')
                         else:
                             logger.error("❌ Forced recovery failed")
-                            socketio.emit('log_message', {'message': '❌ Recovery failed', 'level': 'error'}, namespace='/')
+                            bot_state.emit('log_message', {'message': '❌ Recovery failed', 'level': 'error'}, namespace='/')
 
                 # NOTE: Web client opens a new browser tab for games and does NOT poll
                 # the hall during gameplay. Game end is detected from:
@@ -1444,7 +1554,7 @@ def bot_worker():
                 # Handle game end cleanup
                 if game_finished:
                     logger.info("🏁 Game ended!")
-                    socketio.emit('log_message', {'message': '🏁 Game ended', 'level': 'info'}, namespace='/')
+                    bot_state.emit('log_message', {'message': '🏁 Game ended', 'level': 'info'}, namespace='/')
 
                     # Determine if we won
                     # Note: bot_won means the bot won; player_won means the human opponent won
@@ -1452,7 +1562,7 @@ def bot_worker():
                     if bot_state.board_state:
                         # First check if game_winner was set from message events (most reliable)
                         if bot_state.board_state.game_winner:
-                            bot_won = (bot_state.board_state.game_winner == config.GEMP_USERNAME or
+                            bot_won = (bot_state.board_state.game_winner == bot_state.settings.username or
                                        bot_state.board_state.game_winner == bot_state.board_state.my_player_name)
                             logger.info(f"Game result from message: {'Won' if bot_won else 'Lost'} "
                                        f"(winner: {bot_state.board_state.game_winner}, "
@@ -1497,18 +1607,7 @@ def bot_worker():
                         logger.info(f"💬 Left chat system for game {bot_state.game_id}")
 
                     # Rotate log files (preserve game logs with timestamp)
-                    rotate_game_log(
-                        opponent_name=bot_state.opponent_name,
-                        won=bot_won
-                    )
-                    rotate_decision_log(
-                        opponent_name=bot_state.opponent_name,
-                        won=bot_won
-                    )
-                    rotate_game_state_log(
-                        opponent_name=bot_state.opponent_name,
-                        won=bot_won
-                    )
+                    bot_state.rotate_logs(opponent_name=bot_state.opponent_name, won=bot_won)
 
                     # Clear old game state
                     # CRITICAL: Remember this game_id to prevent rejoining stale games after server restart
@@ -1520,7 +1619,7 @@ def bot_worker():
                     bot_state.game_id = None
                     bot_state.channel_number = 0
                     bot_state.state = GameState.IN_LOBBY  # Go back to lobby, it will auto-create table
-                    socketio.emit('state_update', bot_state.to_dict(), namespace='/')
+                    bot_state.emit('state_update', bot_state.to_dict(), namespace='/')
                     # Note: Table will be auto-created by IN_LOBBY state handler
 
                 # NOTE: Chat polling disabled - was causing decision timeouts due to GEMP's
@@ -1541,20 +1640,20 @@ def bot_worker():
                 should_recover = bot_state.connection_monitor.record_failure(str(e))
                 if should_recover:
                     logger.warning("🔄 Network error triggered recovery attempt...")
-                    socketio.emit('log_message', {'message': '🔄 Network error, attempting recovery...', 'level': 'warning'}, namespace='/')
+                    bot_state.emit('log_message', {'message': '🔄 Network error, attempting recovery...', 'level': 'warning'}, namespace='/')
                     delay = bot_state.connection_monitor.get_recovery_delay()
                     socketio.sleep(delay)
-                    if bot_state.connection_monitor.attempt_recovery(config.GEMP_USERNAME, config.GEMP_PASSWORD):
+                    if bot_state.connection_monitor.attempt_recovery(bot_state.settings.username, bot_state.settings.password):
                         logger.info("✅ Recovery successful after network error")
-                        socketio.emit('log_message', {'message': '✅ Connection recovered', 'level': 'success'}, namespace='/')
+                        bot_state.emit('log_message', {'message': '✅ Connection recovered', 'level': 'success'}, namespace='/')
                         continue  # Continue the main loop
                     else:
                         logger.error("❌ Recovery failed after network error")
             # If no monitor or recovery failed, enter error state but don't stop
             bot_state.state = GameState.ERROR
             bot_state.last_error = f"Network error: {e}"
-            socketio.emit('state_update', bot_state.to_dict(), namespace='/')
-            socketio.emit('log_message', {'message': f'Network error: {e}', 'level': 'error'}, namespace='/')
+            bot_state.emit('state_update', bot_state.to_dict(), namespace='/')
+            bot_state.emit('log_message', {'message': f'Network error: {e}', 'level': 'error'}, namespace='/')
             socketio.sleep(5)  # Wait before retrying
 
         except Exception as e:
@@ -1562,8 +1661,8 @@ def bot_worker():
             logger.error(f"💥 Worker error: {e}", exc_info=True)
             bot_state.state = GameState.ERROR
             bot_state.last_error = str(e)
-            socketio.emit('state_update', bot_state.to_dict(), namespace='/')
-            socketio.emit('log_message', {'message': f'Error: {e}', 'level': 'error'}, namespace='/')
+            bot_state.emit('state_update', bot_state.to_dict(), namespace='/')
+            bot_state.emit('log_message', {'message': f'Error: {e}', 'level': 'error'}, namespace='/')
             bot_state.running = False
 
     logger.info("Bot worker greenlet stopped")
@@ -1579,11 +1678,14 @@ def index():
 @app.route('/health')
 def health():
     """Health check endpoint for monitoring"""
-    return {
+    result = {
         'status': 'ok',
         'bot_state': bot_state.state.value,
         'version': '0.1.0-alpha'
     }
+    if extra_bot_states:
+        result['sessions'] = {bot.settings.username: bot.state.value for bot in extra_bot_states}
+    return result
 
 
 @app.route('/board_state')
@@ -1693,23 +1795,24 @@ def handle_request_state():
     emit('state_update', bot_state.to_dict())
 
 
-def _start_bot_internal():
+def _start_bot_internal(target: BotState = None):
     """Internal function to start the bot - used by both manual start and auto-start"""
-    if bot_state.state not in [GameState.STOPPED, GameState.ERROR]:
-        logger.warning(f'Cannot start - bot is in state: {bot_state.state.value}')
+    target = target or bot_state
+    if target.state not in [GameState.STOPPED, GameState.ERROR]:
+        logger.warning(f'Cannot start - bot is in state: {target.state.value}')
         return False
 
-    logger.info('🚀 Starting bot...')
+    logger.info(f'🚀 Starting bot {target.settings.username}...')
 
     # Create GEMP client
-    bot_state.client = GEMPClient(config.GEMP_SERVER_URL)
-    bot_state.state = GameState.CONNECTING
-    bot_state.last_error = None
-    bot_state.running = True
-    bot_state.current_tables = []
+    target.client = GEMPClient(config.GEMP_SERVER_URL)
+    target.state = GameState.CONNECTING
+    target.last_error = None
+    target.running = True
+    target.current_tables = []
 
     # Start worker greenlet (NOT a thread!)
-    socketio.start_background_task(bot_worker)
+    socketio.start_background_task(bot_worker, target)
     return True
 
 
@@ -1979,6 +2082,10 @@ def _auto_start_check():
     else:
         logger.info('ℹ️ Auto-start disabled - waiting for manual start')
 
+    # Extra game sessions have no admin UI; they always start
+    for extra in extra_bot_states:
+        _start_bot_internal(extra)
+
 
 if __name__ == '__main__':
     logger.info(f'=' * 60)
@@ -1991,6 +2098,12 @@ if __name__ == '__main__':
     logger.info(f'Auto-start: {user_settings.get("auto_start", False)}')
     logger.info(f'=' * 60)
 
+    if extra_bot_states:
+        # Threads are green under BOT_SESSIONS, so deck profiles can't be
+        # warmed in the background at login; build them before any game loop runs
+        from engine.deck_profiles import warm_deck_profiles
+        warm_deck_profiles(background=False)
+
     # Schedule auto-start check (runs after server starts)
     socketio.start_background_task(_auto_start_check)
 
@@ -15,6 +15,7 @@ from .interface import (
     BoardState,
     GameHistory,
     CardInfo,
+    LazyCardInfo,
     LocationState,
     ZoneState,
 )
@@ -32,6 +33,7 @@ __all__ = [
     'BoardState',
     'GameHistory',
     'CardInfo',
+    'LazyCardInfo',
     'LocationState',
     'ZoneState',
     'StaticBrain',
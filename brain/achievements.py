@@ -32,6 +32,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, Callable, TYPE_CHECKING
 
 from .holiday_overlay import get_holiday_overlay
+from engine.title_index import normalize_title
 
 if TYPE_CHECKING:
     from engine.board_state import BoardState
@@ -458,6 +459,13 @@ ACHIEVEMENTS["achievement_holiday_special"] = AchievementDef(
     threshold=3
 )
 
+# Single-card achievements, grouped once so each board card is only compared
+# against the achievements that can match it
+_SINGLE_CARD_ACHIEVEMENTS = [
+    (key, ach) for key, ach in ACHIEVEMENTS.items()
+    if ach.trigger in ('card_in_play', 'my_card', 'their_card') and ach.card_match
+]
+
 
 # =============================================================================
 # Achievement Tracker Class
@@ -555,7 +563,7 @@ class AchievementTracker:
         Get all cards currently on board with their types.
 
         Returns:
-            Dict mapping card_title (lowercase) -> card_type
+            Dict mapping card_title (normalized, see normalize_title) -> card_type
         """
         cards = {}
 
@@ -565,14 +573,14 @@ class AchievementTracker:
                 continue
             # Add location itself
             if loc.site_name:
-                cards[loc.site_name.lower()] = "Location"
+                cards[normalize_title(loc.site_name)] = "Location"
             # Add cards at location
             for card in loc.my_cards:
                 if card.card_title:
-                    cards[card.card_title.lower()] = getattr(card, 'card_type', '') or ''
+                    cards[normalize_title(card.card_title)] = getattr(card, 'card_type', '') or ''
             for card in loc.their_cards:
                 if card.card_title:
-                    cards[card.card_title.lower()] = getattr(card, 'card_type', '') or ''
+                    cards[normalize_title(card.card_title)] = getattr(card, 'card_type', '') or ''
 
         return cards
 
@@ -580,15 +588,11 @@ class AchievementTracker:
                           board_state: 'BoardState', opponent_name: str) -> List[str]:
         """Check single-card achievements"""
         messages = []
-        card_lower = card_title.lower()
+        card_lower = normalize_title(card_title)
 
-        for key, ach in ACHIEVEMENTS.items():
-            if ach.trigger not in ['card_in_play', 'my_card', 'their_card']:
-                continue
+        for key, ach in _SINGLE_CARD_ACHIEVEMENTS:
             if key in self._achievements_triggered_this_game:
                 continue
-            if not ach.card_match:
-                continue
 
             # Check if card matches (title AND type)
             if not self._card_matches(card_lower, ach.card_match, ach.card_type, actual_card_type):
@@ -672,10 +676,10 @@ class AchievementTracker:
                 cards_here = []
                 for card in loc.my_cards:
                     if card.card_title:
-                        cards_here.append(card.card_title.lower())
+                        cards_here.append(normalize_title(card.card_title))
                 for card in loc.their_cards:
                     if card.card_title:
-                        cards_here.append(card.card_title.lower())
+                        cards_here.append(normalize_title(card.card_title))
 
                 # Check if all required cards are present
                 found_all = True
@@ -731,21 +735,23 @@ class AchievementTracker:
 
     def _is_my_card(self, card_title: str, board_state: 'BoardState') -> bool:
         """Check if a card belongs to the bot"""
+        card_lower = normalize_title(card_title)
         for loc in board_state.locations:
             if loc is None:
                 continue
             for card in loc.my_cards:
-                if card.card_title and card_title.lower() in card.card_title.lower():
+                if card.card_title and card_lower in normalize_title(card.card_title):
                     return True
         return False
 
     def _is_their_card(self, card_title: str, board_state: 'BoardState') -> bool:
         """Check if a card belongs to opponent"""
+        card_lower = normalize_title(card_title)
         for loc in board_state.locations:
             if loc is None:
                 continue
             for card in loc.their_cards:
-                if card.card_title and card_title.lower() in card.card_title.lower():
+                if card.card_title and card_lower in normalize_title(card.card_title):
                     return True
         return False
 
@@ -808,7 +814,7 @@ class AchievementTracker:
                     cards_here = []
                     for card in loc.my_cards + loc.their_cards:
                         if card.card_title:
-                            cards_here.append(card.card_title.lower())
+                            cards_here.append(normalize_title(card.card_title))
 
                     # Check if Chewbacca is here
                     chewie_here = any("chew" in c for c in cards_here)
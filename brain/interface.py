@@ -58,6 +58,39 @@ class CardInfo:
     attachments: List[str] = field(default_factory=list)  # Card IDs attached to this
 
 
+class LazyCardInfo(CardInfo):
+    """
+    CardInfo whose metadata is copied from a card database entry on first use.
+
+    card_id and blueprint_id are available immediately; reading any other
+    field fills in all of them from the card metadata. Brains that only
+    look at ids (StaticBrain) never pay for the stat parsing.
+    """
+
+    def __init__(self, card_id: str, blueprint_id: str, card_meta):
+        self.card_id = card_id
+        self.blueprint_id = blueprint_id
+        self._card_meta = card_meta
+
+    def __getattr__(self, name):
+        # Only reached for attributes not yet set on the instance
+        if name.startswith('_') or name not in CardInfo.__dataclass_fields__:
+            raise AttributeError(name)
+        meta = self._card_meta
+        CardInfo.__init__(
+            self,
+            card_id=self.card_id,
+            blueprint_id=self.blueprint_id,
+            title=meta.title,
+            type=meta.card_type,
+            power=meta.power_value,
+            ability=meta.ability_value,
+            deploy_cost=meta.deploy_value,
+            icons=[str(icon) for icon in meta.icons],
+        )
+        return self.__dict__[name]
+
+
 @dataclass
 class LocationState:
     """
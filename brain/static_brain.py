@@ -18,8 +18,9 @@ from engine.evaluators import (
     MoveEvaluator, DrawEvaluator
 )
 from engine.evaluators.base import DecisionContext as EvaluatorContext, ActionType
+from engine.tracing import get_tracer
 
-logger = logging.getLogger(__name__)
+logger = get_tracer('evaluators', logging.getLogger(__name__))
 
 
 class StaticBrain(Brain):
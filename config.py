@@ -1,5 +1,5 @@
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 # Try to load credentials from credentials.py (not committed to git)
 # Note: Do NOT name this file "secrets.py" - it shadows Python's stdlib secrets module
@@ -94,6 +94,20 @@ class Config:
         os.makedirs(self.DATA_DIR, exist_ok=True)
         os.makedirs(self.LOG_DIR, exist_ok=True)
 
+    def reload_env(self):
+        """
+        Re-read every setting from the current environment.
+
+        Field defaults are evaluated once, when this module is imported.
+        Bot workers forked by supervisor.py inherit the supervisor's config,
+        apply their own environment (username, port, fast mode...) and then
+        call this so the shared `config` object picks it up.
+        """
+        import runpy
+        fresh = runpy.run_path(os.path.abspath(__file__))['Config']()
+        for f in fields(fresh):
+            setattr(self, f.name, getattr(fresh, f.name))
+
 # Create global config instance
 config = Config()
 config.__post_init__()
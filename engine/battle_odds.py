@@ -0,0 +1,255 @@
+"""
+Battle Odds
+
+Exact probability distribution of a battle's outcome, so evaluators and the
+Monte Carlo simulator can ask "how likely do we win, and what do we lose?"
+instead of comparing raw power or point estimates of destiny.
+
+Battle resolution (see SWCCG_RULES_REFERENCE.md):
+- each side with ability >= 4 draws 1 battle destiny, plus any extra
+  draws granted by gametext; total = power + sum of destiny draws
+- higher total wins, a tie has no winner
+- attrition against a side = the opponent's total battle destiny
+- the loser also takes battle damage = difference in totals
+- forfeited cards count toward both attrition and battle damage; the rest
+  of the damage is lost as Force
+- a card "immune to attrition < X" need not be forfeited when attrition < X
+
+The destiny total of N draws is the N-fold convolution of the single-draw
+distribution (DeckTracker.get_destiny_distribution). Draws are treated as
+independent, which is exact for one draw and a close approximation for
+several draws from a large Reserve Deck.
+
+Everything is keyed on hashable values and cached, so repeated queries for
+the same (power, draws, destiny distribution, cards) are dictionary lookups.
+
+Example usage:
+    us = BattleSide(power=9, draws=1, destiny=tracked_destiny_key())
+    them = BattleSide(power=7, draws=1)
+    odds = battle_odds(us, them)
+    odds.win, odds.lose, odds.our_losses.force_lost
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .card_loader import get_card
+from .deck_tracker import get_deck_tracker
+
+# Sorted ((destiny_value, probability), ...) - hashable form of a distribution
+DestinyKey = Tuple[Tuple[int, float], ...]
+
+# Neutral single-draw distribution used when the deck is not tracked
+# (mean 3.0, P(destiny >= 5) = 0.25 - same as assess_destiny_quality's defaults)
+DEFAULT_DESTINY: DestinyKey = (
+    (0, 0.125), (1, 0.125), (2, 0.125), (3, 0.25), (4, 0.125), (5, 0.125), (6, 0.125),
+)
+
+# Probabilities are rounded in keys so equal distributions share a cache entry
+_KEY_PRECISION = 9
+
+
+def destiny_key(distribution: Dict[int, float]) -> DestinyKey:
+    """
+    Normalize a destiny distribution into a hashable cache key.
+
+    An empty distribution (empty Reserve Deck) means no destiny is drawn: 0.
+    """
+    total = sum(p for p in distribution.values() if p > 0)
+    if total <= 0:
+        return ((0, 1.0),)
+    return tuple(sorted(
+        (int(value), round(p / total, _KEY_PRECISION))
+        for value, p in distribution.items() if p > 0
+    ))
+
+
+def tracked_destiny_key() -> DestinyKey:
+    """Our single-draw destiny distribution from the DeckTracker (or the default)."""
+    tracker = get_deck_tracker()
+    if not tracker.deck_loaded:
+        return DEFAULT_DESTINY
+    return destiny_key(tracker.get_destiny_distribution())
+
+
+def battle_destiny_draws(can_draw: bool, extra_draws: int = 0) -> int:
+    """Number of battle destiny draws: 1 if the ability test passes, plus gametext extras."""
+    if not can_draw:
+        return 0
+    return 1 + max(0, extra_draws)
+
+
+@lru_cache(maxsize=512)
+def destiny_total_distribution(destiny: DestinyKey, draws: int) -> DestinyKey:
+    """Distribution of the sum of `draws` destiny draws (exact convolution)."""
+    totals: Dict[int, float] = {0: 1.0}
+    for _ in range(max(0, draws)):
+        convolved: Dict[int, float] = {}
+        for subtotal, p_subtotal in totals.items():
+            for value, p_value in destiny:
+                key = subtotal + value
+                convolved[key] = convolved.get(key, 0.0) + p_subtotal * p_value
+        totals = convolved
+    return tuple(sorted(totals.items()))
+
+
+@dataclass(frozen=True)
+class ForfeitCard:
+    """A card that can be forfeited to cover attrition and battle damage."""
+    forfeit: int
+    power: int = 0
+    immune_below: int = 0  # "immune to attrition < X" -> X (0 = not immune)
+
+
+@dataclass(frozen=True)
+class BattleSide:
+    """One side of a battle. Cards are optional; without them losses are Force only."""
+    power: int
+    draws: int = 0
+    destiny: DestinyKey = DEFAULT_DESTINY
+    cards: Tuple[ForfeitCard, ...] = ()
+
+
+@dataclass(frozen=True)
+class BattleLosses:
+    """Expected losses of one side over all outcomes."""
+    attrition: float = 0.0        # Expected attrition against this side
+    damage: float = 0.0           # Expected battle damage taken (loser only)
+    cards_forfeited: float = 0.0  # Expected number of cards forfeited
+    power_lost: float = 0.0       # Expected power of forfeited cards
+    force_lost: float = 0.0       # Expected battle damage paid with Force
+
+
+@dataclass(frozen=True)
+class BattleOdds:
+    """Outcome distribution of one battle, from our point of view."""
+    win: float
+    tie: float
+    lose: float
+    expected_margin: float
+    margin: DestinyKey            # Sorted ((our_total - their_total, probability), ...)
+    our_losses: BattleLosses
+    their_losses: BattleLosses
+
+    def probability_margin_at_least(self, margin: int) -> float:
+        """P(our_total - their_total >= margin)."""
+        return sum(p for value, p in self.margin if value >= margin)
+
+
+@lru_cache(maxsize=4096)
+def _resolve_losses(cards: Tuple[ForfeitCard, ...], attrition: int,
+                    damage: int) -> Tuple[int, int, int]:
+    """
+    Forfeit cards against attrition, then pay the rest of the damage in Force.
+
+    Cards not immune to this attrition are forfeited weakest-first (ties:
+    higher forfeit first) until their forfeit covers the attrition.
+
+    Returns:
+        (cards_forfeited, power_lost, force_lost)
+    """
+    forfeited = 0
+    count = 0
+    power_lost = 0
+    if attrition > 0:
+        eligible = sorted(
+            (card for card in cards if attrition >= card.immune_below),
+            key=lambda card: (card.power, -card.forfeit),
+        )
+        for card in eligible:
+            if forfeited >= attrition:
+                break
+            forfeited += card.forfeit
+            count += 1
+            power_lost += card.power
+    return count, power_lost, max(0, damage - forfeited)
+
+
+def _expected_losses(side: BattleSide, outcomes: Iterable[Tuple[int, int, float]]) -> BattleLosses:
+    """Expected losses over (attrition, damage, probability) outcomes."""
+    attrition = damage = cards = power = force = 0.0
+    for attrition_value, damage_value, p in outcomes:
+        count, power_lost, force_lost = _resolve_losses(side.cards, attrition_value, damage_value)
+        attrition += attrition_value * p
+        damage += damage_value * p
+        cards += count * p
+        power += power_lost * p
+        force += force_lost * p
+    return BattleLosses(attrition=attrition, damage=damage, cards_forfeited=cards,
+                        power_lost=power, force_lost=force)
+
+
+@lru_cache(maxsize=2048)
+def battle_odds(us: BattleSide, them: BattleSide) -> BattleOdds:
+    """
+    Exact outcome distribution of a battle between two sides.
+
+    Results are cached on the (frozen) sides, so identical queries are free.
+    """
+    our_totals = destiny_total_distribution(us.destiny, us.draws)
+    their_totals = destiny_total_distribution(them.destiny, them.draws)
+
+    margins: Dict[int, float] = {}
+    our_outcomes: List[Tuple[int, int, float]] = []
+    their_outcomes: List[Tuple[int, int, float]] = []
+    for our_destiny, p_ours in our_totals:
+        for their_destiny, p_theirs in their_totals:
+            p = p_ours * p_theirs
+            margin = (us.power + our_destiny) - (them.power + their_destiny)
+            margins[margin] = margins.get(margin, 0.0) + p
+            # Attrition against a side is the opponent's total battle destiny
+            our_outcomes.append((their_destiny, max(0, -margin), p))
+            their_outcomes.append((our_destiny, max(0, margin), p))
+
+    return BattleOdds(
+        win=sum(p for margin, p in margins.items() if margin > 0),
+        tie=margins.get(0, 0.0),
+        lose=sum(p for margin, p in margins.items() if margin < 0),
+        expected_margin=sum(margin * p for margin, p in margins.items()),
+        margin=tuple(sorted(margins.items())),
+        our_losses=_expected_losses(us, our_outcomes),
+        their_losses=_expected_losses(them, their_outcomes),
+    )
+
+
+def forfeit_cards(cards: Iterable) -> Tuple[ForfeitCard, ...]:
+    """
+    ForfeitCards for board cards (CardInPlay), with immunity from parsed gametext.
+    """
+    result = []
+    for card in cards:
+        blueprint_id = getattr(card, 'blueprint_id', None)
+        metadata = get_card(blueprint_id) if blueprint_id else None
+        immune_below = metadata.immune_attrition_threshold if metadata else 0
+        result.append(ForfeitCard(forfeit=getattr(card, 'forfeit', 0) or 0,
+                                  power=max(0, getattr(card, 'power', 0) or 0),
+                                  immune_below=immune_below))
+    return tuple(result)
+
+
+def side_from_cards(cards: Iterable, power: int, can_draw: Optional[bool] = None,
+                    destiny: DestinyKey = DEFAULT_DESTINY) -> BattleSide:
+    """
+    Build a BattleSide from board cards (CardInPlay).
+
+    Args:
+        cards: Cards present at the battle location
+        power: Total power of the side (board totals include modifiers)
+        can_draw: Override the ability test (callers that estimate ability
+                  differently); None = sum card ability >= 4
+        destiny: Single-draw destiny distribution key
+    """
+    cards = list(cards)
+    extra_draws = 0
+    ability = 0
+    for card in cards:
+        ability += getattr(card, 'ability', 0) or 0
+        blueprint_id = getattr(card, 'blueprint_id', None)
+        metadata = get_card(blueprint_id) if blueprint_id else None
+        if metadata:
+            extra_draws += metadata.draws_extra_destiny
+    if can_draw is None:
+        can_draw = ability >= 4
+    return BattleSide(power=max(0, power), draws=battle_destiny_draws(can_draw, extra_draws),
+                      destiny=destiny, cards=forfeit_cards(cards))
@@ -13,8 +13,12 @@ Ported from Unity C# AIBoardStateTracker.cs
 
 from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, field
+import copy
+import functools
 import logging
 
+from .location_topology import LocationTopology, parse_int
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -136,6 +140,62 @@ class LocationInPlay:
         return f"LocationInPlay({display_name}@{self.location_index}, my={len(self.my_cards)}, their={len(self.their_cards)})"
 
 
+# =============================================================================
+# VERSIONED QUERY CACHE
+# =============================================================================
+# Derived BoardState queries (concede check, deployable power, flee analysis)
+# are memoized per board version. BoardState.version is bumped by every
+# public attribute assignment, by the card/location mutators and by
+# EventProcessor after each event (see mark_changed), so a cached answer is
+# only reused while nothing on the board has changed.
+
+# Query name -> [hits, misses] across all boards
+_query_stats: Dict[str, List[int]] = {}
+
+
+def versioned_query(copy_result: bool = False):
+    """
+    Memoize a BoardState method on (board version, arguments).
+
+    Args:
+        copy_result: Return a deep copy of cached results (for mutable
+            results callers may modify)
+    """
+    def decorator(method):
+        name = method.__name__
+        stats = _query_stats.setdefault(name, [0, 0])
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = self._query_cache
+            if self._query_cache_version != self._version:
+                cache.clear()
+                self._query_cache_version = self._version
+            key = (name, args, tuple(sorted(kwargs.items()))) if kwargs else (name, args)
+            try:
+                result = cache[key]
+                stats[0] += 1
+            except KeyError:
+                stats[1] += 1
+                result = cache[key] = method(self, *args, **kwargs)
+            return copy.deepcopy(result) if copy_result else result
+
+        return wrapper
+    return decorator
+
+
+def query_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Hit/miss counts of every versioned query since the last reset."""
+    return {name: {'hits': hits, 'misses': misses}
+            for name, (hits, misses) in sorted(_query_stats.items())}
+
+
+def reset_query_cache_stats():
+    """Zero the versioned query hit/miss counts."""
+    for stats in _query_stats.values():
+        stats[0] = stats[1] = 0
+
+
 class BoardState:
     """
     Complete game state tracker.
@@ -148,6 +208,32 @@ class BoardState:
     - Current phase and turn info
     """
 
+    # Mutation counter (see VERSIONED QUERY CACHE); class default so it
+    # exists before __init__ assigns anything
+    _version = 0
+
+    # Planner/strategy references and bookkeeping the brain writes while
+    # deciding; no versioned query reads them
+    _UNVERSIONED_ATTRS = frozenset([
+        'strategy_controller', 'deploy_plan_summary', 'next_turn_crush_plan',
+        'expensive_card_budget', 'game_plan', 'strategic_state',
+        'consecutive_hold_turns', 'hold_failed_last_turn', 'last_hold_reason',
+    ])
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if not name.startswith('_') and name not in self._UNVERSIONED_ATTRS:
+            object.__setattr__(self, '_version', self._version + 1)
+
+    @property
+    def version(self) -> int:
+        """Board version - changes whenever the board may have changed."""
+        return self._version
+
+    def mark_changed(self):
+        """Bump the version after in-place changes (cards, locations, power dicts)."""
+        self._version += 1
+
     def __init__(self, my_player_name: str):
         self.my_player_name = my_player_name
         self.opponent_name: Optional[str] = None
@@ -165,6 +251,15 @@ class BoardState:
         self.locations: List[LocationInPlay] = []        # Board locations by index
         self.cards_in_hand: List[CardInPlay] = []        # My hand
 
+        # Movement topology over self.locations (rebuilt lazily, see topology)
+        self._topology: Optional[LocationTopology] = None
+        self._topology_locations: Optional[List[LocationInPlay]] = None
+
+
+        # Versioned query results (see versioned_query)
+        self._query_cache: Dict[tuple, object] = {}
+        self._query_cache_version = -1
+
         # My zones
         self.force_pile: int = 0         # Force available to activate
         self.used_pile: int = 0          # Force already used
@@ -244,6 +339,8 @@ class BoardState:
         """Reset all state (for new game)"""
         self.cards_in_play.clear()
         self.locations.clear()
+        self._invalidate_topology()
+        self.mark_changed()
         self.cards_in_hand.clear()
         self.dark_power_at_locations.clear()
         self.light_power_at_locations.clear()
@@ -293,6 +390,7 @@ class BoardState:
         Args:
             collapsed: For objectives/two-sided cards, True means back side showing
         """
+        self.mark_changed()
         if zone == "AT_LOCATION":
             self._handle_card_at_location(card_id, blueprint_id, zone, owner, location_index, collapsed)
         elif zone == "ATTACHED":
@@ -518,6 +616,7 @@ class BoardState:
         Simple wrapper - adds a card using update_cards_in_play.
         For backwards compatibility with existing code.
         """
+        self.mark_changed()
         self.update_cards_in_play(
             card_id=card.card_id,
             target_card_id=card.target_card_id,
@@ -536,6 +635,7 @@ class BoardState:
         Note: For LOCATIONS, this CLEARS the slot (sets cardId="") but doesn't
         remove it from the list - index positions are preserved.
         """
+        self.mark_changed()
         card = self.cards_in_play.get(card_id)
         if not card:
             logger.warning(f"Tried to remove non-existent card: {card_id}")
@@ -549,6 +649,7 @@ class BoardState:
                 loc.blueprint_id = ""
                 loc.site_name = ""
                 loc.system_name = f"Empty Location {i}"
+                self._invalidate_topology()
                 logger.debug(f"➖ Cleared location slot {i} (was {card_id})")
                 # Still remove from cards_in_play
                 del self.cards_in_play[card_id]
@@ -574,6 +675,7 @@ class BoardState:
 
         Wrapper for MCIP events which don't provide blueprintId.
         """
+        self.mark_changed()
         card = self.cards_in_play.get(card_id)
         if not card:
             logger.warning(f"Tried to update non-existent card: {card_id}")
@@ -591,6 +693,28 @@ class BoardState:
 
     # ========== Location Management ==========
 
+    def _invalidate_topology(self):
+        """Drop the cached topology after locations change"""
+        self._topology = None
+
+    @property
+    def topology(self) -> LocationTopology:
+        """
+        Movement topology (systems, adjacency, parsec distances) for the
+        current locations.
+
+        Built on first use after add_location()/location removal. Also
+        rebuilt if self.locations is replaced or changes length outside
+        those methods (tests assign the list directly).
+        """
+        topology = self._topology
+        if (topology is None or self._topology_locations is not self.locations
+                or topology.size != len(self.locations)):
+            topology = LocationTopology(self.locations, _get_card_metadata)
+            self._topology = topology
+            self._topology_locations = self.locations
+        return topology
+
     def _ensure_location_exists(self, index: int):
         """Ensure locations list is large enough for this index"""
         while len(self.locations) <= index:
@@ -598,6 +722,7 @@ class BoardState:
 
         # If the location at this index is None, create a placeholder
         if self.locations[index] is None:
+            self._invalidate_topology()
             self.locations[index] = LocationInPlay(
                 card_id="",  # Empty string = placeholder (matches C# logic)
                 blueprint_id="unknown",
@@ -616,7 +741,9 @@ class BoardState:
         location, we INSERT (shift existing locations right), not REPLACE.
         Only empty placeholders (cardId == "") get replaced.
         """
+        self.mark_changed()
         index = location.location_index
+        self._invalidate_topology()
 
         # Check if we can reuse an existing slot
         reuse_slot = False
@@ -927,6 +1054,7 @@ class BoardState:
         Mark a card as 'hit' during the weapons segment.
         Hit cards shouldn't be targeted again - it's wasteful.
         """
+        self.mark_changed()
         self.hit_cards.add(card_id)
         logger.info(f"🎯 Marked card {card_id} as HIT")
 
@@ -936,6 +1064,7 @@ class BoardState:
 
     def clear_hit_cards(self) -> None:
         """Clear hit tracking at battle end."""
+        self.mark_changed()
         if self.hit_cards:
             logger.debug(f"Clearing {len(self.hit_cards)} hit cards")
             self.hit_cards.clear()
@@ -958,6 +1087,7 @@ class BoardState:
         """
         return self.their_reserve_deck + self.their_used_pile + self.their_force_pile
 
+    @versioned_query()
     def should_concede(self) -> tuple[bool, str]:
         """
         Determine if we should concede the game.
@@ -1079,6 +1209,7 @@ class BoardState:
 
         return False, ""
 
+    @versioned_query()
     def force_to_activate(self, max_available: int) -> int:
         """
         Calculate how much force to activate this turn.
@@ -1111,6 +1242,7 @@ class BoardState:
 
     # ========== Deployable Power Calculation ==========
 
+    @versioned_query()
     def total_hand_deployable_ground_power(self, card_id_to_ignore: str = "") -> int:
         """
         Calculate total power we can deploy to GROUND locations this turn.
@@ -1209,6 +1341,7 @@ class BoardState:
 
         return max(dp)
 
+    @versioned_query()
     def total_hand_deployable_space_power(self, card_id_to_ignore: str = "") -> int:
         """
         Calculate total power we can deploy to SPACE locations this turn.
@@ -1299,22 +1432,7 @@ class BoardState:
         - "Tatooine: Mos Eisley" -> "Tatooine"
         - "Coruscant" (system card) -> "Coruscant"
         """
-        if loc_idx < 0 or loc_idx >= len(self.locations):
-            return ""
-
-        loc = self.locations[loc_idx]
-        if not loc:
-            return ""
-
-        # Try site_name first (e.g., "Naboo: Swamp")
-        name = loc.site_name or loc.system_name or ""
-
-        # Extract system prefix (before the colon)
-        if ":" in name:
-            return name.split(":")[0].strip()
-
-        # No colon - might be a system card itself
-        return name.strip()
+        return self.topology.system_name(loc_idx)
 
     def find_same_system_locations(self, loc_idx: int) -> List[int]:
         """
@@ -1325,18 +1443,7 @@ class BoardState:
 
         Returns list of location indices in the same system (excluding current).
         """
-        system_name = self.get_system_name(loc_idx)
-        if not system_name:
-            return []
-
-        same_system = []
-        for i, loc in enumerate(self.locations):
-            if i == loc_idx:
-                continue
-            if loc and self.get_system_name(i) == system_name:
-                same_system.append(i)
-
-        return same_system
+        return self.topology.same_system(loc_idx)
 
     def find_adjacent_locations(self, loc_idx: int) -> List[int]:
         """
@@ -1351,32 +1458,7 @@ class BoardState:
 
         Returns list of valid adjacent location indices.
         """
-        adjacent = []
-
-        # Get our system name for comparison
-        our_system = self.get_system_name(loc_idx)
-        if not our_system:
-            return adjacent
-
-        # Check left
-        if loc_idx > 0 and loc_idx - 1 < len(self.locations):
-            left_loc = self.locations[loc_idx - 1]
-            if left_loc:
-                left_system = self.get_system_name(loc_idx - 1)
-                # Must be in the same system to be adjacent
-                if left_system == our_system:
-                    adjacent.append(loc_idx - 1)
-
-        # Check right
-        if loc_idx + 1 < len(self.locations):
-            right_loc = self.locations[loc_idx + 1]
-            if right_loc:
-                right_system = self.get_system_name(loc_idx + 1)
-                # Must be in the same system to be adjacent
-                if right_system == our_system:
-                    adjacent.append(loc_idx + 1)
-
-        return adjacent
+        return self.topology.adjacent_to(loc_idx)
 
     def find_hyperspeed_destinations(self, loc_idx: int) -> List[int]:
         """
@@ -1385,69 +1467,21 @@ class BoardState:
         Starships can move to systems where parsec difference <= hyperspeed.
         Returns list of valid destination location indices (space systems only).
         """
-        if loc_idx < 0 or loc_idx >= len(self.locations):
-            return []
-
-        current_loc = self.locations[loc_idx]
-        if not current_loc or not current_loc.is_space:
-            return []
-
-        # Get parsec of current system from card metadata
-        current_metadata = _get_card_metadata(current_loc.blueprint_id) if current_loc.blueprint_id else None
-        if not current_metadata:
-            return []
-
-        current_parsec = current_metadata.parsec
-        if current_parsec is None:
-            return []
-
-        # Try to parse parsec as int
-        try:
-            current_parsec = int(current_parsec)
-        except (ValueError, TypeError):
+        topology = self.topology
+        if loc_idx < 0 or loc_idx >= topology.size or topology.parsecs[loc_idx] is None:
             return []
 
         # Get our starships' hyperspeed at this location
         max_hyperspeed = 0
-        for card in current_loc.my_cards:
+        for card in self.locations[loc_idx].my_cards:
             card_meta = _get_card_metadata(card.blueprint_id) if card.blueprint_id else None
-            if card_meta and card_meta.is_starship:
-                try:
-                    hs = int(card_meta.hyperspeed) if card_meta.hyperspeed else 0
-                    max_hyperspeed = max(max_hyperspeed, hs)
-                except (ValueError, TypeError):
-                    pass
+            if card_meta and card_meta.is_starship and card_meta.hyperspeed:
+                max_hyperspeed = max(max_hyperspeed, parse_int(card_meta.hyperspeed) or 0)
 
         if max_hyperspeed == 0:
             return []
 
-        # Find all space systems within hyperspeed range
-        destinations = []
-        for idx, loc in enumerate(self.locations):
-            if idx == loc_idx:
-                continue
-            if not loc or not loc.is_space:
-                continue
-
-            dest_metadata = _get_card_metadata(loc.blueprint_id) if loc.blueprint_id else None
-            if not dest_metadata:
-                continue
-
-            dest_parsec = dest_metadata.parsec
-            if dest_parsec is None:
-                continue
-
-            try:
-                dest_parsec = int(dest_parsec)
-            except (ValueError, TypeError):
-                continue
-
-            # Check if within hyperspeed range
-            parsec_diff = abs(dest_parsec - current_parsec)
-            if parsec_diff <= max_hyperspeed:
-                destinations.append(idx)
-
-        return destinations
+        return topology.within_parsecs(loc_idx, max_hyperspeed)
 
     def my_character_count_at_location(self, loc_idx: int) -> int:
         """
@@ -1491,6 +1525,7 @@ class BoardState:
 
         return count
 
+    @versioned_query(copy_result=True)
     def analyze_flee_options(self, loc_idx: int, is_space: bool = False) -> dict:
         """
         Analyze flee viability from a location.
@@ -0,0 +1,213 @@
+"""
+Board Summary
+
+One pass over the board's locations shared by every turn-start consumer.
+
+StrategicState (drain economy), GamePlan (drain projection, control
+counts), GameStrategy (location priorities) and DeployPhasePlanner
+(location analysis) all need the same per-location facts:
+- power for each side (raw, GEMP uses -1 for "no presence")
+- force icons for each side (card metadata, falling back to LocationInPlay)
+- space/ground, interior/exterior flags
+- control, contested, and the drain each side gets there
+
+get_board_summary() builds a BoardSummary once per board version (a
+versioned query, see board_state.versioned_query), so the turn-start
+pipeline resolves location metadata and power once instead of four times.
+Any board change bumps BoardState.version and produces a fresh summary.
+"""
+
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from engine import card_loader
+from engine.board_state import BoardState, versioned_query
+
+# Opponent power at or below which one of their drains is worth contesting
+# (matches deploy_planner's low enemy power threshold)
+CONTESTABLE_ENEMY_POWER = 4
+
+
+def parse_icons(value) -> int:
+    """Parse an icon count ("2", "2*", "", 2) to int."""
+    if value is None:
+        return 0
+    if isinstance(value, int):
+        return value
+    try:
+        return int(str(value).replace("*", "").strip() or "0")
+    except ValueError:
+        return 0
+
+
+@dataclass(frozen=True)
+class LocationSummary:
+    """Resolved facts about one board location."""
+    index: int
+    location: Any                 # The LocationInPlay this summarizes
+    card_id: str
+    blueprint_id: str
+    name: str                     # site_name, system_name, blueprint_id or 'Unknown'
+    my_power: int                 # Raw power (-1 = no presence)
+    their_power: int
+    my_icons: int = 0             # Icons we drain for (metadata, else LocationInPlay)
+    their_icons: int = 0
+    has_metadata: bool = False    # Icons/flags came from card metadata
+    is_space: bool = False
+    is_ground: bool = False
+    is_interior: bool = False
+    is_exterior: bool = False
+
+    @property
+    def i_control(self) -> bool:
+        """We have presence and they don't."""
+        return self.my_power > 0 and self.their_power <= 0
+
+    @property
+    def they_control(self) -> bool:
+        """They have presence and we don't."""
+        return self.their_power > 0 and self.my_power <= 0
+
+    @property
+    def contested(self) -> bool:
+        """Both sides have presence."""
+        return self.my_power > 0 and self.their_power > 0
+
+    @property
+    def my_drain(self) -> int:
+        """Force we drain here per turn (their icons at a location we control)."""
+        return self.their_icons if self.i_control else 0
+
+    @property
+    def their_drain(self) -> int:
+        """Force they drain here per turn (our icons at a location they control)."""
+        return self.my_icons if self.they_control else 0
+
+    @property
+    def contestable(self) -> bool:
+        """They drain us here with little enough power to take it back."""
+        return self.their_drain > 0 and self.their_power <= CONTESTABLE_ENEMY_POWER
+
+
+class BoardSummary:
+    """
+    Per-location summary of one board version.
+
+    Example usage:
+        summary = get_board_summary(board_state)
+        summary.my_drain_total                 # -> force we drain per turn
+        summary.at(2).their_power              # -> opponent power at slot 2
+        [s.name for s in summary.contestable_drains()]
+    """
+
+    def __init__(self, locations: List[Optional[LocationSummary]], my_side: str):
+        # Aligned with board_state.locations (None for empty slots)
+        self.locations = locations
+        self.my_side = my_side
+
+        present = [s for s in locations if s is not None]
+        self.my_drain_total = sum(s.my_drain for s in present)
+        self.their_drain_total = sum(s.their_drain for s in present)
+
+    def at(self, index: int) -> Optional[LocationSummary]:
+        """Summary of the location at a board index (None if empty/out of range)."""
+        if 0 <= index < len(self.locations):
+            return self.locations[index]
+        return None
+
+    def __iter__(self):
+        return (s for s in self.locations if s is not None)
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def contestable_drains(self) -> List[LocationSummary]:
+        """Opponent drains held with low power."""
+        return [s for s in self if s.contestable]
+
+
+def _normalize_side(board_state) -> str:
+    # BoardState power lookups treat an unknown side as light, so do we
+    my_side = getattr(board_state, 'my_side', 'light') or 'light'
+    return my_side.lower()
+
+
+def _power(board_state, method: str, index: int) -> int:
+    getter = getattr(board_state, method, None)
+    return getter(index) if getter else 0
+
+
+def summarize_location(loc, index: int, board_state, my_side: str) -> LocationSummary:
+    """Resolve power, icons and space/ground flags for one location."""
+    site_name = getattr(loc, 'site_name', '') or ''
+    system_name = getattr(loc, 'system_name', '') or ''
+    blueprint_id = getattr(loc, 'blueprint_id', '') or ''
+    name = site_name or system_name or blueprint_id or 'Unknown'
+
+    metadata = None
+    if blueprint_id and blueprint_id != 'unknown':
+        metadata = card_loader.get_card(blueprint_id)
+
+    is_space = is_ground = is_interior = is_exterior = False
+    if metadata:
+        dark_icons = getattr(metadata, 'dark_side_icons', 0) or 0
+        light_icons = getattr(metadata, 'light_side_icons', 0) or 0
+        my_icons, their_icons = (dark_icons, light_icons) if my_side == 'dark' else (light_icons, dark_icons)
+
+        # Systems have sub_type "System" and no interior/exterior icons;
+        # sites always have interior and/or exterior
+        sub_type = (getattr(metadata, 'sub_type', '') or '').lower()
+        if sub_type == 'system':
+            is_space = True
+        elif sub_type == 'site' or metadata.is_interior or metadata.is_exterior:
+            is_ground = True
+            is_interior = metadata.is_interior
+            is_exterior = metadata.is_exterior
+        else:
+            is_space = True
+    else:
+        my_icons = parse_icons(getattr(loc, 'my_icons', 0))
+        their_icons = parse_icons(getattr(loc, 'their_icons', 0))
+
+    return LocationSummary(
+        index=index,
+        location=loc,
+        card_id=getattr(loc, 'card_id', '') or '',
+        blueprint_id=blueprint_id,
+        name=name,
+        my_power=_power(board_state, 'my_power_at_location', index),
+        their_power=_power(board_state, 'their_power_at_location', index),
+        my_icons=my_icons,
+        their_icons=their_icons,
+        has_metadata=metadata is not None,
+        is_space=is_space,
+        is_ground=is_ground,
+        is_interior=is_interior,
+        is_exterior=is_exterior,
+    )
+
+
+def build_board_summary(board_state) -> BoardSummary:
+    """Summarize every location on the board (uncached)."""
+    my_side = _normalize_side(board_state)
+    locations = getattr(board_state, 'locations', None) or []
+    return BoardSummary(
+        [None if loc is None else summarize_location(loc, idx, board_state, my_side)
+         for idx, loc in enumerate(locations)],
+        my_side,
+    )
+
+
+_versioned_board_summary = versioned_query()(build_board_summary)
+
+
+def get_board_summary(board_state) -> BoardSummary:
+    """
+    BoardSummary for the board's current version.
+
+    Cached in the board's query cache; board stand-ins are summarized
+    uncached.
+    """
+    if isinstance(board_state, BoardState):
+        return _versioned_board_summary(board_state)
+    return build_board_summary(board_state)
@@ -11,6 +11,9 @@ from typing import Dict, Optional, TYPE_CHECKING
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from .combo_scorer import ComboData, build_combo_data
+from .title_index import TitleIndex
+
 # Import gametext parser (lazy to avoid circular imports)
 if TYPE_CHECKING:
     from .gametext_parser import ParsedGametext
@@ -654,6 +657,8 @@ class CardDatabase:
         self.card_json_dir = Path(card_json_dir)
         self.cards: Dict[str, Card] = {}  # Keyed by blueprint_id (gempId)
         self._loaded = False
+        self._title_index: Optional[TitleIndex] = None
+        self._combo_data: Optional[ComboData] = None
 
     def load(self):
         """Load all card data from JSON files"""
@@ -678,7 +683,10 @@ class CardDatabase:
             logger.error(f"Light.json not found at {light_path}")
 
         self._loaded = True
-        logger.info(f"✅ Loaded {len(self.cards)} cards total")
+        self._title_index = TitleIndex(self.cards.values())
+        self._combo_data = build_combo_data(self.cards.values())
+        logger.info(f"✅ Loaded {len(self.cards)} cards total "
+                    f"({self._title_index.unique_titles} unique titles)")
 
     def _load_json_file(self, file_path: Path, side: str):
         """Load cards from a single JSON file"""
@@ -810,14 +818,43 @@ class CardDatabase:
         card = self.get_card(blueprint_id)
         return card.title if card else blueprint_id
 
-    def search_by_title(self, title: str) -> list[Card]:
-        """Search for cards by title (case-insensitive partial match)"""
+    @property
+    def title_index(self) -> TitleIndex:
+        """Normalized title index (rebuilt if cards were added after load)"""
+        if not self._loaded:
+            self.load()
+        if self._title_index is None or len(self._title_index) != len(self.cards):
+            self._title_index = TitleIndex(self.cards.values())
+        return self._title_index
+
+    @property
+    def combo_data(self) -> ComboData:
+        """Combo relationships parsed from the loaded cards' combo fields"""
         if not self._loaded:
             self.load()
+        if self._combo_data is None:
+            self._combo_data = build_combo_data(self.cards.values())
+        return self._combo_data
 
-        title_lower = title.lower()
-        return [card for card in self.cards.values()
-                if title_lower in card.title.lower()]
+    def search_by_title(self, title: str) -> list[Card]:
+        """Search for cards by title (case-insensitive partial match, ignoring "•")"""
+        return self.title_index.substring(title)
+
+    def find_by_exact_title(self, title: str) -> list[Card]:
+        """Find cards whose title matches exactly (case-insensitive, ignoring "•")"""
+        return self.title_index.exact(title)
+
+    def search_by_prefix(self, prefix: str) -> list[Card]:
+        """Find cards whose title starts with prefix (case-insensitive, ignoring "•")"""
+        return self.title_index.prefix(prefix)
+
+    def find_card_by_title(self, title: str) -> Optional[Card]:
+        """
+        Find the best card for a title: an exact match if there is one,
+        otherwise the first card whose title contains it.
+        """
+        matches = self.title_index.exact(title) or self.title_index.substring(title)
+        return matches[0] if matches else None
 
 
 # Global card database instance
@@ -12,13 +12,22 @@ This module:
 1. Parses combo strings to extract card name relationships
 2. Builds bidirectional lookup tables (card A combos with B, and B combos with A)
 3. Scores deployment decisions based on combo potential
+
+Combo data is built by CardDatabase.load() from the already-parsed cards,
+so the card JSON is only read once. Every card name that appears in a combo
+gets an integer id, and partner sets are stored as int bitsets so scoring is
+a few AND operations instead of set building per candidate card.
 """
 
 import logging
-import re
-from typing import Dict, Set, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, Set, List, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
 
+from .title_index import normalize_title
+
+if TYPE_CHECKING:
+    from .card_loader import Card
+
 logger = logging.getLogger(__name__)
 
 # Scoring constants
@@ -48,18 +57,56 @@ DESCRIPTION_MARKERS = [
 @dataclass
 class ComboData:
     """Holds parsed combo relationships for the game"""
-    # Maps card title (lowercase) -> set of combo partner titles (lowercase)
+    # Maps card title (normalized) -> set of combo partner titles (normalized)
     combos_by_title: Dict[str, Set[str]] = field(default_factory=dict)
-    # Maps blueprint_id -> set of combo partner titles (lowercase)
+    # Maps blueprint_id -> set of combo partner titles (normalized)
     combos_by_blueprint: Dict[str, Set[str]] = field(default_factory=dict)
     # Total combos parsed
     total_combos: int = 0
     # Cards with combo data
     cards_with_combos: int = 0
 
-
-# Global combo data - loaded once at startup
-_combo_data: Optional[ComboData] = None
+    # Integer ids for every title that appears in a combo (names[id] -> title)
+    names: List[str] = field(default_factory=list)
+    name_ids: Dict[str, int] = field(default_factory=dict)
+    # Partner bitsets: bit i set => names[i] is a combo partner
+    partner_bits_by_title: Dict[str, int] = field(default_factory=dict)
+    partner_bits_by_blueprint: Dict[str, int] = field(default_factory=dict)
+
+    def name_id(self, title: str) -> int:
+        """Get (or assign) the integer id of a normalized title"""
+        name_id = self.name_ids.get(title)
+        if name_id is None:
+            name_id = len(self.names)
+            self.name_ids[title] = name_id
+            self.names.append(title)
+        return name_id
+
+    def title_bits(self, titles: Iterable[str]) -> int:
+        """Bitset of the given titles (titles never seen in a combo are ignored)"""
+        bits = 0
+        for title in titles:
+            if title:
+                name_id = self.name_ids.get(normalize_title(title))
+                if name_id is not None:
+                    bits |= 1 << name_id
+        return bits
+
+    def partner_bits(self, card_title: str = None, blueprint_id: str = None) -> int:
+        """Bitset of all combo partners of a card"""
+        bits = 0
+        if blueprint_id:
+            bits |= self.partner_bits_by_blueprint.get(blueprint_id, 0)
+        if card_title:
+            bits |= self.partner_bits_by_title.get(normalize_title(card_title), 0)
+        return bits
+
+    def titles_for(self, bits: int) -> Iterator[str]:
+        """Titles of the set bits, in id order"""
+        while bits:
+            low = bits & -bits
+            yield self.names[low.bit_length() - 1]
+            bits ^= low
 
 
 def _is_likely_description(text: str) -> bool:
@@ -122,85 +169,63 @@ def _parse_combo_string(combo_str: str) -> List[str]:
         if _is_likely_description(part):
             continue
 
-        # Clean up the card name
-        # Remove leading bullet/dot if present (•)
-        part = part.lstrip('•').strip()
+        # Clean up the card name (removes bullet/dot markers and case)
+        part = normalize_title(part)
 
         if part and len(part) > 1:  # Must be at least 2 chars
-            card_names.append(part.lower())
+            card_names.append(part)
 
     return card_names
 
 
-def _load_combo_data() -> ComboData:
-    """Load and parse combo data from card JSON files"""
-    import json
-    import os
+def build_combo_data(cards: Iterable['Card']) -> ComboData:
+    """
+    Build combo relationships from loaded cards.
 
+    Called by CardDatabase.load() so combos come from the same parse of
+    the card JSON as everything else.
+    """
     data = ComboData()
 
-    # Find card JSON directory
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    json_dir = os.path.join(os.path.dirname(base_dir), 'swccg-card-json')
-
-    if not os.path.exists(json_dir):
-        logger.warning(f"Card JSON directory not found: {json_dir}")
-        return data
-
-    # Load both Dark and Light side cards
-    for filename in ['Dark.json', 'Light.json']:
-        filepath = os.path.join(json_dir, filename)
-        if not os.path.exists(filepath):
-            logger.warning(f"Card file not found: {filepath}")
-            continue
-
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                card_data = json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to load {filepath}: {e}")
+    for card in cards:
+        if not card.combo_cards:
             continue
 
-        for card in card_data.get('cards', []):
-            combo_list = card.get('combo', [])
-            if not combo_list:
-                continue
+        data.cards_with_combos += 1
 
-            data.cards_with_combos += 1
-
-            # Get this card's info
-            blueprint_id = card.get('gempId', '')
-            card_title = card.get('front', {}).get('title', '').lower().lstrip('•').strip()
-
-            if not card_title:
-                continue
-
-            # Parse each combo string
-            for combo_str in combo_list:
-                card_names = _parse_combo_string(combo_str)
-
-                if len(card_names) < 2:
-                    continue  # Need at least 2 cards for a combo
-
-                data.total_combos += 1
-
-                # Add bidirectional relationships for all cards in this combo
-                for i, name1 in enumerate(card_names):
-                    for j, name2 in enumerate(card_names):
-                        if i != j:
-                            # Add to title lookup
-                            if name1 not in data.combos_by_title:
-                                data.combos_by_title[name1] = set()
-                            data.combos_by_title[name1].add(name2)
+        card_title = normalize_title(card.title)
+        if not card_title:
+            continue
 
-                # Also index by blueprint for faster lookup
-                if blueprint_id:
-                    if blueprint_id not in data.combos_by_blueprint:
-                        data.combos_by_blueprint[blueprint_id] = set()
-                    # Add all combo partners (excluding self)
-                    for name in card_names:
-                        if name != card_title:
-                            data.combos_by_blueprint[blueprint_id].add(name)
+        # Parse each combo string
+        for combo_str in card.combo_cards:
+            card_names = _parse_combo_string(combo_str)
+
+            if len(card_names) < 2:
+                continue  # Need at least 2 cards for a combo
+
+            data.total_combos += 1
+            combo_ids = [data.name_id(name) for name in card_names]
+
+            # Add bidirectional relationships for all cards in this combo
+            for i, name1 in enumerate(card_names):
+                partners = data.combos_by_title.setdefault(name1, set())
+                for j, name2 in enumerate(card_names):
+                    if i != j:
+                        partners.add(name2)
+                        data.partner_bits_by_title[name1] = (
+                            data.partner_bits_by_title.get(name1, 0) | (1 << combo_ids[j]))
+
+            # Also index by blueprint for faster lookup
+            if card.blueprint_id:
+                partners = data.combos_by_blueprint.setdefault(card.blueprint_id, set())
+                bits = data.partner_bits_by_blueprint.get(card.blueprint_id, 0)
+                # Add all combo partners (excluding self)
+                for name, name_id in zip(card_names, combo_ids):
+                    if name != card_title:
+                        partners.add(name)
+                        bits |= 1 << name_id
+                data.partner_bits_by_blueprint[card.blueprint_id] = bits
 
     logger.info(f"🔗 Loaded combo data: {data.cards_with_combos} cards, "
                 f"{data.total_combos} combo relationships, "
@@ -210,11 +235,9 @@ def _load_combo_data() -> ComboData:
 
 
 def get_combo_data() -> ComboData:
-    """Get the global combo data, loading if necessary"""
-    global _combo_data
-    if _combo_data is None:
-        _combo_data = _load_combo_data()
-    return _combo_data
+    """Get the combo data built with the global card database"""
+    from .card_loader import get_card_database
+    return get_card_database().combo_data
 
 
 def get_combo_partners(card_title: str = None, blueprint_id: str = None) -> Set[str]:
@@ -226,20 +249,15 @@ def get_combo_partners(card_title: str = None, blueprint_id: str = None) -> Set[
         blueprint_id: Blueprint ID to look up
 
     Returns:
-        Set of card titles (lowercase) that combo with this card
+        Set of card titles (normalized) that combo with this card
     """
     data = get_combo_data()
-    partners = set()
+    return set(data.titles_for(data.partner_bits(card_title, blueprint_id)))
 
-    if blueprint_id and blueprint_id in data.combos_by_blueprint:
-        partners.update(data.combos_by_blueprint[blueprint_id])
 
-    if card_title:
-        title_lower = card_title.lower().lstrip('•').strip()
-        if title_lower in data.combos_by_title:
-            partners.update(data.combos_by_title[title_lower])
-
-    return partners
+def has_combo_partners(card_title: str = None, blueprint_id: str = None) -> bool:
+    """Check whether a card has any known combo partners"""
+    return get_combo_data().partner_bits(card_title, blueprint_id) != 0
 
 
 def score_combo_potential(
@@ -262,7 +280,8 @@ def score_combo_potential(
     Returns:
         Tuple of (score_bonus, reasoning_string)
     """
-    partners = get_combo_partners(card_title=card_title, blueprint_id=blueprint_id)
+    data = get_combo_data()
+    partners = data.partner_bits(card_title, blueprint_id)
 
     if not partners:
         return 0.0, ""
@@ -270,28 +289,25 @@ def score_combo_potential(
     score = 0.0
     reasons = []
 
-    # Normalize card lists for matching
-    board_lower = {c.lower().lstrip('•').strip() for c in cards_on_board if c}
-    hand_lower = {c.lower().lstrip('•').strip() for c in cards_in_hand if c}
-    location_lower = {c.lower().lstrip('•').strip() for c in (same_location_cards or []) if c}
+    board_bits = data.title_bits(cards_on_board)
+    location_bits = data.title_bits(same_location_cards or [])
 
     # Check for combo partners on board
-    board_matches = partners.intersection(board_lower)
-    for match in board_matches:
+    board_matches = partners & board_bits
+    for match in data.titles_for(board_matches):
         score += COMBO_BONUS_ON_BOARD
         # Extra bonus if at same location
-        if match in location_lower:
+        if location_bits & (1 << data.name_ids[match]):
             score += COMBO_BONUS_SAME_LOCATION
             reasons.append(f"Combo with {match} at location!")
         else:
             reasons.append(f"Combo with {match} on board")
 
-    # Check for combo partners in hand (future potential)
-    hand_matches = partners.intersection(hand_lower)
-    for match in hand_matches:
-        if match not in board_lower:  # Don't double count
-            score += COMBO_BONUS_IN_HAND
-            reasons.append(f"Combo partner {match} in hand")
+    # Check for combo partners in hand (future potential), not double counting board
+    hand_matches = partners & data.title_bits(cards_in_hand) & ~board_bits
+    for match in data.titles_for(hand_matches):
+        score += COMBO_BONUS_IN_HAND
+        reasons.append(f"Combo partner {match} in hand")
 
     if score > 0:
         reason_str = f"COMBO: {', '.join(reasons[:3])}"  # Limit to 3 reasons
@@ -311,6 +327,7 @@ def log_combo_stats():
     logger.info(f"Total combo relationships: {data.total_combos}")
     logger.info(f"Unique cards indexed by title: {len(data.combos_by_title)}")
     logger.info(f"Unique cards indexed by blueprint: {len(data.combos_by_blueprint)}")
+    logger.info(f"Combo titles with integer ids: {len(data.names)}")
 
     # Find cards with most combo partners
     if data.combos_by_title:
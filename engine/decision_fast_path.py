@@ -0,0 +1,224 @@
+"""
+Decision Fast Path
+
+Many GEMP prompts have exactly one legal answer: a noPass selection with a
+single selectable card, an action choice with nothing to do but pass, a
+"Choose where to deploy" with one valid target. Sending those through the
+brain still builds a BrainContext, resolves every option's card metadata
+and runs every applicable evaluator, only to return the one answer we
+could read straight off the decision parameters.
+
+The fast path is a small table of rules tried in order before the brain.
+Each rule looks at the parsed parameters (DecisionSafety.parse_decision_params)
+and either returns the answer or None. An answer is only used if
+DecisionSafety.validate_response accepts it and it is not a response the
+loop tracker has blocked; anything else falls through to the brain.
+
+Rules:
+1. nothing_to_choose - optional prompt with no actions/selectable cards -> pass
+2. single_deploy_target - "Choose where to deploy" with one valid target
+3. single_forced_choice - must choose (noPass or min>=1) and only one option
+
+Deploy and move *actions* never take the fast path: choosing them feeds the
+evaluators' pending-deploy/move tracking used for loop prevention. Deploy
+*targets* do, and record the deployment on the deploy planner just like
+CombinedEvaluator.track_action does.
+
+Configured by the strategy config 'decision_fast_path' section:
+    enabled: Use the fast path at all (default True)
+
+Example usage:
+    fast_path = get_decision_fast_path()
+    answer = fast_path.try_answer(decision_element, params, board_state, blocked_responses)
+    if answer is not None:
+        ...                                   # answer.rule, answer.value
+"""
+
+import logging
+import re
+import xml.etree.ElementTree as ET
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .decision_safety import DecisionSafety
+from .game_session import current_session
+from .strategy_config import get_config
+
+logger = logging.getLogger(__name__)
+
+CARD_TYPES = ('CARD_SELECTION', 'ARBITRARY_CARDS')
+ACTION_TYPES = ('CARD_ACTION_CHOICE', 'ACTION_CHOICE')
+
+# Action texts whose choice the evaluators track (see CombinedEvaluator.track_action)
+TRACKED_ACTION_PREFIXES = ('deploy', 'move', 'shuttle', 'transport', 'transit')
+
+
+@dataclass
+class FastAnswer:
+    """A decision answered without the brain."""
+    rule: str
+    value: str
+    reason: str
+
+
+def _options(params: dict) -> List[str]:
+    """The choices a rule picks from: actions, or selectable non-preselected cards."""
+    if params['decision_type'] in ACTION_TYPES:
+        return params['action_ids']
+    return DecisionSafety.get_selectable_options(params)
+
+
+def _nothing_to_choose(element: ET.Element, params: dict) -> Optional[Tuple[str, str]]:
+    if params['decision_type'] not in CARD_TYPES + ACTION_TYPES:
+        return None
+    if not DecisionSafety.can_pass(params):
+        return None
+    if params['decision_type'] == 'ARBITRARY_CARDS' and params['max'] == 0:
+        return "", "min=0, max=0 - nothing to select"
+    if _options(params) or (params['decision_type'] in ACTION_TYPES and params['card_ids']):
+        return None
+    return "", "no actions or selectable cards - passing"
+
+
+def _single_deploy_target(element: ET.Element, params: dict) -> Optional[Tuple[str, str]]:
+    if params['decision_type'] != 'CARD_SELECTION':
+        return None
+    if "choose where to deploy" not in params['decision_text'].lower():
+        return None
+    options = _options(params)
+    if len(options) != 1:
+        return None
+    return options[0], "only one valid deploy target"
+
+
+def _single_forced_choice(element: ET.Element, params: dict) -> Optional[Tuple[str, str]]:
+    decision_type = params['decision_type']
+    if decision_type not in CARD_TYPES + ACTION_TYPES:
+        return None
+    if not DecisionSafety.must_choose(params) or params['min'] > 1:
+        return None
+    options = _options(params)
+    if len(options) != 1:
+        return None
+    if decision_type == 'ARBITRARY_CARDS' and any(params['preselected']):
+        return None         # the answer would have to carry the preselected cards
+    if decision_type in ACTION_TYPES:
+        texts = [p.get('value', '') for p in element.findall('.//parameter') if p.get('name') == 'actionText']
+        text = re.sub(r'<[^>]+>', '', texts[0]).strip().lower() if texts else ''
+        if text.startswith(TRACKED_ACTION_PREFIXES):
+            return None
+    return options[0], "only one legal choice"
+
+
+# (name, rule) in the order they are tried
+FAST_PATH_RULES: List[Tuple[str, Callable[[ET.Element, dict], Optional[Tuple[str, str]]]]] = [
+    ('nothing_to_choose', _nothing_to_choose),
+    ('single_deploy_target', _single_deploy_target),
+    ('single_forced_choice', _single_forced_choice),
+]
+
+
+class DecisionFastPath:
+    """Answers trivial decisions from their parameters, with per-rule counters."""
+
+    def __init__(self, config: Dict[str, Any] = None):
+        """
+        Initialize with configuration.
+
+        Args:
+            config: Optional dict (strategy config 'decision_fast_path' section) with keys:
+                - enabled: Use the fast path at all (default True)
+        """
+        config = config or {}
+        self.enabled = config.get('enabled', True)
+
+        # Statistics
+        self.seen = 0
+        self.handled: Counter = Counter()
+        self.rejected = 0
+
+    def try_answer(self, decision_element: ET.Element, params: dict, board_state=None,
+                   blocked_responses: Set[str] = None) -> Optional[FastAnswer]:
+        """
+        Answer the decision if a rule recognizes it, else None (use the brain).
+
+        Args:
+            decision_element: The <ge type="D"> element
+            params: DecisionSafety.parse_decision_params(decision_element)
+            board_state: Optional BoardState (deploy targets are recorded on its planner)
+            blocked_responses: Responses the loop tracker has blocked
+        """
+        if not self.enabled:
+            return None
+        self.seen += 1
+
+        for name, rule in FAST_PATH_RULES:
+            answer = rule(decision_element, params)
+            if answer is None:
+                continue
+            value, reason = answer
+            is_valid, warning = DecisionSafety.validate_response(decision_element, value)
+            if not is_valid or (blocked_responses and value in blocked_responses):
+                self.rejected += 1
+                logger.debug(f"⚡ Fast path {name} rejected '{value}': {warning or 'blocked response'}")
+                return None
+            if name == 'single_deploy_target':
+                self._record_deployment(params['decision_text'], board_state)
+            self.handled[name] += 1
+            return FastAnswer(rule=name, value=value, reason=reason)
+        return None
+
+    @staticmethod
+    def _record_deployment(decision_text: str, board_state) -> None:
+        """The target is chosen, so the deployment is committed (as in CombinedEvaluator.track_action)."""
+        planner = getattr(board_state, 'deploy_planner', None)
+        match = re.search(r"value='([^']+)'", decision_text)
+        if planner is not None and match and hasattr(planner, 'record_deployment'):
+            planner.record_deployment(match.group(1))
+            logger.info(f"📝 Recorded deployment of {match.group(1)} (only target)")
+
+    def stats(self) -> Dict[str, Any]:
+        handled = sum(self.handled.values())
+        return {
+            'seen': self.seen,
+            'handled': handled,
+            'by_rule': dict(self.handled),
+            'rejected': self.rejected,
+            'handled_rate': handled / self.seen if self.seen else 0.0,
+        }
+
+    def _summary(self) -> str:
+        stats = self.stats()
+        rules = ", ".join(f"{name}={count}" for name, count in sorted(stats['by_rule'].items()))
+        return f"{stats['handled']}/{stats['seen']} decisions fast-pathed ({rules or 'none'})"
+
+
+# Global instance
+_decision_fast_path: Optional[DecisionFastPath] = None
+
+
+def get_decision_fast_path() -> DecisionFastPath:
+    """Get the fast path for the current game session (or the global one)."""
+    session = current_session()
+    if session is not None:
+        return session.scoped('decision_fast_path',
+                              lambda: DecisionFastPath(get_config().get_section('decision_fast_path')))
+    global _decision_fast_path
+    if _decision_fast_path is None:
+        _decision_fast_path = DecisionFastPath(get_config().get_section('decision_fast_path'))
+    return _decision_fast_path
+
+
+def reset_decision_fast_path() -> DecisionFastPath:
+    """Reset for a new game (re-reads config)."""
+    global _decision_fast_path
+    session = current_session()
+    previous = session.get('decision_fast_path') if session is not None else _decision_fast_path
+    if previous is not None and previous.seen:
+        logger.info(f"⚡ Decision fast path last game: {previous._summary()}")
+    fast_path = DecisionFastPath(get_config().get_section('decision_fast_path'))
+    if session is not None:
+        return session.set('decision_fast_path', fast_path)
+    _decision_fast_path = fast_path
+    return fast_path
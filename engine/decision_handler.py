@@ -17,8 +17,10 @@ from dataclasses import dataclass
 from typing import Optional, Tuple, List, Set
 import xml.etree.ElementTree as ET
 
+from .decision_fast_path import get_decision_fast_path, reset_decision_fast_path
 from .decision_safety import DecisionSafety, DecisionTracker
 from .decision_logger import log_decision as _log_decision_xml
+from .game_session import current_session
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +45,14 @@ class DecisionResult:
 _decision_tracker = DecisionTracker()
 
 
+def _get_decision_tracker() -> DecisionTracker:
+    """Loop-detection tracker for the current game session (or the global one)."""
+    session = current_session()
+    if session is not None:
+        return session.scoped('decision_tracker', DecisionTracker)
+    return _decision_tracker
+
+
 class DecisionHandler:
     """Handles game decisions and determines appropriate responses"""
 
@@ -135,19 +145,20 @@ class DecisionHandler:
 
         # Update state tracking for loop detection
         # If game state changed (e.g., hand size after draw), it's not a loop
-        _decision_tracker.update_state(board_state)
+        decision_tracker = _get_decision_tracker()
+        decision_tracker.update_state(board_state)
 
         # Check for potential infinite loop (now detects MULTI-DECISION loops!)
-        is_loop, count = _decision_tracker.check_for_loop(decision_type, decision_text)
-        loop_severity = _decision_tracker.get_loop_severity()
-        blocked_responses = _decision_tracker.get_blocked_responses(decision_type, decision_text)
+        is_loop, count = decision_tracker.check_for_loop(decision_type, decision_text)
+        loop_severity = decision_tracker.get_loop_severity()
+        blocked_responses = decision_tracker.get_blocked_responses(decision_type, decision_text)
 
         # === EARLY LOOP BREAK: Cancel failed target selection ===
         # For ARBITRARY_CARDS with cancel option: if we just made a selection and
         # we're back at the same decision, the action failed - cancel immediately
-        if _decision_tracker.should_cancel_target_selection(decision_type, decision_text):
+        if decision_tracker.should_cancel_target_selection(decision_type, decision_text):
             logger.warning(f"🎯 Target selection failed - canceling to break potential loop")
-            _decision_tracker.record_decision(decision_type, decision_text, decision_id, "")
+            decision_tracker.record_decision(decision_type, decision_text, decision_id, "")
             return DecisionResult(decision_id=decision_id, value="", no_long_delay=no_long_delay)
 
         # Get available options for forced choice
@@ -174,7 +185,7 @@ class DecisionHandler:
                     else:
                         forced = available[0]
                         logger.error(f"🚨 Forcing different choice: {forced} (blocked: {blocked_responses})")
-                    _decision_tracker.record_decision(decision_type, decision_text, decision_id, forced)
+                    decision_tracker.record_decision(decision_type, decision_text, decision_id, forced)
                     return DecisionResult(decision_id=decision_id, value=forced, no_long_delay=no_long_delay)
                 else:
                     # ALL options are blocked - we're truly stuck
@@ -182,7 +193,7 @@ class DecisionHandler:
                     # Return special marker that app.py can detect
                     # For now, just pick random and hope
                     forced = random.choice(all_options) if all_options else ""
-                    _decision_tracker.record_decision(decision_type, decision_text, decision_id, forced)
+                    decision_tracker.record_decision(decision_type, decision_text, decision_id, forced)
                     return DecisionResult(decision_id=decision_id, value=forced, no_long_delay=no_long_delay)
 
         # === SEVERE LOOP: Force different choice ===
@@ -211,7 +222,7 @@ class DecisionHandler:
                     else:
                         forced = random.choice(available)
                     logger.warning(f"⚠️  SEVERE LOOP ({count}x) - forcing different: {forced}")
-                _decision_tracker.record_decision(decision_type, decision_text, decision_id, forced)
+                decision_tracker.record_decision(decision_type, decision_text, decision_id, forced)
                 return DecisionResult(decision_id=decision_id, value=forced, no_long_delay=no_long_delay)
 
         # === MILD LOOP: Add randomness but still try brain ===
@@ -235,7 +246,7 @@ class DecisionHandler:
             # BUT not for critical selections where passing would break game mechanics!
             if can_pass and loop_severity == 'mild' and random.random() < 0.5 and not is_critical_selection:
                 logger.warning(f"🔄 Mild loop - randomly passing to break pattern")
-                _decision_tracker.record_decision(decision_type, decision_text, decision_id, "")
+                decision_tracker.record_decision(decision_type, decision_text, decision_id, "")
                 return DecisionResult(decision_id=decision_id, value="", no_long_delay=no_long_delay)
             elif is_critical_selection:
                 logger.info(f"🔄 Loop detected but this is a critical selection - must choose, not pass")
@@ -243,10 +254,17 @@ class DecisionHandler:
         result = None
 
         try:
+            # === LAYER 0: Fast Path (only one sensible answer) ===
+            # Answered straight from the parameters - no BrainContext, no evaluators
+            fast = get_decision_fast_path().try_answer(decision_element, params, board_state, blocked_responses)
+            if fast:
+                logger.info(f"⚡ Fast path ({fast.rule}): '{fast.value}' - {fast.reason}")
+                result = (decision_id, fast.value)
+
             # === LAYER 1: Brain (Smart AI) ===
             # ALWAYS pass blocked_responses so evaluators can penalize them
             # This prevents loops by penalizing cancelled actions BEFORE loop detection triggers
-            if brain and board_state and decision_type in ['CARD_ACTION_CHOICE', 'CARD_SELECTION', 'ARBITRARY_CARDS', 'ACTION_CHOICE', 'INTEGER']:
+            if not result and brain and board_state and decision_type in ['CARD_ACTION_CHOICE', 'CARD_SELECTION', 'ARBITRARY_CARDS', 'ACTION_CHOICE', 'INTEGER']:
                 result = DecisionHandler._use_brain(
                     decision_element, board_state, phase_count, brain,
                     blocked_responses=blocked_responses  # Always pass, not just when loop detected
@@ -312,10 +330,10 @@ class DecisionHandler:
         # CRITICAL: If we're cancelling a target selection (empty response),
         # block the previous action that led us here to prevent loops
         if result[1] == "" and decision_type in ('CARD_SELECTION', 'ARBITRARY_CARDS'):
-            _decision_tracker.block_last_action_on_cancel(decision_type, decision_text)
+            decision_tracker.block_last_action_on_cancel(decision_type, decision_text)
 
         # Track this decision
-        _decision_tracker.record_decision(decision_type, decision_text, decision_id, result[1])
+        decision_tracker.record_decision(decision_type, decision_text, decision_id, result[1])
 
         # === LOG FULL DECISION XML FOR ANALYSIS ===
         try:
@@ -360,23 +378,25 @@ class DecisionHandler:
 
     @staticmethod
     def reset_tracker():
-        """Reset the decision tracker (call at game start)"""
-        _decision_tracker.clear()
+        """Reset the decision tracker and fast-path counters (call at game start)"""
+        _get_decision_tracker().clear()
+        reset_decision_fast_path()
 
     @staticmethod
     def notify_phase_change(new_phase: str):
         """Notify tracker of phase change (resets loop detection)"""
-        _decision_tracker.on_phase_change(new_phase)
+        _get_decision_tracker().on_phase_change(new_phase)
 
     @staticmethod
     def should_concede_due_to_loop() -> bool:
         """Check if we're in a critical loop that requires conceding"""
-        return _decision_tracker.should_consider_concede()
+        return _get_decision_tracker().should_consider_concede()
 
     @staticmethod
     def get_loop_status() -> Tuple[str, int]:
         """Get current loop status: (severity, repeat_count)"""
-        return _decision_tracker.get_loop_severity(), _decision_tracker.sequence_repeat_count
+        decision_tracker = _get_decision_tracker()
+        return decision_tracker.get_loop_severity(), decision_tracker.sequence_repeat_count
 
     @staticmethod
     def _use_brain(decision_element: ET.Element, board_state, phase_count: int, brain,
@@ -394,7 +414,7 @@ class DecisionHandler:
         Returns:
             Tuple of (decision_id, decision_value) or None if brain can't handle it
         """
-        from brain import BrainContext, DecisionRequest, DecisionOption, DecisionType, GameHistory, CardInfo, BoardState as BrainBoardState
+        from brain import BrainContext, DecisionRequest, DecisionOption, DecisionType, GameHistory, LazyCardInfo
 
         decision_type = decision_element.get('decisionType', '')
         decision_id = decision_element.get('id', '')
@@ -434,6 +454,16 @@ class DecisionHandler:
             elif name == 'noPass':
                 no_pass = value.lower() == 'true'
 
+        # =====================================================
+        # CRITICAL: For ARBITRARY_CARDS with min > 1, bypass brain!
+        # Brain only returns single choice, but multi-select needs
+        # multiple cards comma-separated. Fall through to handler.
+        # Checked before building options so the bypass costs nothing.
+        # =====================================================
+        if decision_type == 'ARBITRARY_CARDS' and min_value > 1:
+            logger.info(f"🔄 ARBITRARY_CARDS with min={min_value} - bypassing brain for multi-select")
+            return None
+
         # Build DecisionOptions
         options = []
         for i in range(max(len(action_ids), len(card_ids))):
@@ -472,16 +502,8 @@ class DecisionHandler:
                 else:
                     card_meta = get_card(actual_blueprint)
                     if card_meta:
-                        card_info = CardInfo(
-                            card_id=card_id,
-                            blueprint_id=actual_blueprint,
-                            title=card_meta.title,
-                            type=card_meta.card_type,
-                            power=card_meta.power_value,
-                            ability=card_meta.ability_value,
-                            deploy_cost=card_meta.deploy_value,
-                            icons=[str(icon) for icon in card_meta.icons],
-                        )
+                        # Stats/icons are only parsed if a brain reads them
+                        card_info = LazyCardInfo(card_id, actual_blueprint, card_meta)
                     else:
                         logger.warning(f"⚠️  Could not get metadata for blueprint {actual_blueprint} (cardId={card_id})")
 
@@ -518,33 +540,15 @@ class DecisionHandler:
             no_pass=no_pass,
         )
 
-        # Build BrainBoardState (minimal - StaticBrain uses engine BoardState directly)
-        brain_board_state = BrainBoardState(
-            turn_number=phase_count,
-            phase=board_state.current_phase if board_state else "",
-            current_player="me" if (board_state and board_state.is_my_turn()) else "opponent",
-            my_total_power=board_state.total_my_power() if board_state else 0,
-            their_total_power=board_state.total_their_power() if board_state else 0,
-            my_side=board_state.my_side if board_state else "unknown",
-            opponent_name=board_state.opponent_name if board_state else "Unknown",
-        )
-
         # Build BrainContext
+        # (no brain BoardState summary: StaticBrain reads the engine BoardState
+        # directly, and building one meant two full power scans per decision)
         context = BrainContext(
             board_state=board_state,  # Pass engine BoardState directly (StaticBrain uses it)
             decision_request=request,
             game_history=GameHistory(),  # TODO: Track history
         )
 
-        # =====================================================
-        # CRITICAL: For ARBITRARY_CARDS with min > 1, bypass brain!
-        # Brain only returns single choice, but multi-select needs
-        # multiple cards comma-separated. Fall through to handler.
-        # =====================================================
-        if decision_type == 'ARBITRARY_CARDS' and min_value > 1:
-            logger.info(f"🔄 ARBITRARY_CARDS with min={min_value} - bypassing brain for multi-select")
-            return None
-
         # Ask brain for decision
         logger.debug("🧠 Using brain for decision...")
         try:
@@ -4,7 +4,9 @@ Decision XML Logger
 Captures full decision XML for every decision the bot makes.
 This enables post-game analysis, debugging, and training data extraction.
 
-Log files are rotated per-game alongside the main log.
+Log files are rotated per-game alongside the main log. Each account has
+its own DecisionLog; the module functions write to the bound game
+session's log, or to the process's default account log.
 """
 
 import logging
@@ -15,6 +17,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from .game_session import current_session
+
 # Get username for log filename
 _log_username = os.environ.get('GEMP_USERNAME', 'rando')
 
@@ -25,22 +29,79 @@ LOG_DIR.mkdir(parents=True, exist_ok=True)
 # Decision log file path
 DECISION_LOG_PATH = LOG_DIR / f"{_log_username}_decisions.log"
 
-# Create dedicated decision logger
-decision_logger = logging.getLogger("decision_xml")
-decision_logger.setLevel(logging.INFO)
-decision_logger.propagate = False  # Don't propagate to root logger
 
-# File handler for decision log
-_file_handler: Optional[logging.FileHandler] = None
+class DecisionLog:
+    """One account's decision log, on its own logger so accounts never share a file."""
+
+    def __init__(self, username: str, logger_name: str = "decision_xml"):
+        self.username = username
+        self.path = LOG_DIR / f"{username}_decisions.log"
+        self.logger = logging.getLogger(logger_name)
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False  # Don't propagate to root logger
+        # File handler for decision log
+        self._file_handler: Optional[logging.FileHandler] = None
+
+    def _ensure_handler(self):
+        """Lazily initialize the file handler."""
+        if self._file_handler is None:
+            self._file_handler = logging.FileHandler(str(self.path))
+            self._file_handler.setFormatter(logging.Formatter('%(message)s'))  # Raw format
+            self.logger.addHandler(self._file_handler)
+
+    def write(self, entry: str):
+        self._ensure_handler()
+        self.logger.info(entry)
+
+    def rotate(self, opponent_name: str = None, won: bool = None):
+        """Rotate the log file after a game ends (see rotate_decision_log())."""
+        try:
+            if self._file_handler is None:
+                return  # No log to rotate
+
+            # Generate new filename matching main log format
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            result_str = "win" if won else "loss" if won is not None else "unknown"
+            opponent_str = opponent_name.replace(' ', '_') if opponent_name else "unknown"
+
+            new_filename = f"{self.username}_{timestamp}_vs_{opponent_str}_{result_str}_decisions.log"
+            new_path = LOG_DIR / new_filename
+
+            # Flush and close current handler
+            self._file_handler.flush()
+            self._file_handler.close()
+            self.logger.removeHandler(self._file_handler)
+            self._file_handler = None
+
+            # Rename if file exists and has content
+            if self.path.exists() and self.path.stat().st_size > 0:
+                shutil.move(str(self.path), str(new_path))
+
+            # Create new handler
+            self._ensure_handler()
+
+        except Exception as e:
+            # Use standard logging for errors (decision_logger might be broken)
+            logging.getLogger(__name__).error(f"Error rotating decision log: {e}")
+
+    def flush(self):
+        """Flush the decision log."""
+        if self._file_handler:
+            self._file_handler.flush()
 
 
-def _ensure_handler():
-    """Lazily initialize the file handler."""
-    global _file_handler
-    if _file_handler is None:
-        _file_handler = logging.FileHandler(str(DECISION_LOG_PATH))
-        _file_handler.setFormatter(logging.Formatter('%(message)s'))  # Raw format
-        decision_logger.addHandler(_file_handler)
+# Log for the process's own account (GEMP_USERNAME)
+_default_log = DecisionLog(_log_username)
+decision_logger = _default_log.logger
+
+
+def get_decision_log() -> DecisionLog:
+    """The bound game session's log, or the default account's log."""
+    session = current_session()
+    if session is None:
+        return _default_log
+    return session.scoped('decision_log', lambda: DecisionLog(
+        session.settings.username, f"decision_xml.{session.name}"))
 
 
 def log_decision(
@@ -72,8 +133,6 @@ def log_decision(
         phase: Current game phase
         is_my_turn: Whether it's the bot's turn
     """
-    _ensure_handler()
-
     timestamp = datetime.now().isoformat()
 
     # Convert XML element to string
@@ -110,7 +169,7 @@ def log_decision(
     entry_lines.append("")  # Blank line between entries
 
     entry = '\n'.join(entry_lines)
-    decision_logger.info(entry)
+    get_decision_log().write(entry)
 
 
 def rotate_decision_log(opponent_name: str = None, won: bool = None):
@@ -121,40 +180,9 @@ def rotate_decision_log(opponent_name: str = None, won: bool = None):
         opponent_name: Name of the opponent (for filename)
         won: Whether the bot won (for filename)
     """
-    global _file_handler
-
-    try:
-        if _file_handler is None:
-            return  # No log to rotate
-
-        # Generate new filename matching main log format
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        result_str = "win" if won else "loss" if won is not None else "unknown"
-        opponent_str = opponent_name.replace(' ', '_') if opponent_name else "unknown"
-
-        new_filename = f"{_log_username}_{timestamp}_vs_{opponent_str}_{result_str}_decisions.log"
-        new_path = LOG_DIR / new_filename
-
-        # Flush and close current handler
-        _file_handler.flush()
-        _file_handler.close()
-        decision_logger.removeHandler(_file_handler)
-
-        # Rename if file exists and has content
-        if DECISION_LOG_PATH.exists() and DECISION_LOG_PATH.stat().st_size > 0:
-            shutil.move(str(DECISION_LOG_PATH), str(new_path))
-
-        # Create new handler
-        _file_handler = logging.FileHandler(str(DECISION_LOG_PATH))
-        _file_handler.setFormatter(logging.Formatter('%(message)s'))
-        decision_logger.addHandler(_file_handler)
-
-    except Exception as e:
-        # Use standard logging for errors (decision_logger might be broken)
-        logging.getLogger(__name__).error(f"Error rotating decision log: {e}")
+    get_decision_log().rotate(opponent_name, won)
 
 
 def flush():
     """Flush the decision log."""
-    if _file_handler:
-        _file_handler.flush()
+    get_decision_log().flush()
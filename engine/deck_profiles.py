@@ -0,0 +1,413 @@
+"""
+Deck Profiles - Precomputed per-deck data for game start.
+
+At every game start the bot used to find the deck file (falling back to a
+case-insensitive directory scan), parse it for the DeckTracker, look up
+every card's stats, and run DeckAnalyzer + ArchetypeDetector on it again.
+None of that changes unless the deck file does.
+
+A DeckProfile holds everything derived from one deck file:
+- deck_list: blueprint_id -> count (as DeckTracker parses it)
+- card_stats: the DeckTracker CardStats for every blueprint in the deck
+- composition: DeckAnalyzer's DeckComposition
+- archetype and goals: ArchetypeDetector's result
+
+Profiles are keyed by the SHA-1 of the deck file contents and persisted to
+data/deck_profiles.json, so a restart re-analyzes only decks that changed.
+The file also records the card JSON files it was built from; new card data
+discards it. Profiles with cards missing from the card data are served but
+never persisted.
+At login the bot warms the cache for its library and user decks, one
+deck after another on a single background thread; game start then serves
+the profile from memory (one os.stat to notice an edited deck file). A
+deck that was not warmed is profiled on first use.
+
+Under BOT_SESSIONS app.py monkey-patches threading with eventlet, so a
+"background" thread would be a green thread that never yields while it
+analyzes decks and would stall every session's game loop. In that mode
+app.py warms every local deck file once at startup, before any session
+starts, and the login warm-up is skipped.
+
+Configured by the strategy config 'deck_profiles' section:
+    enabled: Use cached profiles at all (default True)
+
+Example usage:
+    warm_deck_profiles([deck.name for deck in library_decks + user_decks])
+    warm_deck_profiles(background=False)        # every local deck file
+    ...
+    profile = get_deck_profile('dark_baseline')
+    tracker.load_profile(profile, 'dark')
+    set_deck_strategy(profile.strategy_goals())
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from . import deck_tracker
+from .archetype_detector import DeckArchetype, StrategicGoals, detect_archetype
+from .deck_analyzer import DeckAnalyzer, DeckComposition
+from .deck_tracker import CardStats, DeckTracker
+from .strategy_config import get_config
+
+logger = logging.getLogger(__name__)
+
+PROFILE_VERSION = 1
+
+# Persisted profiles, keyed by deck content hash
+PROFILE_CACHE_FILE = Path(__file__).parent.parent / 'data' / 'deck_profiles.json'
+
+
+@dataclass
+class DeckProfile:
+    """Everything derived from one deck file."""
+    deck_name: str
+    content_hash: str
+    deck_list: Dict[str, int]
+    card_stats: Dict[str, CardStats]
+    composition: DeckComposition
+    archetype: DeckArchetype
+    goals: StrategicGoals
+    build_ms: float = 0.0
+
+    @property
+    def total_cards(self) -> int:
+        return sum(self.deck_list.values())
+
+    @property
+    def complete(self) -> bool:
+        """Every card in the deck was found in the card data."""
+        return len(self.card_stats) == len(self.deck_list)
+
+    def strategy_goals(self) -> StrategicGoals:
+        """A copy of the goals (the game may adjust its own)."""
+        return copy.deepcopy(self.goals)
+
+    def to_dict(self) -> Dict[str, Any]:
+        goals = asdict(self.goals)
+        goals['archetype'] = self.archetype.value
+        return {
+            'deck_name': self.deck_name,
+            'deck_list': self.deck_list,
+            'card_stats': {bp: asdict(stats) for bp, stats in self.card_stats.items()},
+            'composition': asdict(self.composition),
+            'archetype': self.archetype.value,
+            'goals': goals,
+            'build_ms': self.build_ms,
+        }
+
+    @classmethod
+    def from_dict(cls, content_hash: str, data: Dict[str, Any]) -> 'DeckProfile':
+        archetype = DeckArchetype(data['archetype'])
+        goals = dict(data['goals'], archetype=archetype)
+        return cls(
+            deck_name=data['deck_name'],
+            content_hash=content_hash,
+            deck_list=dict(data['deck_list']),
+            card_stats={bp: CardStats(**stats) for bp, stats in data['card_stats'].items()},
+            composition=DeckComposition(**data['composition']),
+            archetype=archetype,
+            goals=StrategicGoals(**goals),
+            build_ms=data.get('build_ms', 0.0),
+        )
+
+
+def content_hash(content: bytes) -> str:
+    return hashlib.sha1(content).hexdigest()
+
+
+def card_data_signature() -> str:
+    """Size and mtime of the card JSON files profiles were built from."""
+    from .card_loader import get_card_database
+    parts = []
+    for name in ('Dark.json', 'Light.json'):
+        try:
+            stat = (get_card_database().card_json_dir / name).stat()
+            parts.append(f"{name}:{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{name}:missing")
+    return ';'.join(parts)
+
+
+def build_profile(deck_name: str, content: bytes) -> Optional[DeckProfile]:
+    """
+    Analyze one deck file's contents.
+
+    Uses the same parsing and stat caching as DeckTracker.load_deck and the
+    same analysis as the game-start DeckAnalyzer/detect_archetype path.
+    """
+    start = time.perf_counter()
+    text = content.decode('utf-8', errors='replace')
+
+    scratch = DeckTracker()
+    if scratch._parse_deck_file(text) <= 0:
+        logger.warning(f"📚 Deck profile: no cards found in '{deck_name}'")
+        return None
+    scratch._cache_card_stats()
+
+    composition = DeckAnalyzer().analyze_deck_xml(text, deck_name)
+    archetype, goals = detect_archetype(composition)
+
+    return DeckProfile(
+        deck_name=deck_name,
+        content_hash=content_hash(content),
+        deck_list=dict(scratch.deck_list),
+        card_stats=dict(scratch._card_stats),
+        composition=composition,
+        archetype=archetype,
+        goals=goals,
+        build_ms=(time.perf_counter() - start) * 1000,
+    )
+
+
+class DeckProfileCache:
+    """Deck profiles by content hash, with a deck name -> file index."""
+
+    def __init__(self, decks_dir: Optional[Path] = None, cache_file: Optional[Path] = None,
+                 config: Dict[str, Any] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            decks_dir: Directory with the deck files (default: DeckTracker's DECK_BASE_PATH)
+            cache_file: Where profiles are persisted (default: data/deck_profiles.json)
+            config: Optional dict (strategy config 'deck_profiles' section); see module docstring
+        """
+        config = config or {}
+        self.enabled = config.get('enabled', True)
+        self.decks_dir = Path(decks_dir or deck_tracker.DECK_BASE_PATH)
+        self.cache_file = Path(cache_file or PROFILE_CACHE_FILE)
+
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, DeckProfile] = {}                  # content hash -> profile
+        self._by_name: Dict[str, Tuple[Tuple[int, int], str]] = {}   # name -> ((mtime_ns, size), hash)
+        self._files: Optional[Dict[str, str]] = None                 # lower-case stem -> filename
+        self._files_mtime: Optional[int] = None                      # decks_dir mtime_ns when scanned
+        self._dirty = False
+        self._card_data = card_data_signature()
+        self._load()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.built = 0
+
+    # ========== Persistence ==========
+
+    def _load(self) -> None:
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"📚 Ignoring unreadable deck profile cache {self.cache_file}: {e}")
+            return
+        if data.get('version') != PROFILE_VERSION or data.get('card_data') != self._card_data:
+            logger.info("📚 Deck profile cache is from another version or card data, rebuilding")
+            return
+        for digest, entry in data.get('profiles', {}).items():
+            try:
+                self._profiles[digest] = DeckProfile.from_dict(digest, entry)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"Skipping stale deck profile {digest}: {e}")
+        logger.info(f"📚 Loaded {len(self._profiles)} cached deck profiles")
+
+    def save(self) -> None:
+        """Write the profiles to disk if any were built since the last save."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                'version': PROFILE_VERSION,
+                'card_data': self._card_data,
+                'profiles': {digest: profile.to_dict() for digest, profile in self._profiles.items()
+                             if profile.complete},
+            }
+            self._dirty = False
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_file.with_suffix('.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp, self.cache_file)
+        except OSError as e:
+            logger.warning(f"📚 Could not save deck profiles: {e}")
+
+    # ========== Lookup ==========
+
+    def find_deck_file(self, deck_name: str) -> Optional[Path]:
+        """
+        Same matching as deck_tracker.find_deck_file, with the directory scan cached.
+
+        The scan is redone only when the directory's mtime changes (a deck
+        file was added, removed or renamed), so server decks without a local
+        file cost one os.stat per lookup rather than an os.listdir.
+        """
+        stem = deck_name[:-4] if deck_name.endswith('.txt') else deck_name
+        path = self.decks_dir / f"{stem}.txt"
+        if path.exists():
+            return path
+        filename = self._deck_files().get(stem.lower())
+        return self.decks_dir / filename if filename else None
+
+    def _deck_files(self) -> Dict[str, str]:
+        try:
+            mtime = os.stat(self.decks_dir).st_mtime_ns
+        except OSError:
+            mtime = None
+        if self._files is None or mtime != self._files_mtime:
+            try:
+                files = {Path(name).stem.lower(): name for name in os.listdir(self.decks_dir)
+                         if name.lower().endswith('.txt')}
+            except OSError:
+                files = {}
+            self._files, self._files_mtime = files, mtime
+        return self._files
+
+    def get(self, deck_name: str) -> Optional[DeckProfile]:
+        """The profile for a deck, building it if the file is new or changed."""
+        path = self.find_deck_file(deck_name)
+        if path is None:
+            return None
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            known = self._by_name.get(deck_name)
+            if known and known[0] == signature and known[1] in self._profiles:
+                self.hits += 1
+                return self._profiles[known[1]]
+
+        try:
+            content = path.read_bytes()
+        except OSError as e:
+            logger.warning(f"📚 Could not read deck file {path}: {e}")
+            return None
+        digest = content_hash(content)
+
+        with self._lock:
+            profile = self._profiles.get(digest)
+        if profile is None:
+            profile = build_profile(path.stem, content)
+            if profile is None:
+                return None
+            with self._lock:
+                self._profiles[digest] = profile
+                self._dirty = True
+                self.built += 1
+            logger.info(f"📚 Built deck profile for {deck_name} in {profile.build_ms:.0f}ms "
+                        f"({profile.archetype.value}, {profile.total_cards} cards)")
+
+        with self._lock:
+            self._by_name[deck_name] = (signature, digest)
+            self.misses += 1
+        return profile
+
+    # ========== Warm-up ==========
+
+    def warm(self, deck_names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Profile decks one at a time and persist the result.
+
+        Args:
+            deck_names: Decks to profile (default: every deck file in decks_dir)
+        """
+        if deck_names is None:
+            deck_names = [Path(name).stem for name in sorted(self._deck_files().values())]
+        names = list(dict.fromkeys(name for name in deck_names if name))
+        start = time.perf_counter()
+        built_before = self.built
+        found = sum(self._get_quietly(name) is not None for name in names)
+        self.save()
+        stats = {
+            'decks': len(names),
+            'profiled': found,
+            'built': self.built - built_before,
+            'elapsed_ms': (time.perf_counter() - start) * 1000,
+        }
+        logger.info(f"📚 Deck profiles ready: {stats['profiled']}/{stats['decks']} decks "
+                    f"({stats['built']} analyzed) in {stats['elapsed_ms']:.0f}ms")
+        return stats
+
+    def _get_quietly(self, deck_name: str) -> Optional[DeckProfile]:
+        try:
+            return self.get(deck_name)
+        except Exception as e:
+            logger.warning(f"📚 Deck profile for '{deck_name}' failed: {e}")
+            return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'profiles': len(self._profiles),
+            'hits': self.hits,
+            'misses': self.misses,
+            'built': self.built,
+        }
+
+
+# Global instance (profiles depend only on deck file contents, so game sessions share it)
+_cache: Optional[DeckProfileCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_deck_profile_cache() -> DeckProfileCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = DeckProfileCache(config=get_config().get_section('deck_profiles'))
+        return _cache
+
+
+def get_deck_profile(deck_name: str) -> Optional[DeckProfile]:
+    """Cached profile for a deck, or None if disabled or the deck file is not found."""
+    cache = get_deck_profile_cache()
+    if not cache.enabled:
+        return None
+    return cache.get(deck_name)
+
+
+def green_threads() -> bool:
+    """True if eventlet has monkey-patched threading (app.py under BOT_SESSIONS)."""
+    try:
+        from eventlet import patcher
+    except ImportError:
+        return False
+    return patcher.is_monkey_patched('thread')
+
+
+def warm_deck_profiles(deck_names: Optional[List[str]] = None,
+                       background: bool = True) -> Optional[threading.Thread]:
+    """
+    Profile decks ahead of game start.
+
+    Args:
+        deck_names: Decks to profile (default: every local deck file)
+        background: Warm on a background thread (call after login). Skipped
+            when threads are green: deck analysis never yields, so it would
+            stall the other sessions; warm with background=False before the
+            sessions start instead.
+    """
+    cache = get_deck_profile_cache()
+    if not cache.enabled or deck_names == []:
+        return None
+    if not background:
+        cache.warm(deck_names)
+        return None
+    if green_threads():
+        logger.debug("📚 Skipping background deck profile warm-up under eventlet")
+        return None
+    thread = threading.Thread(target=cache.warm, args=(deck_names,),
+                              name='deck-profile-warmup', daemon=True)
+    thread.start()
+    return thread
@@ -6,6 +6,10 @@ Tracks cards throughout a game to enable:
 2. Direct knowledge when bot has seen specific cards (e.g., searching reserve)
 3. Expected destiny calculations for battle decisions
 
+Reserve counts (remaining cards by blueprint, and aggregated by card type,
+destiny value and deploy cost) are maintained incrementally as cards move
+between zones, so probability queries never rebuild the remaining-card dict.
+
 Knowledge Model:
 - "Unknown" cards: We know they exist but not their location in reserve
 - "Known" cards: We've seen specific cards in reserve deck (e.g., during a search)
@@ -14,14 +18,17 @@ Knowledge Model:
 
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Optional, Tuple, TYPE_CHECKING
+from math import comb
+from typing import Callable, Dict, Iterable, List, Set, Optional, Tuple, Union, TYPE_CHECKING
 from collections import defaultdict
 from enum import Enum
 
 from engine.card_loader import get_card, Card
+from engine.game_session import current_session
 
 if TYPE_CHECKING:
     from engine.board_state import BoardState
+    from engine.deck_profiles import DeckProfile
 
 logger = logging.getLogger(__name__)
 
@@ -46,19 +53,29 @@ class CardStats:
     is_unique: bool
 
 
+# Card types that count as "deployable" draws
+DEPLOYABLE_TYPES = frozenset({"Character", "Starship", "Vehicle", "Device", "Weapon"})
+
+
 @dataclass
 class ZoneContents:
     """Contents of a card zone, tracking counts by blueprint_id."""
     cards: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    # Called with the blueprint_id whenever its count changes
+    listener: Optional[Callable[[str], None]] = field(default=None, repr=False, compare=False)
 
     def add(self, blueprint_id: str, count: int = 1) -> None:
         self.cards[blueprint_id] += count
+        if self.listener:
+            self.listener(blueprint_id)
 
     def remove(self, blueprint_id: str, count: int = 1) -> bool:
         if self.cards[blueprint_id] >= count:
             self.cards[blueprint_id] -= count
             if self.cards[blueprint_id] == 0:
                 del self.cards[blueprint_id]
+            if self.listener:
+                self.listener(blueprint_id)
             return True
         return False
 
@@ -69,7 +86,11 @@ class ZoneContents:
         return sum(self.cards.values())
 
     def clear(self) -> None:
+        removed = list(self.cards)
         self.cards.clear()
+        if self.listener:
+            for blueprint_id in removed:
+                self.listener(blueprint_id)
 
     def copy(self) -> 'ZoneContents':
         new = ZoneContents()
@@ -119,6 +140,17 @@ class DeckTracker:
         # Card metadata cache
         self._card_stats: Dict[str, CardStats] = {}
 
+        # Incrementally maintained reserve counts (see _reserve_changed)
+        self._remaining: Dict[str, int] = {}       # blueprint_id -> count remaining
+        self._remaining_total = 0
+        self._remaining_by_type: Dict[str, int] = defaultdict(int)
+        self._power_by_type: Dict[str, int] = defaultdict(int)       # type -> sum of power
+        self._remaining_by_destiny: Dict[int, int] = defaultdict(int)
+        self._deployable_by_cost: Dict[int, int] = defaultdict(int)  # deploy cost -> count
+        self._destiny_sum = 0
+        for zone in (self.hand, self.in_play, self.lost_pile, self.used_pile):
+            zone.listener = self._reserve_changed
+
         # Tracking state
         self.current_turn = 0
         self.my_side: Optional[str] = None
@@ -141,6 +173,7 @@ class DeckTracker:
         self.my_side = my_side.lower()
         self.deck_list.clear()
         self._card_stats.clear()
+        self._rebuild_reserve_counts()
 
         try:
             with open(deck_path, 'r') as f:
@@ -217,6 +250,17 @@ class DeckTracker:
 
         return cards_loaded
 
+    def load_profile(self, profile: 'DeckProfile', my_side: str) -> None:
+        """Load a precomputed deck profile (deck list and card stats) at game start."""
+        self.my_side = my_side.lower()
+        self.deck_list.clear()
+        self.deck_list.update(profile.deck_list)
+        self._card_stats.clear()
+        self._card_stats.update(profile.card_stats)
+        self.deck_loaded = True
+        self._cache_card_stats()
+        logger.info(f"📚 DeckTracker: Loaded {profile.total_cards} cards from profile")
+
     def load_deck_from_list(self, cards: List[str], my_side: str) -> None:
         """Load deck from a list of blueprint_ids."""
         self.my_side = my_side.lower()
@@ -261,6 +305,58 @@ class DeckTracker:
                     is_unique=card.is_unique
                 )
 
+        self._rebuild_reserve_counts()
+
+    # =========================================================================
+    # RESERVE COUNTS
+    # =========================================================================
+
+    def _count_remaining(self, blueprint_id: str) -> int:
+        """Copies of a blueprint not in hand, in play, lost or used."""
+        out = (self.hand.count(blueprint_id) + self.in_play.count(blueprint_id) +
+               self.lost_pile.count(blueprint_id) + self.used_pile.count(blueprint_id))
+        return max(0, self.deck_list.get(blueprint_id, 0) - out)
+
+    def _apply_remaining_delta(self, blueprint_id: str, delta: int) -> None:
+        """Add delta copies of a blueprint to the aggregated reserve counts."""
+        self._remaining_total += delta
+        stats = self._card_stats.get(blueprint_id)
+        if not stats:
+            return
+        self._remaining_by_type[stats.card_type] += delta
+        self._power_by_type[stats.card_type] += stats.power * delta
+        self._remaining_by_destiny[stats.destiny] += delta
+        self._destiny_sum += stats.destiny * delta
+        if stats.card_type in DEPLOYABLE_TYPES:
+            self._deployable_by_cost[stats.deploy_cost] += delta
+
+    def _reserve_changed(self, blueprint_id: str) -> None:
+        """Zone listener: update reserve counts for one blueprint."""
+        new = self._count_remaining(blueprint_id)
+        old = self._remaining.get(blueprint_id, 0)
+        if new == old:
+            return
+        if new:
+            self._remaining[blueprint_id] = new
+        else:
+            del self._remaining[blueprint_id]
+        self._apply_remaining_delta(blueprint_id, new - old)
+
+    def _rebuild_reserve_counts(self) -> None:
+        """Recompute all reserve counts (after the deck list or card stats change)."""
+        self._remaining = {}
+        self._remaining_total = 0
+        self._remaining_by_type = defaultdict(int)
+        self._power_by_type = defaultdict(int)
+        self._remaining_by_destiny = defaultdict(int)
+        self._deployable_by_cost = defaultdict(int)
+        self._destiny_sum = 0
+        for blueprint_id in self.deck_list:
+            count = self._count_remaining(blueprint_id)
+            if count:
+                self._remaining[blueprint_id] = count
+                self._apply_remaining_delta(blueprint_id, count)
+
     # =========================================================================
     # ZONE TRANSITIONS
     # =========================================================================
@@ -360,27 +456,12 @@ class DeckTracker:
 
         Returns dict of blueprint_id -> estimated count remaining.
         """
-        remaining = dict(self.deck_list)
-
-        # Subtract known locations
-        for blueprint_id, count in self.hand.cards.items():
-            remaining[blueprint_id] = max(0, remaining.get(blueprint_id, 0) - count)
-        for blueprint_id, count in self.in_play.cards.items():
-            remaining[blueprint_id] = max(0, remaining.get(blueprint_id, 0) - count)
-        for blueprint_id, count in self.lost_pile.cards.items():
-            remaining[blueprint_id] = max(0, remaining.get(blueprint_id, 0) - count)
-        for blueprint_id, count in self.used_pile.cards.items():
-            remaining[blueprint_id] = max(0, remaining.get(blueprint_id, 0) - count)
-
-        # Remove zeros
-        return {k: v for k, v in remaining.items() if v > 0}
+        return dict(self._remaining)
 
     def get_reserve_count(self) -> int:
         """Get estimated number of cards in reserve deck."""
-        remaining = self.get_remaining_in_reserve()
         # Subtract force pile (which came from reserve)
-        total = sum(remaining.values()) - self.force_pile_count
-        return max(0, total)
+        return max(0, self._remaining_total - self.force_pile_count)
 
     # =========================================================================
     # PROBABILITY CALCULATIONS
@@ -404,18 +485,9 @@ class DeckTracker:
                 return 1.0 if stats.card_type == card_type else 0.0
 
         # Otherwise use probabilistic estimate
-        remaining = self.get_remaining_in_reserve()
-        remaining_total = sum(remaining.values())
-        if remaining_total <= 0:
+        if self._remaining_total <= 0:
             return 0.0
-
-        type_count = 0
-        for blueprint_id, count in remaining.items():
-            stats = self._card_stats.get(blueprint_id)
-            if stats and stats.card_type == card_type:
-                type_count += count
-
-        return type_count / remaining_total
+        return self._remaining_by_type.get(card_type, 0) / self._remaining_total
 
     def probability_draw_deployable(self, max_cost: int = 99) -> float:
         """
@@ -431,24 +503,16 @@ class DeckTracker:
             top_card = self.known_reserve_order[0]
             stats = self._card_stats.get(top_card)
             if stats:
-                deployable = stats.card_type in ("Character", "Starship", "Vehicle", "Device", "Weapon")
+                deployable = stats.card_type in DEPLOYABLE_TYPES
                 affordable = stats.deploy_cost <= max_cost
                 return 1.0 if (deployable and affordable) else 0.0
 
-        remaining = self.get_remaining_in_reserve()
-        remaining_total = sum(remaining.values())
-        if remaining_total <= 0:
+        if self._remaining_total <= 0:
             return 0.0
 
-        deployable_count = 0
-        deployable_types = {"Character", "Starship", "Vehicle", "Device", "Weapon"}
-
-        for blueprint_id, count in remaining.items():
-            stats = self._card_stats.get(blueprint_id)
-            if stats and stats.card_type in deployable_types and stats.deploy_cost <= max_cost:
-                deployable_count += count
-
-        return deployable_count / remaining_total
+        deployable_count = sum(count for cost, count in self._deployable_by_cost.items()
+                               if cost <= max_cost)
+        return deployable_count / self._remaining_total
 
     def probability_destiny_at_least(self, min_destiny: int) -> float:
         """
@@ -466,18 +530,12 @@ class DeckTracker:
             if stats:
                 return 1.0 if stats.destiny >= min_destiny else 0.0
 
-        remaining = self.get_remaining_in_reserve()
-        remaining_total = sum(remaining.values())
-        if remaining_total <= 0:
+        if self._remaining_total <= 0:
             return 0.0
 
-        good_destiny_count = 0
-        for blueprint_id, count in remaining.items():
-            stats = self._card_stats.get(blueprint_id)
-            if stats and stats.destiny >= min_destiny:
-                good_destiny_count += count
-
-        return good_destiny_count / remaining_total
+        good_destiny_count = sum(count for destiny, count in self._remaining_by_destiny.items()
+                                 if destiny >= min_destiny)
+        return good_destiny_count / self._remaining_total
 
     def expected_destiny(self) -> float:
         """
@@ -492,23 +550,14 @@ class DeckTracker:
             if stats:
                 return float(stats.destiny)
 
-        # Get cards in reserve + force pile (not in hand/play/lost/used)
-        remaining = self.get_remaining_in_reserve()
-        remaining_total = sum(remaining.values())
-
-        if remaining_total <= 0:
+        # Cards in reserve + force pile (not in hand/play/lost/used)
+        if self._remaining_total <= 0:
             return 0.0
 
         # Calculate average destiny of the pool (reserve + force pile)
         # Since force pile is a random sample from this pool, the expected
         # destiny of cards in reserve equals the pool average.
-        destiny_sum = 0.0
-        for blueprint_id, count in remaining.items():
-            stats = self._card_stats.get(blueprint_id)
-            if stats:
-                destiny_sum += stats.destiny * count
-
-        return destiny_sum / remaining_total
+        return self._destiny_sum / self._remaining_total
 
     def get_destiny_distribution(self) -> Dict[int, float]:
         """
@@ -517,18 +566,101 @@ class DeckTracker:
         Returns:
             Dict of destiny_value -> probability
         """
-        remaining = self.get_remaining_in_reserve()
-        remaining_total = sum(remaining.values())
-        if remaining_total <= 0:
+        if self._remaining_total <= 0:
             return {}
 
-        distribution: Dict[int, float] = defaultdict(float)
-        for blueprint_id, count in remaining.items():
-            stats = self._card_stats.get(blueprint_id)
-            if stats:
-                distribution[stats.destiny] += count / remaining_total
+        return {destiny: count / self._remaining_total
+                for destiny, count in self._remaining_by_destiny.items() if count > 0}
 
-        return dict(distribution)
+    # =========================================================================
+    # MULTI-DRAW PROBABILITIES (hypergeometric - draws without replacement)
+    # =========================================================================
+
+    def _known_top(self, draws: int) -> Tuple[List[str], List[str]]:
+        """
+        Known top cards covering the next draws, and every known reserve card.
+
+        Known cards are fixed in position, so the remaining draws come from
+        the pool with all known cards removed.
+        """
+        if self.knowledge_state == KnowledgeState.UNKNOWN or not self.known_reserve_order:
+            return [], []
+        known = [bp for bp in self.known_reserve_order if bp in self._remaining]
+        return known[:max(0, draws)], known
+
+    def _stats_type(self, blueprint_id: str) -> Optional[str]:
+        stats = self._card_stats.get(blueprint_id)
+        return stats.card_type if stats else None
+
+    def probability_type_in_draws(self, card_types: Union[str, Iterable[str]], draws: int,
+                                  at_least: int = 1) -> float:
+        """
+        Probability of drawing at least `at_least` cards of the given type(s)
+        in the next `draws` draws.
+
+        Example: probability_type_in_draws("Character", 3) -> P(a character in next 3 draws)
+
+        Args:
+            card_types: Card type or types ("Character", ["Character", "Vehicle"])
+            draws: Number of cards drawn
+            at_least: Minimum number of matching cards
+
+        Returns:
+            Probability 0.0 to 1.0
+        """
+        types = {card_types} if isinstance(card_types, str) else set(card_types)
+        if at_least <= 0:
+            return 1.0
+
+        top, known = self._known_top(draws)
+        hits = sum(1 for bp in top if self._stats_type(bp) in types)
+        draws -= len(top)
+
+        population = self._remaining_total - len(known)
+        successes = sum(self._remaining_by_type.get(t, 0) for t in types)
+        successes -= sum(1 for bp in known if self._stats_type(bp) in types)
+        return _hypergeometric_at_least(population, max(0, successes), draws, at_least - hits)
+
+    def destiny_sum_distribution(self, draws: int) -> Dict[int, float]:
+        """
+        Exact distribution of the sum of the next `draws` destiny draws.
+
+        Draws are without replacement from the remaining cards with known
+        destiny (multivariate hypergeometric over destiny values).
+
+        Example: destiny_sum_distribution(2) -> {0: 0.01, 1: 0.03, ..., 12: 0.02}
+
+        Returns:
+            Dict of destiny_total -> probability (empty if not enough cards)
+        """
+        top, known = self._known_top(draws)
+        fixed = sum(self._card_stats[bp].destiny for bp in top if bp in self._card_stats)
+        draws -= len(top)
+
+        counts = dict(self._remaining_by_destiny)
+        for bp in known:
+            stats = self._card_stats.get(bp)
+            if stats and counts.get(stats.destiny, 0) > 0:
+                counts[stats.destiny] -= 1
+
+        population = sum(count for count in counts.values() if count > 0)
+        if draws < 0 or draws > population:
+            return {}
+
+        # ways[(cards_taken, destiny_sum)] = number of combinations
+        ways: Dict[Tuple[int, int], int] = {(0, 0): 1}
+        for destiny, count in counts.items():
+            if count <= 0:
+                continue
+            extended: Dict[Tuple[int, int], int] = defaultdict(int)
+            for (taken, total), n in ways.items():
+                for k in range(0, min(count, draws - taken) + 1):
+                    extended[(taken + k, total + destiny * k)] += n * comb(count, k)
+            ways = extended
+
+        denominator = comb(population, draws)
+        return {fixed + total: n / denominator for (taken, total), n in ways.items()
+                if taken == draws}
 
     # =========================================================================
     # STRATEGIC QUERIES
@@ -559,23 +691,19 @@ class DeckTracker:
 
     def get_remaining_composition(self) -> Dict[str, int]:
         """Get count of each card type remaining in reserve."""
-        remaining = self.get_remaining_in_reserve()
-        composition: Dict[str, int] = defaultdict(int)
-        for blueprint_id, count in remaining.items():
-            stats = self._card_stats.get(blueprint_id)
-            if stats:
-                composition[stats.card_type] += count
-        return dict(composition)
+        return {card_type: count for card_type, count in self._remaining_by_type.items() if count > 0}
 
     def count_remaining_by_type(self, card_type: str) -> int:
         """Count how many cards of a type remain in reserve."""
-        remaining = self.get_remaining_in_reserve()
-        count = 0
-        for blueprint_id, num in remaining.items():
-            stats = self._card_stats.get(blueprint_id)
-            if stats and stats.card_type == card_type:
-                count += num
-        return count
+        return self._remaining_by_type.get(card_type, 0)
+
+    def average_remaining_power(self, card_types: Union[str, Iterable[str]]) -> Optional[float]:
+        """Average power of remaining cards of the given type(s), None if there are none."""
+        types = {card_types} if isinstance(card_types, str) else set(card_types)
+        count = sum(self._remaining_by_type.get(t, 0) for t in types)
+        if count <= 0:
+            return None
+        return sum(self._power_by_type.get(t, 0) for t in types) / count
 
     def get_top_card_if_known(self) -> Optional[CardStats]:
         """Get the top card of reserve if we have direct knowledge."""
@@ -634,6 +762,21 @@ class DeckTracker:
         return "\n".join(lines)
 
 
+def _hypergeometric_at_least(population: int, successes: int, draws: int, at_least: int) -> float:
+    """P(X >= at_least) for X ~ Hypergeometric(population, successes, draws)."""
+    if at_least <= 0:
+        return 1.0
+    draws = min(max(0, draws), max(0, population))
+    successes = min(successes, population)
+    if draws <= 0 or successes <= 0:
+        return 0.0
+    total = comb(population, draws)
+    p = 0.0
+    for k in range(at_least, min(successes, draws) + 1):
+        p += comb(successes, k) * comb(population - successes, draws - k) / total
+    return p
+
+
 # Singleton instance for the current game
 _tracker: Optional[DeckTracker] = None
 
@@ -642,7 +785,10 @@ DECK_BASE_PATH = "/mnt/ubuntu-lv/swccg/gemp/rando_cal_working/decks"
 
 
 def get_deck_tracker() -> DeckTracker:
-    """Get the global deck tracker instance."""
+    """Get the deck tracker for the current game session (or the global one)."""
+    session = current_session()
+    if session is not None:
+        return session.scoped('deck_tracker', DeckTracker)
     global _tracker
     if _tracker is None:
         _tracker = DeckTracker()
@@ -651,6 +797,9 @@ def get_deck_tracker() -> DeckTracker:
 
 def reset_deck_tracker() -> DeckTracker:
     """Reset the tracker for a new game."""
+    session = current_session()
+    if session is not None:
+        return session.set('deck_tracker', DeckTracker())
     global _tracker
     _tracker = DeckTracker()
     return _tracker
@@ -701,14 +850,21 @@ def initialize_deck_tracker(deck_name: str, my_side: str) -> bool:
     Returns:
         True if deck was loaded successfully
     """
-    global _tracker
-    _tracker = DeckTracker()
+    tracker = reset_deck_tracker()
+
+    # Precomputed at login (or on first use) - no directory scan or parsing
+    from engine.deck_profiles import get_deck_profile
+    profile = get_deck_profile(deck_name)
+    if profile:
+        tracker.load_profile(profile, my_side)
+        logger.info(f"📚 DeckTracker initialized with {deck_name} ({profile.total_cards} cards, cached profile)")
+        return True
 
     deck_path = find_deck_file(deck_name)
     if deck_path:
-        success = _tracker.load_deck(deck_path, my_side)
+        success = tracker.load_deck(deck_path, my_side)
         if success:
-            logger.info(f"📚 DeckTracker initialized with {deck_name} ({sum(_tracker.deck_list.values())} cards)")
+            logger.info(f"📚 DeckTracker initialized with {deck_name} ({sum(tracker.deck_list.values())} cards)")
             return True
         else:
             logger.warning(f"📚 DeckTracker: Failed to load deck from {deck_path}")
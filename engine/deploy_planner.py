@@ -22,12 +22,17 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional, Dict, Tuple, Set
 
-from engine.card_loader import get_card, is_matching_pilot_ship
-from engine.strategy_config import get_config
+from engine.card_loader import get_card
+from engine.board_summary import get_board_summary
+from engine.hand_snapshot import get_hand_snapshot, is_matching_pair
+from engine.strategy_config import get_config, section_reader
 from engine.monte_carlo import MonteCarloSimulator, SimulationResult, ExpectedValue
+from engine.lookahead import DEPLOY, LookaheadSearch, SearchAction, build_search_state
+from engine.speculative_planner import get_speculative_planner
+from engine.tracing import get_tracer
 # NOTE: GoalType was removed - hold penalty testing showed it hurt performance
 
-logger = logging.getLogger(__name__)
+logger = get_tracer('planner', logging.getLogger(__name__))
 
 
 # =============================================================================
@@ -35,17 +40,14 @@ logger = logging.getLogger(__name__)
 # All values loaded from JSON config with hardcoded fallback defaults
 # =============================================================================
 
-def _get_deploy_config(key: str, default):
-    """Get deploy strategy config value."""
-    return get_config().get('deploy_strategy', key, default)
+# _get_deploy_config(key, default) -> deploy strategy config value
+_get_deploy_config = section_reader('deploy_strategy')
 
-def _get_battle_config(key: str, default):
-    """Get battle strategy config value."""
-    return get_config().get('battle_strategy', key, default)
+# _get_battle_config(key, default) -> battle strategy config value
+_get_battle_config = section_reader('battle_strategy')
 
-def _get_contest_config(key: str, default):
-    """Get contest strategy config value."""
-    return get_config().get('contest_strategy', key, default)
+# _get_contest_config(key, default) -> contest strategy config value
+_get_contest_config = section_reader('contest_strategy')
 
 # Battle threshold - power advantage needed to feel comfortable battling
 def get_battle_favorable_threshold() -> int:
@@ -159,10 +161,7 @@ def _pilot_score_for_ship(pilot_dict: Dict, ship_dict: Dict) -> int:
     base_score = pilot_dict.get('power', 0)
 
     # Check for matching pilot/ship bonus
-    pilot_card = get_card(pilot_dict.get('blueprint_id', ''))
-    ship_card = get_card(ship_dict.get('blueprint_id', ''))
-
-    if pilot_card and ship_card and is_matching_pilot_ship(pilot_card, ship_card):
+    if is_matching_pair(pilot_dict.get('blueprint_id', ''), ship_dict.get('blueprint_id', '')):
         base_score += get_matching_pilot_bonus()
         logger.debug(f"   ⭐ Matching pilot bonus: {pilot_dict.get('name', '?')} + {ship_dict.get('name', '?')}")
 
@@ -244,10 +243,10 @@ def has_we_have_a_plan_restriction(board_state) -> bool:
                 # collapsed=False means front side ("We Have A Plan") is showing
                 # This is when the restriction is active
                 if not card.collapsed:
-                    logger.debug(f"📋 We Have A Plan restriction ACTIVE (not flipped)")
+                    logger.debug(lambda: f"📋 We Have A Plan restriction ACTIVE (not flipped)")
                     return True
                 else:
-                    logger.debug(f"📋 We Have A Plan flipped to 'They Will Be Lost And Confused' - no restriction")
+                    logger.debug(lambda: f"📋 We Have A Plan flipped to 'They Will Be Lost And Confused' - no restriction")
                     return False
 
     return False
@@ -556,7 +555,7 @@ class DeploymentPlan:
             # Check if any pilot is waiting to board this ship
             if inst.aboard_ship_blueprint_id == blueprint_id and inst.aboard_ship_card_id is None:
                 inst.aboard_ship_card_id = card_id
-                logger.info(f"📋 Plan updated: {inst.card_name} will board {card_name} (card_id={card_id})")
+                logger.info(lambda: f"📋 Plan updated: {inst.card_name} will board {card_name} (card_id={card_id})")
                 updated = True
 
             # Check if any card is waiting to deploy to this location
@@ -565,7 +564,7 @@ class DeploymentPlan:
                 if inst.target_location_blueprint_id and inst.target_location_blueprint_id == blueprint_id:
                     inst.target_location_id = card_id
                     inst.target_location_pending = False
-                    logger.info(f"📋 Plan updated: {inst.card_name} will deploy to {card_name} (card_id={card_id})")
+                    logger.info(lambda: f"📋 Plan updated: {inst.card_name} will deploy to {card_name} (card_id={card_id})")
                     updated = True
                 # Fallback to name matching if no blueprint_id
                 elif inst.target_location_name and not inst.target_location_blueprint_id:
@@ -574,7 +573,7 @@ class DeploymentPlan:
                         if card_name and inst.target_location_name.lower() in card_name.lower():
                             inst.target_location_id = card_id
                             inst.target_location_pending = False
-                            logger.info(f"📋 Plan updated: {inst.card_name} will deploy to {card_name} (card_id={card_id})")
+                            logger.info(lambda: f"📋 Plan updated: {inst.card_name} will deploy to {card_name} (card_id={card_id})")
                             updated = True
 
         return updated
@@ -719,6 +718,19 @@ class DeployPhasePlanner:
         else:
             self.monte_carlo = None
 
+        # Lookahead search for re-ranking the top plans
+        lookahead_config = get_config().get_section('lookahead')
+        self.lookahead_enabled = lookahead_config.get('enabled', False)
+        self.lookahead_top_n = lookahead_config.get('plan_top_n', 3)
+        self.lookahead_plan_weight = lookahead_config.get('plan_weight', 50.0)
+        self.lookahead = LookaheadSearch(lookahead_config) if self.lookahead_enabled else None
+
+        # Plans precomputed during the opponent's turn (see speculative_planner)
+        self.use_speculation = True
+        speculative = get_speculative_planner()
+        if speculative.enabled:
+            speculative.register_planner(deploy_threshold, battle_force_reserve)
+
     def reset(self):
         """Reset planner state for a new game. Call this when game starts."""
         logger.info("📋 Deploy planner reset for new game")
@@ -855,7 +867,7 @@ class DeployPhasePlanner:
             # Need favorable threshold advantage for CRUSH
             power_needed_for_crush = enemy_power + get_battle_favorable_threshold()
 
-            logger.debug(f"🔮 Checking {loc.name}: enemy={enemy_power}, need {power_needed_for_crush} for crush")
+            logger.debug(lambda: f"🔮 Checking {loc.name}: enemy={enemy_power}, need {power_needed_for_crush} for crush")
 
             # Option 1: Vehicle + pilot combo (ground locations only)
             if loc.is_ground and not loc.is_interior:
@@ -890,7 +902,7 @@ class DeployPhasePlanner:
                         # Score: advantage * 10 + location value (their_icons)
                         score = advantage * 10 + loc.their_icons * 15
 
-                        logger.debug(f"🔮   Vehicle combo: {v_name}+{p_name} = {total_power} power, "
+                        logger.debug(lambda: f"🔮   Vehicle combo: {v_name}+{p_name} = {total_power} power, "
                                    f"cost {total_cost}, advantage +{advantage}, score {score}")
 
                         if score > best_score:
@@ -1033,7 +1045,7 @@ class DeployPhasePlanner:
             # Need at least +1 advantage to beat them (stop the bleed)
             power_needed = enemy_power + 1
 
-            logger.debug(f"🩸🔮 Checking bleed at {loc.name}: enemy={enemy_power}, icons={icons_at_stake}, need {power_needed} to stop")
+            logger.debug(lambda: f"🩸🔮 Checking bleed at {loc.name}: enemy={enemy_power}, icons={icons_at_stake}, need {power_needed} to stop")
 
             # For ground bleed locations - check characters
             if loc.is_ground:
@@ -1060,7 +1072,7 @@ class DeployPhasePlanner:
                     # Score: icons saved × 20 (matches STOP BLEEDING scoring) + advantage bonus
                     score = icons_at_stake * 20 + advantage * 5
 
-                    logger.debug(f"🩸🔮   Character: {c_name} = {c_power} power, "
+                    logger.debug(lambda: f"🩸🔮   Character: {c_name} = {c_power} power, "
                                f"cost {c_cost}, advantage +{advantage}, score {score}")
 
                     if score > best_score:
@@ -1107,7 +1119,7 @@ class DeployPhasePlanner:
                     advantage = s_power - enemy_power
                     score = icons_at_stake * 20 + advantage * 5
 
-                    logger.debug(f"🩸🔮   Starship: {s_name} = {s_power} power, "
+                    logger.debug(lambda: f"🩸🔮   Starship: {s_name} = {s_power} power, "
                                f"cost {s_cost}, advantage +{advantage}, score {score}")
 
                     if score > best_score:
@@ -1321,7 +1333,7 @@ class DeployPhasePlanner:
                 'is_starship': metadata.is_starship,
                 'is_vehicle': metadata.is_vehicle,
             })
-            logger.info(f"🛳️ Found ship with pilot capacity: {metadata.title} (#{card_id}) at {location_name or 'unknown'} "
+            logger.info(lambda: f"🛳️ Found ship with pilot capacity: {metadata.title} (#{card_id}) at {location_name or 'unknown'} "
                        f"[{pilots_aboard}/{capacity} pilots, {remaining} slots open]")
 
         return ships_with_capacity
@@ -1372,11 +1384,11 @@ class DeployPhasePlanner:
                 # Check the appropriate domain
                 if is_space and loc.is_space:
                     has_contested = True
-                    logger.debug(f"   📊 Contested space found: {loc.name} ({loc.my_power} vs {loc.their_power})")
+                    logger.debug(lambda: f"   📊 Contested space found: {loc.name} ({loc.my_power} vs {loc.their_power})")
                     break
                 elif not is_space and loc.is_ground:
                     has_contested = True
-                    logger.debug(f"   📊 Contested ground found: {loc.name} ({loc.my_power} vs {loc.their_power})")
+                    logger.debug(lambda: f"   📊 Contested ground found: {loc.name} ({loc.my_power} vs {loc.their_power})")
                     break
 
             if not has_contested:
@@ -1389,11 +1401,11 @@ class DeployPhasePlanner:
                     # Check enemy power in the relevant domain
                     if is_space and loc.is_space and loc.their_power >= get_react_threat_threshold():
                         has_react_threat = True
-                        logger.debug(f"   ⚠️ React threat in space: {loc.name} has {loc.their_power} enemy power")
+                        logger.debug(lambda: f"   ⚠️ React threat in space: {loc.name} has {loc.their_power} enemy power")
                         break
                     elif not is_space and loc.is_ground and loc.their_power >= get_react_threat_threshold():
                         has_react_threat = True
-                        logger.debug(f"   ⚠️ React threat on ground: {loc.name} has {loc.their_power} enemy power")
+                        logger.debug(lambda: f"   ⚠️ React threat on ground: {loc.name} has {loc.their_power} enemy power")
                         break
 
                 if has_react_threat:
@@ -1494,16 +1506,16 @@ class DeployPhasePlanner:
                 if loc.their_power <= low_enemy_threshold:
                     bleed_locations.append(loc)
                     domain = "space" if loc.is_space else "ground"
-                    logger.debug(f"   🩸 BLEED ({domain}, contestable): {loc.name} - opponent drains {loc.my_icons} icons, enemy power {loc.their_power}")
+                    logger.debug(lambda: f"   🩸 BLEED ({domain}, contestable): {loc.name} - opponent drains {loc.my_icons} icons, enemy power {loc.their_power}")
                 else:
                     domain = "space" if loc.is_space else "ground"
-                    logger.debug(f"   🩸 BLEED ({domain}, high threat): {loc.name} - opponent drains {loc.my_icons} icons, enemy power {loc.their_power}")
+                    logger.debug(lambda: f"   🩸 BLEED ({domain}, high threat): {loc.name} - opponent drains {loc.my_icons} icons, enemy power {loc.their_power}")
 
             # We drain opponent: we have presence, they don't
             # We drain for THEIR icons (their_icons)
             if loc.my_power > 0 and loc.their_power == 0 and loc.their_icons > 0:
                 our_drain += loc.their_icons
-                logger.debug(f"   💧 DRAIN: {loc.name} - we drain {loc.their_icons} icons")
+                logger.debug(lambda: f"   💧 DRAIN: {loc.name} - we drain {loc.their_icons} icons")
 
         drain_gap = our_drain - their_drain
 
@@ -1580,29 +1592,18 @@ class DeployPhasePlanner:
         # Determine what card types we need
         if domain == "ground":
             needed_types = ["Character", "Vehicle"]
-            p_draw_needed = tracker.probability_draw_type("Character") + tracker.probability_draw_type("Vehicle")
         else:  # space
             needed_types = ["Starship"]
-            p_draw_needed = tracker.probability_draw_type("Starship")
 
         # Calculate expected power from drawing
-        remaining = tracker.get_remaining_in_reserve()
-        total_needed_power = 0
-        needed_count = 0
-        for bp_id, count in remaining.items():
-            stats = tracker._card_stats.get(bp_id)
-            if stats and stats.card_type in needed_types:
-                total_needed_power += stats.power * count
-                needed_count += count
-
-        avg_power_if_draw = total_needed_power / needed_count if needed_count > 0 else 0
+        avg_power_if_draw = tracker.average_remaining_power(needed_types) or 0
 
         # Calculate expected draws this turn (force pile size, up to 6)
         max_draws = min(force_pile, 6)
 
         # Probability of drawing at least one needed card in max_draws attempts
-        # P(at least 1) = 1 - P(none)^draws
-        p_at_least_one = 1.0 - ((1.0 - p_draw_needed) ** max_draws) if p_draw_needed > 0 else 0.0
+        # (hypergeometric - draws are without replacement)
+        p_at_least_one = tracker.probability_type_in_draws(needed_types, max_draws)
 
         # Expected power gain from holding
         expected_power_gain = p_at_least_one * avg_power_if_draw
@@ -1778,7 +1779,7 @@ class DeployPhasePlanner:
                 if target_loc.their_power > 0:
                     power_ratio = card_power / target_loc.their_power
                     if power_ratio < 0.4:
-                        logger.debug(f"      🩸 Skipping {card['name']} - {card_power}p is suicide vs enemy {target_loc.their_power}p ({power_ratio:.0%})")
+                        logger.debug(lambda: f"      🩸 Skipping {card['name']} - {card_power}p is suicide vs enemy {target_loc.their_power}p ({power_ratio:.0%})")
                         continue
 
                 # Create "STOP BLEEDING" instruction
@@ -1818,7 +1819,7 @@ class DeployPhasePlanner:
 
                 plans.append((instructions, force_remaining, score))
 
-                logger.debug(f"      🩸 PRESENCE ({domain}) plan: {card['name']} → {target_loc.name} "
+                logger.debug(lambda: f"      🩸 PRESENCE ({domain}) plan: {card['name']} → {target_loc.name} "
                            f"(save {icons_at_stake}, power {card_power}{', risky -' + str(risk_penalty) if is_risky else ''}, score={score:.0f})")
 
         if plans:
@@ -2201,7 +2202,7 @@ class DeployPhasePlanner:
                 if target_loc.my_icons > 0:
                     # They're draining us for our icons - contesting stops this!
                     deny_drain_bonus = target_loc.my_icons * 20
-                    logger.debug(f"   🛡️ DENY DRAIN at {target_loc.name}: +{deny_drain_bonus} "
+                    logger.debug(lambda: f"   🛡️ DENY DRAIN at {target_loc.name}: +{deny_drain_bonus} "
                                f"(prevent drain of {target_loc.my_icons} icons)")
 
                 # WINNING BONUS: When we WIN, we get control and can drain their icons!
@@ -2210,7 +2211,7 @@ class DeployPhasePlanner:
                 if power_advantage > 0 and target_loc.their_icons > 0:
                     # When we win, we'll drain their icons like at an empty location
                     win_control_bonus = target_loc.their_icons * 15
-                    logger.debug(f"   🎯 WIN CONTROL at {target_loc.name}: +{win_control_bonus} "
+                    logger.debug(lambda: f"   🎯 WIN CONTROL at {target_loc.name}: +{win_control_bonus} "
                                f"(will drain {target_loc.their_icons} icons)")
 
                 if power_advantage >= get_battle_favorable_threshold():
@@ -2218,7 +2219,7 @@ class DeployPhasePlanner:
                     # This is a true "crush" - give big bonus
                     crush_bonus = 50 + (power_advantage * 10) + deny_drain_bonus + win_control_bonus
                     score += crush_bonus
-                    logger.debug(f"   💥 FAVORABLE FIGHT at {target_loc.name}: +{crush_bonus} "
+                    logger.debug(lambda: f"   💥 FAVORABLE FIGHT at {target_loc.name}: +{crush_bonus} "
                                f"({our_power} vs {target_loc.their_power}, +{power_advantage} advantage)")
                 elif power_advantage > 0:
                     # MARGINAL FIGHT: We'd win but it's risky (+1 to +3)
@@ -2229,13 +2230,13 @@ class DeployPhasePlanner:
                     # Increase base from 10 to 25 to make winning more attractive than establishing
                     marginal_bonus = 25 + (power_advantage * 5) + deny_drain_bonus + win_control_bonus
                     score += marginal_bonus
-                    logger.debug(f"   ⚠️ MARGINAL FIGHT at {target_loc.name}: +{marginal_bonus} "
+                    logger.debug(lambda: f"   ⚠️ MARGINAL FIGHT at {target_loc.name}: +{marginal_bonus} "
                                f"({our_power} vs {target_loc.their_power}, only +{power_advantage})")
                 else:
                     # LOSING FIGHT: We don't beat them
                     # But contesting still denies force drain!
                     score += 5 + deny_drain_bonus
-                    logger.debug(f"   ❌ LOSING at {target_loc.name}: +{5 + deny_drain_bonus} (contest only)")
+                    logger.debug(lambda: f"   ❌ LOSING at {target_loc.name}: +{5 + deny_drain_bonus} (contest only)")
 
                 # =================================================================
                 # BARRIER CARD AWARENESS (34% of decks have Barrier)
@@ -2248,13 +2249,13 @@ class DeployPhasePlanner:
                     # Single card deployment to contested - vulnerable to Barrier
                     barrier_risk = -15.0
                     score += barrier_risk
-                    logger.debug(f"   🚧 BARRIER RISK at {target_loc.name}: {barrier_risk} "
+                    logger.debug(lambda: f"   🚧 BARRIER RISK at {target_loc.name}: {barrier_risk} "
                                f"(single card vulnerable)")
                 elif cards_here >= 2:
                     # Multiple cards - even if one Barriered, others can battle
                     barrier_resilience = 10.0 * (cards_here - 1)  # +10 for each extra card
                     score += barrier_resilience
-                    logger.debug(f"   🛡️ BARRIER RESILIENCE at {target_loc.name}: +{barrier_resilience} "
+                    logger.debug(lambda: f"   🛡️ BARRIER RESILIENCE at {target_loc.name}: +{barrier_resilience} "
                                f"({cards_here} cards - Barrier can't stop all)")
 
                     # =================================================================
@@ -2269,7 +2270,7 @@ class DeployPhasePlanner:
                         advantage_factor = power_advantage - get_battle_favorable_threshold() + 1
                         commitment_bonus = advantage_factor * 10.0 * (cards_here - 1)
                         score += commitment_bonus
-                        logger.debug(f"   ⚔️ BATTLE COMMITMENT at {target_loc.name}: +{commitment_bonus} "
+                        logger.debug(lambda: f"   ⚔️ BATTLE COMMITMENT at {target_loc.name}: +{commitment_bonus} "
                                    f"({cards_here} cards, +{power_advantage} advantage)")
 
                 # =================================================================
@@ -2283,7 +2284,7 @@ class DeployPhasePlanner:
                     # Can draw destiny - bonus for battle advantage
                     ability_bonus = 25.0
                     score += ability_bonus
-                    logger.debug(f"   🎯 CAN DRAW DESTINY at {target_loc.name}: +{ability_bonus} "
+                    logger.debug(lambda: f"   🎯 CAN DRAW DESTINY at {target_loc.name}: +{ability_bonus} "
                                f"(ability {our_ability} >= {ABILITY_THRESHOLD})")
                 else:
                     # Can't draw destiny - penalty proportional to our power investment
@@ -2291,7 +2292,7 @@ class DeployPhasePlanner:
                     # resources that can't defend themselves via destiny
                     ability_penalty = -20.0 - (our_power * 2)
                     score += ability_penalty
-                    logger.debug(f"   ⚠️ NO DESTINY at {target_loc.name}: {ability_penalty} "
+                    logger.debug(lambda: f"   ⚠️ NO DESTINY at {target_loc.name}: {ability_penalty} "
                                f"(ability {our_ability} < {ABILITY_THRESHOLD}, vulnerable!)")
 
             else:
@@ -2311,7 +2312,7 @@ class DeployPhasePlanner:
                 if target_loc.their_icons > 0:
                     offensive_bonus = target_loc.their_icons * 15
                     establish_bonus += offensive_bonus
-                    logger.debug(f"   ⚔️ OFFENSIVE VALUE at {target_loc.name}: +{offensive_bonus} "
+                    logger.debug(lambda: f"   ⚔️ OFFENSIVE VALUE at {target_loc.name}: +{offensive_bonus} "
                                f"(drain {target_loc.their_icons} icons)")
 
                 # DEFENSIVE VALUE: Protect our icons from opponent drain
@@ -2321,11 +2322,11 @@ class DeployPhasePlanner:
                 if target_loc.my_icons > 0:
                     defensive_bonus = target_loc.my_icons * 15
                     establish_bonus += defensive_bonus
-                    logger.debug(f"   🛡️ DEFENSIVE VALUE at {target_loc.name}: +{defensive_bonus} "
+                    logger.debug(lambda: f"   🛡️ DEFENSIVE VALUE at {target_loc.name}: +{defensive_bonus} "
                                f"(protect {target_loc.my_icons} of our icons)")
 
                 score += establish_bonus
-                logger.debug(f"   ✅ ESTABLISH CONTROL at {target_loc.name}: +{establish_bonus} "
+                logger.debug(lambda: f"   ✅ ESTABLISH CONTROL at {target_loc.name}: +{establish_bonus} "
                            f"({our_power} power, {target_loc.their_icons} their icons, {target_loc.my_icons} our icons)")
 
                 # =================================================================
@@ -2352,13 +2353,13 @@ class DeployPhasePlanner:
                     # Ideal: both power and ability
                     ability_bonus = 25.0
                     score += ability_bonus
-                    logger.info(f"   🎯 STRONG DEFENSIBLE ESTABLISH at {target_loc.name}: +{ability_bonus} "
+                    logger.info(lambda: f"   🎯 STRONG DEFENSIBLE ESTABLISH at {target_loc.name}: +{ability_bonus} "
                                f"({our_power} power + ability {our_ability} = very safe)")
                 elif has_ability:
                     # Good: can draw destiny if challenged
                     ability_bonus = 15.0
                     score += ability_bonus
-                    logger.info(f"   🎯 DEFENSIBLE ESTABLISH at {target_loc.name}: +{ability_bonus} "
+                    logger.info(lambda: f"   🎯 DEFENSIBLE ESTABLISH at {target_loc.name}: +{ability_bonus} "
                                f"(ability {our_ability} >= {ABILITY_THRESHOLD}, can draw destiny)")
                 elif has_strong_power:
                     # Moderate risk: 5+ power without ability >= 4
@@ -2422,7 +2423,7 @@ class DeployPhasePlanner:
                         reinforce_bonus += location_value * 5
 
                         score += reinforce_bonus
-                        logger.debug(f"   🏰 MID-LATE REINFORCE at {target_loc.name}: +{reinforce_bonus} "
+                        logger.debug(lambda: f"   🏰 MID-LATE REINFORCE at {target_loc.name}: +{reinforce_bonus} "
                                    f"(turn {turn_number}, {existing_power} -> {new_total_power} power, "
                                    f"target {get_reinforce_target_power()})")
 
@@ -2654,6 +2655,56 @@ class DeployPhasePlanner:
 
         return result
 
+    def _apply_lookahead(
+        self,
+        valid_plans: List[Tuple],
+        locations: List['LocationAnalysis'],
+        board_state
+    ) -> List[Tuple]:
+        """
+        Re-rank the top N plans by the lookahead value of committing to them.
+
+        Each plan becomes a line of deploy actions on the search model; the
+        search then plays on through the opponent's reply. The plan score is
+        adjusted by plan_weight x value (value is in [-1, 1]).
+
+        Args:
+            valid_plans: List of (plan_type, instructions, force_left, score, reserve)
+            locations: Analyzed locations
+            board_state: Current board state
+
+        Returns:
+            Re-sorted list of plans
+        """
+        root = build_search_state(board_state)
+        index_by_id = {loc.card_id: loc.location_index for loc in locations}
+
+        top_n = min(self.lookahead_top_n, len(valid_plans))
+        rescored = []
+        for plan_type, instructions, force_left, score, reserve in valid_plans[:top_n]:
+            line = []
+            hand = list(root.hand)
+            for inst in instructions:
+                loc_idx = index_by_id.get(inst.target_location_id, -1)
+                card_idx = next((i for i, card in enumerate(hand)
+                                 if card.blueprint_id == inst.card_blueprint_id), None)
+                if loc_idx < 0 or card_idx is None:
+                    continue  # Location cards and cards that add no power in the model
+                line.append(SearchAction(DEPLOY, location=loc_idx, card=card_idx))
+                hand.pop(card_idx)
+
+            result = self.lookahead.evaluate_line(root, line)
+            adjusted = score + self.lookahead_plan_weight * result.value
+            logger.info(lambda: f"🔭 Lookahead {plan_type}: {score:.0f} -> {adjusted:.0f} "
+                       f"({result.describe(root)})")
+            rescored.append((plan_type, instructions, force_left, adjusted, reserve))
+
+        rescored.sort(key=lambda x: x[3], reverse=True)
+        if rescored[0][0] != valid_plans[0][0]:
+            logger.info(f"🔭 Lookahead RERANKED: {valid_plans[0][0]} → {rescored[0][0]}")
+
+        return rescored + valid_plans[top_n:]
+
     def _log_monte_carlo_result(
         self,
         plan_type: str,
@@ -2673,7 +2724,8 @@ class DeployPhasePlanner:
 
         logger.info(f"🎲 MC: {plan_type} at {target}")
         logger.info(f"   Cards: {card_summary}")
-        logger.info(f"   Win rate: {sim_result.win_rate*100:.0f}% ({int(sim_result.win_rate*20)}/20)")
+        logger.info(f"   Win rate: {sim_result.win_rate*100:.0f}% ({int(sim_result.win_rate*20)}/20), "
+                   f"battle P(win) with destiny {sim_result.avg_win_probability*100:.0f}%")
         logger.info(f"   Margin: {sim_result.worst_case:+d} to {sim_result.best_case:+d} "
                    f"(avg {sim_result.avg_power_margin:+.1f}, p10={sim_result.percentile_10_margin:+d})")
 
@@ -3008,7 +3060,7 @@ class DeployPhasePlanner:
                     is_establishing = (existing_power == 0)
                     is_weak_char = (card['power'] <= weak_threshold)
                     if is_establishing and is_weak_char:
-                        logger.debug(f"   ⏭️ BUDDY: {card['name']} (power {card['power']}) needs buddy to establish at {target_loc.name}")
+                        logger.debug(lambda: f"   ⏭️ BUDDY: {card['name']} (power {card['power']}) needs buddy to establish at {target_loc.name}")
                         continue  # Skip single-card plan, multi-card plans still considered below
 
                 # Create a single-card plan
@@ -3200,7 +3252,7 @@ class DeployPhasePlanner:
                     force_remaining = force_budget - actual_combined_cost
                     score = self._score_plan(instructions, locations, self._current_turn)
                     plans.append((instructions, force_remaining, score))
-                    logger.debug(f"   🚗 Vehicle+pilot plan: {vehicle['name']} + {best_pilot['name']} at {target_loc.name} (power={actual_estimated_power}, cost={actual_combined_cost}, score={score:.0f})")
+                    logger.debug(lambda: f"   🚗 Vehicle+pilot plan: {vehicle['name']} + {best_pilot['name']} at {target_loc.name} (power={actual_estimated_power}, cost={actual_combined_cost}, score={score:.0f})")
 
         return plans
 
@@ -3221,7 +3273,7 @@ class DeployPhasePlanner:
             # Filter characters that can deploy to this location (respects deploy restrictions)
             eligible_chars = self._filter_cards_for_location(available_chars, loc.name)
             if not eligible_chars:
-                logger.debug(f"   ⏭️ No characters can deploy to {loc.name} (all restricted)")
+                logger.debug(lambda: f"   ⏭️ No characters can deploy to {loc.name} (all restricted)")
                 continue
 
             power_goal = max(MIN_ESTABLISH_POWER, loc.their_power + 1)
@@ -3286,7 +3338,7 @@ class DeployPhasePlanner:
                 ship_copy['power'] = ship.get('base_power', 0) + best_pilot_power
                 ship_copy['original_cost'] = ship['cost']  # Save original for actual deployment
                 ship_copy['cost'] = ship['cost'] + cheapest_pilot_cost  # Include pilot cost
-                logger.debug(f"   🚀 {ship['name']}: estimated piloted power={ship_copy['power']}, "
+                logger.debug(lambda: f"   🚀 {ship['name']}: estimated piloted power={ship_copy['power']}, "
                             f"combined cost={ship_copy['cost']} (ship {ship_copy['original_cost']} + pilot {cheapest_pilot_cost})")
             ships_with_estimated_power.append(ship_copy)
 
@@ -3302,7 +3354,7 @@ class DeployPhasePlanner:
             )
 
             if not cards_for_location or power_allocated < MIN_ESTABLISH_POWER:
-                logger.debug(f"   ⚠️ Space plan: couldn't meet {MIN_ESTABLISH_POWER} power at {loc.name} "
+                logger.debug(lambda: f"   ⚠️ Space plan: couldn't meet {MIN_ESTABLISH_POWER} power at {loc.name} "
                             f"(got {power_allocated} power)")
                 continue
 
@@ -3362,7 +3414,7 @@ class DeployPhasePlanner:
                             aboard_ship_blueprint_id=ship['blueprint_id'],
                             aboard_ship_card_id=None,  # Will be set when ship deploys
                         ))
-                        logger.info(f"   👨‍✈️ Plan: Deploy pilot {best_pilot['name']} aboard {ship['name']}")
+                        logger.info(lambda: f"   👨‍✈️ Plan: Deploy pilot {best_pilot['name']} aboard {ship['name']}")
                 elif ship.get('has_permanent_pilot') and available_pilots:
                     # Ship has permanent pilot but we can still add another pilot for extra power
                     affordable_pilots_here = [p for p in available_pilots if p['cost'] <= force_remaining]
@@ -3386,7 +3438,7 @@ class DeployPhasePlanner:
                             aboard_ship_blueprint_id=ship['blueprint_id'],
                             aboard_ship_card_id=None,  # Will be set when ship deploys
                         ))
-                        logger.info(f"   👨‍✈️ Plan: Deploy extra pilot {best_pilot['name']} aboard {ship['name']}")
+                        logger.info(lambda: f"   👨‍✈️ Plan: Deploy extra pilot {best_pilot['name']} aboard {ship['name']}")
 
         return instructions, force_remaining
 
@@ -3991,6 +4043,14 @@ class DeployPhasePlanner:
         if strategic_state and strategic_state.enabled:
             strategic_state.on_deploy_phase_start(board_state)
 
+        # === SPECULATIVE PLAN ===
+        # Serve a plan made during the opponent's turn if it was made on identical inputs
+        if self.use_speculation:
+            speculative_plan = get_speculative_planner().take(board_state)
+            if speculative_plan:
+                self.current_plan = speculative_plan
+                return speculative_plan
+
         # Log config values being used for this decision
         logger.info(f"📊 DEPLOY CONFIG: early_game_threshold={get_early_game_threshold()}, "
                    f"early_game_turns={get_early_game_turns()}, deploy_threshold={get_deploy_threshold()}, "
@@ -4045,7 +4105,7 @@ class DeployPhasePlanner:
         raw_hand = getattr(board_state, 'cards_in_hand', [])
         logger.info(f"   📊 Raw board_state: force_pile={board_state.force_pile}, "
                    f"cards_in_hand={len(raw_hand)}, turn={getattr(board_state, 'turn_number', '?')}")
-        if raw_hand:
+        if raw_hand and logger.enabled():
             logger.info(f"   🃏 Full hand ({len(raw_hand)} cards):")
             for i, c in enumerate(raw_hand):
                 # Get card metadata for power/deploy info
@@ -4228,7 +4288,7 @@ class DeployPhasePlanner:
         else:
             logger.debug(f"   📋 _get_all_deployable_cards returned {len(all_cards)} cards")
             for c in all_cards:
-                logger.debug(f"      - {c['name']}: is_char={c['is_character']}, is_ship={c['is_starship']}")
+                logger.debug(lambda: f"      - {c['name']}: is_char={c['is_character']}, is_ship={c['is_starship']}")
 
         locations_in_hand = [c for c in all_cards if c['is_location']]
 
@@ -4269,7 +4329,7 @@ class DeployPhasePlanner:
         if starships:
             for s in starships:
                 pilot_status = 'needs_pilot (0 power)' if s.get('needs_pilot') else f'has_pilot ({s["power"]} power)'
-                logger.info(f"   🚀 Starship: {s['name']} - {pilot_status}, cost={s['cost']}")
+                logger.info(lambda: f"   🚀 Starship: {s['name']} - {pilot_status}, cost={s['cost']}")
         else:
             logger.info(f"   ⚠️ No starships in hand!")
 
@@ -4294,7 +4354,7 @@ class DeployPhasePlanner:
                 loc_type = "GROUND(exterior)"
             else:
                 loc_type = "GROUND"
-            logger.info(f"      - {loc.name}: {loc_type}, my={loc.my_power}, their={loc.their_power}, my_icons={loc.my_icons}, their_icons={loc.their_icons}")
+            logger.info(lambda: f"      - {loc.name}: {loc_type}, my={loc.my_power}, their={loc.their_power}, my_icons={loc.my_icons}, their_icons={loc.their_icons}")
 
         # === LOG OPPONENT BOARD STATE SUMMARY ===
         self._log_opponent_board_summary(board_state, locations)
@@ -4347,7 +4407,7 @@ class DeployPhasePlanner:
                     deploy_cost=loc_card['cost'],
                 ))
                 force_remaining -= loc_card['cost']
-                logger.info(f"   📍 Plan: Deploy location {loc_card['name']} (cost {loc_card['cost']})")
+                logger.info(lambda: f"   📍 Plan: Deploy location {loc_card['name']} (cost {loc_card['cost']})")
 
                 # Create virtual LocationAnalysis for the newly deployed location
                 # so we can plan character deployments there in the same phase
@@ -4383,7 +4443,7 @@ class DeployPhasePlanner:
                             location_index=-1,  # No index yet
                         )
                         newly_deployed_locations.append(virtual_loc)
-                        logger.info(f"   📍 New location available for chars: {loc_card['name']} (our={my_icons}, their={their_icons} icons)")
+                        logger.info(lambda: f"   📍 New location available for chars: {loc_card['name']} (our={my_icons}, their={their_icons} icons)")
 
         # =================================================================
         # STEP 2: IDENTIFY CONTESTED LOCATIONS (reduce harm)
@@ -4406,9 +4466,10 @@ class DeployPhasePlanner:
         ]
 
         # Log any skipped flee locations
-        flee_locs = [loc for loc in locations if loc.should_flee]
-        for loc in flee_locs:
-            logger.info(f"   🏃 Skip reinforce at {loc.name}: will flee ({loc.power_differential} diff)")
+        if logger.enabled():
+            for loc in locations:
+                if loc.should_flee:
+                    logger.info(f"   🏃 Skip reinforce at {loc.name}: will flee ({loc.power_differential} diff)")
 
         # Sort: Battle opportunities first, then by severity (biggest deficit first)
         contested_ground.sort(key=lambda x: (not x.is_battle_opportunity, x.power_differential))
@@ -4505,7 +4566,7 @@ class DeployPhasePlanner:
             and not is_restricted_deployment_location(loc.name)  # Skip Dagobah/Ahch-To
         ]
         if attackable_space:
-            logger.info(f"   ⚔️ Attackable space: {[(loc.name, loc.their_power, loc.my_icons) for loc in attackable_space]}")
+            logger.info(lambda: f"   ⚔️ Attackable space: {[(loc.name, loc.their_power, loc.my_icons) for loc in attackable_space]}")
 
         # =================================================================
         # ATTACKABLE GROUND: STOP_BLEEDING locations with enemy presence
@@ -4528,7 +4589,7 @@ class DeployPhasePlanner:
             and not (whap_restriction and is_interior_naboo_site(loc.name, loc.is_interior))  # Skip interior Naboo if WHAP active
         ]
         if attackable_ground:
-            logger.info(f"   🩸 Attackable ground (STOP_BLEEDING): {[(loc.name, loc.their_power, loc.my_icons) for loc in attackable_ground]}")
+            logger.info(lambda: f"   🩸 Attackable ground (STOP_BLEEDING): {[(loc.name, loc.their_power, loc.my_icons) for loc in attackable_ground]}")
 
         # Sort by icons (most valuable first)
         # Primary: opponent icons (deny their force drain)
@@ -4549,9 +4610,9 @@ class DeployPhasePlanner:
         uncontested_space = uncontested_space[:max_establish]
 
         if uncontested_ground:
-            logger.info(f"   🎯 Ground targets (chars): {[loc.name for loc in uncontested_ground]}")
+            logger.info(lambda: f"   🎯 Ground targets (chars): {[loc.name for loc in uncontested_ground]}")
         if uncontested_space:
-            logger.info(f"   🚀 Space targets (starships): {[loc.name for loc in uncontested_space]}")
+            logger.info(lambda: f"   🚀 Space targets (starships): {[loc.name for loc in uncontested_space]}")
 
         # =================================================================
         # STEP 3B: CALCULATE FORCE DRAIN ECONOMY
@@ -4665,7 +4726,7 @@ class DeployPhasePlanner:
                                 can_deploy = True
                                 break
                     if not can_deploy:
-                        logger.debug(f"   ⛔ {char['name']} cannot deploy to {loc.name} (restricted to {restrictions})")
+                        logger.debug(lambda: f"   ⛔ {char['name']} cannot deploy to {loc.name} (restricted to {restrictions})")
                         continue  # Skip this character for this location
                 location_chars.append(char)
 
@@ -4681,13 +4742,13 @@ class DeployPhasePlanner:
                     # Already at or above threshold, skip
                     continue
                 log_tag = "WEAK"
-                logger.info(f"   🔧 {log_tag}: {loc.name} (have {loc.my_power}, need +{power_needed} to reach {ground_threshold})")
+                logger.info(lambda: f"   🔧 {log_tag}: {loc.name} (have {loc.my_power}, need +{power_needed} to reach {ground_threshold})")
             else:
                 # Contested: need to beat enemy
                 deficit = abs(loc.power_differential)
                 power_needed = deficit + get_battle_favorable_threshold()  # Want to reach favorable
                 log_tag = "BATTLE OPP" if loc.is_battle_opportunity else "Contested"
-                logger.info(f"   ⚔️ {log_tag}: {loc.name} ({loc.my_power} vs {loc.their_power}, need +{power_needed})")
+                logger.info(lambda: f"   ⚔️ {log_tag}: {loc.name} ({loc.my_power} vs {loc.their_power}, need +{power_needed})")
 
                 # === UNREACHABLE TARGET CHECK ===
                 # Skip STOP_BLEEDING locations where we can't possibly win
@@ -4702,11 +4763,11 @@ class DeployPhasePlanner:
                 if loc.my_power == 0 and power_needed > location_char_power + destiny_margin:
                     if is_early_game_establish:
                         # Early game: still try to establish presence, but note the disadvantage
-                        logger.info(f"   ⚠️ HARD TARGET: {loc.name} needs +{power_needed} but only {location_char_power} deployable - will try anyway (early game)")
+                        logger.info(lambda: f"   ⚠️ HARD TARGET: {loc.name} needs +{power_needed} but only {location_char_power} deployable - will try anyway (early game)")
                         # Reduce power_needed to just establish presence, not win immediately
                         power_needed = max(4, location_char_power)  # Deploy what we can
                     else:
-                        logger.info(f"   ⏭️ UNREACHABLE: {loc.name} needs +{power_needed} but only {location_char_power} deployable (+{destiny_margin} destiny) - skipping")
+                        logger.info(lambda: f"   ⏭️ UNREACHABLE: {loc.name} needs +{power_needed} but only {location_char_power} deployable (+{destiny_margin} destiny) - skipping")
                         continue
 
             # Find OPTIMAL combination of cards within budget
@@ -4722,7 +4783,7 @@ class DeployPhasePlanner:
             )
 
             if not cards_for_location:
-                logger.info(f"   ⏭️ No affordable cards for {loc.name}")
+                logger.info(lambda: f"   ⏭️ No affordable cards for {loc.name}")
                 continue
 
             # CRITICAL: For NEW attacks (attackable_ground where my_power=0), verify we can actually WIN
@@ -4744,12 +4805,12 @@ class DeployPhasePlanner:
                         # Severe drain deficit at high-value location AND low life - deploy anyway!
                         # Even losing a battle saves (icons × turns) life force from drains
                         icons_to_save = loc.my_icons
-                        logger.info(f"   🩸 PRESENCE DEPLOY: Can't beat {loc.name}: {new_total_power} vs {loc.their_power}, "
+                        logger.info(lambda: f"   🩸 PRESENCE DEPLOY: Can't beat {loc.name}: {new_total_power} vs {loc.their_power}, "
                                    f"but drain_gap={drain_gap}, life={life_force}, saving {icons_to_save} drain/turn - worth it!")
                         is_presence_deploy = True  # Mark as presence deploy
                     else:
                         # Not desperate enough or low-value location - skip
-                        logger.info(f"   ⏭️ Can't beat {loc.name}: {new_total_power} vs {loc.their_power}, skipping")
+                        logger.info(lambda: f"   ⏭️ Can't beat {loc.name}: {new_total_power} vs {loc.their_power}, skipping")
                         continue
                 elif new_total_power == loc.their_power:
                     # We can MATCH but not beat - check if we can draw destiny
@@ -4759,25 +4820,25 @@ class DeployPhasePlanner:
 
                     if can_draw_destiny:
                         # Can draw destiny - ~50% chance to win, worth it for high-icon locations
-                        logger.info(f"   ⚔️ Will TIE at {loc.name}: {new_total_power} vs {loc.their_power}, "
+                        logger.info(lambda: f"   ⚔️ Will TIE at {loc.name}: {new_total_power} vs {loc.their_power}, "
                                    f"but CAN draw destiny (ability={total_ability}) - worth the gamble!")
                     elif loc.my_icons >= 1 and drain_gap < 0:
                         # Can't draw destiny BUT tying STOPS THEIR DRAIN!
                         # At a TIE, NEITHER side controls → NEITHER side drains
                         # This is VALUABLE when we're being drained (drain_gap < 0)
                         icons_to_save = loc.my_icons
-                        logger.info(f"   🩸 TIE TO STOP DRAIN at {loc.name}: {new_total_power} vs {loc.their_power}, "
+                        logger.info(lambda: f"   🩸 TIE TO STOP DRAIN at {loc.name}: {new_total_power} vs {loc.their_power}, "
                                    f"can't win but TIE stops their {icons_to_save} drain/turn (drain_gap={drain_gap})")
                         is_presence_deploy = True  # Mark as presence deploy since we're not trying to win
                     else:
                         # Not being drained OR no icons to save - skip
-                        logger.info(f"   ⏭️ Can only tie {loc.name}: {new_total_power} vs {loc.their_power}, "
+                        logger.info(lambda: f"   ⏭️ Can only tie {loc.name}: {new_total_power} vs {loc.their_power}, "
                                    f"can't draw destiny (ability={total_ability}), drain_gap={drain_gap}, skipping")
                         continue
 
             # Log the selected combination
             card_names = [c['name'] for c in cards_for_location]
-            logger.info(f"   📊 Optimal combo: {card_names} = {power_allocated} power for {cost_used} Force")
+            logger.info(lambda: f"   📊 Optimal combo: {card_names} = {power_allocated} power for {cost_used} Force")
 
             # Update remaining budget and available cards
             force_remaining -= cost_used
@@ -4812,7 +4873,7 @@ class DeployPhasePlanner:
                     deploy_cost=char['cost'],
                 ))
                 emoji = "🔧" if is_weak_presence else ("⚔️" if loc.is_battle_opportunity else "🛡️")
-                logger.info(f"   {emoji} Plan: Deploy {char['name']} ({char['power']} power, {char['cost']} cost) to {loc.name}")
+                logger.info(lambda: f"   {emoji} Plan: Deploy {char['name']} ({char['power']} power, {char['cost']} cost) to {loc.name}")
 
         # =================================================================
         # STEP 4B: ALLOCATE STARSHIPS TO CONTESTED/WEAK SPACE LOCATIONS
@@ -4874,20 +4935,20 @@ class DeployPhasePlanner:
                     # Already at or above threshold, skip
                     continue
                 log_tag = "WEAK SPACE"
-                logger.info(f"   🔧 {log_tag}: {loc.name} (have {loc.my_power}, need +{power_needed} to reach {space_threshold})")
+                logger.info(lambda: f"   🔧 {log_tag}: {loc.name} (have {loc.my_power}, need +{power_needed} to reach {space_threshold})")
             else:
                 # Contested: need to beat enemy
                 deficit = abs(loc.power_differential)
                 power_needed = deficit + get_battle_favorable_threshold()  # Want to reach favorable
                 log_tag = "BATTLE OPP" if loc.is_battle_opportunity else "Contested"
-                logger.info(f"   🚀 {log_tag}: {loc.name} ({loc.my_power} vs {loc.their_power}, need +{power_needed})")
+                logger.info(lambda: f"   🚀 {log_tag}: {loc.name} ({loc.my_power} vs {loc.their_power}, need +{power_needed})")
 
                 # === UNREACHABLE TARGET CHECK (SPACE) ===
                 # Skip STOP_BLEEDING locations where we can't possibly win
                 available_ship_power = sum(s['power'] for s in available_ships)
                 destiny_margin = 4  # Average destiny draw advantage
                 if loc.my_power == 0 and power_needed > available_ship_power + destiny_margin:
-                    logger.info(f"   ⏭️ UNREACHABLE SPACE: {loc.name} needs +{power_needed} but only {available_ship_power} deployable (+{destiny_margin} destiny) - skipping")
+                    logger.info(lambda: f"   ⏭️ UNREACHABLE SPACE: {loc.name} needs +{power_needed} but only {available_ship_power} deployable (+{destiny_margin} destiny) - skipping")
                     continue
 
             # Find OPTIMAL combination of starships within budget
@@ -4903,7 +4964,7 @@ class DeployPhasePlanner:
             )
 
             if not ships_for_location:
-                logger.info(f"   ⏭️ No affordable starships for {loc.name}")
+                logger.info(lambda: f"   ⏭️ No affordable starships for {loc.name}")
                 continue
 
             # CRITICAL: For NEW attacks (attackable_space where my_power=0), verify we can actually WIN
@@ -4919,12 +4980,12 @@ class DeployPhasePlanner:
                     if drain_gap <= -2 and loc.my_icons >= 2 and life_force < 25:
                         # Severe drain deficit at high-value location AND low life - deploy anyway!
                         icons_to_save = loc.my_icons
-                        logger.info(f"   🩸 PRESENCE DEPLOY: Can't beat {loc.name}: {new_total_power} vs {loc.their_power}, "
+                        logger.info(lambda: f"   🩸 PRESENCE DEPLOY: Can't beat {loc.name}: {new_total_power} vs {loc.their_power}, "
                                    f"but drain_gap={drain_gap}, life={life_force}, saving {icons_to_save} drain/turn - worth it!")
                         is_presence_deploy = True  # Mark as presence deploy
                     else:
                         # Not desperate enough or low-value location - skip
-                        logger.info(f"   ⏭️ Can't beat {loc.name}: {new_total_power} vs {loc.their_power}, skipping")
+                        logger.info(lambda: f"   ⏭️ Can't beat {loc.name}: {new_total_power} vs {loc.their_power}, skipping")
                         continue
                 elif new_total_power == loc.their_power:
                     # We can MATCH but not beat - check if we can draw destiny
@@ -4935,24 +4996,24 @@ class DeployPhasePlanner:
 
                     if can_draw_destiny:
                         # Can draw destiny - ~50% chance to win, worth it for high-icon locations
-                        logger.info(f"   ⚔️ Will TIE at {loc.name}: {new_total_power} vs {loc.their_power}, "
+                        logger.info(lambda: f"   ⚔️ Will TIE at {loc.name}: {new_total_power} vs {loc.their_power}, "
                                    f"but CAN draw destiny (ability={total_ability}) - worth the gamble!")
                     elif loc.my_icons >= 1 and drain_gap < 0:
                         # Can't draw destiny BUT tying STOPS THEIR DRAIN!
                         # At a TIE, NEITHER side controls → NEITHER side drains
                         icons_to_save = loc.my_icons
-                        logger.info(f"   🩸 TIE TO STOP DRAIN at {loc.name}: {new_total_power} vs {loc.their_power}, "
+                        logger.info(lambda: f"   🩸 TIE TO STOP DRAIN at {loc.name}: {new_total_power} vs {loc.their_power}, "
                                    f"can't win but TIE stops their {icons_to_save} drain/turn (drain_gap={drain_gap})")
                         is_presence_deploy = True
                     else:
                         # Not being drained OR no icons to save - skip
-                        logger.info(f"   ⏭️ Can only tie {loc.name}: {new_total_power} vs {loc.their_power}, "
+                        logger.info(lambda: f"   ⏭️ Can only tie {loc.name}: {new_total_power} vs {loc.their_power}, "
                                    f"can't draw destiny (ability={total_ability}), drain_gap={drain_gap}, skipping")
                         continue
 
             # Log the selected combination
             ship_names = [s['name'] for s in ships_for_location]
-            logger.info(f"   📊 Optimal starship combo: {ship_names} = {power_allocated} power for {cost_used} Force")
+            logger.info(lambda: f"   📊 Optimal starship combo: {ship_names} = {power_allocated} power for {cost_used} Force")
 
             # Update remaining budget and available ships
             force_remaining -= cost_used
@@ -4984,7 +5045,7 @@ class DeployPhasePlanner:
                     deploy_cost=ship['cost'],
                 ))
                 emoji = "🔧" if is_weak_presence else "🚀"
-                logger.info(f"   {emoji} Plan: Deploy {ship['name']} ({ship['power']} power, {ship['cost']} cost) to {loc.name}")
+                logger.info(lambda: f"   {emoji} Plan: Deploy {ship['name']} ({ship['power']} power, {ship['cost']} cost) to {loc.name}")
 
         # =================================================================
         # STEP 5: COMPARE GROUND vs SPACE PLANS
@@ -5041,7 +5102,7 @@ class DeployPhasePlanner:
         for new_loc in newly_deployed_locations:
             if new_loc.is_ground and new_loc.is_site and new_loc.their_icons > 0:
                 char_ground_targets.append(new_loc)
-                logger.info(f"   📍 Added newly deployed location as target: {new_loc.name}")
+                logger.info(lambda: f"   📍 Added newly deployed location as target: {new_loc.name}")
 
         # GAMEPLAN INTEGRATION: Ensure priority locations from goals are included
         # This connects GamePlan strategic goals to target selection
@@ -5060,7 +5121,7 @@ class DeployPhasePlanner:
             if loc.card_id in priority_location_ids and loc.card_id not in existing_target_ids:
                 if loc.is_ground and loc.is_site and loc.my_icons > 0:
                     char_ground_targets.insert(0, loc)  # High priority - add at front
-                    logger.info(f"   🎯 Added GamePlan priority target: {loc.name}")
+                    logger.info(lambda: f"   🎯 Added GamePlan priority target: {loc.name}")
 
         # Log why locations were excluded
         excluded_space = [loc.name for loc in locations if loc.is_space and not loc.is_ground]
@@ -5074,7 +5135,7 @@ class DeployPhasePlanner:
 
         if char_ground_targets:
             # Log with both offensive (their_icons) and defensive (my_icons) values
-            logger.info(f"   🎯 Ground targets: {[(loc.name, f'our:{loc.my_icons}', f'their:{loc.their_icons}', f'pwr:{loc.their_power}') for loc in char_ground_targets]}")
+            logger.info(lambda: f"   🎯 Ground targets: {[(loc.name, f'our:{loc.my_icons}', f'their:{loc.their_icons}', f'pwr:{loc.their_power}') for loc in char_ground_targets]}")
 
         # Include contested/crushable ground locations for character reinforcement
         # These have our presence AND enemy presence - we can deploy to CRUSH them!
@@ -5093,7 +5154,7 @@ class DeployPhasePlanner:
         for loc in crushable_ground:
             if loc not in char_ground_targets:
                 char_ground_targets.insert(0, loc)  # Contested locations first (higher priority)
-                logger.info(f"   ⚔️ Crushable ground: {loc.name} ({loc.my_power} vs {loc.their_power})")
+                logger.info(lambda: f"   ⚔️ Crushable ground: {loc.name} ({loc.my_power} vs {loc.their_power})")
 
         # Include FRIENDLY uncontested ground locations for reinforcement
         # These have our presence but NO enemy presence - good for:
@@ -5117,7 +5178,7 @@ class DeployPhasePlanner:
         for loc in reinforceable_ground:
             if loc not in char_ground_targets:
                 char_ground_targets.append(loc)  # Lower priority - append to end
-                logger.info(f"   🏰 Reinforceable friendly: {loc.name} (my power: {loc.my_power}, enemy icons: {loc.their_icons})")
+                logger.info(lambda: f"   🏰 Reinforceable friendly: {loc.name} (my power: {loc.my_power}, enemy icons: {loc.their_icons})")
 
         # Include contested/crushable space locations for starship reinforcement
         # These have our presence (can deploy via presence rule even without icons)
@@ -5139,13 +5200,13 @@ class DeployPhasePlanner:
         for loc in attackable_space:
             if loc not in space_targets:
                 space_targets.insert(0, loc)  # Attackable locations first (battle opportunity!)
-                logger.info(f"   ⚔️ Attackable space: {loc.name} (enemy has {loc.their_power} power)")
+                logger.info(lambda: f"   ⚔️ Attackable space: {loc.name} (enemy has {loc.their_power} power)")
 
         # Add crushable space locations (we're there, enemy is there, not overkill)
         for loc in crushable_space:
             if loc not in space_targets:
                 space_targets.insert(0, loc)  # Contested locations also high priority
-                logger.info(f"   ⚔️ Crushable space: {loc.name} ({loc.my_power} vs {loc.their_power})")
+                logger.info(lambda: f"   ⚔️ Crushable space: {loc.name} ({loc.my_power} vs {loc.their_power})")
 
         # Add reinforceable space locations (we control, no enemy, could add more ships)
         # This allows deploying piloted ships to locations we already control but aren't at overkill
@@ -5163,16 +5224,16 @@ class DeployPhasePlanner:
         for loc in reinforceable_space:
             if loc not in space_targets:
                 space_targets.append(loc)  # Lower priority - append to end
-                logger.info(f"   🏰 Reinforceable space: {loc.name} (my power: {loc.my_power}, enemy icons: {loc.their_icons})")
+                logger.info(lambda: f"   🏰 Reinforceable space: {loc.name} (my power: {loc.my_power}, enemy icons: {loc.their_icons})")
 
         # Add newly deployed space locations as targets (uncontested, enemy icons)
         for new_loc in newly_deployed_locations:
             if new_loc.is_space and new_loc.their_icons > 0:
                 space_targets.append(new_loc)
-                logger.info(f"   📍 Added newly deployed space location as target: {new_loc.name}")
+                logger.info(lambda: f"   📍 Added newly deployed space location as target: {new_loc.name}")
 
         if space_targets:
-            logger.info(f"   🚀 Space targets: {[(loc.name, loc.their_icons, loc.their_power) for loc in space_targets]}")
+            logger.info(lambda: f"   🚀 Space targets: {[(loc.name, loc.their_icons, loc.their_power) for loc in space_targets]}")
 
         # Identify ALL pilots (any character with pilot ability can fly ships)
         # Pure pilots (pilot but not warrior) are BEST aboard ships but all can pilot
@@ -5206,7 +5267,7 @@ class DeployPhasePlanner:
                 ]
 
                 if not affordable_pilots_for_ship:
-                    logger.info(f"      ⏭️ No affordable pilots for {ship['name']}")
+                    logger.info(lambda: f"      ⏭️ No affordable pilots for {ship['name']}")
                     continue
 
                 # Score each pilot for this ship and pick the best
@@ -5250,7 +5311,7 @@ class DeployPhasePlanner:
                 force_left_after = force_remaining - best_pilot['cost']
 
                 all_repilot_plans.append(([instruction], force_left_after, base_score))
-                logger.info(f"      🔧 RE-PILOT plan: {best_pilot['name']} → {ship['name']} "
+                logger.info(lambda: f"      🔧 RE-PILOT plan: {best_pilot['name']} → {ship['name']} "
                            f"(score={base_score:.0f}, cost={best_pilot['cost']}, power={total_power})")
 
         # =================================================================
@@ -5272,7 +5333,7 @@ class DeployPhasePlanner:
                 ]
 
                 if not affordable_pilots_for_ship:
-                    logger.info(f"      ⏭️ No affordable pilots for {ship['name']}")
+                    logger.info(lambda: f"      ⏭️ No affordable pilots for {ship['name']}")
                     continue
 
                 # Score each pilot for this ship and pick the best
@@ -5330,7 +5391,7 @@ class DeployPhasePlanner:
                 force_left_after = force_remaining - best_pilot['cost']
 
                 all_addpilot_plans.append(([instruction], force_left_after, base_score))
-                logger.info(f"      👨‍✈️ ADD-PILOT plan: {best_pilot['name']} → {ship['name']} "
+                logger.info(lambda: f"      👨‍✈️ ADD-PILOT plan: {best_pilot['name']} → {ship['name']} "
                            f"(score={base_score:.0f}, +{power_boost} power, cost={best_pilot['cost']})")
 
         # =================================================================
@@ -5344,7 +5405,7 @@ class DeployPhasePlanner:
         # by earlier steps. Step 5 generates INDEPENDENT plans for comparison.
         # Pass ALL pilots (not just pure) for vehicle+pilot combos - any pilot can drive!
         # Log final target list for debugging (includes crushable locations added after initial log)
-        logger.info(f"   🎯 Final ground targets for planning: {[loc.name for loc in char_ground_targets]}")
+        logger.info(lambda: f"   🎯 Final ground targets for planning: {[loc.name for loc in char_ground_targets]}")
         all_ground_plans = self._generate_all_ground_plans(
             characters.copy(), vehicles.copy(), char_ground_targets, force_remaining, locations, all_pilots,
             ground_threshold=ground_threshold, contest_advantage=contest_advantage
@@ -5380,7 +5441,7 @@ class DeployPhasePlanner:
             uncovered_bleed = [loc for loc in bleed_locations if loc.name not in normal_plan_targets]
 
             if uncovered_bleed:
-                logger.info(f"   🩸 BLEED LOCATIONS without normal plans: {[loc.name for loc in uncovered_bleed]}")
+                logger.info(lambda: f"   🩸 BLEED LOCATIONS without normal plans: {[loc.name for loc in uncovered_bleed]}")
                 all_presence_plans = self._generate_presence_only_plans(
                     characters.copy(), vehicles.copy(), uncovered_bleed, force_remaining, locations,
                     pilots=all_pilots, starships=starships.copy()
@@ -5407,7 +5468,7 @@ class DeployPhasePlanner:
                     reason_type = "CRUSH"
                 elif "Reinforce" in instructions[0].reason:
                     reason_type = "reinforce"
-            logger.info(f"      GROUND {i+1}: {cards} → {target} ({reason_type}) score={score:.0f}, cost={cost}")
+            logger.info(lambda: f"      GROUND {i+1}: {cards} → {target} ({reason_type}) score={score:.0f}, cost={cost}")
 
         for i, (instructions, force_left, score) in enumerate(all_space_plans):
             cost = force_remaining - force_left
@@ -5421,7 +5482,7 @@ class DeployPhasePlanner:
                     reason_type = "CONTEST"
                 elif "Reinforce" in instructions[0].reason:
                     reason_type = "reinforce"
-            logger.info(f"      SPACE {i+1}: {cards} → {target} ({reason_type}) score={score:.0f}, cost={cost}")
+            logger.info(lambda: f"      SPACE {i+1}: {cards} → {target} ({reason_type}) score={score:.0f}, cost={cost}")
 
         for i, (instructions, force_left, score) in enumerate(all_repilot_plans):
             cost = force_remaining - force_left
@@ -5431,13 +5492,13 @@ class DeployPhasePlanner:
             if target and target.startswith("aboard:"):
                 parts = target.split(":", 2)
                 target = parts[2] if len(parts) > 2 else target
-            logger.info(f"      RE-PILOT {i+1}: {cards} → aboard {target} score={score:.0f}, cost={cost}")
+            logger.info(lambda: f"      RE-PILOT {i+1}: {cards} → aboard {target} score={score:.0f}, cost={cost}")
 
         for i, (instructions, force_left, score) in enumerate(all_presence_plans):
             cost = force_remaining - force_left
             cards = [inst.card_name for inst in instructions]
             target = instructions[0].target_location_name if instructions else "?"
-            logger.info(f"      🩸 PRESENCE {i+1}: {cards} → {target} (STOP BLEEDING) score={score:.0f}, cost={cost}")
+            logger.info(lambda: f"      🩸 PRESENCE {i+1}: {cards} → {target} (STOP BLEEDING) score={score:.0f}, cost={cost}")
 
         for i, (instructions, force_left, score) in enumerate(all_addpilot_plans):
             cost = force_remaining - force_left
@@ -5447,7 +5508,7 @@ class DeployPhasePlanner:
             if target and target.startswith("aboard:"):
                 parts = target.split(":", 2)
                 target = parts[2] if len(parts) > 2 else target
-            logger.info(f"      🛳️ ADD-PILOT {i+1}: {cards} → aboard {target} score={score:.0f}, cost={cost}")
+            logger.info(lambda: f"      🛳️ ADD-PILOT {i+1}: {cards} → aboard {target} score={score:.0f}, cost={cost}")
 
         # =================================================================
         # STEP 5B: GENERATE COMBINED GROUND+SPACE PLANS
@@ -5536,7 +5597,7 @@ class DeployPhasePlanner:
             for i, (_, instructions, force_left, score) in enumerate(combined_plans[:3]):
                 cost = force_remaining - force_left
                 cards = [inst.card_name for inst in instructions]
-                logger.info(f"      COMBINED {i+1}: {cards} -> score={score:.0f}, cost={cost}")
+                logger.info(lambda: f"      COMBINED {i+1}: {cards} -> score={score:.0f}, cost={cost}")
 
         # =================================================================
         # STEP 5B-2: COMBINE SAME-DOMAIN PLANS FOR MULTI-LOCATION ESTABLISHMENT
@@ -5579,7 +5640,7 @@ class DeployPhasePlanner:
                             # One plan is a CRUSH - prefer committing to battle over spreading
                             # Give NO bonus for splitting forces away from a crush opportunity
                             multi_loc_bonus = 0
-                            logger.debug(f"   ⚔️ Multi-ground: No bonus (one plan is CRUSH)")
+                            logger.debug(lambda: f"   ⚔️ Multi-ground: No bonus (one plan is CRUSH)")
                         else:
                             # Neither is a crush - normal bonus for spreading control
                             multi_loc_bonus = 30
@@ -5625,7 +5686,7 @@ class DeployPhasePlanner:
                         if s1_is_crush or s2_is_crush:
                             # One plan is a CRUSH - prefer committing to battle
                             multi_loc_bonus = 0
-                            logger.debug(f"   ⚔️ Multi-space: No bonus (one plan is CRUSH)")
+                            logger.debug(lambda: f"   ⚔️ Multi-space: No bonus (one plan is CRUSH)")
                         else:
                             multi_loc_bonus = 30
 
@@ -5666,7 +5727,7 @@ class DeployPhasePlanner:
                     actual_force_left = total_force - plan_cost - plan_reserve
                     valid_plans.append((plan_type, instructions, actual_force_left, score, plan_reserve))
                 else:
-                    logger.debug(f"   ⏭️ Plan {plan_type} rejected: cost {plan_cost} + reserve {plan_reserve} > {total_force}")
+                    logger.debug(lambda: f"   ⏭️ Plan {plan_type} rejected: cost {plan_cost} + reserve {plan_reserve} > {total_force}")
 
             if not valid_plans:
                 logger.info(f"   ⏭️ All {len(all_plans)} plans rejected due to reserve requirements")
@@ -5685,10 +5746,18 @@ class DeployPhasePlanner:
                         valid_plans, locations, all_cards, board_state
                     )
 
+                # =================================================================
+                # LOOKAHEAD SEARCH (optional)
+                # Value each top plan by searching our remaining turn and the
+                # opponent's reply after committing to it.
+                # =================================================================
+                if self.lookahead and len(valid_plans) > 1:
+                    valid_plans = self._apply_lookahead(valid_plans, locations, board_state)
+
                 best_type, best_instructions, best_force_left, best_score, best_reserve = valid_plans[0]
 
                 # === LOG ALL CANDIDATE PLANS FOR ANALYSIS ===
-                if len(valid_plans) > 1:
+                if len(valid_plans) > 1 and logger.enabled():
                     logger.info(f"   📊 PLAN COMPARISON ({len(valid_plans)} candidates):")
                     for i, (ptype, pinst, pforce, pscore, preserve) in enumerate(valid_plans):
                         marker = "→" if i == 0 else " "
@@ -5706,8 +5775,9 @@ class DeployPhasePlanner:
                         logger.info(f"      {marker} {ptype.upper()}: {card_summary} → {target} ({reason_type}) score={pscore:.0f}")
 
                 logger.info(f"   ✅ CHOSE {best_type.upper()} PLAN (score {best_score:.0f}, reserve {best_reserve})")
-                for inst in best_instructions:
-                    logger.info(f"      - {inst.card_name} -> {inst.target_location_name} ({inst.power_contribution} power)")
+                if logger.enabled():
+                    for inst in best_instructions:
+                        logger.info(f"      - {inst.card_name} -> {inst.target_location_name} ({inst.power_contribution} power)")
 
                 # =================================================================
                 # EARLY GAME HOLD-BACK CHECK
@@ -6051,17 +6121,10 @@ class DeployPhasePlanner:
                         p_ship = tracker.probability_draw_type("Starship")
                         expected_destiny = tracker.expected_destiny()
 
-                        # Get average power of characters/ships in remaining deck
-                        remaining = tracker.get_remaining_in_reserve()
-                        total_char_power = 0
-                        char_count = 0
-                        for bp_id, count in remaining.items():
-                            stats = tracker._card_stats.get(bp_id)
-                            if stats and stats.card_type == "Character":
-                                total_char_power += stats.power * count
-                                char_count += count
-
-                        avg_char_power = total_char_power / char_count if char_count > 0 else 3.0
+                        # Get average power of characters in remaining deck
+                        avg_char_power = tracker.average_remaining_power("Character")
+                        if avg_char_power is None:
+                            avg_char_power = 3.0
 
                         # Estimate: if we draw and get a character with power > current plan's average
                         current_avg_power = sum(
@@ -6159,7 +6222,7 @@ class DeployPhasePlanner:
                                     power_contribution=best_ship['power'],
                                     deploy_cost=best_ship['cost'],
                                 ))
-                                logger.info(f"   🚀 AFTER RE-PILOT: Deploy {best_ship['name']} to {loc.name}")
+                                logger.info(lambda: f"   🚀 AFTER RE-PILOT: Deploy {best_ship['name']} to {loc.name}")
                                 force_remaining -= best_ship['cost']
                                 piloted_ships.remove(best_ship)
                                 deployed_any = True
@@ -6212,7 +6275,7 @@ class DeployPhasePlanner:
                                     power_contribution=best_ship['power'],
                                     deploy_cost=best_ship['cost'],
                                 ))
-                                logger.info(f"   🚀 CROSS-DOMAIN: Deploy {best_ship['name']} to {loc.name}")
+                                logger.info(lambda: f"   🚀 CROSS-DOMAIN: Deploy {best_ship['name']} to {loc.name}")
                                 force_remaining -= best_ship['cost']
                                 piloted_ships.remove(best_ship)
                                 break  # One location per cross-domain for now
@@ -6248,7 +6311,7 @@ class DeployPhasePlanner:
                                         power_contribution=char['power'],
                                         deploy_cost=char['cost'],
                                     ))
-                                    logger.info(f"   🎭 CROSS-DOMAIN: Deploy {char['name']} to {loc.name}")
+                                    logger.info(lambda: f"   🎭 CROSS-DOMAIN: Deploy {char['name']} to {loc.name}")
                                     if char in available_chars:
                                         available_chars.remove(char)
                                 force_remaining -= cost_used
@@ -6264,7 +6327,7 @@ class DeployPhasePlanner:
         # These are pilots that weren't used in the chosen ground/space plan
         available_pilot_chars = [c for c in available_chars if c.get('is_pilot')]
         if available_pilot_chars:
-            logger.info(f"   👨‍✈️ Available pilots for vehicles: {[p['name'] for p in available_pilot_chars]}")
+            logger.info(lambda: f"   👨‍✈️ Available pilots for vehicles: {[p['name'] for p in available_pilot_chars]}")
 
         # Create pilot+vehicle combos for unpiloted vehicles
         piloted_combos = []  # List of {vehicle, pilot, combined_power, combined_cost}
@@ -6287,7 +6350,7 @@ class DeployPhasePlanner:
                     'cost': combined_cost,
                     'name': f"{vehicle['name']} + {best_pilot['name']}",
                 })
-                logger.info(f"   👨‍✈️ Combo: {vehicle['name']} + {best_pilot['name']} = {combined_power} power, {combined_cost} cost")
+                logger.info(lambda: f"   👨‍✈️ Combo: {vehicle['name']} + {best_pilot['name']} = {combined_power} power, {combined_cost} cost")
                 available_reserved.remove(best_pilot)
                 available_vehicles.remove(vehicle)
 
@@ -6313,7 +6376,7 @@ class DeployPhasePlanner:
         if interior_only:
             logger.info(f"   ⛔ Interior-only locations (no vehicles): {interior_only}")
 
-        logger.info(f"   🎯 Ground targets for vehicles (exterior): {[loc.name for loc in ground_targets]}")
+        logger.info(lambda: f"   🎯 Ground targets for vehicles (exterior): {[loc.name for loc in ground_targets]}")
 
         # Deploy piloted combos (vehicle + pilot together)
         # Uses ground_threshold since vehicles deploy to ground locations
@@ -6337,7 +6400,7 @@ class DeployPhasePlanner:
                 vehicle = best_combo['vehicle']
                 pilot = best_combo['pilot']
 
-                logger.info(f"   🚗+👨‍✈️ Plan: Deploy {vehicle['name']} + {pilot['name']} ({best_combo['power']} power, {best_combo['cost']} cost) to {loc.name}")
+                logger.info(lambda: f"   🚗+👨‍✈️ Plan: Deploy {vehicle['name']} + {pilot['name']} ({best_combo['power']} power, {best_combo['cost']} cost) to {loc.name}")
 
                 # Add vehicle to plan
                 plan.instructions.append(DeploymentInstruction(
@@ -6393,7 +6456,7 @@ class DeployPhasePlanner:
                         power_contribution=vehicle['power'],
                         deploy_cost=vehicle['cost'],
                     ))
-                    logger.info(f"   🚗 Plan: Deploy {vehicle['name']} ({vehicle['power']} power) to {loc.name}")
+                    logger.info(lambda: f"   🚗 Plan: Deploy {vehicle['name']} ({vehicle['power']} power) to {loc.name}")
                     force_remaining -= vehicle['cost']
                     piloted_vehicles.remove(vehicle)
                     break
@@ -6443,7 +6506,7 @@ class DeployPhasePlanner:
                                 power_contribution=vehicle['power'],
                                 deploy_cost=vehicle['cost'],
                             ))
-                            logger.info(f"   💪 PILE ON: Deploy {vehicle['name']} ({vehicle['power']} power) to {loc.name}")
+                            logger.info(lambda: f"   💪 PILE ON: Deploy {vehicle['name']} ({vehicle['power']} power) to {loc.name}")
                             force_remaining -= vehicle['cost']
                             piloted_vehicles.remove(vehicle)
 
@@ -6465,7 +6528,7 @@ class DeployPhasePlanner:
                                 power_contribution=char['power'],
                                 deploy_cost=char['cost'],
                             ))
-                            logger.info(f"   💪 PILE ON: Deploy {char['name']} ({char['power']} power) to {loc.name}")
+                            logger.info(lambda: f"   💪 PILE ON: Deploy {char['name']} ({char['power']} power) to {loc.name}")
                             force_remaining -= char['cost']
                             available_chars.remove(char)
 
@@ -6506,7 +6569,7 @@ class DeployPhasePlanner:
                 # Use appropriate threshold for location type
                 loc_threshold = space_threshold if loc.is_space else ground_threshold
                 if planned_power >= loc_threshold + 4:
-                    logger.debug(f"   ⏭️ Skip {loc.name}: already well-fortified ({planned_power} power)")
+                    logger.debug(lambda: f"   ⏭️ Skip {loc.name}: already well-fortified ({planned_power} power)")
                     continue
 
                 # Deploy additional characters (ground locations only)
@@ -6529,7 +6592,7 @@ class DeployPhasePlanner:
                                 power_contribution=char['power'],
                                 deploy_cost=char['cost'],
                             ))
-                            logger.info(f"   🛡️ REINFORCE: Deploy {char['name']} ({char['power']} power) to {loc.name}")
+                            logger.info(lambda: f"   🛡️ REINFORCE: Deploy {char['name']} ({char['power']} power) to {loc.name}")
                             force_remaining -= char['cost']
                             available_chars.remove(char)
 
@@ -6562,11 +6625,11 @@ class DeployPhasePlanner:
             starship_weapons = [w for w in targeted_weapons if w.get('weapon_target_type') == 'starship']
 
             if char_weapons:
-                logger.info(f"      Character weapons: {[w['name'] for w in char_weapons]}")
+                logger.info(lambda: f"      Character weapons: {[w['name'] for w in char_weapons]}")
             if vehicle_weapons:
-                logger.info(f"      Vehicle weapons: {[w['name'] for w in vehicle_weapons]}")
+                logger.info(lambda: f"      Vehicle weapons: {[w['name'] for w in vehicle_weapons]}")
             if starship_weapons:
-                logger.info(f"      Starship weapons: {[w['name'] for w in starship_weapons]}")
+                logger.info(lambda: f"      Starship weapons: {[w['name'] for w in starship_weapons]}")
 
             # Find locations where we have or WILL HAVE presence
             # Priority order: attack locations (we're deploying there) > existing presence
@@ -6591,7 +6654,7 @@ class DeployPhasePlanner:
                     if char_info and char_info.get('is_warrior'):
                         loc_id = inst.target_location_id
                         warriors_at_location[loc_id] = warriors_at_location.get(loc_id, 0) + 1
-                        logger.debug(f"      Warrior in plan: {inst.card_name} -> {inst.target_location_name}")
+                        logger.debug(lambda: f"      Warrior in plan: {inst.card_name} -> {inst.target_location_name}")
 
             # Count existing warriors at locations (from board state)
             # CRITICAL: Only count warriors that DON'T already have weapons attached!
@@ -6609,11 +6672,11 @@ class DeployPhasePlanner:
                                     for ac in card.attached_cards
                                 )
                                 if has_weapon:
-                                    logger.debug(f"      Skip warrior {card.card_title} - already has weapon")
+                                    logger.debug(lambda: f"      Skip warrior {card.card_title} - already has weapon")
                                     continue
                                 loc_id = locations[loc_idx].card_id
                                 warriors_at_location[loc_id] = warriors_at_location.get(loc_id, 0) + 1
-                                logger.debug(f"      Available warrior: {card.card_title} at loc {loc_idx}")
+                                logger.debug(lambda: f"      Available warrior: {card.card_title} at loc {loc_idx}")
 
             if warriors_at_location:
                 logger.info(f"      Warriors available: {warriors_at_location}")
@@ -6632,7 +6695,7 @@ class DeployPhasePlanner:
                     if vehicle_info:
                         loc_id = inst.target_location_id
                         vehicles_at_location[loc_id] = vehicles_at_location.get(loc_id, 0) + 1
-                        logger.debug(f"      Vehicle in plan: {inst.card_name} -> {inst.target_location_name}")
+                        logger.debug(lambda: f"      Vehicle in plan: {inst.card_name} -> {inst.target_location_name}")
 
             # Count existing vehicles at locations (from board state)
             # Only count vehicles that DON'T already have vehicle weapons attached!
@@ -6650,11 +6713,11 @@ class DeployPhasePlanner:
                                     for ac in card.attached_cards
                                 )
                                 if has_weapon:
-                                    logger.debug(f"      Skip vehicle {card.card_title} - already has weapon")
+                                    logger.debug(lambda: f"      Skip vehicle {card.card_title} - already has weapon")
                                     continue
                                 loc_id = locations[loc_idx].card_id
                                 vehicles_at_location[loc_id] = vehicles_at_location.get(loc_id, 0) + 1
-                                logger.debug(f"      Available vehicle: {card.card_title} at loc {loc_idx}")
+                                logger.debug(lambda: f"      Available vehicle: {card.card_title} at loc {loc_idx}")
 
             if vehicles_at_location:
                 logger.info(f"      Vehicles available: {vehicles_at_location}")
@@ -6704,13 +6767,13 @@ class DeployPhasePlanner:
                             for char_name in available_char_names:
                                 if match_lower in char_name:
                                     has_matching_char = True
-                                    logger.debug(f"      {weapon['name']} matches character: {char_name}")
+                                    logger.debug(lambda: f"      {weapon['name']} matches character: {char_name}")
                                     break
                             if has_matching_char:
                                 break
 
                         if not has_matching_char:
-                            logger.info(f"   ⏭️ Skip {weapon['name']}: no matching character (needs: {matching_chars[:3]}...)")
+                            logger.info(lambda: f"   ⏭️ Skip {weapon['name']}: no matching character (needs: {matching_chars[:3]}...)")
                             continue
 
                     # Find a location with a valid target for this weapon type
@@ -6728,7 +6791,7 @@ class DeployPhasePlanner:
                                 target_loc = loc
                                 break
                             else:
-                                logger.debug(f"      Skip {loc.name}: no available warriors ({available_warriors} warriors, {allocated_weapons} weapons allocated)")
+                                logger.debug(lambda: f"      Skip {loc.name}: no available warriors ({available_warriors} warriors, {allocated_weapons} weapons allocated)")
                         elif weapon_type == 'vehicle' and loc.is_ground and loc.is_exterior:
                             # CRITICAL: Vehicle weapons require VEHICLES!
                             # Check if there's an available vehicle at this location
@@ -6738,13 +6801,13 @@ class DeployPhasePlanner:
                                 target_loc = loc
                                 break
                             else:
-                                logger.debug(f"      Skip {loc.name}: no available vehicles ({available_vehicles} vehicles, {allocated_vweapons} weapons allocated)")
+                                logger.debug(lambda: f"      Skip {loc.name}: no available vehicles ({available_vehicles} vehicles, {allocated_vweapons} weapons allocated)")
                         elif weapon_type == 'starship' and loc.is_space:
                             target_loc = loc
                             break
 
                     if not target_loc:
-                        logger.info(f"   ⏭️ No valid location for {weapon_type} weapon {weapon['name']}")
+                        logger.info(lambda: f"   ⏭️ No valid location for {weapon_type} weapon {weapon['name']}")
                         continue
 
                     # Add weapon to plan
@@ -6769,7 +6832,7 @@ class DeployPhasePlanner:
                     elif weapon_type == 'vehicle':
                         vehicle_weapons_at_location[target_loc.card_id] = vehicle_weapons_at_location.get(target_loc.card_id, 0) + 1
 
-                    logger.info(f"   🗡️ Plan: Deploy {weapon['name']} ({weapon_type} weapon, cost {weapon['cost']}) to {target_loc.name}")
+                    logger.info(lambda: f"   🗡️ Plan: Deploy {weapon['name']} ({weapon_type} weapon, cost {weapon['cost']}) to {target_loc.name}")
             else:
                 logger.info("   🗡️ No locations with our presence for weapon targets")
 
@@ -6798,14 +6861,14 @@ class DeployPhasePlanner:
                 plan.strategy = DeployStrategy.ESTABLISH
                 plan.reason = f"Establish at {len([i for i in plan.instructions if i.priority == 2])} locations"
 
-            logger.info(f"📋 FINAL PLAN: {plan.strategy.value} - {len(plan.instructions)} deployments")
+            logger.summary(f"📋 FINAL PLAN: {plan.strategy.value} - {len(plan.instructions)} deployments")
             # Log all location card_ids for debugging deploy target matching
-            loc_card_ids = [(loc.card_id, loc.name) for loc in locations]
-            logger.info(f"   📍 Location card_ids: {loc_card_ids}")
-            for i, inst in enumerate(plan.instructions):
-                backup_info = f" (backup: {inst.backup_location_name}, id={inst.backup_location_id})" if inst.backup_location_id else ""
-                target_info = f"{inst.target_location_name or 'table'} (id={inst.target_location_id})"
-                logger.info(f"   {i+1}. {inst.card_name} -> {target_info}: {inst.reason}{backup_info}")
+            logger.info(lambda: f"   📍 Location card_ids: {[(loc.card_id, loc.name) for loc in locations]}")
+            if logger.enabled():
+                for i, inst in enumerate(plan.instructions):
+                    backup_info = f" (backup: {inst.backup_location_name}, id={inst.backup_location_id})" if inst.backup_location_id else ""
+                    target_info = f"{inst.target_location_name or 'table'} (id={inst.target_location_id})"
+                    logger.info(f"   {i+1}. {inst.card_name} -> {target_info}: {inst.reason}{backup_info}")
         else:
             plan.strategy = DeployStrategy.HOLD_BACK
             # Build detailed reason why we're holding back
@@ -6824,7 +6887,7 @@ class DeployPhasePlanner:
                 reasons.append("no force remaining")
 
             plan.reason = "; ".join(reasons) if reasons else "No good deployment options"
-            logger.info(f"📋 FINAL PLAN: HOLD BACK - {plan.reason}")
+            logger.summary(f"📋 FINAL PLAN: HOLD BACK - {plan.reason}")
             logger.info(f"   Debug: {len(locations)} locations, {len(characters)} chars, {len(starships)} ships, {force_remaining} force left")
 
         plan.phase_started = True
@@ -6921,10 +6984,10 @@ class DeployPhasePlanner:
                     # Allow at most -2 deficit (reasonable destiny swing)
                     # Also skip if opponent has 2x our power (they could reinforce easily)
                     if deficit > 2:
-                        logger.debug(f"   Skipping backup {loc.name}: {card_power} vs {loc.their_power} = deficit {deficit} (too risky alone)")
+                        logger.debug(lambda: f"   Skipping backup {loc.name}: {card_power} vs {loc.their_power} = deficit {deficit} (too risky alone)")
                         continue
                     if card_power > 0 and loc.their_power >= card_power * 2:
-                        logger.debug(f"   Skipping backup {loc.name}: {card_power} vs {loc.their_power} = opponent 2x+ our power")
+                        logger.debug(lambda: f"   Skipping backup {loc.name}: {card_power} vs {loc.their_power} = opponent 2x+ our power")
                         continue
 
                 elif loc.their_power > 0 and loc.my_power > 0:
@@ -6935,7 +6998,7 @@ class DeployPhasePlanner:
                     # Skip if we'd STILL be at a deficit > 4 after deploying
                     # (We need to be competitive, not just slightly less losing)
                     if deficit > 4:
-                        logger.debug(f"   Skipping backup {loc.name}: {power_after} vs {loc.their_power} = still losing by {deficit}")
+                        logger.debug(lambda: f"   Skipping backup {loc.name}: {power_after} vs {loc.their_power} = still losing by {deficit}")
                         continue
 
                 # This location is viable as backup
@@ -6948,11 +7011,11 @@ class DeployPhasePlanner:
                     inst.backup_reason = f"reinforce ({loc.my_power} vs {loc.their_power})"
                 else:
                     inst.backup_reason = f"establish presence ({loc.my_icons} icons)"
-                logger.debug(f"   📋 Backup for {inst.card_name}: {loc.name} ({inst.backup_reason})")
+                logger.debug(lambda: f"   📋 Backup for {inst.card_name}: {loc.name} ({inst.backup_reason})")
                 break
             else:
                 # No viable backup found after checking all candidates
-                logger.debug(f"   ⚠️ No viable backup for {inst.card_name} - all locations too dangerous or restricted")
+                logger.debug(lambda: f"   ⚠️ No viable backup for {inst.card_name} - all locations too dangerous or restricted")
 
     def _get_all_hand_cards_as_dicts(self, board_state) -> List[Dict]:
         """
@@ -6961,50 +7024,33 @@ class DeployPhasePlanner:
         Used for next-turn planning where we want to consider expensive cards
         that we can't afford this turn but could afford next turn.
         """
-        from .card_loader import get_card
-
         all_cards = []
-        for card in board_state.cards_in_hand:
-            if not card.blueprint_id:
-                continue
-            metadata = get_card(card.blueprint_id)
-            if not metadata:
-                continue
-
-            has_permanent_pilot = getattr(metadata, 'has_permanent_pilot', False)
-            is_warrior = metadata.is_warrior if hasattr(metadata, 'is_warrior') else False
-            is_unpiloted_craft = (metadata.is_starship or metadata.is_vehicle) and not has_permanent_pilot
-
-            # Get parsed gametext abilities for better evaluation
-            base_cost = metadata.deploy_value or 0
-            deploy_reduction = metadata.parsed.deploy_reduction if hasattr(metadata, 'parsed') else 0
-            effective_cost = max(0, base_cost - deploy_reduction)
-
+        for hc in get_hand_snapshot(board_state):
             all_cards.append({
-                'blueprint_id': card.blueprint_id,
-                'name': metadata.title,
-                'cost': effective_cost,  # Use effective cost (with reductions)
-                'base_cost': base_cost,  # Original cost for reference
-                'deploy_value': base_cost,
-                'deploy_reduction': deploy_reduction,
-                'power': 0 if is_unpiloted_craft else (metadata.power_value or 0),
-                'power_value': metadata.power_value or 0,
-                'base_power': metadata.power_value or 0,
-                'is_character': metadata.is_character,
-                'is_starship': metadata.is_starship,
-                'is_vehicle': metadata.is_vehicle,
-                'is_pilot': metadata.is_pilot,
-                'is_warrior': is_warrior,
-                'is_location': metadata.is_location,
-                'has_permanent_pilot': has_permanent_pilot,
-                'needs_pilot': is_unpiloted_craft,
-                'pilot_adds_power': getattr(metadata, 'pilot_adds_power', 2) if metadata.is_pilot else 0,
-                'ability': metadata.ability_value or 0,  # For destiny draw eligibility
+                'blueprint_id': hc.blueprint_id,
+                'name': hc.name,
+                'cost': hc.cost,  # Use effective cost (with reductions)
+                'base_cost': hc.base_cost,  # Original cost for reference
+                'deploy_value': hc.base_cost,
+                'deploy_reduction': hc.deploy_reduction,
+                'power': hc.power,
+                'power_value': hc.base_power,
+                'base_power': hc.base_power,
+                'is_character': hc.is_character,
+                'is_starship': hc.is_starship,
+                'is_vehicle': hc.is_vehicle,
+                'is_pilot': hc.is_pilot,
+                'is_warrior': hc.is_warrior,
+                'is_location': hc.is_location,
+                'has_permanent_pilot': hc.has_permanent_pilot,
+                'needs_pilot': hc.needs_pilot,
+                'pilot_adds_power': hc.pilot_power(2),
+                'ability': hc.ability,  # For destiny draw eligibility
                 # Parsed gametext abilities
-                'has_attrition_immunity': metadata.has_attrition_immunity,
-                'immune_attrition_threshold': metadata.immune_attrition_threshold,
-                'draws_extra_destiny': metadata.draws_extra_destiny,
-                'force_drain_bonus': metadata.parsed.force_drain_bonus if hasattr(metadata, 'parsed') else 0,
+                'has_attrition_immunity': hc.has_attrition_immunity,
+                'immune_attrition_threshold': hc.immune_attrition_threshold,
+                'draws_extra_destiny': hc.draws_extra_destiny,
+                'force_drain_bonus': hc.force_drain_bonus,
             })
 
         return all_cards
@@ -7031,66 +7077,36 @@ class DeployPhasePlanner:
         Returns:
             Card dict formatted for deployment, or None if no alternative exists.
         """
-        from .card_loader import get_card
-
         exclude_blueprints = exclude_blueprints or set()
         alternatives = []
 
         # Get ALL cards from hand (including ones we filtered for being expensive)
-        hand_list = list(board_state.cards_in_hand) if board_state.cards_in_hand else []
-
-        for card in hand_list:
-            if not card.blueprint_id:
-                continue
-            if card.blueprint_id in exclude_blueprints:
-                continue
-
-            metadata = get_card(card.blueprint_id)
-            if not metadata:
-                continue
-
-            # Check card type
-            is_match = False
-            if card_type == "starship" and metadata.is_starship:
-                is_match = True
-            elif card_type == "character" and metadata.is_character:
-                is_match = True
-            elif card_type == "vehicle" and metadata.is_vehicle:
-                is_match = True
+        hand = get_hand_snapshot(board_state)
 
-            if not is_match:
+        for hc in hand.of_type(card_type):
+            if hc.blueprint_id in exclude_blueprints:
                 continue
 
-            # Calculate effective deploy cost
-            base_cost = metadata.deploy_value or 0
-            deploy_reduction = metadata.parsed.deploy_reduction if hasattr(metadata, 'parsed') else 0
-            effective_cost = max(0, base_cost - deploy_reduction)
-
             # Check affordability
-            if effective_cost > max_cost:
+            if hc.cost > max_cost:
                 continue
 
-            # Build card dict
-            has_permanent_pilot = getattr(metadata, 'has_permanent_pilot', False)
-            is_warrior = metadata.is_warrior if hasattr(metadata, 'is_warrior') else False
-            is_unpiloted_craft = (metadata.is_starship or metadata.is_vehicle) and not has_permanent_pilot
-
             alternatives.append({
-                'card_id': card.card_id,
-                'blueprint_id': card.blueprint_id,
-                'name': metadata.title,
-                'power': 0 if is_unpiloted_craft else (metadata.power_value or 0),
-                'base_power': metadata.power_value or 0,
-                'cost': effective_cost,
-                'base_cost': base_cost,
-                'is_character': metadata.is_character,
-                'is_starship': metadata.is_starship,
-                'is_vehicle': metadata.is_vehicle,
-                'is_pilot': metadata.is_pilot,
-                'is_warrior': is_warrior,
-                'has_permanent_pilot': has_permanent_pilot,
-                'needs_pilot': is_unpiloted_craft,
-                'pilot_adds_power': getattr(metadata, 'pilot_adds_power', 2) if metadata.is_pilot else 0,
+                'card_id': hc.card_id,
+                'blueprint_id': hc.blueprint_id,
+                'name': hc.name,
+                'power': hc.power,
+                'base_power': hc.base_power,
+                'cost': hc.cost,
+                'base_cost': hc.base_cost,
+                'is_character': hc.is_character,
+                'is_starship': hc.is_starship,
+                'is_vehicle': hc.is_vehicle,
+                'is_pilot': hc.is_pilot,
+                'is_warrior': hc.is_warrior,
+                'has_permanent_pilot': hc.has_permanent_pilot,
+                'needs_pilot': hc.needs_pilot,
+                'pilot_adds_power': hc.pilot_power(2),
             })
 
         if not alternatives:
@@ -7109,16 +7125,8 @@ class DeployPhasePlanner:
 
         # Find what we couldn't afford (for logging)
         unaffordable_ships = []
-        for card in hand_list:
-            if not card.blueprint_id:
-                continue
-            metadata = get_card(card.blueprint_id)
-            if metadata and card_type == "starship" and metadata.is_starship:
-                base_cost = metadata.deploy_value or 0
-                deploy_reduction = metadata.parsed.deploy_reduction if hasattr(metadata, 'parsed') else 0
-                effective_cost = max(0, base_cost - deploy_reduction)
-                if effective_cost > max_cost:
-                    unaffordable_ships.append((metadata.title, effective_cost))
+        if card_type == "starship":
+            unaffordable_ships = [(hc.name, hc.cost) for hc in hand.starships if hc.cost > max_cost]
 
         if unaffordable_ships:
             expensive_str = ', '.join(f"{name}({cost})" for name, cost in unaffordable_ships)
@@ -7171,116 +7179,88 @@ class DeployPhasePlanner:
 
         # Log unique cards already on board (helps explain why cards from hand can't deploy)
         if unique_titles_on_board:
-            logger.info(f"   📋 Unique cards already on board: {sorted(unique_titles_on_board)}")
+            logger.info(lambda: f"   📋 Unique cards already on board: {sorted(unique_titles_on_board)}")
 
-        # DEBUG: Log how many cards we're iterating over
-        hand_list = list(board_state.cards_in_hand)  # Materialize to get count
-        logger.info(f"   🔍 _get_all_deployable_cards: {len(hand_list)} cards in hand, {available_force} force available")
+        hand = get_hand_snapshot(board_state)
+        hand_size = len(hand) + len(hand.unresolved)
+        logger.info(f"   🔍 _get_all_deployable_cards: {hand_size} cards in hand, {available_force} force available")
         cards_added = 0  # Counter for debugging
 
-        for card in hand_list:
-            if not card.blueprint_id:
-                logger.info(f"   ⏭️ Skip card: no blueprint_id (title={getattr(card, 'card_title', '?')})")
-                continue
-
-            metadata = get_card(card.blueprint_id)
-            if not metadata:
-                logger.info(f"   ⏭️ Skip {card.blueprint_id}: no metadata found")
-                continue
+        for card, reason in hand.unresolved:
+            if reason == "no blueprint_id":
+                logger.info(lambda: f"   ⏭️ Skip card: no blueprint_id (title={getattr(card, 'card_title', '?')})")
+            else:
+                logger.info(lambda: f"   ⏭️ Skip {card.blueprint_id}: {reason}")
 
+        for hc in hand:
             # Debug: log what we're processing (at DEBUG level unless issues)
-            logger.debug(f"   📋 Processing {metadata.title}: is_char={metadata.is_character}, "
-                        f"is_ship={metadata.is_starship}, is_veh={metadata.is_vehicle}, "
-                        f"deploy={metadata.deploy_value}, power={metadata.power_value}")
+            logger.debug(lambda: f"   📋 Processing {hc.name}: is_char={hc.is_character}, "
+                        f"is_ship={hc.is_starship}, is_veh={hc.is_vehicle}, "
+                        f"deploy={hc.base_cost}, power={hc.base_power}")
 
             # === UNIQUENESS CHECK ===
             # Skip if this unique card is already on the board
-            if metadata.is_unique and metadata.title in unique_titles_on_board:
-                logger.info(f"   ⏭️ Skip {metadata.title}: unique card already on board")
+            if hc.is_unique and hc.name in unique_titles_on_board:
+                logger.info(lambda: f"   ⏭️ Skip {hc.name}: unique card already on board")
                 continue
 
             # Skip if we already have this unique card in our deployable list
-            if metadata.is_unique and metadata.title in unique_titles_in_plan:
-                logger.info(f"   ⏭️ Skip {metadata.title}: duplicate unique in hand")
+            if hc.is_unique and hc.name in unique_titles_in_plan:
+                logger.info(lambda: f"   ⏭️ Skip {hc.name}: duplicate unique in hand")
                 continue
 
-            # Calculate effective deploy cost (factoring in gametext reductions)
-            base_deploy_cost = metadata.deploy_value or 0
-            deploy_reduction = metadata.parsed.deploy_reduction if hasattr(metadata, 'parsed') else 0
-            deploy_cost = max(0, base_deploy_cost - deploy_reduction)
-
-            if deploy_cost > available_force:
-                logger.info(f"   ⏭️ Skip {metadata.title}: too expensive ({deploy_cost} > {available_force})")
+            if hc.cost > available_force:
+                logger.info(lambda: f"   ⏭️ Skip {hc.name}: too expensive ({hc.cost} > {available_force})")
                 continue
 
-            # Check if this is an unpiloted vehicle/starship (0 effective power without pilot)
-            has_permanent_pilot = getattr(metadata, 'has_permanent_pilot', False)
-            base_power = metadata.power_value or 0
-
-            # Effective power: unpiloted vehicles/starships have 0 power until piloted
-            is_unpiloted_craft = (metadata.is_starship or metadata.is_vehicle) and not has_permanent_pilot
-            effective_power = 0 if is_unpiloted_craft else base_power
-
-            # Pure pilots (pilot but not warrior) are best deployed aboard ships
-            is_warrior = metadata.is_warrior if hasattr(metadata, 'is_warrior') else False
-            is_pure_pilot = metadata.is_pilot and not is_warrior
-
-            # Weapon target type info
-            weapon_target_type = getattr(metadata, 'weapon_target_type', None)
-            is_targeted_weapon = getattr(metadata, 'is_targeted_weapon', False)
-            is_standalone_weapon = getattr(metadata, 'is_standalone_weapon', False)
-
-            # Deploy restriction systems (e.g., ["Tatooine"] for Jawas)
-            deploy_restrictions = getattr(metadata, 'deploy_restriction_systems', []) or []
-
             deployable.append({
-                'card_id': card.card_id,
-                'blueprint_id': card.blueprint_id,
-                'name': metadata.title,
-                'power': effective_power,  # Use effective power (0 for unpiloted)
-                'base_power': base_power,  # Store base power for reference
-                'cost': deploy_cost,  # Effective cost after reductions
-                'base_cost': base_deploy_cost,  # Original cost for reference
-                'deploy_reduction': deploy_reduction,  # Amount reduced by gametext
-                'is_unique': metadata.is_unique,
-                'is_location': metadata.is_location,
-                'is_character': metadata.is_character,
-                'is_starship': metadata.is_starship,
-                'is_vehicle': metadata.is_vehicle,
-                'is_pilot': metadata.is_pilot,
-                'is_warrior': is_warrior,
-                'is_pure_pilot': is_pure_pilot,
-                'pilot_adds_power': getattr(metadata, 'pilot_adds_power', 1) if metadata.is_pilot else 0,
-                'is_weapon': metadata.is_weapon,
-                'is_device': metadata.is_device,
-                'has_permanent_pilot': has_permanent_pilot,
-                'needs_pilot': is_unpiloted_craft,
+                'card_id': hc.card_id,
+                'blueprint_id': hc.blueprint_id,
+                'name': hc.name,
+                'power': hc.power,  # Use effective power (0 for unpiloted)
+                'base_power': hc.base_power,  # Store base power for reference
+                'cost': hc.cost,  # Effective cost after reductions
+                'base_cost': hc.base_cost,  # Original cost for reference
+                'deploy_reduction': hc.deploy_reduction,  # Amount reduced by gametext
+                'is_unique': hc.is_unique,
+                'is_location': hc.is_location,
+                'is_character': hc.is_character,
+                'is_starship': hc.is_starship,
+                'is_vehicle': hc.is_vehicle,
+                'is_pilot': hc.is_pilot,
+                'is_warrior': hc.is_warrior,
+                'is_pure_pilot': hc.is_pure_pilot,
+                'pilot_adds_power': hc.pilot_power(1),
+                'is_weapon': hc.is_weapon,
+                'is_device': hc.is_device,
+                'has_permanent_pilot': hc.has_permanent_pilot,
+                'needs_pilot': hc.needs_pilot,
                 # Weapon-specific fields
-                'weapon_target_type': weapon_target_type,  # "character", "vehicle", "starship", or None
-                'is_targeted_weapon': is_targeted_weapon,  # Needs to attach to a target
-                'is_standalone_weapon': is_standalone_weapon,  # Automated/Artillery - no target needed
-                'is_character_weapon': getattr(metadata, 'is_character_weapon', False),  # Deploys only on specific characters
-                'matching_weapon': getattr(metadata, 'matching_weapon', []),  # List of character names weapon can deploy on
+                'weapon_target_type': hc.weapon_target_type,  # "character", "vehicle", "starship", or None
+                'is_targeted_weapon': hc.is_targeted_weapon,  # Needs to attach to a target
+                'is_standalone_weapon': hc.is_standalone_weapon,  # Automated/Artillery - no target needed
+                'is_character_weapon': hc.is_character_weapon,  # Deploys only on specific characters
+                'matching_weapon': list(hc.matching_weapon),  # List of character names weapon can deploy on
                 # Deploy restriction systems (empty list = can deploy anywhere)
-                'deploy_restriction_systems': deploy_restrictions,
+                'deploy_restriction_systems': list(hc.deploy_restriction_systems),
                 # Parsed gametext abilities for better evaluation
-                'has_attrition_immunity': metadata.has_attrition_immunity,
-                'immune_attrition_threshold': metadata.immune_attrition_threshold,
-                'draws_extra_destiny': metadata.draws_extra_destiny,
-                'force_drain_bonus': metadata.parsed.force_drain_bonus if hasattr(metadata, 'parsed') else 0,
+                'has_attrition_immunity': hc.has_attrition_immunity,
+                'immune_attrition_threshold': hc.immune_attrition_threshold,
+                'draws_extra_destiny': hc.draws_extra_destiny,
+                'force_drain_bonus': hc.force_drain_bonus,
             })
 
             cards_added += 1
 
             # Track unique cards we've added (to prevent duplicates from hand)
-            if metadata.is_unique:
-                unique_titles_in_plan.add(metadata.title)
+            if hc.is_unique:
+                unique_titles_in_plan.add(hc.name)
 
         # DEBUG: Warn if we got no deployable cards but hand wasn't empty
-        if len(hand_list) > 0 and len(deployable) == 0:
-            logger.warning(f"   ⚠️ _get_all_deployable_cards: Hand had {len(hand_list)} cards but 0 are deployable!")
+        if hand_size > 0 and len(deployable) == 0:
+            logger.warning(f"   ⚠️ _get_all_deployable_cards: Hand had {hand_size} cards but 0 are deployable!")
         else:
-            logger.info(f"   ✅ _get_all_deployable_cards: {cards_added} deployable cards from {len(hand_list)} in hand")
+            logger.info(f"   ✅ _get_all_deployable_cards: {cards_added} deployable cards from {hand_size} in hand")
 
         return deployable
 
@@ -7327,7 +7307,7 @@ class DeployPhasePlanner:
             if can_deploy:
                 filtered.append(card)
             else:
-                logger.debug(f"   🚫 {card['name']} restricted to {restrictions}, skipping {location_name}")
+                logger.debug(lambda: f"   🚫 {card['name']} restricted to {restrictions}, skipping {location_name}")
 
         return filtered
 
@@ -7345,102 +7325,50 @@ class DeployPhasePlanner:
         if not hasattr(board_state, 'locations') or not board_state.locations:
             return locations
 
-        for idx, loc in enumerate(board_state.locations):
-            if not loc:
-                continue
+        # Power, icons and ground/space flags come from the shared per-turn summary
+        for summary in get_board_summary(board_state):
+            idx = summary.index
+            loc = summary.location
 
             # Skip duplicates (same card_id already processed)
-            card_id = getattr(loc, 'card_id', '')
+            card_id = summary.card_id
             if card_id and card_id in seen_card_ids:
                 continue
             if card_id:
                 seen_card_ids.add(card_id)
 
-            # Get location name - prefer site_name, fall back to system_name or blueprint_id
-            site_name = getattr(loc, 'site_name', '')
-            system_name = getattr(loc, 'system_name', '')
-            blueprint_id = getattr(loc, 'blueprint_id', '')
-            loc_name = site_name or system_name or blueprint_id or 'Unknown'
+            # Location name - site_name, falling back to system_name or blueprint_id
+            loc_name = summary.name
 
             # Debug: log what we're getting if name resolution fails
             if loc_name == 'Unknown':
-                logger.warning(f"   ⚠️ Location {idx} has no name: site='{site_name}', system='{system_name}', bp='{blueprint_id}'")
-
-            # Check interior/exterior from card metadata (for vehicle filtering)
-            from .card_loader import get_card
-            loc_metadata = get_card(blueprint_id) if blueprint_id else None
-
-            # Determine if ground (site) or space (system) from card metadata
-            # RULE: Systems have sub_type="System" and NO interior/exterior icons
-            #       Sites have sub_type="Site" and ALWAYS have interior and/or exterior icons
-            is_interior = False
-            is_exterior = False
-            loc_is_space = False
-            loc_is_ground = False
-
-            if loc_metadata:
-                # Check sub_type first - most reliable
-                sub_type = getattr(loc_metadata, 'sub_type', '') or ''
-                if sub_type.lower() == 'system':
-                    loc_is_space = True
-                    loc_is_ground = False
-                elif sub_type.lower() == 'site':
-                    loc_is_ground = True
-                    loc_is_space = False
-                    # Sites always have interior and/or exterior
-                    is_interior = loc_metadata.is_interior
-                    is_exterior = loc_metadata.is_exterior
-                else:
-                    # Fallback: check icons
-                    # If has interior or exterior icon, it's a site (ground)
-                    if loc_metadata.is_interior or loc_metadata.is_exterior:
-                        loc_is_ground = True
-                        is_interior = loc_metadata.is_interior
-                        is_exterior = loc_metadata.is_exterior
-                    else:
-                        # No interior/exterior = system (space)
-                        loc_is_space = True
+                logger.warning(f"   ⚠️ Location {idx} has no name: site='{getattr(loc, 'site_name', '')}', "
+                               f"system='{getattr(loc, 'system_name', '')}', bp='{summary.blueprint_id}'")
 
             analysis = LocationAnalysis(
                 card_id=card_id,
                 name=loc_name,
-                is_ground=loc_is_ground,
-                is_space=loc_is_space,
-                is_site=loc_is_ground,  # Sites are ground locations (have interior/exterior)
+                is_ground=summary.is_ground,
+                is_space=summary.is_space,
+                is_site=summary.is_ground,  # Sites are ground locations (have interior/exterior)
                 location_index=idx,
             )
 
             # Store interior/exterior for vehicle filtering
-            analysis.is_interior = is_interior
-            analysis.is_exterior = is_exterior
-
-            # Get power from board_state (uses array index, same as admin panel)
-            # Note: board_state power values are authoritative - no need to recalculate from cards
-            raw_my_power = board_state.my_power_at_location(idx) if hasattr(board_state, 'my_power_at_location') else 0
-            raw_their_power = board_state.their_power_at_location(idx) if hasattr(board_state, 'their_power_at_location') else 0
+            analysis.is_interior = summary.is_interior
+            analysis.is_exterior = summary.is_exterior
 
-            analysis.my_power = max(0, raw_my_power)
-            analysis.their_power = max(0, raw_their_power)
+            # Board state power values are authoritative - no need to recalculate from cards
+            analysis.my_power = max(0, summary.my_power)
+            analysis.their_power = max(0, summary.their_power)
             analysis.i_control = getattr(loc, 'i_control', False)
             analysis.they_control = getattr(loc, 'they_control', False)
             analysis.contested = analysis.my_power > 0 and analysis.their_power > 0
 
-            # Get force icons from card metadata
-            # Icons on the card are what each side can control:
-            # - light_side_icons = icons Light side controls when they control location
-            # - dark_side_icons = icons Dark side controls when they control location
-            my_side = getattr(board_state, 'my_side', 'light') or 'light'
-            if loc_metadata:
-                if my_side.lower() == 'light':
-                    analysis.my_icons = loc_metadata.light_side_icons or 0
-                    analysis.their_icons = loc_metadata.dark_side_icons or 0
-                else:
-                    analysis.my_icons = loc_metadata.dark_side_icons or 0
-                    analysis.their_icons = loc_metadata.light_side_icons or 0
-            else:
-                # Fallback to LocationInPlay data (usually empty)
-                analysis.my_icons = self._parse_icon_string(getattr(loc, 'my_icons', 0))
-                analysis.their_icons = self._parse_icon_string(getattr(loc, 'their_icons', 0))
+            # Force icons: what each side controls when it controls the location
+            # (card metadata, falling back to LocationInPlay data)
+            analysis.my_icons = summary.my_icons
+            analysis.their_icons = summary.their_icons
 
             # =============================================================
             # BATTLE/FLEE ANALYSIS
@@ -7459,14 +7387,14 @@ class DeployPhasePlanner:
                 # If we can WIN (even by 1), don't flee - reinforce instead!
                 if potential_diff >= 0:
                     can_win_with_reinforcements = True
-                    logger.info(f"   💪 {analysis.name}: CAN WIN with reinforcements ({analysis.my_power}+{deployable_power}={potential_power} vs {analysis.their_power}, diff=+{potential_diff})")
+                    logger.info(lambda: f"   💪 {analysis.name}: CAN WIN with reinforcements ({analysis.my_power}+{deployable_power}={potential_power} vs {analysis.their_power}, diff=+{potential_diff})")
 
                 if potential_diff >= get_battle_favorable_threshold():
                     analysis.can_flip_to_favorable = True
                     # This is a battle opportunity if we can also afford to battle
                     if board_state.force_pile >= 3:  # Need force for deploy + battle
                         analysis.is_battle_opportunity = True
-                        logger.info(f"   ⚔️ {analysis.name}: BATTLE OPPORTUNITY (+{potential_diff} after deploy)")
+                        logger.info(lambda: f"   ⚔️ {analysis.name}: BATTLE OPPORTUNITY (+{potential_diff} after deploy)")
 
             # RETREAT situation: We're at severe disadvantage AND can't win with reinforcements
             # Don't reinforce - we'll flee in move phase
@@ -7476,15 +7404,15 @@ class DeployPhasePlanner:
                 if hasattr(board_state, 'analyze_flee_options'):
                     flee_info = board_state.analyze_flee_options(idx, analysis.is_space)
                     if flee_info.get('can_flee') and flee_info.get('can_afford'):
-                        logger.info(f"   🏃 {analysis.name}: should flee ({power_diff} diff, can't win even with +{deployable_power}), skip reinforce")
+                        logger.info(lambda: f"   🏃 {analysis.name}: should flee ({power_diff} diff, can't win even with +{deployable_power}), skip reinforce")
                     else:
                         # Can't flee - might need to reinforce anyway
                         analysis.should_flee = False
-                        logger.info(f"   ⚠️ {analysis.name}: severe deficit ({power_diff}) but CAN'T FLEE")
+                        logger.info(lambda: f"   ⚠️ {analysis.name}: severe deficit ({power_diff}) but CAN'T FLEE")
             elif analysis.contested and power_diff <= get_retreat_threshold() and can_win_with_reinforcements:
                 # We're behind but CAN win - DON'T flee, reinforce!
                 analysis.should_flee = False
-                logger.info(f"   🔄 {analysis.name}: behind ({power_diff}) but WILL REINFORCE TO WIN (+{potential_diff} after deploy)")
+                logger.info(lambda: f"   🔄 {analysis.name}: behind ({power_diff}) but WILL REINFORCE TO WIN (+{potential_diff} after deploy)")
 
             locations.append(analysis)
 
@@ -7538,7 +7466,7 @@ class DeployPhasePlanner:
             for loc_name, cards in sorted(opponent_by_location.items()):
                 loc_power = sum(p for _, p, _ in cards)
                 card_list = ", ".join(f"{n}({p})" for n, p, _ in cards)
-                logger.info(f"      - {loc_name}: {loc_power} power [{card_list}]")
+                logger.info(lambda: f"      - {loc_name}: {loc_power} power [{card_list}]")
 
     def get_card_score(self, blueprint_id: str, current_force: int = 0,
                        available_blueprint_ids: Optional[List[str]] = None) -> Tuple[float, str]:
@@ -7702,7 +7630,7 @@ class DeployPhasePlanner:
                 power_diff = my_power - their_power
 
                 if power_diff >= favorable_threshold:
-                    logger.info(f"⚔️ Favorable battle at loc {loc_idx}: {my_power} vs {their_power} (+{power_diff}) - skip extras!")
+                    logger.info(lambda: f"⚔️ Favorable battle at loc {loc_idx}: {my_power} vs {their_power} (+{power_diff}) - skip extras!")
                     return True
 
         return False
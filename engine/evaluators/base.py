@@ -7,14 +7,15 @@ Ported from Unity C# BotAIHelper.cs ranking system.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Set
+from typing import Optional, List, Dict, Any, Set, Callable, FrozenSet, Tuple
 from enum import Enum
 import logging
 import random
 
 from ..strategy_profile import get_current_profile, StrategyMode
+from ..tracing import get_tracer
 
-logger = logging.getLogger(__name__)
+logger = get_tracer('evaluators', logging.getLogger(__name__))
 
 
 class ActionType(Enum):
@@ -92,6 +93,52 @@ class DecisionContext:
     # Actions in this set should be heavily penalized to avoid re-selection
     blocked_responses: Set[str] = field(default_factory=set)
 
+    # Per-decision memo for lazily computed fields (see memoized())
+    _memo: Dict[Any, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def memoized(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """
+        Return a value computed at most once per decision.
+
+        Evaluators share one context per decision, so card metadata, owner
+        lookups and board summaries only cost something for the first
+        evaluator that actually asks for them.
+        """
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = compute()
+            return value
+
+    def board_is_my_turn(self) -> bool:
+        """Whose turn it is according to the board (True when there is no board)"""
+        if not self.board_state:
+            return True
+        return self.memoized('is_my_turn', self.board_state.is_my_turn)
+
+    def tracked_card(self, card_id: str) -> Any:
+        """The board's tracked card for card_id, or None"""
+        if not self.board_state or not card_id:
+            return None
+        return self.memoized(('tracked', card_id),
+                             lambda: self.board_state.cards_in_play.get(card_id))
+
+    def card_owner(self, card_id: str) -> Optional[str]:
+        """Owner of a tracked card, or None if the card is not tracked"""
+        card = self.tracked_card(card_id)
+        return card.owner if card else None
+
+    def card_metadata(self, blueprint_id: str) -> Any:
+        """Card database entry for a blueprint, looked up once per decision"""
+        if not blueprint_id:
+            return None
+
+        def lookup():
+            from ..card_loader import get_card
+            return get_card(blueprint_id)
+
+        return self.memoized(('card', blueprint_id), lookup)
+
 
 @dataclass
 class EvaluatedAction:
@@ -138,10 +185,33 @@ class ActionEvaluator(ABC):
     their scores are combined.
     """
 
+    # Dispatch declarations used by CombinedEvaluator to skip evaluators
+    # without calling can_evaluate(). They must never be stricter than
+    # can_evaluate() itself:
+    # - decision_types: decision types handled (None = any type)
+    # - my_turn_only: only runs when the board says it is our turn
+    # - phases: lowercase substrings one of which must be in the phase (None = any)
+    decision_types: Optional[FrozenSet[str]] = None
+    my_turn_only: bool = False
+    phases: Optional[Tuple[str, ...]] = None
+
     def __init__(self, name: str):
         self.name = name
         self.enabled = True
-        self.logger = logging.getLogger(f"{__name__}.{name}")
+        self.logger = get_tracer('evaluators', logging.getLogger(f"{__name__}.{name}"))
+
+    def may_evaluate(self, context: DecisionContext) -> bool:
+        """
+        Cheap pre-check from the class declarations (decision type is
+        handled by the CombinedEvaluator index).
+        """
+        if self.my_turn_only and not context.board_is_my_turn():
+            return False
+        if self.phases is not None:
+            phase = (context.phase or "").lower()
+            if not any(p in phase for p in self.phases):
+                return False
+        return True
 
     @abstractmethod
     def can_evaluate(self, context: DecisionContext) -> bool:
@@ -168,6 +238,8 @@ class ActionEvaluator(ABC):
 
     def log_evaluation(self, action: EvaluatedAction):
         """Log evaluation for debugging"""
+        if not logger.enabled(logging.DEBUG):
+            return
         reasons = " | ".join(action.reasoning)
         self.logger.debug(f"  [{self.name}] {action.display_text}: {action.score:.1f} - {reasons}")
 
@@ -392,7 +464,27 @@ class CombinedEvaluator:
 
     def __init__(self, evaluators: List[ActionEvaluator]):
         self.evaluators = evaluators
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_tracer('evaluators', logging.getLogger(__name__))
+        self._dispatch: Dict[str, List[ActionEvaluator]] = {}
+        self._dispatch_size = len(evaluators)
+
+    def evaluators_for(self, decision_type: str) -> List[ActionEvaluator]:
+        """
+        Evaluators that declare they handle decision_type, in registration order.
+
+        The index is built lazily per decision type and rebuilt if the
+        evaluator list changes size.
+        """
+        if self._dispatch_size != len(self.evaluators):
+            self._dispatch.clear()
+            self._dispatch_size = len(self.evaluators)
+
+        candidates = self._dispatch.get(decision_type)
+        if candidates is None:
+            candidates = [e for e in self.evaluators
+                          if e.decision_types is None or decision_type in e.decision_types]
+            self._dispatch[decision_type] = candidates
+        return candidates
 
     def track_action(self, action: EvaluatedAction, card_id: str = None, decision_text: str = None):
         """
@@ -411,7 +503,7 @@ class CombinedEvaluator:
             for evaluator in self.evaluators:
                 if hasattr(evaluator, 'track_deploy'):
                     evaluator.track_deploy(card_id)
-                    self.logger.debug(f"📝 Tracked deploy of card {card_id}")
+                    self.logger.debug(lambda: f"📝 Tracked deploy of card {card_id}")
 
                 # NOTE: We do NOT call record_deployment() here because:
                 # CARD_ACTION_CHOICE ("Deploy Yularen") is followed by
@@ -432,7 +524,7 @@ class CombinedEvaluator:
                     for evaluator in self.evaluators:
                         if hasattr(evaluator, 'planner') and hasattr(evaluator.planner, 'record_deployment'):
                             evaluator.planner.record_deployment(blueprint_id)
-                            self.logger.info(f"📝 Recorded deployment of {blueprint_id} (target selected)")
+                            self.logger.info(lambda: f"📝 Recorded deployment of {blueprint_id} (target selected)")
                             break
 
         # Track moves
@@ -440,7 +532,7 @@ class CombinedEvaluator:
             for evaluator in self.evaluators:
                 if hasattr(evaluator, 'track_move'):
                     evaluator.track_move(card_id)
-                    self.logger.debug(f"📝 Tracked move of card {card_id}")
+                    self.logger.debug(lambda: f"📝 Tracked move of card {card_id}")
 
     def evaluate_decision(self, context: DecisionContext) -> Optional[EvaluatedAction]:
         """
@@ -454,12 +546,12 @@ class CombinedEvaluator:
         """
         all_actions = []
 
-        for evaluator in self.evaluators:
+        for evaluator in self.evaluators_for(context.decision_type):
             if not evaluator.enabled:
                 continue
 
-            if evaluator.can_evaluate(context):
-                self.logger.debug(f"🔍 Running evaluator: {evaluator.name}")
+            if evaluator.may_evaluate(context) and evaluator.can_evaluate(context):
+                self.logger.debug(lambda: f"🔍 Running evaluator: {evaluator.name}")
                 actions = evaluator.evaluate(context)
                 all_actions.extend(actions)
 
@@ -506,7 +598,7 @@ class CombinedEvaluator:
                 # Must take an action (noPass=true or min >= 1)
                 self.logger.info(f"⚠️  All actions bad (best: {best_action.score:.1f}), but MUST choose (noPass={context.no_pass}, min={min_required})")
 
-        self.logger.info(f"✅ Best action: {best_action.display_text} (score: {best_action.score:.1f})")
-        self.logger.info(f"   Reasoning: {' | '.join(best_action.reasoning)}")
+        logger.summary(f"✅ Best action: {best_action.display_text} (score: {best_action.score:.1f})")
+        logger.info(lambda: f"   Reasoning: {' | '.join(best_action.reasoning)}")
 
         return best_action
@@ -24,23 +24,24 @@ from typing import List, Optional
 from .base import ActionEvaluator, DecisionContext, EvaluatedAction, ActionType
 from ..game_strategy import GameStrategy, ThreatLevel
 from ..strategy_profile import get_current_profile, StrategyMode
-from ..strategy_config import get_config
+from ..strategy_config import section_reader, weight_reader, get_snapshot
 from ..card_loader import get_card
 from ..deck_tracker import get_deck_tracker
+from ..battle_odds import battle_odds, side_from_cards, tracked_destiny_key
+from ..lookahead import BATTLE, consult_lookahead, get_evaluator_weight
+from ..tracing import get_tracer
 
-logger = logging.getLogger(__name__)
+logger = get_tracer('evaluators', logging.getLogger(__name__))
 
 # =============================================================================
 # CONFIG-DRIVEN PARAMETERS
 # =============================================================================
 
-def _get_battle_config(key: str, default):
-    """Get battle strategy config value."""
-    return get_config().get('battle_strategy', key, default)
+# _get_battle_config(key, default) -> battle strategy config value
+_get_battle_config = section_reader('battle_strategy')
 
-def _get_weight(key: str, default: float) -> float:
-    """Get evaluator weight."""
-    return get_config().get_weight('battle', key, default)
+# _get_weight(key, default) -> evaluator weight
+_get_weight = weight_reader('battle')
 
 # Rank deltas
 def get_very_good_delta() -> float:
@@ -154,6 +155,9 @@ class BattleEvaluator(ActionEvaluator):
     - Opponent weapons at location (lightsabers, blasters, etc.)
     """
 
+    decision_types = frozenset({'CARD_ACTION_CHOICE', 'ACTION_CHOICE'})
+    my_turn_only = True
+
     def __init__(self):
         super().__init__("Battle")
 
@@ -196,7 +200,7 @@ class BattleEvaluator(ActionEvaluator):
                     # So: ability 1 = 8 threat, ability 6 = 23 threat
                     weapon_threat = 5.0 + (wielder_ability * 3.0)
                     total_threat += weapon_threat
-                    logger.debug(f"   Weapon {attached.card_title}: wielder ability {wielder_ability}, threat {weapon_threat}")
+                    logger.debug(lambda: f"   Weapon {attached.card_title}: wielder ability {wielder_ability}, threat {weapon_threat}")
 
         return weapon_count, weapon_names, total_threat
 
@@ -264,8 +268,9 @@ class BattleEvaluator(ActionEvaluator):
                     card = bs.cards_in_play.get(card_id)
                     if card and card.location_index >= 0:
                         loc_idx = card.location_index
-                        logger.debug(f"⚔️ Battle location found via card {card_id}: index {loc_idx}")
+                        logger.debug(lambda: f"⚔️ Battle location found via card {card_id}: index {loc_idx}")
                         self._rank_battle_at_location(action, bs, loc_idx, game_strategy)
+                        self._apply_lookahead(action, bs, loc_idx)
                     elif bs.locations:
                         # Fallback: Find a CONTESTED location (where we both have cards)
                         # Don't just pick the first location!
@@ -273,11 +278,12 @@ class BattleEvaluator(ActionEvaluator):
                         for idx, loc in enumerate(bs.locations):
                             if loc and loc.my_cards and loc.their_cards:
                                 contested_idx = idx
-                                logger.debug(f"⚔️ Battle location found via contested search: {loc.site_name} (idx {idx})")
+                                logger.debug(lambda: f"⚔️ Battle location found via contested search: {loc.site_name} (idx {idx})")
                                 break
 
                         if contested_idx is not None:
                             self._rank_battle_at_location(action, bs, contested_idx, game_strategy)
+                            self._apply_lookahead(action, bs, contested_idx)
                         else:
                             # No contested location - this shouldn't happen during battle
                             logger.warning(f"⚔️ No contested location found for battle!")
@@ -291,11 +297,12 @@ class BattleEvaluator(ActionEvaluator):
                         for idx, loc in enumerate(bs.locations):
                             if loc and loc.my_cards and loc.their_cards:
                                 contested_idx = idx
-                                logger.debug(f"⚔️ Battle location (no card_id): {loc.site_name} (idx {idx})")
+                                logger.debug(lambda: f"⚔️ Battle location (no card_id): {loc.site_name} (idx {idx})")
                                 break
 
                         if contested_idx is not None:
                             self._rank_battle_at_location(action, bs, contested_idx, game_strategy)
+                            self._apply_lookahead(action, bs, contested_idx)
                         else:
                             logger.warning(f"⚔️ No card_id and no contested location!")
                             action.add_reasoning("No card ID or contested location", 0.0)
@@ -309,6 +316,16 @@ class BattleEvaluator(ActionEvaluator):
 
         return actions
 
+    def _apply_lookahead(self, action: EvaluatedAction, board_state, loc_idx: int):
+        """Adjust by the lookahead search's value of battling here vs the best alternative."""
+        result = consult_lookahead(board_state)
+        if result is None:
+            return
+        advantage = result.advantage(lambda a: a.kind == BATTLE and a.location == loc_idx)
+        if advantage is not None:
+            action.add_reasoning(f"Lookahead: battle here {advantage:+.2f} vs best alternative",
+                                 advantage * get_evaluator_weight())
+
     def _rank_battle_at_location(self, action: EvaluatedAction, board_state, loc_idx: int,
                                    game_strategy: Optional[GameStrategy] = None):
         """
@@ -368,11 +385,12 @@ class BattleEvaluator(ActionEvaluator):
         weapon_count, weapon_names, weapon_threat = self._count_opponent_weapons_at_location(board_state, loc_idx)
 
         # Log the battle analysis for debugging
-        logger.info(f"⚔️ BATTLE ANALYSIS at {loc_name}:")
-        logger.info(f"   Power: {my_power} (me) vs {their_power} (them) = diff {power_diff}")
-        logger.info(f"   Cards: {my_card_count} (me) vs {their_card_count} (them)")
-        logger.info(f"   Ability: {my_ability}, ability test: {ability_test}")
-        if weapon_count > 0:
+        if logger.enabled():
+            logger.info(f"⚔️ BATTLE ANALYSIS at {loc_name}:")
+            logger.info(f"   Power: {my_power} (me) vs {their_power} (them) = diff {power_diff}")
+            logger.info(f"   Cards: {my_card_count} (me) vs {their_card_count} (them)")
+            logger.info(f"   Ability: {my_ability}, ability test: {ability_test}")
+        if weapon_count > 0 and logger.enabled():
             logger.info(f"   ⚠️ WEAPONS: {weapon_count} opponent weapons (threat={weapon_threat:.0f}): {', '.join(weapon_names)}")
 
         # Check if this location is marked for fleeing in the deploy plan
@@ -558,6 +576,19 @@ class BattleEvaluator(ActionEvaluator):
                     15.0 + expected_destiny * 3
                 )
 
+            # Exact outcome distribution for the same ability tests (engine/battle_odds.py)
+            odds = battle_odds(
+                side_from_cards(loc.my_cards if loc else (), my_power,
+                                we_can_draw_destiny, tracked_destiny_key()),
+                side_from_cards(loc.their_cards if loc else (), their_power,
+                                they_can_draw_destiny),
+            )
+            action.add_reasoning(
+                f"Battle odds: win {odds.win:.0%}, lose {odds.lose:.0%}, "
+                f"E[our attrition]={odds.our_losses.attrition:.1f}, "
+                f"E[our Force loss]={odds.our_losses.force_lost:.1f}"
+            )
+
             effective_diff = power_diff - weapon_power_penalty - destiny_variance_penalty
 
             # Calculate fresh threat level with RAISED thresholds
@@ -581,7 +612,8 @@ class BattleEvaluator(ActionEvaluator):
 
             logger.info(f"⚔️ Battle analysis at loc {loc_idx}: power_diff={power_diff}, "
                        f"weapon_penalty={weapon_power_penalty:.1f}, destiny_penalty={destiny_variance_penalty:.1f}, "
-                       f"effective_diff={effective_diff:.1f}, threat={threat_level.value}")
+                       f"effective_diff={effective_diff:.1f}, threat={threat_level.value}, "
+                       f"P(win)={odds.win:.2f}, E[margin]={odds.expected_margin:+.1f}")
 
             # Apply weapon penalty to score (ability-based: high ability weapons hurt more)
             if weapon_count > 0:
@@ -625,8 +657,9 @@ class BattleEvaluator(ActionEvaluator):
         # Config values for immunity scoring
         immunity_bonus_high = _get_weight('immunity_bonus_high', 25.0)
         immunity_bonus_low = _get_weight('immunity_bonus_low', 15.0)
-        immunity_ratio_high = get_config().get('gametext_abilities', 'immunity_ratio_high', 0.5)
-        immunity_ratio_low = get_config().get('gametext_abilities', 'immunity_ratio_low', 0.25)
+        gametext_abilities = get_snapshot().section('gametext_abilities')
+        immunity_ratio_high = gametext_abilities.get('immunity_ratio_high', 0.5)
+        immunity_ratio_low = gametext_abilities.get('immunity_ratio_low', 0.25)
         extra_destiny_weight = _get_weight('extra_destiny_bonus', 20.0)
 
         if loc and loc.my_cards:
@@ -645,12 +678,12 @@ class BattleEvaluator(ActionEvaluator):
                         threshold = card_meta.immune_attrition_threshold
                         if threshold > expected_attrition:
                             immune_power += card_power
-                            logger.debug(f"   🛡️ {card_meta.title} immune to attrition < {threshold} (expected ~{expected_attrition})")
+                            logger.debug(lambda: f"   🛡️ {card_meta.title} immune to attrition < {threshold} (expected ~{expected_attrition})")
 
                     # Check extra destiny draws
                     if card_meta.draws_extra_destiny > 0:
                         total_extra_destiny += card_meta.draws_extra_destiny
-                        logger.debug(f"   🎲 {card_meta.title} draws {card_meta.draws_extra_destiny} extra destiny")
+                        logger.debug(lambda: f"   🎲 {card_meta.title} draws {card_meta.draws_extra_destiny} extra destiny")
 
             # Immunity bonus
             if immune_power > 0 and total_power > 0:
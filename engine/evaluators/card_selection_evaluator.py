@@ -26,8 +26,9 @@ from ..priority_cards import (
     get_protection_score_by_title,
 )
 from ..shield_strategy import score_shield_for_deployment
+from ..tracing import get_tracer
 
-logger = logging.getLogger(__name__)
+logger = get_tracer('evaluators', logging.getLogger(__name__))
 
 # Rank deltas (from C# BotAIHelper) - normalized for better decision nuance
 VERY_GOOD_DELTA = 150.0  # Reduced from 999 - strongly prefer but allows comparison
@@ -44,6 +45,8 @@ class CardSelectionEvaluator(ActionEvaluator):
     from a list (e.g., choosing where to deploy, which card to forfeit).
     """
 
+    decision_types = frozenset({'CARD_SELECTION', 'ARBITRARY_CARDS'})
+
     def __init__(self):
         super().__init__("CardSelection")
 
@@ -253,10 +256,10 @@ class CardSelectionEvaluator(ActionEvaluator):
                     if planned_target_id:
                         if card_id == planned_target_id:
                             action.add_reasoning(f"PLANNED TARGET: {planned_target_name}", +200.0)
-                            logger.info(f"✅ {loc_name} is the PLANNED target (+200)")
+                            logger.info(lambda: f"✅ {loc_name} is the PLANNED target (+200)")
                         else:
                             action.add_reasoning(f"Not planned target (want {planned_target_name})", -100.0)
-                            logger.debug(f"❌ {loc_name} is NOT the planned target (-100)")
+                            logger.debug(lambda: f"❌ {loc_name} is NOT the planned target (-100)")
 
                     # Determine location type
                     is_docking_bay = location.is_space and getattr(location, 'is_ground', False)
@@ -276,7 +279,7 @@ class CardSelectionEvaluator(ActionEvaluator):
                             action.add_reasoning("Starship to space system - has power!", GOOD_DELTA * 3)
                             # Warn if no permanent pilot - will need a pilot aboard
                             if not has_permanent_pilot:
-                                logger.info(f"ℹ️  {deploying_card.title} needs pilot aboard for power in space")
+                                logger.info(lambda: f"ℹ️  {deploying_card.title} needs pilot aboard for power in space")
                         elif is_ground:
                             # Ground location - starship can't deploy here
                             action.add_reasoning("STARSHIP TO GROUND - invalid!", VERY_BAD_DELTA)
@@ -395,7 +398,7 @@ class CardSelectionEvaluator(ActionEvaluator):
                                     f"CONSOLIDATE: Have {max_existing_power} power elsewhere, don't spread {deploying_power} here",
                                     penalty
                                 )
-                                logger.info(f"⚠️ Extra deploy to empty {loc_name}: penalizing spread ({deploying_power} power)")
+                                logger.info(lambda: f"⚠️ Extra deploy to empty {loc_name}: penalizing spread ({deploying_power} power)")
                             else:
                                 # Moderate character - mild penalty
                                 action.add_reasoning(
@@ -409,7 +412,7 @@ class CardSelectionEvaluator(ActionEvaluator):
                                 f"Consolidate with {our_power} existing power",
                                 consolidation_bonus
                             )
-                            logger.debug(f"✅ Consolidating at {loc_name}: +{consolidation_bonus:.0f}")
+                            logger.debug(lambda: f"✅ Consolidating at {loc_name}: +{consolidation_bonus:.0f}")
                 else:
                     # Location not found - might be deploying to a vehicle/starship/character!
                     # Check if card_id is a card in play
@@ -468,7 +471,7 @@ class CardSelectionEvaluator(ActionEvaluator):
                                     if str(card_id) == str(planned_ship_id):
                                         # This IS the ship the plan wants us to pilot!
                                         action.add_reasoning(f"RE-PILOT PLAN: Deploy aboard {planned_ship_name}!", 150.0)
-                                        logger.info(f"🎯 Following RE-PILOT plan: {deploying_card.title if deploying_card else 'pilot'} → {planned_ship_name}")
+                                        logger.info(lambda: f"🎯 Following RE-PILOT plan: {deploying_card.title if deploying_card else 'pilot'} → {planned_ship_name}")
                                     else:
                                         # Plan says pilot a DIFFERENT ship
                                         action.add_reasoning(f"PLAN SAYS PILOT {planned_ship_name} - not this ship!", -200.0)
@@ -634,7 +637,7 @@ class CardSelectionEvaluator(ActionEvaluator):
                                 # NO opponent icons = NO drain potential = low strategic value!
                                 # Deploying here doesn't threaten opponent's life force
                                 action.add_reasoning("0 opponent icons = no drain potential!", BAD_DELTA)
-                                logger.info(f"⚠️  {loc_name} has 0 opponent icons - penalizing deployment")
+                                logger.info(lambda: f"⚠️  {loc_name} has 0 opponent icons - penalizing deployment")
 
                         # Also check runtime icon data from board state
                         elif loc.my_icons or loc.their_icons:
@@ -651,7 +654,7 @@ class CardSelectionEvaluator(ActionEvaluator):
                                 else:
                                     # NO opponent icons = NO drain potential
                                     action.add_reasoning("0 opponent icons = no drain potential!", BAD_DELTA)
-                                    logger.info(f"⚠️  {loc_name} has 0 opponent icons - penalizing deployment")
+                                    logger.info(lambda: f"⚠️  {loc_name} has 0 opponent icons - penalizing deployment")
                             except ValueError:
                                 pass
 
@@ -785,37 +788,37 @@ class CardSelectionEvaluator(ActionEvaluator):
                             if is_deployable and not can_afford:
                                 # BEST: Can't afford to deploy anyway - lose this first!
                                 action.add_reasoning(f"Can't afford (costs {deploy_cost}, have {total_force})", GOOD_DELTA * 8)
-                                logger.info(f"💀 Force loss: {card_title} unaffordable ({deploy_cost}) - BEST to lose")
+                                logger.info(lambda: f"💀 Force loss: {card_title} unaffordable ({deploy_cost}) - BEST to lose")
                             elif protection > 0:
                                 # PRIORITY CARD - protect it even though it's effect/interrupt!
                                 penalty = -protection * 0.8  # Strong penalty for losing priority cards
                                 action.add_reasoning(f"PRIORITY CARD - protect! (score {protection})", penalty)
-                                logger.info(f"🛡️ Force loss: {card_title} is PRIORITY - protecting!")
+                                logger.info(lambda: f"🛡️ Force loss: {card_title} is PRIORITY - protecting!")
                             elif not is_deployable:
                                 # Non-priority Effects/Interrupts - OK to lose
                                 action.add_reasoning(f"Effect/Interrupt - bot can't use well", GOOD_DELTA * 6)
-                                logger.debug(f"💀 Force loss: {card_title} ({card_type}) - good to lose")
+                                logger.debug(lambda: f"💀 Force loss: {card_title} ({card_type}) - good to lose")
                             elif is_deployable and can_afford:
                                 # Can afford this - lose based on forfeit value
                                 # Lower forfeit = more expendable
                                 forfeit_bonus = (8 - forfeit_val) * 5  # 0 forfeit = +40, 8 forfeit = 0
                                 action.add_reasoning(f"Deployable (forfeit {forfeit_val}) - preserve if valuable", forfeit_bonus)
-                                logger.debug(f"💀 Force loss: {card_title} forfeit {forfeit_val} - score bonus {forfeit_bonus}")
+                                logger.debug(lambda: f"💀 Force loss: {card_title} forfeit {forfeit_val} - score bonus {forfeit_bonus}")
                         else:
                             # NORMAL MODE: Preserve hand, lose from piles
                             if is_deployable:
                                 # AVOID losing valuable deployable cards
                                 action.add_reasoning(f"Deployable card in hand ({card_type})", BAD_DELTA * 4)
-                                logger.debug(f"Force loss: {card_title} is deployable ({card_type}) - avoid")
+                                logger.debug(lambda: f"Force loss: {card_title} is deployable ({card_type}) - avoid")
                             elif protection > 0:
                                 # PRIORITY CARD - protect it!
                                 penalty = -protection * 0.8
                                 action.add_reasoning(f"PRIORITY CARD - protect! (score {protection})", penalty)
-                                logger.info(f"🛡️ Force loss: {card_title} is PRIORITY - protecting!")
+                                logger.info(lambda: f"🛡️ Force loss: {card_title} is PRIORITY - protecting!")
                             else:
                                 # Non-priority Effects/Interrupts - OK to lose
                                 action.add_reasoning(f"Effect/Interrupt - bot can't use well, lose this", GOOD_DELTA * 5)
-                                logger.debug(f"Force loss: {card_title} ({card_type}) - OK to lose")
+                                logger.debug(lambda: f"Force loss: {card_title} ({card_type}) - OK to lose")
 
                     elif zone == "RESERVE_DECK" or zone == "RESERVE":
                         if prefer_hand_loss:
@@ -968,8 +971,8 @@ class CardSelectionEvaluator(ActionEvaluator):
             })
 
         # Sort by forfeit value for logging
-        sorted_by_forfeit = sorted(card_info, key=lambda x: x['forfeit'])
-        logger.info(f"🎯 Forfeit options (sorted by value): {[(c['card_title'], c['forfeit']) for c in sorted_by_forfeit]}")
+        logger.info(lambda: f"🎯 Forfeit options (sorted by value): "
+                           f"{[(c['card_title'], c['forfeit']) for c in sorted(card_info, key=lambda x: x['forfeit'])]}")
         if attrition_remaining > 0:
             logger.info(f"🎯 Attrition remaining to satisfy: {attrition_remaining}")
 
@@ -1003,7 +1006,7 @@ class CardSelectionEvaluator(ActionEvaluator):
             # They're already damaged - no reason to keep them around
             if bs and bs.is_card_hit(card_id):
                 action.add_reasoning("ALREADY HIT - forfeit first!", +150.0)
-                logger.info(f"🎯 {card_title} is HIT - prioritizing for forfeit")
+                logger.info(lambda: f"🎯 {card_title} is HIT - prioritizing for forfeit")
 
             # BONUS: Pilots on ships should be forfeited FIRST
             # (when ship dies, pilots die too - so save the ship by forfeiting pilot)
@@ -1043,7 +1046,7 @@ class CardSelectionEvaluator(ActionEvaluator):
                 # Higher immunity threshold = more valuable
                 immunity_penalty = -10.0 - (threshold * 5)  # immunity<5 = -35, immunity<3 = -25
                 action.add_reasoning(f"Attrition immune (<{threshold}) - keep!", immunity_penalty)
-                logger.debug(f"🛡️ {card_title} immune to attrition < {threshold} - penalizing forfeit")
+                logger.debug(lambda: f"🛡️ {card_title} immune to attrition < {threshold} - penalizing forfeit")
 
             # PENALTY: Characters with extra destiny draws are valuable in battles
             if card_meta and card_meta.draws_extra_destiny > 0:
@@ -1245,7 +1248,7 @@ class CardSelectionEvaluator(ActionEvaluator):
                 if bs.is_card_hit(card_id):
                     action.add_reasoning("ALREADY HIT - forfeit first!", +150.0)
                     card_title = card.card_title or card_id
-                    logger.info(f"🎯 {card_title} is HIT - prioritizing for forfeit")
+                    logger.info(lambda: f"🎯 {card_title} is HIT - prioritizing for forfeit")
 
                 # Penalize forfeiting high-value cards (unique characters, ships)
                 if card_meta:
@@ -1292,7 +1295,7 @@ class CardSelectionEvaluator(ActionEvaluator):
                 # PRIORITY CARD - heavily penalize losing from hand
                 penalty = -protection * 1.0  # Full penalty for losing priority cards
                 action.add_reasoning(f"PRIORITY CARD - protect! (score {protection})", penalty)
-                logger.info(f"🛡️ Battle loss: {card_title} is PRIORITY - protecting!")
+                logger.info(lambda: f"🛡️ Battle loss: {card_title} is PRIORITY - protecting!")
             elif card_meta:
                 card_type = card_meta.card_type or ""
                 if card_type.lower() in ['effect', 'interrupt', 'used interrupt', 'lost interrupt']:
@@ -1497,7 +1500,7 @@ class CardSelectionEvaluator(ActionEvaluator):
                     )
                     action.score = shield_score  # Override base score entirely
                     action.add_reasoning(f"Shield: {shield_reason}")  # Log reason without adding to score
-                    logger.debug(f"🛡️ {card_meta.title}: score={shield_score:.0f} ({shield_reason})")
+                    logger.debug(lambda: f"🛡️ {card_meta.title}: score={shield_score:.0f} ({shield_reason})")
                     actions.append(action)
                     continue  # Skip generic target evaluation
 
@@ -1560,7 +1563,7 @@ class CardSelectionEvaluator(ActionEvaluator):
                                         -30.0
                                     )
                                     logger.debug(
-                                        f"⚡ Blaster Deflection risk: {card.card_title} "
+                                        lambda: f"⚡ Blaster Deflection risk: {card.card_title} "
                                         f"has ability {target_ability}"
                                     )
 
@@ -1576,7 +1579,7 @@ class CardSelectionEvaluator(ActionEvaluator):
                                     -100.0
                                 )
                                 logger.debug(
-                                    f"🛡️ {card.card_title} has targeting immunity: {targeting_text}"
+                                    lambda: f"🛡️ {card.card_title} has targeting immunity: {targeting_text}"
                                 )
                     else:
                         # Our own card - check if this is a BUFF selection
@@ -1616,7 +1619,7 @@ class CardSelectionEvaluator(ActionEvaluator):
                                 )
                                 action.score = shield_score  # Override base score entirely
                                 action.add_reasoning(f"Shield: {shield_reason}")  # Log reason without adding
-                                logger.info(f"🛡️ Fallback shield scoring: {card_meta.title} = {shield_score:.0f}")
+                                logger.info(lambda: f"🛡️ Fallback shield scoring: {card_meta.title} = {shield_score:.0f}")
                             else:
                                 action.add_reasoning(f"Card from blueprint: {card_meta.title}", +10.0)
                         else:
@@ -1756,7 +1759,7 @@ class CardSelectionEvaluator(ActionEvaluator):
                     obj_bonus = objective_handler.score_starting_card(blueprint, card_title)
                     if obj_bonus > 0:
                         action.add_reasoning(f"OBJECTIVE REQUIREMENT", obj_bonus)
-                        logger.info(f"🎯 {card_title} is required by objective! (+{obj_bonus})")
+                        logger.info(lambda: f"🎯 {card_title} is required by objective! (+{obj_bonus})")
                     else:
                         # Not a required card - lower priority during starting phase
                         action.add_reasoning("Not objective requirement", -20.0)
@@ -1829,7 +1832,7 @@ class CardSelectionEvaluator(ActionEvaluator):
                         drain_bonus = their_icons * 10.0
                         action.add_reasoning(f"{their_icons} opponent icon(s) = drain potential", drain_bonus)
 
-                    logger.debug(f"  {card_meta.title}: {my_icons} my icons, {their_icons} their icons")
+                    logger.debug(lambda: f"  {card_meta.title}: {my_icons} my icons, {their_icons} their icons")
                 else:
                     # Add small random factor if no metadata
                     action.add_reasoning("Unknown location", random.uniform(0, 10))
@@ -1940,7 +1943,7 @@ class CardSelectionEvaluator(ActionEvaluator):
                         # PRIORITY CARD - don't lose it!
                         penalty = -protection * 0.8
                         action.add_reasoning(f"PRIORITY CARD - protect! (score {protection})", penalty)
-                        logger.info(f"🛡️ Lost pile: {card_meta.title} is PRIORITY - protecting!")
+                        logger.info(lambda: f"🛡️ Lost pile: {card_meta.title} is PRIORITY - protecting!")
                     elif "effect" in card_type or "interrupt" in card_type:
                         # Non-priority effects/interrupts - OK to lose
                         action.add_reasoning(f"{card_meta.card_type} - OK to lose", 40.0)
@@ -2051,7 +2054,7 @@ class CardSelectionEvaluator(ActionEvaluator):
                         # PRIORITY CARD - don't place it!
                         penalty = -protection * 0.6  # Slightly less severe than losing
                         action.add_reasoning(f"PRIORITY CARD - protect! (score {protection})", penalty)
-                        logger.info(f"🛡️ Pile placement: {card_meta.title} is PRIORITY - protecting!")
+                        logger.info(lambda: f"🛡️ Pile placement: {card_meta.title} is PRIORITY - protecting!")
                     elif "effect" in card_type or "interrupt" in card_type:
                         # Non-priority effects/interrupts - OK to place
                         action.add_reasoning(f"{card_meta.card_type} - OK to place", 30.0)
@@ -23,15 +23,17 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 from .base import ActionEvaluator, DecisionContext, EvaluatedAction, ActionType
 from ..card_loader import get_card
+from ..hand_snapshot import get_hand_snapshot
 from ..game_strategy import GameStrategy, ThreatLevel
 from ..deploy_planner import DeployPhasePlanner, DeployStrategy
 from ..shield_strategy import score_shield_for_deployment, get_shield_tracker, reset_shield_tracker
-from ..combo_scorer import score_combo_potential
+from ..combo_scorer import has_combo_partners, score_combo_potential
 from ..strategy_profile import get_current_profile, StrategyMode
 from ..strategy_config import get_config
+from ..tracing import get_tracer
 from config import config
 
-logger = logging.getLogger(__name__)
+logger = get_tracer('evaluators', logging.getLogger(__name__))
 
 
 class DeployEvaluator(ActionEvaluator):
@@ -48,6 +50,8 @@ class DeployEvaluator(ActionEvaluator):
     - Cross-turn focus bonus for matching card types
     """
 
+    my_turn_only = True
+
     def __init__(self):
         super().__init__("Deploy")
         # Track cards we've already tried deploying this turn to avoid retry loops
@@ -83,8 +87,11 @@ class DeployEvaluator(ActionEvaluator):
         if hasattr(self.planner, 'finalize_game'):
             trajectory = self.planner.finalize_game(won)
             if trajectory and len(trajectory.experiences) > 0:
-                from ..neural_planner.trajectory_io import save_trajectory
-                save_trajectory(trajectory)
+                import os
+                from pathlib import Path
+                from ..neural_planner.trajectory_io import DEFAULT_TRAJECTORY_DIR, save_trajectory
+                # A training collector reads the games of its bot pair from its own directory
+                save_trajectory(trajectory, Path(os.environ.get('NEURAL_TRAJECTORY_DIR') or DEFAULT_TRAJECTORY_DIR))
                 logger.info(f"Saved training trajectory: {len(trajectory.experiences)} experiences, "
                            f"won={won}")
 
@@ -101,7 +108,12 @@ class DeployEvaluator(ActionEvaluator):
         Otherwise, uses the standard DeployPhasePlanner.
 
         If NEURAL_TRAINING_MODE=1 env var is set, uses TrainingNeuralPlanner
-        which collects experiences for training.
+        which collects experiences for training (NEURAL_MODEL_PATH overrides
+        the model path, so the bot follows the learner's published weights).
+
+        If DISTILL_RECORD=1 env var is set, the rules-based planner is wrapped
+        in a DistillationRecorder that records its decisions for behaviour
+        cloning.
         """
         import os
 
@@ -124,6 +136,7 @@ class DeployEvaluator(ActionEvaluator):
                 if training_mode:
                     from ..neural_planner.collector import TrainingNeuralPlanner
                     device = os.environ.get('NEURAL_DEVICE', 'cpu')
+                    model_path = os.environ.get('NEURAL_MODEL_PATH') or model_path
                     logger.info(f"Using TrainingNeuralPlanner (model={model_path}, "
                                f"device={device}, training_mode=True)")
                     return TrainingNeuralPlanner(
@@ -141,6 +154,8 @@ class DeployEvaluator(ActionEvaluator):
                         model_path=model_path,
                         fallback_planner=fallback,
                         confidence_threshold=confidence_threshold,
+                        quantize=neural_config.get('quantize_int8', False),
+                        quantize_min_agreement=neural_config.get('quantize_min_agreement', 0.98),
                     )
             except ImportError as e:
                 logger.warning(f"Neural planner not available ({e}), using rules-based")
@@ -148,11 +163,21 @@ class DeployEvaluator(ActionEvaluator):
                 logger.error(f"Failed to create neural planner ({e}), using rules-based")
 
         # Default to rules-based planner
-        return DeployPhasePlanner(
+        planner = DeployPhasePlanner(
             deploy_threshold=config.DEPLOY_THRESHOLD,
             battle_force_reserve=config.BATTLE_FORCE_RESERVE
         )
 
+        if os.environ.get('DISTILL_RECORD', '').lower() in ('1', 'true', 'yes'):
+            try:
+                from ..neural_planner.distillation import DistillationRecorder
+                logger.info("Recording rules planner decisions for distillation")
+                return DistillationRecorder(planner)
+            except ImportError as e:
+                logger.warning(f"Distillation recorder not available ({e})")
+
+        return planner
+
     def _get_game_strategy(self, context: DecisionContext) -> Optional[GameStrategy]:
         """Get GameStrategy from board_state's strategy_controller"""
         if context.board_state and context.board_state.strategy_controller:
@@ -165,40 +190,9 @@ class DeployEvaluator(ActionEvaluator):
 
         Returns list of (card_in_hand, card_metadata) tuples for pilots.
         """
-        pilots = []
         if not bs or not bs.cards_in_hand:
-            return pilots
-
-        for card in bs.cards_in_hand:
-            if card.blueprint_id:
-                metadata = get_card(card.blueprint_id)
-                if metadata and metadata.is_character and metadata.is_pilot:
-                    pilots.append((card, metadata))
-
-        return pilots
-
-    def _can_pilot_ship(self, pilot_metadata, ship_metadata) -> bool:
-        """
-        Check if a pilot can pilot a specific ship/vehicle.
-
-        In SWCCG:
-        - Any character with Pilot icon can pilot any compatible ship
-        - Matching pilots (Luke + Red 5) can deploy for free aboard matching ship
-        - For simplicity, we assume any pilot can pilot any ship for now
-        """
-        if not pilot_metadata or not ship_metadata:
-            return False
-
-        # Must be a pilot character
-        if not pilot_metadata.is_pilot:
-            return False
-
-        # Ship must be a starship or vehicle
-        if not (ship_metadata.is_starship or ship_metadata.is_vehicle):
-            return False
-
-        # TODO: Add matching pilot logic for reduced deploy costs
-        return True
+            return []
+        return [(hc.card, hc.metadata) for hc in get_hand_snapshot(bs).pilots]
 
     def _check_can_deploy_with_pilot(self, ship_metadata, bs) -> tuple:
         """
@@ -214,24 +208,13 @@ class DeployEvaluator(ActionEvaluator):
         if ship_metadata.has_permanent_pilot:
             return (True, None, ship_metadata.deploy_value, "Ship has permanent pilot")
 
-        # Find available pilots in hand
-        pilots_in_hand = self._find_pilots_in_hand(bs)
-        if not pilots_in_hand:
+        # Cheapest pilot in hand (any pilot can fly any starship/vehicle)
+        hand = get_hand_snapshot(bs)
+        pilot = next((hc for hc in hand.by_cost if hc.is_character and hc.is_pilot), None)
+        if not pilot:
             return (False, None, ship_metadata.deploy_value, "No pilots in hand!")
-
-        # Find the cheapest compatible pilot
-        cheapest_pilot = None
-        cheapest_cost = float('inf')
-
-        for card, pilot_meta in pilots_in_hand:
-            if self._can_pilot_ship(pilot_meta, ship_metadata):
-                pilot_cost = pilot_meta.deploy_value or 0
-                if pilot_cost < cheapest_cost:
-                    cheapest_cost = pilot_cost
-                    cheapest_pilot = pilot_meta
-
-        if not cheapest_pilot:
-            return (False, None, ship_metadata.deploy_value, "No compatible pilots in hand!")
+        cheapest_pilot = pilot.metadata
+        cheapest_cost = pilot.cost
 
         # Calculate total cost
         ship_cost = ship_metadata.deploy_value or 0
@@ -263,7 +246,7 @@ class DeployEvaluator(ActionEvaluator):
         for card_id, card in bs.cards_in_play.items():
             # Log all our cards for debugging
             if card.owner == bs.my_player_name:
-                logger.debug(f"  Our card #{card_id}: {card.card_title or 'no title'} (blueprint={card.blueprint_id})")
+                logger.debug(lambda: f"  Our card #{card_id}: {card.card_title or 'no title'} (blueprint={card.blueprint_id})")
 
             if card.owner != bs.my_player_name:
                 continue
@@ -285,7 +268,7 @@ class DeployEvaluator(ActionEvaluator):
 
                 # Check if it has permanent pilot
                 if metadata.has_permanent_pilot:
-                    logger.debug(f"  ✓ {card_type.title()} {metadata.title} (#{card_id}): has permanent pilot - piloted")
+                    logger.debug(lambda: f"  ✓ {card_type.title()} {metadata.title} (#{card_id}): has permanent pilot - piloted")
                     continue
 
                 # Check if it has a pilot aboard (attached)
@@ -299,7 +282,7 @@ class DeployEvaluator(ActionEvaluator):
                         break
 
                 if has_pilot_aboard:
-                    logger.debug(f"  ✓ {card_type.title()} {metadata.title} (#{card_id}): has pilot aboard ({pilot_name}) - piloted")
+                    logger.debug(lambda: f"  ✓ {card_type.title()} {metadata.title} (#{card_id}): has pilot aboard ({pilot_name}) - piloted")
                     continue
 
                 # This ship/vehicle is unpiloted!
@@ -485,7 +468,7 @@ class DeployEvaluator(ActionEvaluator):
                         deployed_cards.append(instruction)
 
                 for instruction in deployed_cards:
-                    logger.info(f"📋 Auto-detected deployment: {instruction.card_name} left hand")
+                    logger.info(lambda: f"📋 Auto-detected deployment: {instruction.card_name} left hand")
                     self.planner.record_deployment(instruction.card_blueprint_id)
             # Show plan status - useful for debugging
             if deploy_plan.is_plan_complete():
@@ -519,7 +502,7 @@ class DeployEvaluator(ActionEvaluator):
                 is_special_ability = "Reserve Deck" in action_text or "Lost Pile" in action_text
                 if not is_special_ability:
                     regular_deploy_count += 1
-            logger.debug(f"   Action {i}: id={action_id}, has_deploy={has_deploy}, text={action_text[:80]}...")
+            logger.debug(lambda: f"   Action {i}: id={action_id}, has_deploy={has_deploy}, text={action_text[:80]}...")
 
         if deploy_action_count == 0 and deploy_plan:
             if deploy_plan.is_plan_complete():
@@ -638,7 +621,7 @@ class DeployEvaluator(ActionEvaluator):
                 blueprint_id = self._extract_blueprint_from_action(action_text)
                 card_metadata = None
 
-                logger.debug(f"   Deploy action found: blueprint_id={blueprint_id}, card_id={card_id}")
+                logger.debug(lambda: f"   Deploy action found: blueprint_id={blueprint_id}, card_id={card_id}")
 
                 if blueprint_id:
                     action.blueprint_id = blueprint_id  # Track for planner notification
@@ -651,7 +634,7 @@ class DeployEvaluator(ActionEvaluator):
                         blueprint_id = tracked_card.blueprint_id
                         action.blueprint_id = blueprint_id  # Track for planner notification
                         card_metadata = get_card(blueprint_id)
-                        logger.debug(f"   Used fallback: blueprint_id={blueprint_id}")
+                        logger.debug(lambda: f"   Used fallback: blueprint_id={blueprint_id}")
                     else:
                         logger.warning(f"   ⚠️ Fallback failed: card_id={card_id} not in cards_in_play or has no blueprint")
 
@@ -678,15 +661,15 @@ class DeployEvaluator(ActionEvaluator):
                             if self.planner.has_favorable_battle_setup(bs):
                                 plan_score = -50.0
                                 plan_reason = "Skip extras - commit to favorable battle!"
-                                logger.info(f"⚔️ {card_metadata.title}: {plan_reason}")
+                                logger.info(lambda: f"⚔️ {card_metadata.title}: {plan_reason}")
 
                         action.add_reasoning(plan_reason, plan_score)
 
                         # If card is in plan, that's all we need
                         if plan_score > 0:
-                            logger.info(f"✅ {card_metadata.title} IN PLAN: {plan_reason}")
+                            logger.info(lambda: f"✅ {card_metadata.title} IN PLAN: {plan_reason}")
                         else:
-                            logger.info(f"❌ {card_metadata.title} NOT in plan: {plan_reason}")
+                            logger.info(lambda: f"❌ {card_metadata.title} NOT in plan: {plan_reason}")
                     else:
                         # No plan or no blueprint - use basic scoring
                         if card_metadata.is_location:
@@ -698,7 +681,7 @@ class DeployEvaluator(ActionEvaluator):
                     # COMBO SCORING - Bonus for synergistic cards
                     # Check if this card has combo partners on board or in hand
                     # =======================================================
-                    if bs and card_metadata.title:
+                    if bs and card_metadata.title and has_combo_partners(card_metadata.title, blueprint_id):
                         # Collect card titles on board (our cards)
                         cards_on_board = []
                         for cid, card_in_play in bs.cards_in_play.items():
@@ -730,7 +713,7 @@ class DeployEvaluator(ActionEvaluator):
 
                         if combo_score > 0:
                             action.add_reasoning(combo_reason, combo_score)
-                            logger.info(f"🔗 {card_metadata.title}: {combo_reason} (+{combo_score:.0f})")
+                            logger.info(lambda: f"🔗 {card_metadata.title}: {combo_reason} (+{combo_score:.0f})")
 
                     # Always check affordability
                     if bs and bs.force_pile < card_metadata.deploy_value:
@@ -748,7 +731,7 @@ class DeployEvaluator(ActionEvaluator):
                             action.add_reasoning(f"NO VALID TARGETS: {target_msg}", -500.0)
                             logger.warning(f"⚠️ {card_metadata.title}: {target_msg}")
                         else:
-                            logger.debug(f"🗡️ {card_metadata.title}: {target_msg}")
+                            logger.debug(lambda: f"🗡️ {card_metadata.title}: {target_msg}")
                 else:
                     logger.warning(f"⚠️  Deploy action with unknown card: cardId={card_id}")
                     action.add_reasoning(f"Deploy action (card unknown)", -50.0)
@@ -864,7 +847,7 @@ class DeployEvaluator(ActionEvaluator):
                 # PILOT boarding specific ship - match against ship card_id
                 if card_id == planned_ship_card_id:
                     action.add_reasoning(f"BOARD SHIP: {planned_ship_name}", +200.0)
-                    logger.info(f"✅ Card {card_id} is the PLANNED SHIP {planned_ship_name} (+200)")
+                    logger.info(lambda: f"✅ Card {card_id} is the PLANNED SHIP {planned_ship_name} (+200)")
                 elif planned_ship_card_id in context.card_ids:
                     # Planned ship IS available, so penalize this non-planned option
                     action.add_reasoning(f"Not planned ship (want {planned_ship_name})", -100.0)
@@ -876,7 +859,7 @@ class DeployEvaluator(ActionEvaluator):
                     # Allow deploying to the system location as fallback
                     if card_id == planned_target_id:
                         action.add_reasoning(f"SYSTEM FALLBACK: {planned_target_name}", +100.0)
-                        logger.info(f"📋 Ship not offered, deploying pilot to system {planned_target_name}")
+                        logger.info(lambda: f"📋 Ship not offered, deploying pilot to system {planned_target_name}")
                     else:
                         action.add_reasoning(f"Neither ship nor system available", -50.0)
 
@@ -892,11 +875,11 @@ class DeployEvaluator(ActionEvaluator):
                             target_loc = bs.locations[target_loc_idx]
                             if target_loc and target_loc.card_id == planned_target_id:
                                 target_matches_plan = True
-                                logger.info(f"✅ Weapon target {target_card.card_title} is at planned location {planned_target_name}")
+                                logger.info(lambda: f"✅ Weapon target {target_card.card_title} is at planned location {planned_target_name}")
 
                 if card_id == planned_target_id or target_matches_plan:
                     action.add_reasoning(f"PLANNED TARGET: {planned_target_name}", +200.0)
-                    logger.info(f"✅ Card {card_id} is the PLANNED target (+200)")
+                    logger.info(lambda: f"✅ Card {card_id} is the PLANNED target (+200)")
                 elif planned_target_id in context.card_ids:
                     # Planned target IS available, so penalize this non-planned option
                     action.add_reasoning(f"Not planned target (want {planned_target_name})", -100.0)
@@ -919,7 +902,7 @@ class DeployEvaluator(ActionEvaluator):
                         action.add_reasoning(f"Not at planned location (want {planned_target_name})", -100.0)
                     elif not any_match_at_planned_loc:
                         # No targets at planned location - allow deploying elsewhere
-                        logger.info(f"📋 No weapon targets at planned location {planned_target_name} - allowing other options")
+                        logger.info(lambda: f"📋 No weapon targets at planned location {planned_target_name} - allowing other options")
                         action.add_reasoning(f"Planned location has no valid targets - ok to deploy here", +50.0)
                 else:
                     # Planned target is NOT available - check for backup
@@ -945,7 +928,7 @@ class DeployEvaluator(ActionEvaluator):
                     if backup_id and card_id == backup_id:
                         # This IS the backup target
                         action.add_reasoning(f"BACKUP TARGET: {backup_name} ({backup_reason})", +150.0)
-                        logger.info(f"✅ Card {card_id} is the BACKUP target (+150) - primary {planned_target_name} unavailable")
+                        logger.info(lambda: f"✅ Card {card_id} is the BACKUP target (+150) - primary {planned_target_name} unavailable")
 
                         # === SAFETY CHECK: Don't walk into a massacre! ===
                         # Even if this is the backup, check if deploying our card there is suicidal
@@ -1086,7 +1069,7 @@ class DeployEvaluator(ActionEvaluator):
                                 # UNPILOTED vehicle/starship - HIGH PRIORITY!
                                 # This gives the vehicle/starship power
                                 action.add_reasoning("PILOT UNPILOTED VEHICLE/STARSHIP!", +150.0)
-                                logger.info(f"🎯 {deploying_card.title} can pilot unpiloted {target_name}")
+                                logger.info(lambda: f"🎯 {deploying_card.title} can pilot unpiloted {target_name}")
                             else:
                                 # Already has a pilot - lower priority (adds ability but redundant)
                                 action.add_reasoning("Vehicle already has pilot", -20.0)
@@ -1218,19 +1201,20 @@ class DeployEvaluator(ActionEvaluator):
                 # Find if any instruction is for a pilot going aboard this ship
                 if instruction.aboard_ship_blueprint_id == ship_blueprint:
                     planned_pilot_blueprint = instruction.card_blueprint_id
-                    logger.info(f"   📋 Plan says pilot: {instruction.card_name} (blueprint={planned_pilot_blueprint})")
+                    logger.info(lambda: f"   📋 Plan says pilot: {instruction.card_name} (blueprint={planned_pilot_blueprint})")
                     break
 
         # Build list of pilot cards from hand that match the card_ids
         # card_ids are game instance IDs, we need to match against cards_in_hand
         pilot_card_map = {}  # card_id -> (card_in_hand, metadata)
+        matching_ids = set()
         if bs and bs.cards_in_hand:
-            for card in bs.cards_in_hand:
-                if card.card_id in context.card_ids:
-                    metadata = get_card(card.blueprint_id)
-                    if metadata:
-                        pilot_card_map[card.card_id] = (card, metadata)
-                        logger.debug(f"   Found pilot: {metadata.title} (card_id={card.card_id}, blueprint={card.blueprint_id})")
+            hand = get_hand_snapshot(bs)
+            for hc in hand:
+                if hc.card_id in context.card_ids:
+                    pilot_card_map[hc.card_id] = (hc.card, hc.metadata)
+                    logger.debug(lambda: f"   Found pilot: {hc.name} (card_id={hc.card_id}, blueprint={hc.blueprint_id})")
+            matching_ids = {hc.card_id for hc in hand.matching_pilots(ship_blueprint)}
 
         # Score each pilot option
         for card_id in context.card_ids:
@@ -1249,7 +1233,7 @@ class DeployEvaluator(ActionEvaluator):
                 # Check if this is the planned pilot
                 if planned_pilot_blueprint and card_in_hand.blueprint_id == planned_pilot_blueprint:
                     action.add_reasoning(f"PLANNED pilot for {ship_name}", +200.0)
-                    logger.info(f"   ✅ {pilot_meta.title} is the PLANNED pilot (+200)")
+                    logger.info(lambda: f"   ✅ {pilot_meta.title} is the PLANNED pilot (+200)")
                 else:
                     # Score based on pilot quality
                     # Lower deploy cost is better (we're paying extra for this)
@@ -1262,11 +1246,12 @@ class DeployEvaluator(ActionEvaluator):
                     ability_score = ability * 10
                     action.add_reasoning(f"Ability {ability}", ability_score)
 
-                    # Prefer matching pilots (check gametext for ship name)
-                    if pilot_meta.gametext and ship_name and ship_name.lower().replace('•', '') in pilot_meta.gametext.lower():
+                    # Prefer matching pilots (matching field, else gametext names the ship)
+                    if card_id in matching_ids or (pilot_meta.gametext and ship_name and
+                                                   ship_name.lower().replace('•', '') in pilot_meta.gametext.lower()):
                         action.add_reasoning(f"Matching pilot for {ship_name}!", +50.0)
 
-                    logger.debug(f"   {pilot_meta.title}: cost={deploy_cost}, ability={ability}, score={action.score}")
+                    logger.debug(lambda: f"   {pilot_meta.title}: cost={deploy_cost}, ability={ability}, score={action.score}")
 
                 # Check affordability
                 if bs and pilot_meta.deploy_value:
@@ -1310,7 +1295,7 @@ class DeployEvaluator(ActionEvaluator):
         for i, card_id in enumerate(context.card_ids):
             # Check if this card is selectable
             if i < len(context.selectable) and not context.selectable[i]:
-                logger.debug(f"Skipping non-selectable card: {card_id}")
+                logger.debug(lambda: f"Skipping non-selectable card: {card_id}")
                 continue
 
             blueprint = context.blueprints[i] if i < len(context.blueprints) else None
@@ -1362,7 +1347,7 @@ class DeployEvaluator(ActionEvaluator):
                             blueprint, card_metadata.title, turn_number, my_side, bs
                         )
                         action.add_reasoning(f"Shield: {shield_reason}", shield_score)
-                        logger.debug(f"🛡️ {card_metadata.title}: score={shield_score:.0f} ({shield_reason})")
+                        logger.debug(lambda: f"🛡️ {card_metadata.title}: score={shield_score:.0f} ({shield_reason})")
 
                     # === RESERVE DECK DEPLOY LOGIC ===
                     if "reserve deck" in text_lower:
@@ -1759,23 +1744,19 @@ class DeployEvaluator(ActionEvaluator):
 
         total_power = 0
 
-        # Collect deployable cards
+        # Deployable cards, highest power first to maximize power deployed
         deployable_cards = []
-        for card in board_state.cards_in_hand:
-            metadata = get_card(card.blueprint_id)
-            if not metadata:
-                continue
-
+        for hc in get_hand_snapshot(board_state).by_power:
             # Check if card can deploy to this location type
             can_deploy_here = False
             if location.is_space and not getattr(location, 'is_ground', False):
                 # Pure space - only starships
-                can_deploy_here = metadata.is_starship
+                can_deploy_here = hc.is_starship
             elif getattr(location, 'is_ground', True):
                 # Ground or docking bay - characters can go anywhere, vehicles need exterior
-                if metadata.is_character:
+                if hc.is_character:
                     can_deploy_here = True
-                elif metadata.is_vehicle:
+                elif hc.is_vehicle:
                     # Check if location has exterior icon
                     loc_meta = get_card(location.blueprint_id) if location.blueprint_id else None
                     has_exterior = loc_meta.is_exterior if loc_meta else True
@@ -1783,18 +1764,15 @@ class DeployEvaluator(ActionEvaluator):
                 # Don't count starships at docking bays - they have 0 power there
             else:
                 # Default - assume characters can deploy
-                can_deploy_here = metadata.is_character
+                can_deploy_here = hc.is_character
 
-            if can_deploy_here and metadata.deploy_value and metadata.deploy_value > 0:
+            if can_deploy_here and hc.base_cost > 0:
                 deployable_cards.append({
-                    'power': metadata.power_value or 0,
-                    'cost': metadata.deploy_value,
-                    'name': metadata.title
+                    'power': hc.power,
+                    'cost': hc.cost,
+                    'name': hc.name
                 })
 
-        # Sort by power (highest first) to maximize power deployed
-        deployable_cards.sort(key=lambda x: x['power'], reverse=True)
-
         # "Deploy" cards until we run out of Force
         remaining_force = available_force
         for card in deployable_cards:
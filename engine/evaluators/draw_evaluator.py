@@ -19,21 +19,20 @@ from typing import List, Optional
 from .base import ActionEvaluator, DecisionContext, EvaluatedAction, ActionType
 from ..game_strategy import GameStrategy, HAND_SOFT_CAP, HAND_HARD_CAP
 from ..strategy_profile import get_current_profile, StrategyMode
-from ..strategy_config import get_config
+from ..strategy_config import section_reader, weight_reader
+from ..tracing import get_tracer
 
-logger = logging.getLogger(__name__)
+logger = get_tracer('evaluators', logging.getLogger(__name__))
 
 # =============================================================================
 # CONFIG-DRIVEN PARAMETERS
 # =============================================================================
 
-def _get_draw_config(key: str, default):
-    """Get draw strategy config value."""
-    return get_config().get('draw_strategy', key, default)
+# _get_draw_config(key, default) -> draw strategy config value
+_get_draw_config = section_reader('draw_strategy')
 
-def _get_weight(key: str, default: float) -> float:
-    """Get evaluator weight."""
-    return get_config().get_weight('draw', key, default)
+# _get_weight(key, default) -> evaluator weight
+_get_weight = weight_reader('draw')
 
 # Rank deltas
 def get_very_good_delta() -> float:
@@ -114,6 +113,10 @@ class DrawEvaluator(ActionEvaluator):
     - Force generation deficit (draw to find locations)
     """
 
+    decision_types = frozenset({'CARD_ACTION_CHOICE', 'ACTION_CHOICE'})
+    my_turn_only = True
+    phases = ('draw',)
+
     def __init__(self):
         super().__init__("Draw")
 
@@ -157,7 +160,7 @@ class DrawEvaluator(ActionEvaluator):
             action_lower = action_text.lower()
             # Match "Draw" but not "Draw destiny" (destiny is random number, not card draw)
             if "draw" in action_lower and "destiny" not in action_lower:
-                logger.info(f"🎴 DrawEvaluator triggered by action: '{action_text}'")
+                logger.info(lambda: f"🎴 DrawEvaluator triggered by action: '{action_text}'")
                 return True
 
         return False
@@ -179,10 +182,10 @@ class DrawEvaluator(ActionEvaluator):
                 continue
             if "destiny" in action_lower:
                 # "Draw destiny to X" is NOT drawing cards - skip it
-                logger.debug(f"🎴 Skipping destiny draw action: '{action_text}'")
+                logger.debug(lambda: f"🎴 Skipping destiny draw action: '{action_text}'")
                 continue
 
-            logger.info(f"🎴 Evaluating draw action: '{action_text}' (id={action_id})")
+            logger.info(lambda: f"🎴 Evaluating draw action: '{action_text}' (id={action_id})")
 
             action = EvaluatedAction(
                 action_id=action_id,
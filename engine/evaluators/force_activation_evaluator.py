@@ -15,18 +15,18 @@ Ported from C# BotAIHelper.ForceToActivate() and RankActivateForceAction()
 import logging
 from typing import List, Optional
 from .base import ActionEvaluator, DecisionContext, EvaluatedAction, ActionType
-from ..strategy_config import get_config
+from ..strategy_config import section_reader
+from ..tracing import get_tracer
 
-logger = logging.getLogger(__name__)
+logger = get_tracer('evaluators', logging.getLogger(__name__))
 
 
 # =============================================================================
 # CONFIG-DRIVEN PARAMETERS
 # =============================================================================
 
-def _get_force_config(key: str, default):
-    """Get force activation strategy config value."""
-    return get_config().get('force_activation_strategy', key, default)
+# _get_force_config(key, default) -> force activation strategy config value
+_get_force_config = section_reader('force_activation_strategy')
 
 # Late-game thresholds
 def get_late_game_life_force() -> int:
@@ -54,6 +54,8 @@ class ForceActivationEvaluator(ActionEvaluator):
     as the action_id (as a string).
     """
 
+    decision_types = frozenset({'INTEGER'})
+
     def __init__(self):
         super().__init__("ForceActivation")
 
@@ -17,21 +17,21 @@ import logging
 from typing import List, Optional, Tuple
 from .base import ActionEvaluator, DecisionContext, EvaluatedAction, ActionType
 from ..game_strategy import GameStrategy, ThreatLevel
-from ..strategy_config import get_config
+from ..strategy_config import section_reader, weight_reader
+from ..lookahead import MOVE, consult_lookahead, get_evaluator_weight
+from ..tracing import get_tracer
 
-logger = logging.getLogger(__name__)
+logger = get_tracer('evaluators', logging.getLogger(__name__))
 
 # =============================================================================
 # CONFIG-DRIVEN PARAMETERS
 # =============================================================================
 
-def _get_move_config(key: str, default):
-    """Get move strategy config value."""
-    return get_config().get('move_strategy', key, default)
+# _get_move_config(key, default) -> move strategy config value
+_get_move_config = section_reader('move_strategy')
 
-def _get_weight(key: str, default: float) -> float:
-    """Get evaluator weight."""
-    return get_config().get_weight('move', key, default)
+# _get_weight(key, default) -> evaluator weight
+_get_weight = weight_reader('move')
 
 # Rank deltas
 def get_very_good_delta() -> float:
@@ -94,6 +94,9 @@ class MoveEvaluator(ActionEvaluator):
     - Strategic retreat from dangerous/retreat threat levels
     """
 
+    decision_types = frozenset({'CARD_ACTION_CHOICE', 'ACTION_CHOICE'})
+    my_turn_only = True
+
     def __init__(self):
         super().__init__("Move")
         self.pending_move_card_ids = set()  # Track cards we already tried moving
@@ -170,6 +173,7 @@ class MoveEvaluator(ActionEvaluator):
                 if card:
                     loc_idx = card.location_index
                     self._rank_move_from_location(action, bs, loc_idx, card_id, game_strategy)
+                    self._apply_lookahead(action, bs, loc_idx)
                 else:
                     action.add_reasoning("Card not found in play", get_bad_delta())
             else:
@@ -179,6 +183,16 @@ class MoveEvaluator(ActionEvaluator):
 
         return actions
 
+    def _apply_lookahead(self, action: EvaluatedAction, board_state, loc_idx: int):
+        """Adjust by the lookahead search's value of moving from here vs the best alternative."""
+        result = consult_lookahead(board_state)
+        if result is None:
+            return
+        advantage = result.advantage(lambda a: a.kind == MOVE and a.source == loc_idx)
+        if advantage is not None:
+            action.add_reasoning(f"Lookahead: moving from here {advantage:+.2f} vs best alternative",
+                                 advantage * get_evaluator_weight())
+
     def _rank_move_from_location(self, action: EvaluatedAction, board_state, loc_idx: int,
                                    card_id: str, game_strategy: Optional[GameStrategy] = None):
         """
@@ -426,7 +440,7 @@ class MoveEvaluator(ActionEvaluator):
                     except ValueError:
                         their_icons = 0
 
-            logger.debug(f"   Adj loc {adj_idx}: their_power={their_power_raw} (has_cards={their_has_cards}), our_power={our_power_there}, their_icons={their_icons}")
+            logger.debug(lambda: f"   Adj loc {adj_idx}: their_power={their_power_raw} (has_cards={their_has_cards}), our_power={our_power_there}, their_icons={their_icons}")
 
             # Skip if we already have good presence
             if our_power_there >= establish_threshold and their_power == 0:
@@ -595,7 +609,7 @@ class MoveEvaluator(ActionEvaluator):
                     except ValueError:
                         their_icons = 0
 
-            logger.debug(f"   Attack target loc {adj_idx}: their_power={their_power}, "
+            logger.debug(lambda: f"   Attack target loc {adj_idx}: their_power={their_power}, "
                         f"our_power={our_power_there}, their_icons={their_icons}")
 
             # Calculate attack scenarios
@@ -8,7 +8,8 @@ Ported from Unity C# GameCommsHelper.cs
 """
 
 import xml.etree.ElementTree as ET
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional, Set
 import logging
 from .board_state import BoardState, LocationInPlay
 from .card_loader import get_card
@@ -16,8 +17,63 @@ from .objective_handler import get_objective_handler
 from .strategic_state import StrategicState
 from . import game_state_logger
 from .deck_tracker import get_deck_tracker
+from .speculative_planner import BOARD_EVENT_TYPES
+from .tracing import get_tracer
 
-logger = logging.getLogger(__name__)
+logger = get_tracer('events', logging.getLogger(__name__))
+
+# Events that neither read nor write anything a GS sets. A GS followed by
+# another GS with only these in between is superseded: the later one
+# overwrites every field before anything looks at them. Decisions, phase
+# and turn changes and participant events read that state, so they
+# always see every GS applied.
+GS_TRANSPARENT_EVENT_TYPES = frozenset(['PCIP', 'RCIP', 'PCIPAR', 'RCFP', 'RLFP', 'MCIP', 'M', 'IP', 'CAC'])
+
+_GS_GENERATION_ATTRS = ('darkForceGeneration', 'lightForceGeneration')
+_GS_POWER_TAGS = ('darkPowerAtLocations', 'lightPowerAtLocations')
+
+
+def _gs_coverage(event: ET.Element):
+    """What a GS event sets: (generation attrs, power elements, player zone names)."""
+    generation = frozenset(a for a in _GS_GENERATION_ATTRS if event.get(a) is not None)
+    power = set()
+    zones = set()
+    # GEMP puts the zones and power elements directly under <ge>
+    for child in event:
+        if child.tag == 'playerZones':
+            zones.add(child.get('name', ''))
+        elif child.tag in _GS_POWER_TAGS:
+            power.add(child.tag)
+    return generation, power, zones
+
+
+def find_superseded_gs(events: List[ET.Element]) -> Set[int]:
+    """
+    Indices of GS events in one update batch that a later GS supersedes.
+
+    A GS is superseded when the next GS follows with only
+    GS_TRANSPARENT_EVENT_TYPES in between and sets everything it sets
+    (GEMP omits force generation and power elements from some GS events).
+    """
+    superseded = set()
+    pending = None  # (index, coverage) of the last GS not yet superseded
+    for i, event in enumerate(events):
+        event_type = event.get('type', '')
+        if event_type == 'GS':
+            coverage = _gs_coverage(event)
+            if pending is not None and all(old <= new for old, new in zip(pending[1], coverage)):
+                superseded.add(pending[0])
+            pending = (i, coverage)
+        elif event_type not in GS_TRANSPARENT_EVENT_TYPES:
+            pending = None
+    return superseded
+
+
+@lru_cache(maxsize=256)
+def _location_index(attr_name: str) -> Optional[int]:
+    """Location index of a power attribute ("_3", "locationIndex3" -> 3)."""
+    numeric_part = ''.join(filter(str.isdigit, attr_name))
+    return int(numeric_part) if numeric_part else None
 
 
 class EventProcessor:
@@ -35,12 +91,18 @@ class EventProcessor:
         self._on_battle_start_callbacks = []
         # Callbacks for side detection (for delayed welcome message)
         self._on_side_detected_callbacks = []
+        # Callbacks for board-changing events (for speculative planning)
+        self._on_board_changed_callbacks = []
         # Flag to indicate we're processing historical events (catching up)
         # When True, skip chat-related callbacks to avoid re-posting old messages
         self.catching_up = False
         # Track highest battle damage during current battle
         # Only send chat/record score when battle ends (EB event)
         self._pending_battle_damage = 0
+        # Skip superseded GS events within an update batch (see process_events)
+        self.coalesce_gs = True
+        self.gs_applied = 0
+        self.gs_coalesced = 0
 
     def register_card_placed_callback(self, callback):
         """
@@ -74,6 +136,15 @@ class EventProcessor:
         """
         self._on_side_detected_callbacks.append(callback)
 
+    def register_board_changed_callback(self, callback):
+        """
+        Register a callback to be called after every processed event that may
+        change the board (see speculative_planner.BOARD_EVENT_TYPES).
+
+        Callback signature: callback(event_type: str)
+        """
+        self._on_board_changed_callbacks.append(callback)
+
     def _notify_side_detected(self, my_side: str):
         """Notify all registered callbacks that our side was detected"""
         opponent_side = "light" if my_side == "dark" else "dark"
@@ -119,7 +190,24 @@ class EventProcessor:
             except Exception as e:
                 logger.error(f"Error in card placed callback: {e}")
 
-    def process_event(self, event: ET.Element):
+    def process_events(self, events: List[ET.Element]):
+        """
+        Process the non-decision events of one update batch in order.
+
+        GS events superseded by a later GS in the batch only feed the
+        DeckTracker their force deltas (see find_superseded_gs).
+        """
+        superseded = self.find_superseded_gs(events)
+        for i, event in enumerate(events):
+            self.process_event(event, superseded=i in superseded)
+
+    def find_superseded_gs(self, events: List[ET.Element]) -> Set[int]:
+        """Indices of GS events to coalesce in this batch (none if disabled)."""
+        if not self.coalesce_gs:
+            return set()
+        return find_superseded_gs(events)
+
+    def process_event(self, event: ET.Element, superseded: bool = False):
         """
         Process a single game event and update board state.
 
@@ -140,12 +228,18 @@ class EventProcessor:
 
         Args:
             event: XML element representing the event (<ge> tag)
+            superseded: GS that a later GS in the same batch overwrites
+                (see find_superseded_gs); only its force deltas are tracked
         """
         event_type = event.get('type', '')
 
         # Log ALL events to game state logger for replay/training data (except D which goes to decision_logger)
         game_state_logger.log_game_event(event, event_type)
 
+        if superseded and event_type == 'GS':
+            self._track_superseded_gs(event)
+            return
+
         # Log events at DEBUG level (app.py already logs important ones at INFO)
         if event_type not in ['GS', 'M', 'IP', 'CAC']:  # Skip very verbose events
             logger.debug(f"📬 Event type={event_type}: {dict(event.attrib)}")
@@ -165,6 +259,7 @@ class EventProcessor:
         # === Game State Events ===
         elif event_type == 'GS':
             self._handle_gs(event)
+            self.gs_applied += 1
 
         # === Player/Turn Events ===
         elif event_type == 'P':
@@ -194,6 +289,17 @@ class EventProcessor:
         else:
             logger.debug(f"Unhandled event type: {event_type}")
 
+        # Handlers also change cards, locations and power dicts in place
+        if event_type not in ['D', 'IP', 'CAC', 'M']:
+            self.board_state.mark_changed()
+
+        if event_type in BOARD_EVENT_TYPES:
+            for callback in self._on_board_changed_callbacks:
+                try:
+                    callback(event_type)
+                except Exception as e:
+                    logger.error(f"Error in board changed callback: {e}")
+
     # ========== Event Handlers ==========
 
     def _handle_pcip(self, event: ET.Element):
@@ -481,7 +587,7 @@ class EventProcessor:
                 zone = card.zone if card else None
 
                 self.board_state.remove_card(cid.strip())
-                logger.debug(f"➖ Removed card: {cid.strip()}")
+                logger.debug(lambda: f"➖ Removed card: {cid.strip()}")
 
                 # Track card loss/use for deck probability calculations
                 if blueprint_id and owner == self.board_state.my_player_name:
@@ -553,33 +659,7 @@ class EventProcessor:
                 new_force = int(zone_element.get('FORCE_PILE', '0'))
                 new_used = int(zone_element.get('USED_PILE', '0'))
 
-                # === DECK TRACKING: Force activation and recirculation ===
-                old_force = self.board_state.force_pile
-                old_used = self.board_state.used_pile
-
-                # Log if force changes significantly (for debugging)
-                if new_force != old_force and new_force > 0:
-                    logger.debug(f"💰 Force pile updated: {old_force} -> {new_force}")
-
-                # Track force activation (force pile increased)
-                if new_force > old_force:
-                    force_activated = new_force - old_force
-                    tracker = get_deck_tracker()
-                    if tracker.deck_loaded:
-                        tracker.force_activated(force_activated)
-                        logger.debug(f"📚 DeckTracker: {force_activated} force activated")
-
-                # Track recirculation (used pile decreased significantly without our turn ending)
-                # Recirculation happens when used pile goes under reserve deck
-                if new_used < old_used and old_used > 0:
-                    # Could be recirculation - used pile went down
-                    tracker = get_deck_tracker()
-                    if tracker.deck_loaded:
-                        tracker.force_recirculated()
-                        logger.debug(f"📚 DeckTracker: Recirculation detected (used: {old_used} -> {new_used})")
-
-                self.board_state.force_pile = new_force
-                self.board_state.used_pile = new_used
+                self._track_force_piles(new_force, new_used)
                 self.board_state.reserve_deck = int(zone_element.get('RESERVE_DECK', '0'))
                 self.board_state.lost_pile = int(zone_element.get('LOST_PILE', '0'))
                 self.board_state.out_of_play = int(zone_element.get('OUT_OF_PLAY', '0'))
@@ -602,27 +682,16 @@ class EventProcessor:
                           f"Zone names: {all_names}")
 
         # Parse power at locations
-        dark_power_element = event.find('.//darkPowerAtLocations')
-        if dark_power_element is not None:
-            self.board_state.dark_power_at_locations.clear()
-            for attr_name, attr_value in dark_power_element.attrib.items():
-                # Attribute name can be "_0", "_1" or "locationIndex0", "locationIndex1"
-                # Extract the numeric part
-                numeric_part = ''.join(filter(str.isdigit, attr_name))
-                if numeric_part:
-                    index = int(numeric_part)
-                    self.board_state.dark_power_at_locations[index] = int(attr_value)
-
-        light_power_element = event.find('.//lightPowerAtLocations')
-        if light_power_element is not None:
-            self.board_state.light_power_at_locations.clear()
-            for attr_name, attr_value in light_power_element.attrib.items():
-                # Attribute name can be "_0", "_1" or "locationIndex0", "locationIndex1"
-                # Extract the numeric part
-                numeric_part = ''.join(filter(str.isdigit, attr_name))
-                if numeric_part:
-                    index = int(numeric_part)
-                    self.board_state.light_power_at_locations[index] = int(attr_value)
+        # Attribute names can be "_0", "_1" or "locationIndex0", "locationIndex1"
+        for tag, power_at_locations in (('darkPowerAtLocations', self.board_state.dark_power_at_locations),
+                                        ('lightPowerAtLocations', self.board_state.light_power_at_locations)):
+            power_element = event.find('.//' + tag)
+            if power_element is not None:
+                power_at_locations.clear()
+                for attr_name, attr_value in power_element.attrib.items():
+                    index = _location_index(attr_name)
+                    if index is not None:
+                        power_at_locations[index] = int(attr_value)
 
         # Parse battle attrition and damage (used during damage segment)
         dark_attrition = event.get('darkBattleAttritionRemaining', '0')
@@ -642,11 +711,59 @@ class EventProcessor:
             logger.info(f"⚔️ Battle damage: Dark attrition={dark_attrition}, damage={dark_damage} | "
                        f"Light attrition={light_attrition}, damage={light_damage}")
 
-        # Only log game state if values changed (avoid spam from multiple GS events per response)
-        new_state = (self.board_state.force_pile, self.board_state.total_my_power(), self.board_state.reserve_deck)
-        if not hasattr(self, '_last_gs_state') or self._last_gs_state != new_state:
-            self._last_gs_state = new_state
-            logger.info(f"📊 Game state updated: Force={new_state[0]}, Power={new_state[1]}, Reserve={new_state[2]}")
+        # Only log game state if values changed (avoid spam from multiple GS events per response).
+        # Total power is only needed for this log line.
+        if logger.isEnabledFor(logging.INFO):
+            new_state = (self.board_state.force_pile, self.board_state.total_my_power(), self.board_state.reserve_deck)
+            if not hasattr(self, '_last_gs_state') or self._last_gs_state != new_state:
+                self._last_gs_state = new_state
+                logger.info(f"📊 Game state updated: Force={new_state[0]}, Power={new_state[1]}, Reserve={new_state[2]}")
+
+    def _track_force_piles(self, new_force: int, new_used: int):
+        """
+        Apply our new Force/Used pile sizes, feeding the DeckTracker
+        force activation and recirculation.
+        """
+        # === DECK TRACKING: Force activation and recirculation ===
+        old_force = self.board_state.force_pile
+        old_used = self.board_state.used_pile
+
+        # Log if force changes significantly (for debugging)
+        if new_force != old_force and new_force > 0:
+            logger.debug(f"💰 Force pile updated: {old_force} -> {new_force}")
+
+        # Track force activation (force pile increased)
+        if new_force > old_force:
+            force_activated = new_force - old_force
+            tracker = get_deck_tracker()
+            if tracker.deck_loaded:
+                tracker.force_activated(force_activated)
+                logger.debug(f"📚 DeckTracker: {force_activated} force activated")
+
+        # Track recirculation (used pile decreased significantly without our turn ending)
+        # Recirculation happens when used pile goes under reserve deck
+        if new_used < old_used and old_used > 0:
+            # Could be recirculation - used pile went down
+            tracker = get_deck_tracker()
+            if tracker.deck_loaded:
+                tracker.force_recirculated()
+                logger.debug(f"📚 DeckTracker: Recirculation detected (used: {old_used} -> {new_used})")
+
+        self.board_state.force_pile = new_force
+        self.board_state.used_pile = new_used
+
+    def _track_superseded_gs(self, event: ET.Element):
+        """
+        Handle a GS that a later GS in the same batch overwrites.
+
+        Only our pile sizes are applied, so the DeckTracker sees the same
+        sequence of Force activations and recirculations.
+        """
+        self.gs_coalesced += 1
+        for zone_element in event.iter('playerZones'):
+            if zone_element.get('name', '') == self.board_state.my_player_name:
+                self._track_force_piles(int(zone_element.get('FORCE_PILE', '0')),
+                                        int(zone_element.get('USED_PILE', '0')))
 
     def _handle_participant(self, event: ET.Element):
         """
@@ -666,7 +783,7 @@ class EventProcessor:
                 if participant and participant != self.board_state.my_player_name:
                     if not self.board_state.opponent_name:
                         self.board_state.opponent_name = participant
-                        logger.info(f"👥 Opponent: {participant}")
+                        logger.info(lambda: f"👥 Opponent: {participant}")
 
         # Set our side if provided
         if participant_id == self.board_state.my_player_name and side:
@@ -695,7 +812,7 @@ class EventProcessor:
                     self.board_state.strategic_state = StrategicState()
                     logger.info("📈 Strategic State Engine initialized")
 
-        logger.info(f"🔄 Turn: {participant_id}")
+        logger.summary(f"🔄 Turn: {participant_id}")
 
     def _handle_phase_change(self, event: ET.Element):
         """
@@ -764,7 +881,7 @@ class EventProcessor:
         if 'Deploy' in phase and hasattr(self.board_state, 'game_plan') and self.board_state.game_plan:
             self.board_state.game_plan.on_deploy_phase_starting(self.board_state)
 
-        logger.info(f"⏭️  Phase: {phase} (turn {self.board_state.turn_number})")
+        logger.summary(f"⏭️  Phase: {phase} (turn {self.board_state.turn_number})")
 
     def _handle_start_battle(self, event: ET.Element):
         """
@@ -852,7 +969,7 @@ class EventProcessor:
                 reason = match.group(2)
                 self.board_state.game_winner = winner_name
                 self.board_state.game_win_reason = reason
-                logger.info(f"🏆 Game winner detected: {winner_name} ({reason})")
+                logger.summary(f"🏆 Game winner detected: {winner_name} ({reason})")
 
         # Also check for loser message for redundancy: "PlayerName lost due to: Reason"
         elif 'lost due to:' in message:
@@ -871,7 +988,7 @@ class EventProcessor:
                         # We don't know opponent's name here, but we know we didn't win
                         self.board_state.game_winner = "opponent"
                     self.board_state.game_win_reason = reason
-                    logger.info(f"🏁 Game ended: {loser_name} lost ({reason})")
+                    logger.summary(f"🏁 Game ended: {loser_name} lost ({reason})")
 
     def _parse_battle_damage(self, message: str):
         """
@@ -900,10 +1017,10 @@ class EventProcessor:
                         # Track highest damage during this battle
                         # Only notify when battle ends (see _handle_end_battle)
                         if damage > self._pending_battle_damage:
-                            logger.info(f"💥 Battle damage updated: {self._pending_battle_damage} -> {damage}")
+                            logger.info(lambda: f"💥 Battle damage updated: {self._pending_battle_damage} -> {damage}")
                             self._pending_battle_damage = damage
                         else:
-                            logger.debug(f"💥 Battle damage {damage} (pending: {self._pending_battle_damage})")
+                            logger.debug(lambda: f"💥 Battle damage {damage} (pending: {self._pending_battle_damage})")
                         return
                 except ValueError:
                     pass
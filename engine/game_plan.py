@@ -15,6 +15,7 @@ from enum import Enum
 from typing import List, Optional, Dict, Tuple, TYPE_CHECKING
 
 from engine.card_loader import get_card
+from engine.board_summary import get_board_summary
 
 if TYPE_CHECKING:
     from engine.board_state import BoardState
@@ -153,6 +154,51 @@ class CardSaveRecommendation:
     expected_value_if_played_now: float
 
 
+def location_icons(loc, my_side: str) -> Tuple[int, int]:
+    """
+    Get icons for a location from card metadata, with fallback to LocationInPlay.
+
+    Card metadata is the authoritative source, but LocationInPlay fields are used
+    as a fallback for testing or when metadata isn't available.
+
+    Args:
+        loc: LocationInPlay object
+        my_side: "dark" or "light"
+
+    Returns:
+        Tuple of (my_icons, their_icons)
+    """
+    blueprint_id = getattr(loc, 'blueprint_id', '')
+    if blueprint_id:
+        loc_metadata = get_card(blueprint_id)
+        if loc_metadata:
+            # Icons on the card are what each side controls
+            dark_icons = loc_metadata.dark_side_icons or 0
+            light_icons = loc_metadata.light_side_icons or 0
+
+            if my_side.lower() == 'dark':
+                return (dark_icons, light_icons)
+            else:
+                return (light_icons, dark_icons)
+
+    # Fallback: try to parse from LocationInPlay fields (for testing or when no metadata)
+    my_icons_str = getattr(loc, 'my_icons', '0') or '0'
+    their_icons_str = getattr(loc, 'their_icons', '0') or '0'
+
+    try:
+        # Handle potential asterisks or other markers
+        my_icons = int(my_icons_str.replace('*', '').strip() or '0')
+    except (ValueError, AttributeError):
+        my_icons = 0
+
+    try:
+        their_icons = int(their_icons_str.replace('*', '').strip() or '0')
+    except (ValueError, AttributeError):
+        their_icons = 0
+
+    return (my_icons, their_icons)
+
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -197,29 +243,14 @@ class GamePlanConfig:
 
 def get_game_plan_config() -> GamePlanConfig:
     """Get GamePlan configuration from strategy config."""
-    from engine.strategy_config import get_config
-    config = get_config()
-    return GamePlanConfig(
-        enabled=config.get('game_plan', 'enabled', False),
-        multi_turn_horizon=config.get('game_plan', 'multi_turn_horizon', 3),
-        adaptation_enabled=config.get('game_plan', 'adaptation_enabled', True),
-        card_saving_enabled=config.get('game_plan', 'card_saving_enabled', True),
-        goal_score_multiplier=config.get('game_plan', 'goal_score_multiplier', 1.0),
-        min_save_advantage=config.get('game_plan', 'min_save_advantage', 1.3),
-        avoid_overwhelming_force=config.get('game_plan', 'avoid_overwhelming_force', True),
-        overwhelming_force_threshold=config.get('game_plan', 'overwhelming_force_threshold', 8),
-        avoid_penalty_multiplier=config.get('game_plan', 'avoid_penalty_multiplier', 2.0),
-        save_pilots_for_ships=config.get('game_plan', 'save_pilots_for_ships', True),
-        save_weak_characters=config.get('game_plan', 'save_weak_characters', True),
-        weak_character_power=config.get('game_plan', 'weak_character_power', 2),
-    )
+    from engine.strategy_config import get_snapshot
+    return GamePlanConfig.from_dict(get_snapshot().section('game_plan'))
 
 
 def is_game_plan_enabled() -> bool:
     """Quick check if GamePlan is enabled."""
-    from engine.strategy_config import get_config
-    config = get_config()
-    return config.get('game_plan', 'enabled', False)
+    from engine.strategy_config import get_snapshot
+    return get_snapshot().value('game_plan', 'enabled', False)
 
 
 # =============================================================================
@@ -403,6 +434,8 @@ class GamePlan:
 
         my_drain = self._calculate_my_drain_potential(board_state)
         their_drain = self._calculate_their_drain_potential(board_state)
+        locations_i_control = self._count_locations_i_control(board_state)
+        locations_they_control = self._count_locations_they_control(board_state)
 
         current_turn = board_state.turn_number or 1
 
@@ -433,8 +466,8 @@ class GamePlan:
                 my_drain_per_turn=my_drain,
                 their_drain_per_turn=their_drain,
                 drain_differential=my_drain - their_drain,
-                locations_i_control=self._count_locations_i_control(board_state),
-                locations_they_control=self._count_locations_they_control(board_state),
+                locations_i_control=locations_i_control,
+                locations_they_control=locations_they_control,
                 estimated_turns_to_win=turns_to_win,
                 estimated_turns_to_lose=turns_to_lose,
             )
@@ -447,98 +480,27 @@ class GamePlan:
 
     def _calculate_my_drain_potential(self, board_state: 'BoardState') -> int:
         """Calculate how much we can drain opponent per turn."""
-        total_drain = 0
-        my_side = board_state.my_side
-
-        for i, loc in enumerate(board_state.locations):
-            # We drain at locations we control with opponent's icons
-            my_power = board_state.my_power_at_location(i)
-            their_power = board_state.their_power_at_location(i)
-
-            if my_power > 0 and their_power <= 0:
-                # We control this location - drain = opponent's icons here
-                our_icons, opp_icons = self._get_location_icons(loc, my_side)
-                total_drain += opp_icons
-
-        return total_drain
+        # We drain at locations we control with opponent's icons
+        return get_board_summary(board_state).my_drain_total
 
     def _calculate_their_drain_potential(self, board_state: 'BoardState') -> int:
         """Calculate how much opponent can drain us per turn."""
-        total_drain = 0
-        my_side = board_state.my_side
-
-        for i, loc in enumerate(board_state.locations):
-            my_power = board_state.my_power_at_location(i)
-            their_power = board_state.their_power_at_location(i)
-
-            if their_power > 0 and my_power <= 0:
-                # They control this location - drain = our icons here
-                our_icons, opp_icons = self._get_location_icons(loc, my_side)
-                total_drain += our_icons
-
-        return total_drain
+        # They drain at locations they control with our icons
+        return get_board_summary(board_state).their_drain_total
 
     def _count_locations_i_control(self, board_state: 'BoardState') -> int:
         """Count locations where we have presence and opponent doesn't."""
-        count = 0
-        for i in range(len(board_state.locations)):
-            if board_state.my_power_at_location(i) > 0 and \
-               board_state.their_power_at_location(i) == 0:
-                count += 1
-        return count
+        return sum(1 for loc in get_board_summary(board_state)
+                   if loc.my_power > 0 and loc.their_power == 0)
 
     def _count_locations_they_control(self, board_state: 'BoardState') -> int:
         """Count locations where opponent has presence and we don't."""
-        count = 0
-        for i in range(len(board_state.locations)):
-            if board_state.their_power_at_location(i) > 0 and \
-               board_state.my_power_at_location(i) == 0:
-                count += 1
-        return count
+        return sum(1 for loc in get_board_summary(board_state)
+                   if loc.their_power > 0 and loc.my_power == 0)
 
     def _get_location_icons(self, loc, my_side: str) -> Tuple[int, int]:
-        """
-        Get icons for a location from card metadata, with fallback to LocationInPlay.
-
-        Card metadata is the authoritative source, but LocationInPlay fields are used
-        as a fallback for testing or when metadata isn't available.
-
-        Args:
-            loc: LocationInPlay object
-            my_side: "dark" or "light"
-
-        Returns:
-            Tuple of (my_icons, their_icons)
-        """
-        blueprint_id = getattr(loc, 'blueprint_id', '')
-        if blueprint_id:
-            loc_metadata = get_card(blueprint_id)
-            if loc_metadata:
-                # Icons on the card are what each side controls
-                dark_icons = loc_metadata.dark_side_icons or 0
-                light_icons = loc_metadata.light_side_icons or 0
-
-                if my_side.lower() == 'dark':
-                    return (dark_icons, light_icons)
-                else:
-                    return (light_icons, dark_icons)
-
-        # Fallback: try to parse from LocationInPlay fields (for testing or when no metadata)
-        my_icons_str = getattr(loc, 'my_icons', '0') or '0'
-        their_icons_str = getattr(loc, 'their_icons', '0') or '0'
-
-        try:
-            # Handle potential asterisks or other markers
-            my_icons = int(my_icons_str.replace('*', '').strip() or '0')
-        except (ValueError, AttributeError):
-            my_icons = 0
-
-        try:
-            their_icons = int(their_icons_str.replace('*', '').strip() or '0')
-        except (ValueError, AttributeError):
-            their_icons = 0
-
-        return (my_icons, their_icons)
+        """Get (my_icons, their_icons) for a location - see location_icons()."""
+        return location_icons(loc, my_side)
 
     def _is_goal_achievable(self, board_state: 'BoardState',
                             enemy_power: int,
@@ -1186,11 +1148,12 @@ class GamePlan:
 
         # Get config-driven goal weights with TIEBREAKER-SCALE defaults
         # These are intentionally low to complement tactical scoring, not override
-        from engine.strategy_config import get_config
-        stop_bleeding_base = get_config().get('goal_weights', 'stop_bleeding_base', 30)  # Was 200
-        stop_bleeding_per_icon = get_config().get('goal_weights', 'stop_bleeding_per_icon', 10)  # Was 50
-        avoid_location_penalty = get_config().get('goal_weights', 'avoid_location_penalty', 100)  # Was 500
-        establish_base = get_config().get('goal_weights', 'establish_drain_base', 20)  # Was 100
+        from engine.strategy_config import get_snapshot
+        goal_weights = get_snapshot().section('goal_weights')
+        stop_bleeding_base = goal_weights.get('stop_bleeding_base', 30)  # Was 200
+        stop_bleeding_per_icon = goal_weights.get('stop_bleeding_per_icon', 10)  # Was 50
+        avoid_location_penalty = goal_weights.get('avoid_location_penalty', 100)  # Was 500
+        establish_base = goal_weights.get('establish_drain_base', 20)  # Was 100
 
         for goal in self.current_goals:
             if goal.is_complete:
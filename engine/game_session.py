@@ -0,0 +1,169 @@
+"""
+Game Sessions
+
+Per-account game state for running several accounts' games in one process.
+
+The engine keeps its per-game helpers behind module-level getters
+(get_deck_tracker(), get_shield_tracker(), get_config(), ...). Those
+getters used to return one process-wide instance, which limited a process
+to one account and one game. A GameSession is a bag of those per-game
+objects; while a session is bound to the current greenlet (or thread),
+the getters return the session's own instance instead of the global one:
+
+    session = GameSession("randoblu", AccountSettings.from_env(env))
+    with use_session(session):
+        get_deck_tracker()      # -> randoblu's tracker
+        get_config()            # -> randoblu's strategy config (if it has its own)
+
+With no session bound, every getter behaves exactly as before, so tests,
+tools and single-account runs are unaffected. Card data, combo data and
+neural models stay process-wide and are shared by all sessions.
+"""
+
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional
+
+try:
+    from greenlet import getcurrent as _current_greenlet
+except ImportError:
+    _current_greenlet = None
+
+
+@dataclass
+class AccountSettings:
+    """Per-account settings (the environment variables app.py reads)."""
+    username: str
+    password: str = ''
+    table_prefix: str = 'Bot Table'
+    joiner_mode: bool = False
+    joiner_target: str = ''
+    max_games: int = 0
+    fixed_deck_name: Optional[str] = None
+    strategy_config: Optional[str] = None
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str] = None, default_username: str = 'rando_cal',
+                 default_password: str = '', default_table_prefix: str = 'Bot Table') -> 'AccountSettings':
+        """Read settings from an environment mapping (default: os.environ)."""
+        env = os.environ if env is None else env
+        return cls(
+            username=env.get('GEMP_USERNAME', default_username),
+            password=env.get('GEMP_PASSWORD', default_password),
+            table_prefix=env.get('BOT_TABLE_PREFIX', default_table_prefix),
+            joiner_mode=env.get('BOT_JOINER_MODE', 'false').lower() == 'true',
+            joiner_target=env.get('BOT_JOINER_TARGET', ''),
+            max_games=int(env.get('MAX_GAMES', '0')),
+            fixed_deck_name=env.get('FIXED_DECK_NAME') or None,
+            strategy_config=env.get('STRATEGY_CONFIG') or None,
+        )
+
+
+class GameSession:
+    """
+    Per-game objects for one account.
+
+    Module getters store their per-session instance here under a fixed
+    key ('deck_tracker', 'shield_tracker', ...), created on first use.
+    """
+
+    def __init__(self, name: str, settings: Optional[AccountSettings] = None,
+                 strategy_config_path: Optional[str] = None):
+        """
+        Args:
+            name: Session name (the account's username)
+            settings: Account settings (default: username only)
+            strategy_config_path: Strategy config for this session only;
+                None shares the process-wide config
+        """
+        self.name = name
+        self.settings = settings or AccountSettings(username=name)
+        self.strategy_config_path = strategy_config_path
+        self._objects: Dict[str, Any] = {}
+
+    def scoped(self, key: str, factory: Callable[[], Any]) -> Any:
+        """This session's object for key, created with factory() on first use."""
+        value = self._objects.get(key)
+        if value is None:
+            value = self._objects[key] = factory()
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._objects.get(key, default)
+
+    def set(self, key: str, value: Any) -> Any:
+        """Replace this session's object for key (None removes it)."""
+        if value is None:
+            self._objects.pop(key, None)
+        else:
+            self._objects[key] = value
+        return value
+
+    def __repr__(self) -> str:
+        return f"GameSession({self.name!r}, objects={sorted(self._objects)})"
+
+
+# =============================================================================
+# SESSION BINDING
+# =============================================================================
+
+# Session bound to each greenlet/thread, keyed by task_key()
+_bound: Dict[Any, GameSession] = {}
+
+# Bindings whose session has its own strategy config; while there are none,
+# config readers skip the per-greenlet session lookup
+_own_config_bindings = 0
+
+
+def task_key() -> Any:
+    """Identity of the running greenlet (or thread, without greenlet)."""
+    if _current_greenlet is not None:
+        return _current_greenlet()
+    return threading.get_ident()
+
+
+def current_session() -> Optional[GameSession]:
+    """The session bound to the running greenlet/thread, if any."""
+    if not _bound:
+        return None
+    return _bound.get(task_key())
+
+
+def own_config_bound() -> bool:
+    """Whether any greenlet/thread has a session with its own strategy config bound."""
+    return _own_config_bindings > 0
+
+
+@contextmanager
+def use_session(session: GameSession) -> Iterator[GameSession]:
+    """Bind a session to the running greenlet/thread for the with-block."""
+    global _own_config_bindings
+    key = task_key()
+    previous = _bound.get(key)
+    _bound[key] = session
+    own_config = bool(session.strategy_config_path)
+    _own_config_bindings += own_config
+    try:
+        yield session
+    finally:
+        _own_config_bindings -= own_config
+        if previous is None:
+            _bound.pop(key, None)
+        else:
+            _bound[key] = previous
+
+
+class SessionLogFilter(logging.Filter):
+    """Add %(session)s (bound session name, or default) to log records."""
+
+    def __init__(self, default: str = '-'):
+        super().__init__()
+        self.default = default
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        session = current_session()
+        record.session = session.name if session else self.default
+        return True
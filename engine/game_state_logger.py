@@ -4,7 +4,9 @@ Game State XML Logger
 Captures ALL XML updates from GEMP server for complete game replay and training data.
 Separate from decision_logger which only captures decision XML.
 
-Log files are rotated per-game alongside the main log.
+Log files are rotated per-game alongside the main log. Each account has
+its own GameStateLog; the module functions write to the bound game
+session's log, or to the process's default account log.
 
 Events captured:
 - P (Participant) - Player info
@@ -26,6 +28,8 @@ from pathlib import Path
 from typing import Optional
 import time
 
+from .game_session import current_session
+
 # Get username for log filename
 _log_username = os.environ.get('GEMP_USERNAME', 'rando')
 
@@ -36,68 +40,166 @@ LOG_DIR.mkdir(parents=True, exist_ok=True)
 # Game state log file path
 GAME_STATE_LOG_PATH = LOG_DIR / f"{_log_username}_gamestate.xml"
 
-# Track game start time for relative timestamps
-_game_start_time: Optional[float] = None
 
-# File handle for writing
-_log_file: Optional[object] = None
-_initialized: bool = False
+class GameStateLog:
+    """One account's game state XML log."""
 
+    def __init__(self, username: str):
+        self.username = username
+        self.path = LOG_DIR / f"{username}_gamestate.xml"
+        # Track game start time for relative timestamps
+        self._game_start_time: Optional[float] = None
+        # File handle for writing
+        self._log_file: Optional[object] = None
+        self._initialized: bool = False
 
-def _ensure_initialized():
-    """Lazily initialize the log file."""
-    global _log_file, _initialized, _game_start_time
+    def disable(self):
+        """Stop writing (e.g. while replaying the log being read)."""
+        self._initialized = True
+        self._log_file = None
 
-    if _initialized:
-        return
+    def _ensure_initialized(self):
+        """Lazily initialize the log file."""
+        if self._initialized:
+            return
 
-    try:
-        _log_file = open(GAME_STATE_LOG_PATH, 'w', encoding='utf-8')
-        _game_start_time = time.time()
+        try:
+            self._log_file = open(self.path, 'w', encoding='utf-8')
+            self._game_start_time = time.time()
+
+            # Write XML header
+            self._log_file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            self._log_file.write(f'<game_log started="{datetime.now().isoformat()}" bot="{self.username}">\n')
+            self._log_file.flush()
+            self._initialized = True
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Failed to initialize game state logger: {e}")
+
+    def _elapsed(self) -> float:
+        return time.time() - self._game_start_time if self._game_start_time else 0.0
+
+    def log_game_event(self, event_element: ET.Element, event_type: str):
+        """Log a game state XML event (see log_game_event())."""
+        # Skip decision events (handled by decision_logger)
+        if event_type == 'D':
+            return
 
-        # Write XML header
-        _log_file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-        _log_file.write(f'<game_log started="{datetime.now().isoformat()}" bot="{_log_username}">\n')
-        _log_file.flush()
-        _initialized = True
-    except Exception as e:
-        logging.getLogger(__name__).error(f"Failed to initialize game state logger: {e}")
+        self._ensure_initialized()
 
+        if self._log_file is None:
+            return
 
-def log_game_event(event_element: ET.Element, event_type: str):
-    """
-    Log a game state XML event.
+        try:
+            # Calculate relative timestamp
+            elapsed = self._elapsed()
 
-    Args:
-        event_element: The XML element from GEMP
-        event_type: Event type tag (P, TC, GPC, PCIP, etc.)
-    """
-    global _game_start_time
+            # Convert element to string
+            xml_str = ET.tostring(event_element, encoding='unicode')
+
+            # Write event with timestamp and type
+            self._log_file.write(f'  <event t="{elapsed:.3f}" type="{event_type}">\n')
+            self._log_file.write(f'    {xml_str}\n')
+            self._log_file.write('  </event>\n')
+            self._log_file.flush()
+
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Error logging game event: {e}")
+
+    def log_raw_xml(self, raw_xml: str, context: str = "update"):
+        """Log a raw XML string (see log_raw_xml())."""
+        self._ensure_initialized()
+
+        if self._log_file is None:
+            return
+
+        try:
+            elapsed = self._elapsed()
+
+            self._log_file.write(f'  <raw_xml t="{elapsed:.3f}" context="{context}">\n')
+            self._log_file.write('    <![CDATA[\n')
+            self._log_file.write(raw_xml)
+            self._log_file.write('\n    ]]>\n')
+            self._log_file.write('  </raw_xml>\n')
+            self._log_file.flush()
+
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Error logging raw XML: {e}")
+
+    def set_opponent(self, opponent_name: str):
+        """Record opponent name in the log."""
+        self._ensure_initialized()
+
+        if self._log_file is None:
+            return
+
+        try:
+            self._log_file.write(f'  <opponent t="{self._elapsed():.3f}" name="{opponent_name}"/>\n')
+            self._log_file.flush()
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Error logging opponent: {e}")
+
+    def rotate(self, opponent_name: str = None, won: bool = None):
+        """Rotate the log file after a game ends (see rotate_game_state_log())."""
+        try:
+            if not self._initialized or self._log_file is None:
+                return
+
+            # Write closing tag
+            self._log_file.write('</game_log>\n')
+            self._log_file.flush()
+            self._log_file.close()
 
-    # Skip decision events (handled by decision_logger)
-    if event_type == 'D':
-        return
+            # Generate new filename matching main log format
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            result_str = "win" if won else "loss" if won is not None else "unknown"
+            opponent_str = opponent_name.replace(' ', '_') if opponent_name else "unknown"
 
-    _ensure_initialized()
+            new_filename = f"{self.username}_{timestamp}_vs_{opponent_str}_{result_str}_gamestate.xml"
+            new_path = LOG_DIR / new_filename
 
-    if _log_file is None:
-        return
+            # Rename if file exists and has content
+            if self.path.exists() and self.path.stat().st_size > 0:
+                shutil.move(str(self.path), str(new_path))
+                logging.getLogger(__name__).info(f"Game state log rotated to: {new_filename}")
 
-    try:
-        # Calculate relative timestamp
-        elapsed = time.time() - _game_start_time if _game_start_time else 0.0
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Error rotating game state log: {e}")
 
-        # Convert element to string
-        xml_str = ET.tostring(event_element, encoding='unicode')
+        # Reset state for next game (even on error)
+        self._log_file = None
+        self._initialized = False
+        self._game_start_time = None
 
-        # Write event with timestamp and type
-        _log_file.write(f'  <event t="{elapsed:.3f}" type="{event_type}">\n')
-        _log_file.write(f'    {xml_str}\n')
-        _log_file.write('  </event>\n')
-        _log_file.flush()
+    def flush(self):
+        """Flush the game state log."""
+        if self._log_file:
+            try:
+                self._log_file.flush()
+            except Exception:
+                pass
 
-    except Exception as e:
-        logging.getLogger(__name__).error(f"Error logging game event: {e}")
+
+# Log for the process's own account (GEMP_USERNAME)
+_default_log = GameStateLog(_log_username)
+
+
+def get_game_state_log() -> GameStateLog:
+    """The bound game session's log, or the default account's log."""
+    session = current_session()
+    if session is None:
+        return _default_log
+    return session.scoped('game_state_log', lambda: GameStateLog(session.settings.username))
+
+
+def log_game_event(event_element: ET.Element, event_type: str):
+    """
+    Log a game state XML event.
+
+    Args:
+        event_element: The XML element from GEMP
+        event_type: Event type tag (P, TC, GPC, PCIP, etc.)
+    """
+    get_game_state_log().log_game_event(event_element, event_type)
 
 
 def log_raw_xml(raw_xml: str, context: str = "update"):
@@ -108,25 +210,7 @@ def log_raw_xml(raw_xml: str, context: str = "update"):
         raw_xml: Raw XML string from GEMP
         context: Context description (e.g., "initial_state", "update")
     """
-    global _game_start_time
-
-    _ensure_initialized()
-
-    if _log_file is None:
-        return
-
-    try:
-        elapsed = time.time() - _game_start_time if _game_start_time else 0.0
-
-        _log_file.write(f'  <raw_xml t="{elapsed:.3f}" context="{context}">\n')
-        _log_file.write('    <![CDATA[\n')
-        _log_file.write(raw_xml)
-        _log_file.write('\n    ]]>\n')
-        _log_file.write('  </raw_xml>\n')
-        _log_file.flush()
-
-    except Exception as e:
-        logging.getLogger(__name__).error(f"Error logging raw XML: {e}")
+    get_game_state_log().log_raw_xml(raw_xml, context)
 
 
 def set_opponent(opponent_name: str):
@@ -136,17 +220,7 @@ def set_opponent(opponent_name: str):
     Args:
         opponent_name: Name of the opponent player
     """
-    _ensure_initialized()
-
-    if _log_file is None:
-        return
-
-    try:
-        elapsed = time.time() - _game_start_time if _game_start_time else 0.0
-        _log_file.write(f'  <opponent t="{elapsed:.3f}" name="{opponent_name}"/>\n')
-        _log_file.flush()
-    except Exception as e:
-        logging.getLogger(__name__).error(f"Error logging opponent: {e}")
+    get_game_state_log().set_opponent(opponent_name)
 
 
 def rotate_game_state_log(opponent_name: str = None, won: bool = None):
@@ -157,47 +231,9 @@ def rotate_game_state_log(opponent_name: str = None, won: bool = None):
         opponent_name: Name of the opponent (for filename)
         won: Whether the bot won (for filename)
     """
-    global _log_file, _initialized, _game_start_time
-
-    try:
-        if not _initialized or _log_file is None:
-            return
-
-        # Write closing tag
-        _log_file.write('</game_log>\n')
-        _log_file.flush()
-        _log_file.close()
-
-        # Generate new filename matching main log format
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        result_str = "win" if won else "loss" if won is not None else "unknown"
-        opponent_str = opponent_name.replace(' ', '_') if opponent_name else "unknown"
-
-        new_filename = f"{_log_username}_{timestamp}_vs_{opponent_str}_{result_str}_gamestate.xml"
-        new_path = LOG_DIR / new_filename
-
-        # Rename if file exists and has content
-        if GAME_STATE_LOG_PATH.exists() and GAME_STATE_LOG_PATH.stat().st_size > 0:
-            shutil.move(str(GAME_STATE_LOG_PATH), str(new_path))
-            logging.getLogger(__name__).info(f"Game state log rotated to: {new_filename}")
-
-        # Reset state for next game
-        _log_file = None
-        _initialized = False
-        _game_start_time = None
-
-    except Exception as e:
-        logging.getLogger(__name__).error(f"Error rotating game state log: {e}")
-        # Reset state even on error
-        _log_file = None
-        _initialized = False
-        _game_start_time = None
+    get_game_state_log().rotate(opponent_name, won)
 
 
 def flush():
     """Flush the game state log."""
-    if _log_file:
-        try:
-            _log_file.flush()
-        except Exception:
-            pass
+    get_game_state_log().flush()
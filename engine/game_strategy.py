@@ -20,6 +20,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Set, Optional, TYPE_CHECKING
 
+from .board_summary import LocationSummary, get_board_summary
+
 if TYPE_CHECKING:
     from .board_state import BoardState, LocationInPlay, CardInPlay
 
@@ -284,25 +286,24 @@ class GameStrategy:
         self.contested_locations.clear()
         self.dangerous_locations.clear()
 
-        for i, loc in enumerate(board_state.locations):
-            if loc is None or not loc.card_id:
+        for summary in get_board_summary(board_state):
+            if not summary.card_id:
                 continue
 
-            priority = self._score_location(loc, i, board_state)
+            priority = self._score_location(summary)
             self.location_priorities.append(priority)
 
             if priority.is_contested:
-                self.contested_locations.append(i)
+                self.contested_locations.append(summary.index)
             if priority.is_dangerous:
-                self.dangerous_locations.append(i)
+                self.dangerous_locations.append(summary.index)
 
         # Sort by score (highest first)
         self.location_priorities.sort(key=lambda p: p.score, reverse=True)
 
-    def _score_location(self, location: 'LocationInPlay', index: int,
-                        board_state: 'BoardState') -> LocationPriority:
+    def _score_location(self, summary: LocationSummary) -> LocationPriority:
         """
-        Score a single location for priority.
+        Score a single location (from the shared BoardSummary) for priority.
 
         Factors:
         - Force icons controlled (+20 per icon)
@@ -311,15 +312,13 @@ class GameStrategy:
         - Enemy presence (+25 if contested)
         - Empty location (+8 for easy control)
         """
-        priority = LocationPriority(location_index=index, score=0.0)
+        location = summary.location
+        priority = LocationPriority(location_index=summary.index, score=0.0)
 
         # Force icons
-        try:
-            icons = int(location.my_icons) if location.my_icons and location.my_icons.isdigit() else 0
-            if icons > 0:
-                priority.add_reason(f"{icons} force icons", icons * LOCATION_WEIGHT_FORCE_ICON)
-        except ValueError:
-            pass
+        icons = summary.my_icons
+        if icons > 0:
+            priority.add_reason(f"{icons} force icons", icons * LOCATION_WEIGHT_FORCE_ICON)
 
         # Battleground status (can battle and drain here)
         # Sites are typically battlegrounds; space locations depend on type
@@ -337,9 +336,7 @@ class GameStrategy:
                               LOCATION_WEIGHT_ENEMY_PRESENCE)
 
             # Assess threat level
-            my_power = board_state.my_power_at_location(index)
-            their_power = board_state.their_power_at_location(index)
-            priority.threat_level = self._assess_threat_level(my_power, their_power)
+            priority.threat_level = self._assess_threat_level(summary.my_power, summary.their_power)
 
             if priority.threat_level in [ThreatLevel.DANGEROUS, ThreatLevel.RETREAT]:
                 priority.is_dangerous = True
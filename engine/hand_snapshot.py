@@ -0,0 +1,214 @@
+"""
+Hand Snapshot
+
+Resolved view of the cards in our hand, shared by the deploy planner and
+evaluators.
+
+Planning one deploy phase used to look up the same hand cards dozens of
+times: every helper walked cards_in_hand, called get_card() per card and
+re-derived costs, power and pilot flags. get_hand_snapshot() does that
+once per board version (a versioned query, see board_state.versioned_query).
+Each HandCard carries:
+- the card metadata and the CardInPlay it came from
+- effective cost (after gametext reductions) and effective power
+  (0 for unpiloted starships/vehicles)
+- pilot/warrior/needs-pilot/permanent-pilot flags
+- weapon target info and deploy restrictions
+- parsed gametext abilities (attrition immunity, extra destiny, drain bonus)
+
+The snapshot also keeps pre-sorted views (by cost, by power), and
+is_matching_pair() memoizes matching pilot/ship pairs for the planner's
+pilot scoring and the deploy evaluator.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+from engine import card_loader
+from engine.board_state import BoardState, versioned_query
+
+
+@dataclass(frozen=True)
+class HandCard:
+    """One resolved card in hand."""
+    card: Any                       # CardInPlay
+    metadata: Any                   # card_loader.Card
+    card_id: str
+    blueprint_id: str
+    name: str
+    base_cost: int
+    deploy_reduction: int
+    cost: int                       # Effective deploy cost after reductions
+    base_power: int
+    power: int                      # Effective power (0 for unpiloted craft)
+    ability: int
+    is_unique: bool
+    is_character: bool
+    is_starship: bool
+    is_vehicle: bool
+    is_location: bool
+    is_weapon: bool
+    is_device: bool
+    is_pilot: bool
+    is_warrior: bool
+    has_permanent_pilot: bool
+    needs_pilot: bool               # Unpiloted starship/vehicle
+    pilot_adds_power: Optional[int]  # None if the metadata doesn't say
+    weapon_target_type: Optional[str]
+    is_targeted_weapon: bool
+    is_standalone_weapon: bool
+    is_character_weapon: bool
+    matching_weapon: Tuple[str, ...]
+    deploy_restriction_systems: Tuple[str, ...]
+    has_attrition_immunity: bool
+    immune_attrition_threshold: int
+    draws_extra_destiny: int
+    force_drain_bonus: int
+
+    @property
+    def is_pure_pilot(self) -> bool:
+        """Pilot but not warrior - best deployed aboard ships."""
+        return self.is_pilot and not self.is_warrior
+
+    def pilot_power(self, default: int) -> int:
+        """Power this card adds when piloting (0 for non-pilots)."""
+        if not self.is_pilot:
+            return 0
+        return default if self.pilot_adds_power is None else self.pilot_adds_power
+
+
+def resolve_hand_card(card, metadata) -> HandCard:
+    """Derive the HandCard fields for one card with metadata."""
+    parsed = getattr(metadata, 'parsed', None)
+    base_cost = metadata.deploy_value or 0
+    deploy_reduction = parsed.deploy_reduction if parsed is not None else 0
+    base_power = metadata.power_value or 0
+    has_permanent_pilot = getattr(metadata, 'has_permanent_pilot', False)
+    needs_pilot = bool((metadata.is_starship or metadata.is_vehicle) and not has_permanent_pilot)
+
+    return HandCard(
+        card=card,
+        metadata=metadata,
+        card_id=card.card_id,
+        blueprint_id=card.blueprint_id,
+        name=metadata.title,
+        base_cost=base_cost,
+        deploy_reduction=deploy_reduction,
+        cost=max(0, base_cost - deploy_reduction),
+        base_power=base_power,
+        power=0 if needs_pilot else base_power,
+        ability=getattr(metadata, 'ability_value', 0) or 0,
+        is_unique=getattr(metadata, 'is_unique', False),
+        is_character=metadata.is_character,
+        is_starship=metadata.is_starship,
+        is_vehicle=metadata.is_vehicle,
+        is_location=getattr(metadata, 'is_location', False),
+        is_weapon=getattr(metadata, 'is_weapon', False),
+        is_device=getattr(metadata, 'is_device', False),
+        is_pilot=metadata.is_pilot,
+        is_warrior=getattr(metadata, 'is_warrior', False),
+        has_permanent_pilot=has_permanent_pilot,
+        needs_pilot=needs_pilot,
+        pilot_adds_power=getattr(metadata, 'pilot_adds_power', None),
+        weapon_target_type=getattr(metadata, 'weapon_target_type', None),
+        is_targeted_weapon=getattr(metadata, 'is_targeted_weapon', False),
+        is_standalone_weapon=getattr(metadata, 'is_standalone_weapon', False),
+        is_character_weapon=getattr(metadata, 'is_character_weapon', False),
+        matching_weapon=tuple(getattr(metadata, 'matching_weapon', []) or []),
+        deploy_restriction_systems=tuple(getattr(metadata, 'deploy_restriction_systems', []) or []),
+        has_attrition_immunity=getattr(metadata, 'has_attrition_immunity', False),
+        immune_attrition_threshold=getattr(metadata, 'immune_attrition_threshold', 0),
+        draws_extra_destiny=getattr(metadata, 'draws_extra_destiny', 0),
+        force_drain_bonus=parsed.force_drain_bonus if parsed is not None else 0,
+    )
+
+
+class HandSnapshot:
+    """
+    Resolved cards in hand, in hand order.
+
+    Example usage:
+        hand = get_hand_snapshot(board_state)
+        hand.pilots                            # -> pilot characters
+        hand.by_cost[0].name                   # -> cheapest card
+        hand.matching_pilots(ship_blueprint)   # -> pilots matching a ship
+    """
+
+    def __init__(self, cards: List[HandCard], unresolved: List[Tuple[Any, str]]):
+        self.cards = cards
+        # (CardInPlay, reason) for cards without blueprint or metadata
+        self.unresolved = unresolved
+
+        self.characters = [c for c in cards if c.is_character]
+        self.starships = [c for c in cards if c.is_starship]
+        self.vehicles = [c for c in cards if c.is_vehicle]
+        self.pilots = [c for c in cards if c.is_character and c.is_pilot]
+
+        # Stable sorts, so ties keep hand order
+        self.by_cost = sorted(cards, key=lambda c: c.cost)
+        self.by_power = sorted(cards, key=lambda c: c.power, reverse=True)
+
+    def __iter__(self):
+        return iter(self.cards)
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def of_type(self, card_type: str) -> List[HandCard]:
+        """Cards of one type: "character", "starship" or "vehicle"."""
+        return {'character': self.characters, 'starship': self.starships,
+                'vehicle': self.vehicles}.get(card_type, [])
+
+    def matching_pilots(self, ship_blueprint_id: str) -> List[HandCard]:
+        """Pilots in hand that match a starship/vehicle, cheapest first."""
+        return [p for p in self.by_cost
+                if p.is_character and p.is_pilot and is_matching_pair(p.blueprint_id, ship_blueprint_id)]
+
+
+@lru_cache(maxsize=4096)
+def _matching(get_card, is_matching, pilot_blueprint_id: str, ship_blueprint_id: str) -> bool:
+    pilot = get_card(pilot_blueprint_id)
+    ship = get_card(ship_blueprint_id)
+    return bool(pilot and ship and is_matching(pilot, ship))
+
+
+def is_matching_pair(pilot_blueprint_id: str, ship_blueprint_id: str) -> bool:
+    """Whether a pilot and a starship/vehicle are a matching pair (memoized per card source)."""
+    if not pilot_blueprint_id or not ship_blueprint_id:
+        return False
+    return _matching(card_loader.get_card, card_loader.is_matching_pilot_ship,
+                     pilot_blueprint_id, ship_blueprint_id)
+
+
+def build_hand_snapshot(cards_in_hand) -> HandSnapshot:
+    """Resolve every card in hand (uncached)."""
+    cards = []
+    unresolved = []
+    for card in cards_in_hand or []:
+        if not card.blueprint_id:
+            unresolved.append((card, "no blueprint_id"))
+            continue
+        metadata = card_loader.get_card(card.blueprint_id)
+        if not metadata:
+            unresolved.append((card, "no metadata found"))
+            continue
+        cards.append(resolve_hand_card(card, metadata))
+    return HandSnapshot(cards, unresolved)
+
+
+@versioned_query()
+def _versioned_hand_snapshot(board_state) -> HandSnapshot:
+    return build_hand_snapshot(board_state.cards_in_hand)
+
+
+def get_hand_snapshot(board_state) -> HandSnapshot:
+    """
+    HandSnapshot for the board's current hand.
+
+    Cached in the board's query cache until the board version changes;
+    board stand-ins are resolved uncached.
+    """
+    if isinstance(board_state, BoardState):
+        return _versioned_hand_snapshot(board_state)
+    return build_hand_snapshot(getattr(board_state, 'cards_in_hand', None))
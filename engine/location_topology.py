@@ -0,0 +1,159 @@
+"""
+Location Topology
+
+Precomputed movement structure for the locations on the board, so
+reachability queries do not re-split location names or re-fetch card
+metadata on every call.
+
+For a list of board locations the topology holds:
+- the system name of every slot ("Naboo: Swamp" -> "Naboo")
+- system membership (system name -> slot indices)
+- adjacency lists (neighbouring slot in the same system)
+- parsec values of space locations and a pairwise parsec-distance matrix
+- per-location destinations sorted by parsec distance, so "everything
+  within N parsecs" is a bisect instead of a scan
+
+BoardState rebuilds the topology lazily whenever its locations change
+(see BoardState.topology). The semantics mirror the original
+BoardState.get_system_name / find_same_system_locations /
+find_adjacent_locations / find_hyperspeed_destinations scans exactly.
+"""
+
+from bisect import bisect_right
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .board_state import LocationInPlay
+
+
+def system_name_of(location: Optional['LocationInPlay']) -> str:
+    """
+    Extract the system name from a location.
+
+    "Naboo: Swamp" -> "Naboo", "Coruscant" (system card) -> "Coruscant"
+    """
+    if not location:
+        return ""
+    name = location.site_name or location.system_name or ""
+    if ":" in name:
+        return name.split(":")[0].strip()
+    return name.strip()
+
+
+def parse_int(value) -> Optional[int]:
+    """Card stat as int, or None if missing/non-numeric (e.g. "*")."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+class LocationTopology:
+    """
+    Movement structure over one snapshot of board locations.
+
+    Example usage:
+        topology = LocationTopology(board_state.locations, get_card)
+        topology.adjacent[2]                  # -> [1, 3]
+        topology.same_system(2)               # -> every other slot in that system
+        topology.parsec_distance(0, 4)        # -> 3 (or None if not both space)
+        topology.within_parsecs(0, 4)         # -> space slots reachable with hyperspeed 4
+    """
+
+    def __init__(self, locations: Sequence[Optional['LocationInPlay']],
+                 get_metadata: Callable[[str], object]):
+        n = len(locations)
+        self.size = n
+
+        self.system_names: List[str] = [system_name_of(loc) for loc in locations]
+
+        self.systems: Dict[str, List[int]] = {}
+        for idx, (loc, system) in enumerate(zip(locations, self.system_names)):
+            if loc and system:
+                self.systems.setdefault(system, []).append(idx)
+
+        self.adjacent: List[List[int]] = []
+        for idx, system in enumerate(self.system_names):
+            neighbours = []
+            if system:
+                if idx > 0 and locations[idx - 1] and self.system_names[idx - 1] == system:
+                    neighbours.append(idx - 1)
+                if idx + 1 < n and locations[idx + 1] and self.system_names[idx + 1] == system:
+                    neighbours.append(idx + 1)
+            self.adjacent.append(neighbours)
+
+        # Parsec structures need card metadata; built on the first space query
+        self._locations = list(locations)
+        self._get_metadata = get_metadata
+        self._parsecs: Optional[List[Optional[int]]] = None
+        self._distances: List[List[Optional[int]]] = []
+        self._by_distance: List[List[Tuple[int, int]]] = []
+
+    def _build_parsecs(self):
+        n = self.size
+        parsecs: List[Optional[int]] = []
+        for loc in self._locations:
+            parsec = None
+            if loc and loc.is_space and loc.blueprint_id:
+                metadata = self._get_metadata(loc.blueprint_id)
+                if metadata:
+                    parsec = parse_int(metadata.parsec)
+            parsecs.append(parsec)
+
+        space = [idx for idx, parsec in enumerate(parsecs) if parsec is not None]
+        self._distances = [[None] * n for _ in range(n)]
+        self._by_distance = [[] for _ in range(n)]
+        for src in space:
+            row = self._distances[src]
+            for dst in space:
+                row[dst] = abs(parsecs[dst] - parsecs[src])
+            self._by_distance[src] = sorted((row[dst], dst) for dst in space if dst != src)
+        self._parsecs = parsecs
+
+    @property
+    def parsecs(self) -> List[Optional[int]]:
+        """Parsec of every space location whose card has a numeric parsec (else None)."""
+        if self._parsecs is None:
+            self._build_parsecs()
+        return self._parsecs
+
+    @property
+    def distances(self) -> List[List[Optional[int]]]:
+        """Pairwise parsec-distance matrix (None unless both are space locations)."""
+        if self._parsecs is None:
+            self._build_parsecs()
+        return self._distances
+
+    def system_name(self, loc_idx: int) -> str:
+        if loc_idx < 0 or loc_idx >= self.size:
+            return ""
+        return self.system_names[loc_idx]
+
+    def same_system(self, loc_idx: int) -> List[int]:
+        """Other occupied slots in the same system, in board order."""
+        system = self.system_name(loc_idx)
+        if not system:
+            return []
+        return [idx for idx in self.systems.get(system, ()) if idx != loc_idx]
+
+    def adjacent_to(self, loc_idx: int) -> List[int]:
+        """Neighbouring slots (index +/- 1) in the same system."""
+        if loc_idx < 0 or loc_idx >= self.size:
+            return []
+        return list(self.adjacent[loc_idx])
+
+    def parsec_distance(self, src: int, dst: int) -> Optional[int]:
+        """Parsec distance between two space locations (None if either has no parsec)."""
+        if not (0 <= src < self.size and 0 <= dst < self.size):
+            return None
+        return self.distances[src][dst]
+
+    def within_parsecs(self, loc_idx: int, max_distance: int) -> List[int]:
+        """Other space slots at most max_distance parsecs away, in board order."""
+        if loc_idx < 0 or loc_idx >= self.size or self.parsecs[loc_idx] is None:
+            return []
+        by_distance = self._by_distance[loc_idx]
+        end = bisect_right(by_distance, (max_distance, self.size))
+        return sorted(idx for _, idx in by_distance[:end])
@@ -0,0 +1,670 @@
+"""
+Lookahead Search
+
+Time-bounded Monte Carlo tree search over the rest of our turn and the
+opponent's reply, on a lightweight board model.
+
+GamePlan.project_game extrapolates drains assuming the board holds and
+MonteCarloSimulator stress-tests one deploy plan against a fixed opponent
+model. This module searches over our own choices instead:
+
+- our turn: deploy cards from hand, battle, move (phase order is kept:
+  deploys, then battles, then moves), end turn
+- opponent turn: sampled responses (activate, drain, counter-deploy,
+  battle when the exact battle odds favour them)
+- battles are resolved by sampling destiny totals from battle_odds
+
+Board model:
+- SearchState is an immutable snapshot (tuples of frozen dataclasses).
+  Applying an action returns a new state that shares every untouched
+  location with its parent (copy-on-write), and states are hashable so the
+  search tree is a transposition table keyed by state.
+- Values are from our point of view in [-1, 1]: life force swing plus the
+  drain differential of the resulting board.
+
+Search:
+- UCT over our decisions; opponent turns and battles are chance events
+  (open-loop sampling), so the tree approximates expectimax.
+- Bounded by wall-clock time (time_budget_ms) and max_iterations.
+- Runs in the calling process: the bot forks (supervisor) and runs under
+  eventlet (BOT_SESSIONS), where a process pool is unsafe, and the search
+  budget is too small to pay for worker start-up and pickling.
+
+Example usage:
+    search = LookaheadSearch(get_config().get_section('lookahead'))
+    result = search.search(build_search_state(board_state))
+    result.best_line, result.value
+"""
+
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from .battle_odds import (
+    DEFAULT_DESTINY,
+    BattleSide,
+    DestinyKey,
+    battle_odds,
+    destiny_total_distribution,
+    tracked_destiny_key,
+)
+
+logger = logging.getLogger(__name__)
+
+# Action kinds
+DEPLOY = 'deploy'
+BATTLE = 'battle'
+MOVE = 'move'
+END_TURN = 'end_turn'
+
+# Turn phases in the model (our turn only; the opponent turn is sampled whole)
+PHASE_DEPLOY = 0
+PHASE_BATTLE = 1
+PHASE_MOVE = 2
+PHASE_DONE = 3
+
+
+@dataclass(frozen=True)
+class SearchAction:
+    """One of our choices in the lookahead model."""
+    kind: str
+    location: int = -1   # deploy / battle target, move destination
+    source: int = -1     # move source
+    card: int = -1       # index into SearchState.hand for deploys
+
+    def describe(self, state: Optional['SearchState'] = None) -> str:
+        def name(idx):
+            if state and 0 <= idx < len(state.locations):
+                return state.locations[idx].name
+            return f"#{idx}"
+        if self.kind == DEPLOY:
+            card = state.hand[self.card].name if state and 0 <= self.card < len(state.hand) else f"card {self.card}"
+            return f"deploy {card} -> {name(self.location)}"
+        if self.kind == BATTLE:
+            return f"battle at {name(self.location)}"
+        if self.kind == MOVE:
+            return f"move {name(self.source)} -> {name(self.location)}"
+        return "end turn"
+
+
+END_TURN_ACTION = SearchAction(END_TURN)
+
+
+@dataclass(frozen=True)
+class SearchCard:
+    """A card in our hand that adds power to a location."""
+    blueprint_id: str
+    name: str
+    power: int
+    cost: int
+    ability: int = 0
+    is_space: bool = False   # Starships deploy to space, everything else to ground
+
+
+@dataclass(frozen=True)
+class SearchLocation:
+    """Power, ability and icons of both sides at one location."""
+    name: str
+    is_space: bool
+    my_power: int = 0
+    their_power: int = 0
+    my_ability: int = 0
+    their_ability: int = 0
+    my_icons: int = 0
+    their_icons: int = 0
+    neighbours: Tuple[int, ...] = ()   # Locations reachable by one move
+
+    @property
+    def we_control(self) -> bool:
+        return self.my_power > 0 and self.their_power <= 0
+
+    @property
+    def they_control(self) -> bool:
+        return self.their_power > 0 and self.my_power <= 0
+
+
+@dataclass(frozen=True)
+class SearchState:
+    """Immutable board snapshot for the search (hashable, copy-on-write)."""
+    locations: Tuple[SearchLocation, ...]
+    hand: Tuple[SearchCard, ...] = ()
+    my_force: int = 0
+    their_force: int = 0
+    their_hand: int = 0
+    my_life: int = 0
+    their_life: int = 0
+    my_activation: int = 0
+    their_activation: int = 0
+    turn: int = 0                 # Turns played since the root (0 = current turn)
+    phase: int = PHASE_DEPLOY
+    used: FrozenSet[int] = frozenset()   # Locations that already battled / moved this turn
+
+    def with_location(self, idx: int, **changes) -> 'SearchState':
+        """New state with one location changed; all others are shared."""
+        locations = list(self.locations)
+        locations[idx] = replace(locations[idx], **changes)
+        return replace(self, locations=tuple(locations))
+
+    def my_drain(self) -> int:
+        return sum(loc.their_icons for loc in self.locations if loc.we_control)
+
+    def their_drain(self) -> int:
+        return sum(loc.my_icons for loc in self.locations if loc.they_control)
+
+
+@dataclass(frozen=True)
+class SearchParams:
+    """Picklable search settings (shared with worker processes)."""
+    time_budget_ms: float = 50.0
+    max_iterations: int = 20000
+    exploration: float = 1.4
+    turns: int = 2                 # Our turn + the opponent's reply
+    drain_weight: float = 2.0      # Value of one point of drain differential
+    value_scale: float = 8.0       # tanh scale for leaf values
+    rollout_end_turn_prob: float = 0.25
+    our_destiny: DestinyKey = DEFAULT_DESTINY
+    their_destiny: DestinyKey = DEFAULT_DESTINY
+
+
+@dataclass
+class SearchResult:
+    """Best line found and the statistics behind it."""
+    best_line: List[SearchAction]
+    value: float                                   # Mean value of the best root action [-1, 1]
+    iterations: int
+    elapsed_ms: float
+    root_actions: Dict[SearchAction, Tuple[int, float]] = field(default_factory=dict)  # visits, mean
+
+    def advantage(self, predicate: Callable[[SearchAction], bool], min_visits: int = 5) -> Optional[float]:
+        """
+        Best mean value among root actions matching predicate, minus the best
+        mean among the other root actions. None if either side is unexplored.
+        """
+        matching = [mean for action, (visits, mean) in self.root_actions.items()
+                    if visits >= min_visits and predicate(action)]
+        others = [mean for action, (visits, mean) in self.root_actions.items()
+                  if visits >= min_visits and not predicate(action)]
+        if not matching or not others:
+            return None
+        return max(matching) - max(others)
+
+    def describe(self, state: Optional[SearchState] = None) -> str:
+        """Human-readable line; card and location names are read from state."""
+        steps = []
+        for action in self.best_line:
+            steps.append(action.describe(state))
+            if state is not None and action.kind in (DEPLOY, MOVE):
+                state = apply_action(state, action, SearchParams(), random.Random(0))
+        line = ", ".join(steps) or "nothing"
+        return f"{line} (value {self.value:+.2f}, {self.iterations} iterations, {self.elapsed_ms:.0f}ms)"
+
+
+# =============================================================================
+# MODEL
+# =============================================================================
+
+# Opponent counter-deploy power by location importance (same ranges as MonteCarloSimulator)
+_RESPONSE_POWER = {2: (4, 6), 1: (3, 5), 0: (2, 4)}
+
+# The opponent initiates battle when its exact win probability is at least this
+_OPPONENT_BATTLE_WIN_PROB = 0.6
+
+
+def _sample(distribution: DestinyKey, rng: random.Random) -> int:
+    roll = rng.random()
+    cumulative = 0.0
+    for value, p in distribution:
+        cumulative += p
+        if roll < cumulative:
+            return value
+    return distribution[-1][0]
+
+
+def legal_actions(state: SearchState) -> List[SearchAction]:
+    """Our legal actions, END_TURN always last."""
+    actions: List[SearchAction] = []
+    if state.phase == PHASE_DEPLOY:
+        seen = set()
+        for card_idx, card in enumerate(state.hand):
+            stats = (card.power, card.cost, card.ability, card.is_space)
+            if card.cost > state.my_force or stats in seen:
+                continue
+            seen.add(stats)  # identical cards are interchangeable
+            for loc_idx, loc in enumerate(state.locations):
+                if loc.is_space == card.is_space:
+                    actions.append(SearchAction(DEPLOY, location=loc_idx, card=card_idx))
+    if state.phase <= PHASE_BATTLE and state.my_force >= 1:
+        for loc_idx, loc in enumerate(state.locations):
+            if loc.my_power > 0 and loc.their_power > 0 and loc_idx not in state.used:
+                actions.append(SearchAction(BATTLE, location=loc_idx))
+    if state.phase <= PHASE_MOVE and state.my_force >= 1:
+        for loc_idx, loc in enumerate(state.locations):
+            if loc.my_power > 0 and loc_idx not in state.used:
+                for dst in loc.neighbours:
+                    actions.append(SearchAction(MOVE, location=dst, source=loc_idx))
+    actions.append(END_TURN_ACTION)
+    return actions
+
+
+def _resolve_battle(state: SearchState, loc_idx: int, params: SearchParams,
+                    rng: random.Random) -> SearchState:
+    """Sample one battle outcome and apply attrition, forfeits and damage."""
+    loc = state.locations[loc_idx]
+    our_totals = destiny_total_distribution(params.our_destiny, 1 if loc.my_ability >= 4 else 0)
+    their_totals = destiny_total_distribution(params.their_destiny, 1 if loc.their_ability >= 4 else 0)
+    our_destiny = _sample(our_totals, rng)
+    their_destiny = _sample(their_totals, rng)
+    margin = (loc.my_power + our_destiny) - (loc.their_power + their_destiny)
+
+    # Attrition is the opponent's destiny; forfeited power also covers damage
+    my_lost = min(loc.my_power, their_destiny)
+    their_lost = min(loc.their_power, our_destiny)
+    my_life, their_life = state.my_life, state.their_life
+    if margin < 0:
+        extra = min(loc.my_power - my_lost, max(0, -margin - my_lost))
+        my_lost += extra
+        my_life -= max(0, -margin - my_lost)
+    elif margin > 0:
+        extra = min(loc.their_power - their_lost, max(0, margin - their_lost))
+        their_lost += extra
+        their_life -= max(0, margin - their_lost)
+
+    def scaled(ability, power, lost):
+        return ability * (power - lost) // power if power > 0 else 0
+
+    state = state.with_location(
+        loc_idx,
+        my_power=loc.my_power - my_lost,
+        their_power=loc.their_power - their_lost,
+        my_ability=scaled(loc.my_ability, loc.my_power, my_lost),
+        their_ability=scaled(loc.their_ability, loc.their_power, their_lost),
+    )
+    return replace(state, my_life=my_life, their_life=their_life)
+
+
+def _opponent_turn(state: SearchState, params: SearchParams, rng: random.Random) -> SearchState:
+    """Sample the opponent's whole turn: activate, drain, counter-deploy, battle."""
+    their_force = state.their_force + state.their_activation
+    state = replace(state, my_life=state.my_life - state.their_drain())
+    their_hand = state.their_hand
+
+    for loc_idx, loc in enumerate(state.locations):
+        if their_hand <= 0 or their_force <= 0:
+            break
+        if loc.my_power > 0:
+            # Counter our presence - more likely where the icons are
+            importance = min(2, loc.their_icons + loc.my_icons // 2)
+            if rng.random() > 0.35 + 0.2 * importance:
+                continue
+            low, high = _RESPONSE_POWER[importance]
+        elif loc.my_icons > 0 and loc.their_power <= 0:
+            # Occupy an empty location to drain us
+            if rng.random() > 0.3:
+                continue
+            low, high = _RESPONSE_POWER[0]
+        else:
+            continue
+        power = min(rng.randint(low, high), their_force + 1)
+        their_force -= max(1, power - 1)
+        their_hand -= 1
+        state = state.with_location(loc_idx, their_power=max(0, loc.their_power) + power,
+                                    their_ability=loc.their_ability + 2)
+
+    # Battle where their odds are good
+    for loc_idx, loc in enumerate(state.locations):
+        if their_force < 1 or loc.my_power <= 0 or loc.their_power <= 0:
+            continue
+        odds = battle_odds(
+            BattleSide(power=loc.their_power, draws=1 if loc.their_ability >= 4 else 0,
+                       destiny=params.their_destiny),
+            BattleSide(power=loc.my_power, draws=1 if loc.my_ability >= 4 else 0,
+                       destiny=params.our_destiny),
+        )
+        if odds.win >= _OPPONENT_BATTLE_WIN_PROB:
+            their_force -= 1
+            state = _resolve_battle(state, loc_idx, params, rng)
+
+    return replace(state, their_force=their_force, their_hand=their_hand)
+
+
+def apply_action(state: SearchState, action: SearchAction, params: SearchParams,
+                 rng: random.Random) -> SearchState:
+    """
+    Apply one of our actions. Battles and END_TURN (the opponent's reply)
+    are sampled, so the result may differ between calls.
+    """
+    if action.kind == DEPLOY:
+        card = state.hand[action.card]
+        loc = state.locations[action.location]
+        state = state.with_location(action.location, my_power=max(0, loc.my_power) + card.power,
+                                    my_ability=loc.my_ability + card.ability)
+        hand = state.hand[:action.card] + state.hand[action.card + 1:]
+        return replace(state, hand=hand, my_force=state.my_force - card.cost)
+
+    if action.kind == BATTLE:
+        state = replace(state, my_force=state.my_force - 1, phase=PHASE_BATTLE,
+                        used=state.used | {action.location})
+        return _resolve_battle(state, action.location, params, rng)
+
+    if action.kind == MOVE:
+        src = state.locations[action.source]
+        dst = state.locations[action.location]
+        state = state.with_location(action.location, my_power=max(0, dst.my_power) + src.my_power,
+                                    my_ability=dst.my_ability + src.my_ability)
+        state = state.with_location(action.source, my_power=0, my_ability=0)
+        return replace(state, my_force=state.my_force - 1, phase=PHASE_MOVE,
+                       used=state.used | {action.source, action.location})
+
+    # END_TURN: the opponent replies, then our next turn starts (within the horizon)
+    state = replace(state, turn=state.turn + 1, phase=PHASE_DONE)
+    if state.turn < params.turns:
+        state = _opponent_turn(state, params, rng)
+        state = replace(state, turn=state.turn + 1)
+        if state.turn < params.turns:
+            state = replace(state, phase=PHASE_DEPLOY, used=frozenset(),
+                            my_force=state.my_force + state.my_activation,
+                            their_life=state.their_life - state.my_drain())
+    return state
+
+
+def is_terminal(state: SearchState, params: SearchParams) -> bool:
+    return state.turn >= params.turns or state.my_life <= 0 or state.their_life <= 0
+
+
+def evaluate_state(state: SearchState, root: SearchState, params: SearchParams) -> float:
+    """Value of a state relative to the root, from our point of view, in [-1, 1]."""
+    life_swing = (root.their_life - state.their_life) - (root.my_life - state.my_life)
+    drain_diff = state.my_drain() - state.their_drain()
+    return math.tanh((life_swing + params.drain_weight * drain_diff) / params.value_scale)
+
+
+# =============================================================================
+# SEARCH
+# =============================================================================
+
+class _Node:
+    """Statistics of one state in the transposition table."""
+    __slots__ = ('actions', 'visits', 'action_visits', 'action_values')
+
+    def __init__(self, actions: List[SearchAction]):
+        self.actions = actions
+        self.visits = 0
+        self.action_visits: Dict[SearchAction, int] = {}
+        self.action_values: Dict[SearchAction, float] = {}
+
+    def select(self, exploration: float) -> SearchAction:
+        for action in self.actions:
+            if action not in self.action_visits:
+                return action
+        log_visits = math.log(self.visits)
+        return max(self.actions, key=lambda a: self.action_values[a] / self.action_visits[a] +
+                   exploration * math.sqrt(log_visits / self.action_visits[a]))
+
+    def update(self, action: SearchAction, value: float):
+        self.visits += 1
+        self.action_visits[action] = self.action_visits.get(action, 0) + 1
+        self.action_values[action] = self.action_values.get(action, 0.0) + value
+
+    def mean(self, action: SearchAction) -> float:
+        return self.action_values[action] / self.action_visits[action]
+
+    def best_action(self) -> Optional[SearchAction]:
+        if not self.action_visits:
+            return None
+        return max(self.action_visits, key=lambda a: (self.action_visits[a], self.mean(a)))
+
+
+def _rollout(state: SearchState, root: SearchState, params: SearchParams, rng: random.Random) -> float:
+    while not is_terminal(state, params):
+        actions = legal_actions(state)
+        if len(actions) == 1 or rng.random() < params.rollout_end_turn_prob:
+            action = END_TURN_ACTION
+        else:
+            action = rng.choice(actions[:-1])
+        state = apply_action(state, action, params, rng)
+    return evaluate_state(state, root, params)
+
+
+def run_search(root: SearchState, params: SearchParams, table: Dict[SearchState, _Node],
+               seed: Optional[int] = None) -> int:
+    """Run iterations into the given transposition table until the budget runs out."""
+    rng = random.Random(seed)
+    deadline = time.perf_counter() + params.time_budget_ms / 1000.0
+    iterations = 0
+    while iterations < params.max_iterations and time.perf_counter() < deadline:
+        iterations += 1
+        path: List[Tuple[_Node, SearchAction]] = []
+        state = root
+        value = None
+        while not is_terminal(state, params):
+            node = table.get(state)
+            if node is None:
+                table[state] = _Node(legal_actions(state))
+                value = _rollout(state, root, params, rng)
+                break
+            action = node.select(params.exploration)
+            path.append((node, action))
+            state = apply_action(state, action, params, rng)
+        if value is None:
+            value = evaluate_state(state, root, params)
+        for node, action in path:
+            node.update(action, value)
+    return iterations
+
+
+class LookaheadSearch:
+    """
+    Time-bounded search with a transposition table kept between calls.
+
+    Consecutive searches from related positions (the same turn, one action
+    later) reuse the statistics already gathered for shared states.
+    """
+
+    DEFAULT_TIME_BUDGET_MS = 50
+    DEFAULT_MAX_NODES = 200000
+
+    def __init__(self, config: Optional[Dict] = None):
+        """
+        Initialize search with configuration.
+
+        Args:
+            config: Optional dict (strategy config 'lookahead' section) with keys:
+                - time_budget_ms: Wall-clock budget per search (default 50)
+                - max_iterations: Iteration cap per search (default 20000)
+                - exploration: UCT exploration constant (default 1.4)
+                - turns: Turns to look ahead, ours first (default 2 = ours + the reply)
+                - drain_weight: Value of one point of drain differential (default 2.0)
+                - max_nodes: Transposition table size before it is cleared (default 200000)
+        """
+        config = config or {}
+        self.params = SearchParams(
+            time_budget_ms=config.get('time_budget_ms', self.DEFAULT_TIME_BUDGET_MS),
+            max_iterations=config.get('max_iterations', SearchParams.max_iterations),
+            exploration=config.get('exploration', SearchParams.exploration),
+            turns=config.get('turns', SearchParams.turns),
+            drain_weight=config.get('drain_weight', SearchParams.drain_weight),
+        )
+        self.max_nodes = config.get('max_nodes', self.DEFAULT_MAX_NODES)
+        self._table: Dict[SearchState, _Node] = {}
+        self._seed = 0
+
+    def search(self, root: SearchState, our_destiny: Optional[DestinyKey] = None) -> SearchResult:
+        """
+        Search from root and return the best line of our actions for this turn.
+
+        Args:
+            root: Current position
+            our_destiny: Our single-draw destiny distribution (default: DeckTracker)
+        """
+        start = time.perf_counter()
+        params = replace(self.params, our_destiny=our_destiny or tracked_destiny_key())
+        if len(self._table) > self.max_nodes:
+            self._table.clear()
+
+        self._seed += 1
+        iterations = run_search(root, params, self._table, self._seed)
+
+        node = self._table.get(root)
+        root_actions: Dict[SearchAction, Tuple[int, float]] = {}
+        if node:
+            root_actions = {a: (visits, node.action_values[a] / visits)
+                            for a, visits in node.action_visits.items() if visits > 0}
+        best_line: List[SearchAction] = []
+        value = 0.0
+        if root_actions:
+            best = max(root_actions, key=lambda a: (root_actions[a][0], root_actions[a][1]))
+            value = root_actions[best][1]
+            best_line = [best] + self._continue_line(root, best, params)
+
+        return SearchResult(best_line=best_line, value=value, iterations=iterations,
+                            elapsed_ms=(time.perf_counter() - start) * 1000, root_actions=root_actions)
+
+    def evaluate_line(self, root: SearchState, line: Sequence[SearchAction],
+                      our_destiny: Optional[DestinyKey] = None) -> SearchResult:
+        """
+        Value of committing to a line of deterministic actions (e.g. a deploy
+        plan), then playing on with the search.
+        """
+        state = root
+        rng = random.Random(0)
+        for action in line:
+            state = apply_action(state, action, self.params, rng)
+        result = self.search(state, our_destiny)
+        result.best_line = list(line) + result.best_line
+        return result
+
+    def _continue_line(self, state: SearchState, action: SearchAction, params: SearchParams) -> List[SearchAction]:
+        """Follow the most-visited actions while the line stays deterministic."""
+        line: List[SearchAction] = []
+        while action.kind in (DEPLOY, MOVE):
+            state = apply_action(state, action, params, random.Random(0))
+            node = self._table.get(state)
+            action = node.best_action() if node else None
+            if action is None:
+                break
+            line.append(action)
+        return line
+
+
+# =============================================================================
+# BOARD ADAPTER
+# =============================================================================
+
+def _phase_of(board_state) -> int:
+    phase = (getattr(board_state, 'current_phase', '') or '').lower()
+    if 'deploy' in phase or phase in ('', 'activate', 'control'):
+        return PHASE_DEPLOY
+    if 'battle' in phase:
+        return PHASE_BATTLE
+    if 'move' in phase:
+        return PHASE_MOVE
+    return PHASE_DONE
+
+
+def search_card_from_metadata(blueprint_id: str, metadata) -> Optional[SearchCard]:
+    """SearchCard for a hand card, or None if it adds no power in this model."""
+    if not metadata or not (metadata.is_character or metadata.is_starship or metadata.is_vehicle):
+        return None
+    unpiloted = (metadata.is_starship or metadata.is_vehicle) and \
+        not getattr(metadata, 'has_permanent_pilot', False)
+    power = 0 if unpiloted else (metadata.power_value or 0)
+    if power <= 0:
+        return None
+    return SearchCard(blueprint_id=blueprint_id, name=metadata.title or blueprint_id, power=power,
+                      cost=metadata.deploy_value or 0, ability=metadata.ability_value or 0,
+                      is_space=bool(metadata.is_starship))
+
+
+def build_search_state(board_state, hand: Optional[Sequence[SearchCard]] = None) -> SearchState:
+    """
+    Snapshot a BoardState for the search.
+
+    Args:
+        board_state: Current board
+        hand: Our deployable cards (default: read from board_state.cards_in_hand)
+    """
+    from .card_loader import get_card
+    from .game_plan import location_icons
+
+    if hand is None:
+        hand = []
+        for card in getattr(board_state, 'cards_in_hand', []):
+            if card.blueprint_id:
+                search_card = search_card_from_metadata(card.blueprint_id, get_card(card.blueprint_id))
+                if search_card:
+                    hand.append(search_card)
+
+    my_side = board_state.my_side or 'light'
+    topology = board_state.topology
+    locations = []
+    for idx, loc in enumerate(board_state.locations):
+        if not loc:
+            locations.append(SearchLocation(name=f"#{idx}", is_space=False))
+            continue
+        my_icons, their_icons = location_icons(loc, my_side)
+        locations.append(SearchLocation(
+            name=loc.site_name or loc.system_name or f"#{idx}",
+            is_space=bool(loc.is_space),
+            my_power=max(0, board_state.my_power_at_location(idx)),
+            their_power=max(0, board_state.their_power_at_location(idx)),
+            my_ability=sum(card.ability or 0 for card in loc.my_cards),
+            their_ability=sum(card.ability or 0 for card in loc.their_cards),
+            my_icons=my_icons,
+            their_icons=their_icons,
+            neighbours=tuple(topology.adjacent_to(idx)) if not loc.is_space else (),
+        ))
+
+    return SearchState(
+        locations=tuple(locations),
+        hand=tuple(hand),
+        my_force=board_state.force_pile,
+        their_force=board_state.their_force_pile,
+        their_hand=board_state.their_hand_size,
+        my_life=board_state.total_reserve_force(),
+        their_life=board_state.their_total_life_force(),
+        my_activation=sum(loc.my_icons for loc in locations),
+        their_activation=sum(loc.their_icons for loc in locations),
+        phase=_phase_of(board_state),
+    )
+
+
+def get_evaluator_weight() -> float:
+    """Score per unit of lookahead advantage for evaluators (value range is [-2, 2])."""
+    from .strategy_config import get_snapshot
+    return get_snapshot().section('lookahead').get('evaluator_weight', 50.0)
+
+
+# Shared search used by the evaluators (rebuilt when the strategy config reloads)
+_search: Optional[LookaheadSearch] = None
+_search_revision = -1
+_last_result: Optional[Tuple[SearchState, SearchResult]] = None
+
+
+def consult_lookahead(board_state) -> Optional[SearchResult]:
+    """
+    Search result for the current position, or None when lookahead is
+    disabled or it is not our turn. Repeated calls for the same position
+    (several actions of one decision) return the cached result.
+    """
+    global _search, _search_revision, _last_result
+    from .strategy_config import get_snapshot
+
+    snapshot = get_snapshot()
+    config = snapshot.section('lookahead')
+    if not config.get('enabled', False) or board_state is None or not board_state.is_my_turn():
+        return None
+
+    root = build_search_state(board_state)
+    if _search is None or _search_revision != snapshot.revision:
+        _search = LookaheadSearch(config)
+        _search_revision = snapshot.revision
+        _last_result = None
+    if _last_result is not None and _last_result[0] == root:
+        return _last_result[1]
+    result = _search.search(root)
+    logger.info(f"🔭 Lookahead: {result.describe(root)}")
+    _last_result = (root, result)
+    return result
@@ -11,6 +11,8 @@ import random
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 
+from .battle_odds import DEFAULT_DESTINY, BattleSide, battle_odds, tracked_destiny_key
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +24,7 @@ class TrialOutcome:
     barrier_killed: bool        # Was one of our cards Barriered?
     opponent_battled: bool      # Did opponent initiate battle on turn 1?
     turn_resolved: int          # 1 = resolved turn 1, 2 = resolved turn 2
+    win_probability: float = 1.0  # Exact P(win) of the resolving battle (with destiny)
 
 
 @dataclass
@@ -35,6 +38,7 @@ class SimulationResult:
     barrier_losses: int         # Count of trials where barrier killed our card
     opponent_battled_count: int # Count of trials where opponent battled turn 1
     histogram: Dict[int, int]   # margin -> count (for visualization)
+    avg_win_probability: float = 1.0  # Mean exact battle P(win) across trials
 
 
 @dataclass
@@ -83,6 +87,9 @@ class MonteCarloSimulator:
         """
         config = config or {}
 
+        # Our single-draw destiny distribution, refreshed per simulate_plan()
+        self._our_destiny = DEFAULT_DESTINY
+
         self.n_simulations = config.get('n_simulations', self.DEFAULT_N_SIMULATIONS)
         self.barrier_prob = config.get('barrier_probability', self.DEFAULT_BARRIER_PROBABILITY)
 
@@ -117,6 +124,7 @@ class MonteCarloSimulator:
             SimulationResult with win rate, margins, and histogram
         """
         outcomes = []
+        self._our_destiny = tracked_destiny_key()
 
         for _ in range(self.n_simulations):
             outcome = self._simulate_two_turns(plan, location_analyses, hand_cards, board_state)
@@ -148,7 +156,8 @@ class MonteCarloSimulator:
             percentile_10_margin=percentile_10_margin,
             barrier_losses=sum(1 for o in outcomes if o.barrier_killed),
             opponent_battled_count=sum(1 for o in outcomes if o.opponent_battled),
-            histogram=self._build_histogram(outcomes)
+            histogram=self._build_histogram(outcomes),
+            avg_win_probability=sum(o.win_probability for o in outcomes) / len(outcomes),
         )
 
     def calculate_expected_value(
@@ -330,7 +339,8 @@ class MonteCarloSimulator:
                 we_control=turn1_result['we_control'],
                 barrier_killed=barrier_killed,
                 opponent_battled=True,
-                turn_resolved=1
+                turn_resolved=1,
+                win_probability=turn1_result['win_probability'],
             )
 
         # TURN 2: Opponent didn't battle - we can reinforce from our REAL hand
@@ -364,14 +374,15 @@ class MonteCarloSimulator:
 
         if best_outcome is None:
             # No contested locations - we control everything
-            best_outcome = {'margin': 99, 'we_control': True}
+            best_outcome = {'margin': 99, 'we_control': True, 'win_probability': 1.0}
 
         return TrialOutcome(
             power_margin=best_outcome['margin'],
             we_control=best_outcome['we_control'],
             barrier_killed=barrier_killed,
             opponent_battled=False,
-            turn_resolved=2
+            turn_resolved=2,
+            win_probability=best_outcome['win_probability'],
         )
 
     def _get_counter_probability(self, importance: str, opponent_hand: int) -> float:
@@ -518,11 +529,21 @@ class MonteCarloSimulator:
         return total_power
 
     def _resolve_battle(self, location_state: Dict) -> Dict:
-        """Simplified battle resolution - power comparison."""
+        """
+        Simplified battle resolution - power comparison.
+
+        Also reports the exact probability of winning once both sides add one
+        battle destiny (the location state carries no ability information).
+        """
         margin = location_state['our_power'] - location_state['their_power']
+        odds = battle_odds(
+            BattleSide(power=max(0, location_state['our_power']), draws=1, destiny=self._our_destiny),
+            BattleSide(power=max(0, location_state['their_power']), draws=1),
+        )
         return {
             'margin': margin,
-            'we_control': margin > 0
+            'we_control': margin > 0,
+            'win_probability': odds.win,
         }
 
     def _build_histogram(self, outcomes: List[TrialOutcome]) -> Dict[int, int]:
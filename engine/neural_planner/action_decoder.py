@@ -425,3 +425,43 @@ class ActionDecoder:
             except Exception:
                 return default
         return default
+
+
+def plan_to_action(plan: DeploymentPlan, board_state: Any) -> int:
+    """
+    Convert a DeploymentPlan back to the action index that best describes it.
+
+    Inverse of ActionDecoder.decode(), used to label rules-planner decisions
+    for training (experience collection and behaviour cloning).
+
+    Args:
+        plan: Plan produced by any planner
+        board_state: BoardState the plan was made for
+
+    Returns:
+        Action index (0-20)
+    """
+    if plan.strategy == DeployStrategy.HOLD_BACK:
+        return ACTION_HOLD_BACK
+
+    if plan.strategy == DeployStrategy.DEPLOY_LOCATIONS:
+        return ACTION_DEPLOY_LOCATION_CARD
+
+    # For other strategies, try to determine target location
+    if plan.instructions:
+        target_loc_id = plan.instructions[0].target_location_id
+
+        locations = getattr(board_state, 'locations', [])
+        for i, loc in enumerate(locations):
+            if i > ACTION_DEPLOY_LOC_END - ACTION_DEPLOY_LOC_START:
+                break
+            if loc and getattr(loc, 'card_id', None) == target_loc_id:
+                return ACTION_DEPLOY_LOC_START + i
+
+    # Default based on strategy
+    if plan.strategy == DeployStrategy.REINFORCE:
+        return ACTION_REINFORCE_BEST
+    elif plan.strategy == DeployStrategy.ESTABLISH:
+        return ACTION_ESTABLISH_GROUND
+
+    return ACTION_HOLD_BACK
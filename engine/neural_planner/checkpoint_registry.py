@@ -0,0 +1,410 @@
+"""
+Compact checkpoint registry for the neural deploy planner.
+
+Replaces the "one full .pt + one stats JSON per batch" layout with:
+- fp16 weight storage (half the size of fp32 state dicts)
+- content-addressed tensor blobs, so tensors that did not change between
+  checkpoints are stored once
+- optimizer state kept only for the most recent N checkpoints
+- a retention policy (keep last N + best K by a metric)
+- a single index.json with metrics for every checkpoint, so evaluation
+  sweeps can pick checkpoints without opening any weight files
+- lazy, memory-mapped weight loading (fp16 until copied into a module)
+
+Layout:
+    models/registry/index.json
+    models/registry/blobs/<sha1>.pt      # one tensor each, fp16
+    models/registry/optim/<name>.pt      # optimizer state (latest N only)
+
+Usage:
+    registry = CheckpointRegistry('models/registry')
+    registry.save('batch100', network.state_dict(), metrics={'win_rate': 0.55},
+                  optimizer_state=optimizer.state_dict())
+    best = registry.best('win_rate')
+    network.load_state_dict(registry.load_weights(best['name']))
+
+    # Migrate old checkpoints/stats pairs
+    python -m engine.neural_planner.checkpoint_registry migrate models/checkpoints
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Try to import PyTorch
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+INDEX_VERSION = 1
+
+# Legacy train_neural.py checkpoint names: checkpoint_20260113_165210_batch5.pt
+LEGACY_CHECKPOINT_RE = re.compile(r'checkpoint_(\d{8}_\d{6})_batch(\d+)\.pt$')
+
+
+def _torch_load(path: Path, mmap: bool) -> Any:
+    """torch.load with memory mapping when the installed torch supports it."""
+    if mmap:
+        try:
+            return torch.load(path, map_location='cpu', mmap=True, weights_only=True)
+        except TypeError:
+            # torch < 2.1 has no mmap/weights_only arguments
+            pass
+    return torch.load(path, map_location='cpu')
+
+
+class LazyStateDict(Mapping):
+    """
+    State dict whose tensors are loaded (memory-mapped) on first access.
+
+    Passing this to load_state_dict() works like a normal dict; code that
+    only inspects a few tensors never touches the rest. Tensors keep their
+    stored dtype (fp16) unless a dtype is given: casting copies the tensor
+    out of the mapping, while load_state_dict() converts while copying into
+    the module's parameters anyway.
+    """
+
+    def __init__(self, blob_dir: Path, tensor_refs: Dict[str, str],
+                 dtype: Optional['torch.dtype'] = None, mmap: bool = True):
+        self._blob_dir = blob_dir
+        self._refs = tensor_refs
+        self._dtype = dtype
+        self._mmap = mmap
+        self._cache: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._cache:
+            tensor = _torch_load(self._blob_dir / f"{self._refs[key]}.pt", self._mmap)
+            if self._dtype is not None and tensor.is_floating_point():
+                tensor = tensor.to(self._dtype)
+            self._cache[key] = tensor
+        return self._cache[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._refs)
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+
+class CheckpointRegistry:
+    """
+    Registry of compact, deduplicated training checkpoints.
+
+    Thread-safety: single writer (the training script). Readers only need
+    index.json and the blobs it references.
+    """
+
+    def __init__(
+        self,
+        root: str = 'models/registry',
+        keep_optimizer: int = 2,
+        keep_last: int = 5,
+        keep_best: int = 3,
+        best_metric: str = 'win_rate',
+        half_precision: bool = True,
+        deduplicate: bool = True,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            root: Registry directory
+            keep_optimizer: Keep optimizer state for the latest N checkpoints
+            keep_last: Retention - always keep the latest N checkpoints
+            keep_best: Retention - also keep the best K by best_metric
+            best_metric: Metric (higher is better) used for retention
+            half_precision: Store floating point tensors as fp16
+            deduplicate: Reuse blobs for tensors identical to stored ones
+        """
+        if not TORCH_AVAILABLE:
+            raise RuntimeError("PyTorch required for checkpoint registry")
+
+        self.root = Path(root)
+        self.blob_dir = self.root / 'blobs'
+        self.optim_dir = self.root / 'optim'
+        self.index_path = self.root / 'index.json'
+
+        self.keep_optimizer = keep_optimizer
+        self.keep_last = keep_last
+        self.keep_best = keep_best
+        self.best_metric = best_metric
+        self.half_precision = half_precision
+        self.deduplicate = deduplicate
+
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.optim_dir.mkdir(parents=True, exist_ok=True)
+
+        self._entries: List[Dict[str, Any]] = self._read_index()
+
+    # =========================================================================
+    # Index
+    # =========================================================================
+
+    def _read_index(self) -> List[Dict[str, Any]]:
+        if not self.index_path.exists():
+            return []
+        with open(self.index_path, 'r') as f:
+            return json.load(f).get('checkpoints', [])
+
+    def _write_index(self) -> None:
+        tmp_path = self.index_path.with_name(self.index_path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': INDEX_VERSION, 'checkpoints': self._entries}, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def list(self) -> List[Dict[str, Any]]:
+        """All checkpoint entries, oldest first."""
+        return list(self._entries)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Index entry for a checkpoint, or None."""
+        for entry in self._entries:
+            if entry['name'] == name:
+                return entry
+        return None
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """Most recently saved checkpoint entry."""
+        return self._entries[-1] if self._entries else None
+
+    def best(self, metric: Optional[str] = None, n: int = 1,
+             higher_is_better: bool = True) -> Any:
+        """
+        Best checkpoint(s) by a metric, read from the index only.
+
+        Returns:
+            The best entry (n == 1) or a list of up to n entries
+        """
+        metric = metric or self.best_metric
+        scored = [e for e in self._entries if metric in e.get('metrics', {})]
+        scored.sort(key=lambda e: e['metrics'][metric], reverse=higher_is_better)
+        if n == 1:
+            return scored[0] if scored else None
+        return scored[:n]
+
+    # =========================================================================
+    # Save / load
+    # =========================================================================
+
+    def save(
+        self,
+        name: str,
+        state_dict: Dict[str, Any],
+        metrics: Optional[Dict[str, float]] = None,
+        optimizer_state: Optional[Dict[str, Any]] = None,
+        step: Optional[int] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Store a checkpoint and apply the retention policy.
+
+        Args:
+            name: Unique checkpoint name
+            state_dict: Network weights
+            metrics: Scalar metrics to index (win_rate, policy_loss, ...)
+            optimizer_state: Optimizer state (dropped once older than keep_optimizer)
+            step: Training step / batch number
+            extra: Additional JSON-serializable metadata
+
+        Returns:
+            The new index entry
+        """
+        if self.get(name) is not None:
+            raise ValueError(f"Checkpoint {name!r} already exists")
+
+        tensors: Dict[str, str] = {}
+        new_bytes = 0
+        for key, tensor in state_dict.items():
+            tensor = tensor.detach().cpu()
+            if self.half_precision and tensor.is_floating_point():
+                tensor = tensor.half()
+            tensor = tensor.contiguous()
+
+            digest = self._hash_tensor(tensor)
+            blob_path = self.blob_dir / f"{digest}.pt"
+            if not (self.deduplicate and blob_path.exists()):
+                tmp_path = blob_path.with_name(blob_path.name + '.tmp')
+                torch.save(tensor.clone(), tmp_path)
+                os.replace(tmp_path, blob_path)
+                new_bytes += blob_path.stat().st_size
+            tensors[key] = digest
+
+        has_optimizer = optimizer_state is not None
+        if has_optimizer:
+            torch.save(optimizer_state, self.optim_dir / f"{name}.pt")
+
+        entry = {
+            'name': name,
+            'step': step,
+            'created': time.time(),
+            'metrics': dict(metrics or {}),
+            'dtype': 'float16' if self.half_precision else 'native',
+            'has_optimizer': has_optimizer,
+            'tensors': tensors,
+            'extra': extra or {},
+        }
+        self._entries.append(entry)
+        self._apply_retention()
+        self._write_index()
+
+        logger.info(f"Registered checkpoint {name} ({new_bytes / 1024:.0f} KB new data, "
+                    f"{len(tensors)} tensors)")
+        return entry
+
+    def load_weights(self, name: str, lazy: bool = True,
+                     dtype: Optional['torch.dtype'] = None) -> Mapping:
+        """
+        Load checkpoint weights.
+
+        Args:
+            name: Checkpoint name
+            lazy: Return a LazyStateDict (memory-mapped, load on access)
+            dtype: Cast floating tensors to this dtype (default: keep the
+                stored dtype, so tensors stay memory-mapped)
+
+        Returns:
+            Mapping usable with module.load_state_dict()
+        """
+        entry = self.get(name)
+        if entry is None:
+            raise KeyError(f"Unknown checkpoint {name!r}")
+
+        state = LazyStateDict(self.blob_dir, entry['tensors'],
+                              dtype=dtype, mmap=lazy)
+        if lazy:
+            return state
+        return {key: state[key] for key in state}
+
+    def load_optimizer(self, name: str) -> Optional[Dict[str, Any]]:
+        """Optimizer state for a checkpoint, or None if it was not retained."""
+        path = self.optim_dir / f"{name}.pt"
+        if not path.exists():
+            return None
+        return torch.load(path, map_location='cpu')
+
+    def export_model(self, name: str, path: str) -> None:
+        """Write a plain fp32 state dict for NeuralDeployPlanner to load."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        torch.save(dict(self.load_weights(name, lazy=False, dtype=torch.float32)), path)
+
+    def disk_usage(self) -> int:
+        """Total bytes used by the registry."""
+        return sum(p.stat().st_size for p in self.root.rglob('*') if p.is_file())
+
+    # =========================================================================
+    # Retention
+    # =========================================================================
+
+    def _apply_retention(self) -> None:
+        """Drop old optimizer state and checkpoints outside the policy."""
+        keep = {e['name'] for e in self._entries[-self.keep_last:]} if self.keep_last else set()
+        if self.keep_best:
+            for entry in self.best(self.best_metric, n=self.keep_best) or []:
+                keep.add(entry['name'])
+
+        removed = [e for e in self._entries if e['name'] not in keep]
+        self._entries = [e for e in self._entries if e['name'] in keep]
+
+        # Optimizer state only for the latest keep_optimizer checkpoints
+        recent = {e['name'] for e in self._entries[-self.keep_optimizer:]} if self.keep_optimizer else set()
+        for entry in self._entries + removed:
+            if entry['has_optimizer'] and entry['name'] not in recent:
+                optim_path = self.optim_dir / f"{entry['name']}.pt"
+                if optim_path.exists():
+                    optim_path.unlink()
+                entry['has_optimizer'] = False
+
+        if removed:
+            logger.info(f"Retention removed {len(removed)} checkpoint(s): "
+                        f"{', '.join(e['name'] for e in removed)}")
+            self._collect_garbage()
+
+    def _collect_garbage(self) -> None:
+        """Delete blobs no longer referenced by any checkpoint."""
+        live = {digest for e in self._entries for digest in e['tensors'].values()}
+        for blob in self.blob_dir.glob('*.pt'):
+            if blob.stem not in live:
+                blob.unlink()
+
+    # =========================================================================
+    # Helpers
+    # =========================================================================
+
+    @staticmethod
+    def _hash_tensor(tensor: 'torch.Tensor') -> str:
+        digest = hashlib.sha1()
+        digest.update(f"{tensor.dtype}:{tuple(tensor.shape)}".encode())
+        digest.update(tensor.reshape(-1).view(torch.uint8).numpy().tobytes())
+        return digest.hexdigest()
+
+    def import_legacy(self, checkpoint_dir: str) -> int:
+        """
+        Import train_neural.py checkpoint_*.pt / stats_*.json pairs.
+
+        Returns:
+            Number of checkpoints imported
+        """
+        imported = 0
+        for path in sorted(Path(checkpoint_dir).glob('checkpoint_*.pt')):
+            match = LEGACY_CHECKPOINT_RE.search(path.name)
+            if not match or self.get(path.stem) is not None:
+                continue
+            timestamp, batch_num = match.group(1), int(match.group(2))
+
+            metrics: Dict[str, float] = {}
+            stats_path = path.with_name(f"stats_{timestamp}_batch{batch_num}.json")
+            if stats_path.exists():
+                with open(stats_path, 'r') as f:
+                    stats = json.load(f)
+                metrics = {k: v for k, v in stats.items() if isinstance(v, (int, float))}
+
+            checkpoint = torch.load(path, map_location='cpu')
+            state_dict = checkpoint.get('network_state_dict', checkpoint)
+            optimizer_state = checkpoint.get('optimizer_state_dict')
+            self.save(path.stem, state_dict, metrics=metrics,
+                      optimizer_state=optimizer_state, step=batch_num)
+            imported += 1
+
+        return imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Neural planner checkpoint registry')
+    parser.add_argument('command', choices=['list', 'migrate'])
+    parser.add_argument('path', nargs='?', default='models/checkpoints',
+                        help='Legacy checkpoint directory (migrate)')
+    parser.add_argument('--registry', default='models/registry',
+                        help='Registry directory')
+    parser.add_argument('--keep-last', type=int, default=5)
+    parser.add_argument('--keep-best', type=int, default=3)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    registry = CheckpointRegistry(args.registry, keep_last=args.keep_last,
+                                  keep_best=args.keep_best)
+
+    if args.command == 'migrate':
+        count = registry.import_legacy(args.path)
+        print(f"Imported {count} checkpoint(s); registry uses "
+              f"{registry.disk_usage() / (1024 * 1024):.1f} MB")
+
+    for entry in registry.list():
+        metrics = ', '.join(f"{k}={v:.3g}" for k, v in entry['metrics'].items())
+        optim = ' +optim' if entry['has_optimizer'] else ''
+        print(f"{entry['name']}{optim}: {metrics}")
+
+
+if __name__ == '__main__':
+    main()
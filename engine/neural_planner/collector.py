@@ -60,14 +60,18 @@ class ExperienceCollector:
         # Last state for reward computation
         self._last_board_state = None
 
-    def start_game(self, my_side: str = '') -> None:
+    def start_game(self, my_side: str = '', policy_version: int = 0) -> None:
         """
         Start collecting for a new game.
 
         Args:
             my_side: 'dark' or 'light'
+            policy_version: Published policy version playing this game
         """
-        self.current_trajectory = GameTrajectory(my_side=my_side)
+        self.current_trajectory = GameTrajectory(
+            my_side=my_side,
+            policy_version=policy_version,
+        )
         self.game_active = True
         self.reward_shaper.reset()
         self._last_board_state = None
@@ -193,18 +197,24 @@ class TrainingNeuralPlanner:
 
         # Create network
         self.network = DeployPolicyNetwork()
+        self.policy_subscriber = None
         if TORCH_AVAILABLE:
+            from .policy_broadcast import PolicySubscriber
+
             self.network = self.network.to(device)
 
-            # Load weights if available
-            import os
-            if os.path.exists(model_path):
-                try:
-                    state_dict = torch.load(model_path, map_location=device)
-                    self.network.load_state_dict(state_dict)
-                    logger.info(f"Loaded model from {model_path}")
-                except Exception as e:
-                    logger.warning(f"Could not load model: {e}")
+            # Follow versioned weights published by an async learner;
+            # falls back to the plain model file when nothing is published
+            self.policy_subscriber = PolicySubscriber(model_path, device=device)
+            if not self.policy_subscriber.sync(self.network):
+                import os
+                if os.path.exists(model_path):
+                    try:
+                        state_dict = torch.load(model_path, map_location=device)
+                        self.network.load_state_dict(state_dict)
+                        logger.info(f"Loaded model from {model_path}")
+                    except Exception as e:
+                        logger.warning(f"Could not load model: {e}")
 
         # Create base planner
         self.planner = NeuralDeployPlanner(
@@ -227,8 +237,16 @@ class TrainingNeuralPlanner:
 
     def start_game(self, my_side: str = '') -> None:
         """Start collecting experiences for a new game."""
+        # Pick up weights published since the last game (no restart needed)
+        if self.policy_subscriber is not None:
+            try:
+                self.policy_subscriber.sync(self.network)
+            except Exception as e:
+                logger.warning(f"Policy sync failed, keeping current weights: {e}")
+
         if self.collect_experiences:
-            self.collector.start_game(my_side)
+            policy_version = self.policy_subscriber.version if self.policy_subscriber else 0
+            self.collector.start_game(my_side, policy_version=policy_version)
         self.planner.reset()
 
     def create_plan(self, board_state: Any):
@@ -278,32 +296,8 @@ class TrainingNeuralPlanner:
 
     def _plan_to_action(self, plan, board_state: Any) -> int:
         """Convert a DeploymentPlan back to action index."""
-        from ..deploy_planner import DeployStrategy
-
-        if plan.strategy == DeployStrategy.HOLD_BACK:
-            return 0  # ACTION_HOLD_BACK
-
-        if plan.strategy == DeployStrategy.DEPLOY_LOCATIONS:
-            return 17  # ACTION_DEPLOY_LOCATION_CARD
-
-        # For other strategies, try to determine target location
-        if plan.instructions:
-            inst = plan.instructions[0]
-            target_loc_id = inst.target_location_id
-
-            # Find location index
-            locations = getattr(board_state, 'locations', [])
-            for i, loc in enumerate(locations):
-                if loc and getattr(loc, 'card_id', None) == target_loc_id:
-                    return 1 + i  # ACTION_DEPLOY_LOC_START + index
-
-        # Default based on strategy
-        if plan.strategy == DeployStrategy.REINFORCE:
-            return 20  # ACTION_REINFORCE_BEST
-        elif plan.strategy == DeployStrategy.ESTABLISH:
-            return 18  # ACTION_ESTABLISH_GROUND (default)
-
-        return 0  # Fallback to HOLD_BACK
+        from .action_decoder import plan_to_action
+        return plan_to_action(plan, board_state)
 
     # Delegate other methods to base planner
     def get_card_score(self, *args, **kwargs):
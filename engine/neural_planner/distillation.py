@@ -0,0 +1,368 @@
+"""
+Behaviour-cloning distillation of the rules-based deploy planner.
+
+DeployPhasePlanner.create_plan is the most expensive decision the bot
+makes (candidate plan generation, scoring and Monte Carlo reranking).
+This module distills it into DeployPolicyNetwork:
+
+1. Record: DistillationRecorder wraps the rules planner during normal
+   games (DISTILL_RECORD=1) and stores (encoded state, action mask,
+   chosen action, planner latency) for every new plan.
+2. Train: BehaviorCloningTrainer fits the network to the recorded
+   actions with masked cross-entropy.
+3. Hybrid: load the distilled weights into NeuralDeployPlanner with the
+   rules planner as fallback. Its confidence_threshold already routes
+   low-confidence states to the full planner; the train command reports
+   the threshold that keeps agreement high, plus coverage and the
+   expected latency saved per deploy phase.
+
+Usage:
+    DISTILL_RECORD=1 python app.py          # record while playing
+    python -m engine.neural_planner.distillation \
+        --data training_data/distillation --out models/distilled_planner.pt
+"""
+
+import argparse
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .state_encoder import StateEncoder
+from .action_decoder import plan_to_action
+
+logger = logging.getLogger(__name__)
+
+# Try to import PyTorch
+try:
+    import torch
+    import torch.nn.functional as F
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+DEFAULT_DISTILLATION_DIR = Path('training_data/distillation')
+
+
+class DistillationRecorder:
+    """
+    Wraps a rules-based DeployPhasePlanner and records its decisions.
+
+    Exposes the same interface as DeployPhasePlanner, so DeployEvaluator
+    can use it as its planner while recording.
+    """
+
+    def __init__(self, planner: Any, output_dir: Path = DEFAULT_DISTILLATION_DIR):
+        """
+        Initialize the recorder.
+
+        Args:
+            planner: Rules-based DeployPhasePlanner to record
+            output_dir: Directory for per-game sample files
+        """
+        self.planner = planner
+        self.output_dir = Path(output_dir)
+        self.state_encoder = StateEncoder()
+        self.samples: List[Dict[str, Any]] = []
+        self.skipped = 0
+        self.my_side = ''
+
+    def start_game(self, my_side: str = '') -> None:
+        """Start recording a new game."""
+        self.samples = []
+        self.skipped = 0
+        self.my_side = my_side
+
+    def create_plan(self, board_state: Any):
+        """Create a plan with the rules planner, recording new plans."""
+        previous_plan = self.planner.current_plan
+
+        start = time.perf_counter()
+        plan = self.planner.create_plan(board_state)
+        planner_ms = (time.perf_counter() - start) * 1000
+
+        # Cached plans and opponent-turn placeholders are not decisions
+        is_my_turn = board_state.is_my_turn() if hasattr(board_state, 'is_my_turn') else True
+        if plan is previous_plan or not is_my_turn:
+            return plan
+
+        try:
+            self._record(board_state, plan, planner_ms)
+        except Exception as e:
+            logger.warning(f"Distillation recording failed: {e}")
+
+        return plan
+
+    def _record(self, board_state: Any, plan: Any, planner_ms: float) -> None:
+        state = self.state_encoder.encode(board_state)
+        mask = self.state_encoder.get_action_mask(board_state)
+        action = plan_to_action(plan, board_state)
+
+        # The network can never output a masked action, so such labels
+        # cannot be imitated - count them instead of training on them
+        if not mask[action]:
+            self.skipped += 1
+            return
+
+        self.samples.append({
+            'state': state.tolist(),
+            'action_mask': mask.tolist(),
+            'action': action,
+            'strategy': plan.strategy.value,
+            'planner_ms': planner_ms,
+            'turn': getattr(board_state, 'turn_number', 0),
+        })
+
+    def finalize_game(self, won: bool) -> None:
+        """
+        Save this game's samples.
+
+        Returns None so DeployEvaluator.on_game_ended does not treat the
+        recording as an RL trajectory.
+        """
+        if not self.samples:
+            return None
+
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+            filepath = self.output_dir / f'distill_{timestamp}.json'
+            with open(filepath, 'w') as f:
+                json.dump({
+                    'my_side': self.my_side,
+                    'won': won,
+                    'skipped': self.skipped,
+                    'samples': self.samples,
+                }, f)
+            logger.info(f"Saved {len(self.samples)} distillation samples to {filepath} "
+                        f"({self.skipped} unrepresentable)")
+        except Exception as e:
+            logger.error(f"Failed to save distillation samples: {e}")
+
+        self.samples = []
+        return None
+
+    # Delegate the rest of the planner interface
+    def get_card_score(self, *args, **kwargs):
+        return self.planner.get_card_score(*args, **kwargs)
+
+    def record_deployment(self, *args, **kwargs):
+        return self.planner.record_deployment(*args, **kwargs)
+
+    def should_hold_back(self):
+        return self.planner.should_hold_back()
+
+    def get_plan_summary(self):
+        return self.planner.get_plan_summary()
+
+    def reset(self):
+        return self.planner.reset()
+
+    def has_favorable_battle_setup(self, *args, **kwargs):
+        return self.planner.has_favorable_battle_setup(*args, **kwargs)
+
+    @property
+    def current_plan(self):
+        return self.planner.current_plan
+
+
+def load_distillation_samples(
+    directory: Path = DEFAULT_DISTILLATION_DIR,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Load all recorded samples.
+
+    Returns:
+        (states, action_masks, actions, planner_ms) arrays
+    """
+    states, masks, actions, planner_ms = [], [], [], []
+    for filepath in sorted(Path(directory).glob('distill_*.json')):
+        try:
+            with open(filepath, 'r') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"Skipping {filepath}: {e}")
+            continue
+        for sample in data.get('samples', []):
+            states.append(sample['state'])
+            masks.append(sample['action_mask'])
+            actions.append(sample['action'])
+            planner_ms.append(sample.get('planner_ms', 0.0))
+
+    return (
+        np.array(states, dtype=np.float32),
+        np.array(masks, dtype=bool),
+        np.array(actions, dtype=np.int64),
+        np.array(planner_ms, dtype=np.float32),
+    )
+
+
+class BehaviorCloningTrainer:
+    """Supervised trainer that imitates recorded planner actions."""
+
+    def __init__(
+        self,
+        network: Any,
+        learning_rate: float = 1e-3,
+        weight_decay: float = 0.01,
+        batch_size: int = 128,
+        device: str = 'cpu',
+    ):
+        if not TORCH_AVAILABLE:
+            raise RuntimeError("PyTorch required for distillation")
+
+        self.device = device
+        self.network = network.to(device)
+        self.batch_size = batch_size
+        self.optimizer = torch.optim.AdamW(
+            self.network.parameters(), lr=learning_rate, weight_decay=weight_decay,
+        )
+
+    def train(self, states: np.ndarray, masks: np.ndarray, actions: np.ndarray,
+              epochs: int = 20) -> Dict[str, float]:
+        """
+        Fit the network to the recorded actions.
+
+        Returns:
+            Final epoch's mean loss and training accuracy
+        """
+        states_t = torch.from_numpy(states).to(self.device)
+        masks_t = torch.from_numpy(masks).to(self.device)
+        actions_t = torch.from_numpy(actions).to(self.device)
+
+        self.network.train()
+        metrics = {'loss': 0.0, 'accuracy': 0.0}
+        for epoch in range(epochs):
+            order = torch.randperm(len(states_t), device=self.device)
+            total_loss, correct = 0.0, 0
+            for start in range(0, len(order), self.batch_size):
+                idx = order[start:start + self.batch_size]
+                logits, _ = self.network(states_t[idx], masks_t[idx])
+                loss = F.cross_entropy(logits, actions_t[idx])
+
+                self.optimizer.zero_grad()
+                loss.backward()
+                torch.nn.utils.clip_grad_norm_(self.network.parameters(), 1.0)
+                self.optimizer.step()
+
+                total_loss += loss.item() * len(idx)
+                correct += (logits.argmax(dim=-1) == actions_t[idx]).sum().item()
+
+            metrics = {
+                'loss': total_loss / len(order),
+                'accuracy': correct / len(order),
+            }
+            logger.info(f"Epoch {epoch + 1}/{epochs}: loss={metrics['loss']:.4f}, "
+                        f"accuracy={metrics['accuracy']:.2%}")
+
+        return metrics
+
+    def evaluate(self, states: np.ndarray, masks: np.ndarray, actions: np.ndarray,
+                 confidence_threshold: float) -> Dict[str, float]:
+        """
+        Measure agreement with the planner overall and in hybrid mode.
+
+        Returns:
+            agreement: argmax matches planner (all states)
+            coverage: fraction of states handled by the network at this threshold
+            confident_agreement: agreement on the states the network handles
+            hybrid_agreement: agreement of the hybrid (network or planner)
+            neural_ms: mean single-state forward pass latency
+        """
+        self.network.eval()
+        states_t = torch.from_numpy(states).to(self.device)
+        masks_t = torch.from_numpy(masks).to(self.device)
+        actions_t = torch.from_numpy(actions).to(self.device)
+
+        with torch.no_grad():
+            probs = F.softmax(self.network(states_t, masks_t)[0], dim=-1)
+            confidence, predicted = probs.max(dim=-1)
+
+            start = time.perf_counter()
+            samples = min(100, len(states_t))
+            for i in range(samples):
+                self.network(states_t[i:i + 1], masks_t[i:i + 1])
+            neural_ms = (time.perf_counter() - start) * 1000 / max(samples, 1)
+
+        matches = predicted == actions_t
+        confident = confidence >= confidence_threshold
+        coverage = confident.float().mean().item()
+        confident_agreement = (
+            matches[confident].float().mean().item() if confident.any() else 0.0
+        )
+        # Fallback states get the planner's own answer
+        hybrid_agreement = (matches | ~confident).float().mean().item()
+
+        return {
+            'agreement': matches.float().mean().item(),
+            'coverage': coverage,
+            'confident_agreement': confident_agreement,
+            'hybrid_agreement': hybrid_agreement,
+            'neural_ms': neural_ms,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Distill the rules deploy planner')
+    parser.add_argument('--data', default=str(DEFAULT_DISTILLATION_DIR),
+                        help='Directory of recorded distillation samples')
+    parser.add_argument('--out', default='models/distilled_planner.pt',
+                        help='Output path for distilled weights')
+    parser.add_argument('--epochs', type=int, default=20)
+    parser.add_argument('--val-fraction', type=float, default=0.15)
+    parser.add_argument('--target-agreement', type=float, default=0.95,
+                        help='Hybrid-mode agreement to choose the confidence threshold for')
+    parser.add_argument('--device', default='cpu', choices=['cpu', 'cuda'])
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    from .network import DeployPolicyNetwork
+
+    states, masks, actions, planner_ms = load_distillation_samples(Path(args.data))
+    if len(states) == 0:
+        print(f"No distillation samples in {args.data}")
+        return
+
+    order = np.random.permutation(len(states))
+    n_val = max(1, int(len(order) * args.val_fraction))
+    val, train = order[:n_val], order[n_val:]
+
+    trainer = BehaviorCloningTrainer(DeployPolicyNetwork(), device=args.device)
+    trainer.train(states[train], masks[train], actions[train], epochs=args.epochs)
+
+    Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+    torch.save(trainer.network.state_dict(), args.out)
+
+    # Pick the lowest threshold whose hybrid agreement meets the target
+    mean_planner_ms = float(planner_ms.mean())
+    chosen = None
+    print(f"\nValidation on {n_val} held-out planner decisions "
+          f"(rules planner {mean_planner_ms:.1f}ms/plan):")
+    print(f"{'threshold':>10} {'coverage':>9} {'confident':>10} {'hybrid':>8} {'saved ms':>9}")
+    for threshold in (0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95):
+        result = trainer.evaluate(states[val], masks[val], actions[val], threshold)
+        saved_ms = result['coverage'] * mean_planner_ms - result['neural_ms']
+        print(f"{threshold:>10.2f} {result['coverage']:>9.1%} "
+              f"{result['confident_agreement']:>10.1%} {result['hybrid_agreement']:>8.1%} "
+              f"{saved_ms:>9.1f}")
+        if chosen is None and result['hybrid_agreement'] >= args.target_agreement:
+            chosen = (threshold, result, saved_ms)
+
+    print(f"\nOverall argmax agreement: {result['agreement']:.1%}")
+    if chosen:
+        threshold, result, saved_ms = chosen
+        print(f"Recommended confidence_threshold: {threshold} "
+              f"(coverage {result['coverage']:.0%}, ~{saved_ms:.1f}ms saved per deploy phase)")
+    else:
+        print(f"No threshold reaches {args.target_agreement:.0%} hybrid agreement; "
+              f"record more games")
+    print(f"Distilled weights written to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
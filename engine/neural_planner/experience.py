@@ -61,6 +61,10 @@ class GameTrajectory:
     game_length: int = 0  # Number of turns
     my_side: str = ""  # "dark" or "light"
 
+    # Version of the published policy that generated this game
+    # (used by async training to detect and correct stale data)
+    policy_version: int = 0
+
     def add_experience(self, exp: Experience) -> None:
         """Add an experience to the trajectory."""
         self.experiences.append(exp)
@@ -143,6 +147,7 @@ class ExperienceBatch:
     returns: np.ndarray  # [batch]
     advantages: np.ndarray  # [batch]
     values: np.ndarray  # [batch]
+    policy_versions: np.ndarray = None  # [batch] generating policy version
 
     @classmethod
     def from_trajectories(
@@ -169,6 +174,7 @@ class ExperienceBatch:
         all_returns = []
         all_advantages = []
         all_values = []
+        all_versions = []
 
         for traj in trajectories:
             if not traj.experiences:
@@ -186,6 +192,7 @@ class ExperienceBatch:
                 all_returns.append(returns[i])
                 all_advantages.append(advantages[i])
                 all_values.append(exp.value)
+                all_versions.append(traj.policy_version)
 
         # Stack into arrays
         return cls(
@@ -196,6 +203,7 @@ class ExperienceBatch:
             returns=np.array(all_returns, dtype=np.float32),
             advantages=np.array(all_advantages, dtype=np.float32),
             values=np.array(all_values, dtype=np.float32),
+            policy_versions=np.array(all_versions, dtype=np.int64),
         )
 
     def __len__(self) -> int:
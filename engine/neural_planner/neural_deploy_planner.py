@@ -10,11 +10,13 @@ Key features:
 - Same interface as DeployPhasePlanner: create_plan(board_state) -> DeploymentPlan
 - Confidence-based fallback to rules-based planner
 - ONNX export support for optimized CPU inference
+- Optional int8 dynamic quantization, gated on measured agreement with fp32
 """
 
 import logging
 import os
-from typing import Any, Optional, Tuple
+import time
+from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
 
@@ -35,6 +37,39 @@ except ImportError:
     logger.warning("PyTorch not available - neural planner will use fallback")
 
 
+# Networks loaded ahead of time by preload_network(), keyed by (path, device).
+# supervisor.py loads the model once before forking bot workers so every
+# bot shares the same (read-only, eval mode) weights copy-on-write.
+_shared_networks: Dict[Tuple[str, str], Any] = {}
+
+
+def preload_network(model_path: str, device: str = 'cpu') -> bool:
+    """
+    Load a model into the shared network cache.
+
+    NeuralDeployPlanner instances created afterwards with the same path and
+    device use the cached network instead of loading their own copy.
+
+    Returns:
+        True if the network is cached
+    """
+    key = (os.path.abspath(model_path), device)
+    if key in _shared_networks:
+        return True
+    if not TORCH_AVAILABLE or not os.path.exists(model_path):
+        return False
+
+    from .network import DeployPolicyNetwork
+
+    network = DeployPolicyNetwork()
+    network.load_state_dict(torch.load(model_path, map_location=device))
+    network.to(device)
+    network.eval()
+    _shared_networks[key] = network
+    logger.info(f"Preloaded shared neural deploy network from {model_path} (device={device})")
+    return True
+
+
 class NeuralDeployPlanner:
     """
     Neural network-based deploy planner.
@@ -55,6 +90,8 @@ class NeuralDeployPlanner:
         fallback_planner: Any = None,
         confidence_threshold: float = 0.3,
         use_cpu: bool = True,
+        quantize: bool = False,
+        quantize_min_agreement: float = 0.98,
     ):
         """
         Initialize neural deploy planner.
@@ -64,11 +101,16 @@ class NeuralDeployPlanner:
             fallback_planner: Optional rules-based planner for low-confidence fallback
             confidence_threshold: Minimum confidence to use neural decision (0-1)
             use_cpu: Force CPU inference (recommended for production)
+            quantize: Use an int8 quantized network if it passes the accuracy gate
+            quantize_min_agreement: Required int8/fp32 argmax agreement (0-1)
         """
         self.model_path = model_path
         self.fallback_planner = fallback_planner
         self.confidence_threshold = confidence_threshold
         self.use_cpu = use_cpu
+        self.quantize = quantize
+        self.quantize_min_agreement = quantize_min_agreement
+        self.quantized = False
 
         # Initialize components
         self.state_encoder = StateEncoder()
@@ -79,6 +121,12 @@ class NeuralDeployPlanner:
         self._plan_turn: int = -1
         self._plan_phase: str = ""
 
+        # Hybrid-mode statistics: how many plans came from the network vs
+        # the fallback planner, and the time spent producing them
+        self.stats = {'neural_plans': 0, 'fallback_plans': 0,
+                      'neural_ms': 0.0, 'fallback_ms': 0.0}
+        self._last_fallback_plan: Optional[DeploymentPlan] = None
+
         # Load network if available
         self.network = None
         self.device = 'cpu'
@@ -104,19 +152,40 @@ class NeuralDeployPlanner:
             else:
                 self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
 
-            # Load model
-            self.network = DeployPolicyNetwork()
-            state_dict = torch.load(self.model_path, map_location=self.device)
-            self.network.load_state_dict(state_dict)
-            self.network.to(self.device)
-            self.network.eval()
+            # Load model (or reuse the preloaded shared copy)
+            shared = _shared_networks.get((os.path.abspath(self.model_path), self.device))
+            if shared is not None:
+                self.network = shared
+            else:
+                self.network = DeployPolicyNetwork()
+                state_dict = torch.load(self.model_path, map_location=self.device)
+                self.network.load_state_dict(state_dict)
+                self.network.to(self.device)
+                self.network.eval()
+
+            if self.quantize and self.device == 'cpu':
+                self._maybe_quantize()
 
-            logger.info(f"Loaded neural deploy planner from {self.model_path} (device={self.device})")
+            logger.info(f"Loaded neural deploy planner from {self.model_path} "
+                        f"(device={self.device}, int8={self.quantized})")
 
         except Exception as e:
             logger.error(f"Failed to load neural model: {e}")
             self.network = None
 
+    def _maybe_quantize(self) -> None:
+        """Swap in the int8 network if the stored accuracy report allows it."""
+        from .quantization import passes_accuracy_gate, quantize_network
+
+        if not passes_accuracy_gate(self.model_path, self.quantize_min_agreement):
+            return
+
+        try:
+            self.network = quantize_network(self.network)
+            self.quantized = True
+        except Exception as e:
+            logger.warning(f"Int8 quantization failed, using fp32: {e}")
+
     def create_plan(self, board_state: Any) -> DeploymentPlan:
         """
         Create deployment plan using neural network.
@@ -137,9 +206,10 @@ class NeuralDeployPlanner:
             return self.current_plan
 
         # Generate new plan
+        start = time.perf_counter()
         if self.network is None or not TORCH_AVAILABLE:
             # No neural network - use fallback or random
-            return self._fallback_plan(board_state)
+            return self._record_plan_stats(self._fallback_plan(board_state), 'fallback', start)
 
         try:
             action, confidence = self._get_neural_action(board_state)
@@ -150,7 +220,7 @@ class NeuralDeployPlanner:
                     f"🧠 Neural confidence {confidence:.2f} < {self.confidence_threshold}, "
                     f"using fallback"
                 )
-                return self._fallback_plan(board_state)
+                return self._record_plan_stats(self._fallback_plan(board_state), 'fallback', start)
 
             # Decode action to plan
             plan = self.action_decoder.decode(
@@ -165,11 +235,41 @@ class NeuralDeployPlanner:
             self._plan_phase = phase
 
             logger.info(f"🧠 Neural plan: {plan.strategy.value} (confidence={confidence:.2f})")
-            return plan
+            return self._record_plan_stats(plan, 'neural', start)
 
         except Exception as e:
             logger.error(f"Neural planning failed: {e}")
-            return self._fallback_plan(board_state)
+            return self._record_plan_stats(self._fallback_plan(board_state), 'fallback', start)
+
+    def _record_plan_stats(self, plan: DeploymentPlan, source: str, start: float) -> DeploymentPlan:
+        """Count a newly produced plan (cached fallback plans are not counted)."""
+        if source == 'fallback':
+            if plan is self._last_fallback_plan:
+                return plan
+            self._last_fallback_plan = plan
+
+        self.stats[f'{source}_plans'] += 1
+        self.stats[f'{source}_ms'] += (time.perf_counter() - start) * 1000
+        return plan
+
+    def get_stats(self) -> dict:
+        """
+        Hybrid-mode statistics.
+
+        Returns:
+            Counts and mean latency of neural vs fallback plans, and the
+            fraction of plans the network handled on its own
+        """
+        neural = self.stats['neural_plans']
+        fallback = self.stats['fallback_plans']
+        total = neural + fallback
+        return {
+            'neural_plans': neural,
+            'fallback_plans': fallback,
+            'neural_coverage': neural / total if total else 0.0,
+            'avg_neural_ms': self.stats['neural_ms'] / neural if neural else 0.0,
+            'avg_fallback_ms': self.stats['fallback_ms'] / fallback if fallback else 0.0,
+        }
 
     def _get_neural_action(self, board_state: Any) -> Tuple[int, float]:
         """
@@ -309,6 +409,8 @@ class NeuralDeployPlanner:
 def create_neural_planner(
     model_path: str = 'models/deploy_planner.pt',
     fallback_to_rules: bool = True,
+    quantize: bool = False,
+    quantize_min_agreement: float = 0.98,
 ) -> NeuralDeployPlanner:
     """
     Factory function to create a neural deploy planner.
@@ -316,6 +418,9 @@ def create_neural_planner(
     Args:
         model_path: Path to trained model
         fallback_to_rules: If True, create rules-based fallback
+        quantize: Use int8 inference when the model's quantization report
+            (see engine.neural_planner.quantization) shows enough agreement
+        quantize_min_agreement: Required int8/fp32 argmax agreement (0-1)
 
     Returns:
         Configured NeuralDeployPlanner instance
@@ -332,4 +437,6 @@ def create_neural_planner(
     return NeuralDeployPlanner(
         model_path=model_path,
         fallback_planner=fallback,
+        quantize=quantize,
+        quantize_min_agreement=quantize_min_agreement,
     )
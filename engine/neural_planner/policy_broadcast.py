@@ -0,0 +1,215 @@
+"""
+Versioned policy broadcast for asynchronous training.
+
+The learner publishes new weights as immutable, versioned files next to
+the deployed model path, plus a small JSON pointer naming the latest
+version. Collectors (bot processes or in-process collector threads) poll
+the pointer between games and hot-swap their weights without restarting.
+
+Layout for model_path='models/deploy_planner.pt':
+    models/deploy_planner.pt              # latest weights (legacy loaders)
+    models/deploy_planner.v12.pt          # immutable versioned weights
+    models/deploy_planner.version.json    # {"version": 12, "path": ..., ...}
+
+Every file is written to a temp name and then os.replace()d into place,
+so readers never observe a half-written file. Because versioned files are
+immutable, a reader that sees pointer version N always loads version N
+weights even if the learner publishes N+1 concurrently.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Try to import PyTorch
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+
+def _pointer_path(model_path: str) -> Path:
+    path = Path(model_path)
+    return path.with_name(f"{path.stem}.version.json")
+
+
+def _versioned_path(model_path: str, version: int) -> Path:
+    path = Path(model_path)
+    return path.with_name(f"{path.stem}.v{version}{path.suffix}")
+
+
+def read_policy_version(model_path: str) -> int:
+    """
+    Read the currently published policy version.
+
+    Returns:
+        Published version, or 0 if nothing has been published yet
+    """
+    pointer = _pointer_path(model_path)
+    try:
+        with open(pointer, 'r') as f:
+            return int(json.load(f).get('version', 0))
+    except (OSError, ValueError):
+        return 0
+
+
+class PolicyPublisher:
+    """
+    Learner-side publisher of versioned policy weights.
+
+    Example usage:
+        publisher = PolicyPublisher('models/deploy_planner.pt')
+        version = publisher.publish(network.state_dict(), metrics={'policy_loss': 0.4})
+    """
+
+    def __init__(self, model_path: str, keep_versions: int = 4):
+        """
+        Initialize the publisher.
+
+        Args:
+            model_path: Deployed model path that collectors load from
+            keep_versions: Number of versioned weight files to retain on disk
+        """
+        if not TORCH_AVAILABLE:
+            raise RuntimeError("PyTorch required for policy publishing")
+
+        self.model_path = model_path
+        self.keep_versions = keep_versions
+        self.version = read_policy_version(model_path)
+
+        os.makedirs(os.path.dirname(model_path) or '.', exist_ok=True)
+
+    def publish(self, state_dict: Dict[str, Any], metrics: Optional[Dict] = None) -> int:
+        """
+        Publish new weights as the next policy version.
+
+        Args:
+            state_dict: Network state dict to broadcast
+            metrics: Optional training metrics stored in the pointer file
+
+        Returns:
+            The newly published version number
+        """
+        version = self.version + 1
+
+        # Weights are detached to CPU so collectors never need a GPU to load them
+        cpu_state = {k: v.detach().cpu() for k, v in state_dict.items()}
+
+        versioned = _versioned_path(self.model_path, version)
+        self._atomic_torch_save(cpu_state, versioned)
+        self._atomic_torch_save(cpu_state, Path(self.model_path))
+
+        pointer = {
+            'version': version,
+            'path': versioned.name,
+            'published_at': time.time(),
+            'metrics': metrics or {},
+        }
+        pointer_path = _pointer_path(self.model_path)
+        tmp_path = pointer_path.with_name(pointer_path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(pointer, f)
+        os.replace(tmp_path, pointer_path)
+
+        self.version = version
+        self._prune_old_versions()
+
+        logger.info(f"Published policy version {version} to {versioned}")
+        return version
+
+    def _atomic_torch_save(self, obj: Any, path: Path) -> None:
+        tmp_path = path.with_name(path.name + '.tmp')
+        torch.save(obj, tmp_path)
+        os.replace(tmp_path, path)
+
+    def _prune_old_versions(self) -> None:
+        """Delete versioned files older than the retention window."""
+        oldest_kept = self.version - self.keep_versions + 1
+        path = Path(self.model_path)
+        for candidate in path.parent.glob(f"{path.stem}.v*{path.suffix}"):
+            suffix = candidate.stem[len(path.stem) + 2:]
+            if suffix.isdigit() and int(suffix) < oldest_kept:
+                try:
+                    candidate.unlink()
+                except OSError as e:
+                    logger.warning(f"Failed to delete old policy {candidate}: {e}")
+
+
+class PolicySubscriber:
+    """
+    Collector-side subscriber that picks up newly published weights.
+
+    poll() is cheap when nothing changed (a single os.stat), so it can be
+    called before every game.
+    """
+
+    def __init__(self, model_path: str, device: str = 'cpu'):
+        """
+        Initialize the subscriber.
+
+        Args:
+            model_path: Deployed model path the publisher writes to
+            device: Device to map loaded weights onto
+        """
+        self.model_path = model_path
+        self.device = device
+        self.version = 0
+        self._pointer_mtime = 0.0
+
+    def poll(self) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        Check for a newer published policy.
+
+        Returns:
+            (version, state_dict) if a newer version is available, else None
+        """
+        pointer_path = _pointer_path(self.model_path)
+        try:
+            mtime = pointer_path.stat().st_mtime
+        except OSError:
+            return None
+
+        if mtime == self._pointer_mtime:
+            return None
+        self._pointer_mtime = mtime
+
+        try:
+            with open(pointer_path, 'r') as f:
+                pointer = json.load(f)
+            version = int(pointer['version'])
+            if version <= self.version:
+                return None
+
+            weights_path = pointer_path.with_name(pointer['path'])
+            state_dict = torch.load(weights_path, map_location=self.device)
+        except (OSError, ValueError, KeyError, RuntimeError, EOFError) as e:
+            # Publisher may have pruned or still be writing the file between
+            # pointer read and load; retry on the next poll.
+            logger.warning(f"Could not load published policy: {e}")
+            self._pointer_mtime = 0.0
+            return None
+
+        self.version = version
+        return version, state_dict
+
+    def sync(self, network: Any) -> bool:
+        """
+        Load the latest published weights into a network if newer.
+
+        Returns:
+            True if the network weights were updated
+        """
+        update = self.poll()
+        if update is None:
+            return False
+
+        version, state_dict = update
+        network.load_state_dict(state_dict)
+        logger.info(f"Synced policy to version {version}")
+        return True
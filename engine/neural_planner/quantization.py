@@ -0,0 +1,263 @@
+"""
+Int8 quantization for CPU-only inference of the deploy policy.
+
+Production bots run the DeployPolicyNetwork on CPU inside the deploy
+decision. Dynamic int8 quantization of the Linear layers (weights stored
+as int8, activations quantized on the fly) shrinks the model and speeds
+up the matmuls without any calibration data.
+
+Because quantization can flip close decisions, int8 is only used after
+an accuracy gate: the harness below compares argmax actions and
+confidences of the int8 and fp32 models on stored trajectories and writes
+a report next to the model. NeuralDeployPlanner only switches to int8 if
+that report matches the current weights and its agreement clears the
+configured threshold.
+
+Usage:
+    # Evaluate and write models/deploy_planner.quant.json
+    python -m engine.neural_planner.quantization models/deploy_planner.pt \
+        --trajectories training_data/trajectories
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import logging
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .trajectory_io import DEFAULT_TRAJECTORY_DIR, load_trajectories_from_dir
+
+logger = logging.getLogger(__name__)
+
+# Try to import PyTorch
+try:
+    import torch
+    import torch.nn as nn
+    import torch.nn.functional as F
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+# Default minimum argmax agreement required to deploy the int8 model
+DEFAULT_MIN_AGREEMENT = 0.98
+
+
+@dataclass
+class QuantizationReport:
+    """Result of comparing an int8 model against its fp32 source."""
+    model_sha1: str
+    num_states: int
+    action_agreement: float  # Fraction of states with identical argmax
+    mean_confidence_delta: float  # Mean |p_fp32(a) - p_int8(a)| of fp32 argmax
+    max_confidence_delta: float
+    fp32_latency_ms: float  # Mean single-state forward pass
+    int8_latency_ms: float
+    fp32_size_mb: float  # Serialized state dict size
+    int8_size_mb: float
+
+    @property
+    def speedup(self) -> float:
+        return self.fp32_latency_ms / self.int8_latency_ms if self.int8_latency_ms > 0 else 0.0
+
+    @property
+    def size_reduction(self) -> float:
+        return 1.0 - self.int8_size_mb / self.fp32_size_mb if self.fp32_size_mb > 0 else 0.0
+
+
+def report_path_for(model_path: str) -> Path:
+    """Path of the accuracy-gate report for a model file."""
+    path = Path(model_path)
+    return path.with_name(f"{path.stem}.quant.json")
+
+
+def file_sha1(path: str) -> str:
+    """SHA1 of a model file (ties a report to specific weights)."""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def quantize_network(network: 'nn.Module') -> 'nn.Module':
+    """
+    Create a dynamic int8 copy of a network for CPU inference.
+
+    Only nn.Linear layers are quantized; attention output projections and
+    LayerNorms stay fp32.
+    """
+    if not TORCH_AVAILABLE:
+        raise RuntimeError("PyTorch required for quantization")
+
+    import copy
+    source = copy.deepcopy(network).to('cpu').eval()
+    return torch.ao.quantization.quantize_dynamic(source, {nn.Linear}, dtype=torch.qint8)
+
+
+def _state_dict_size_mb(model: 'nn.Module') -> float:
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell() / (1024 * 1024)
+
+
+def _mean_latency_ms(model: 'nn.Module', states: 'torch.Tensor',
+                     masks: 'torch.Tensor', samples: int = 200) -> float:
+    samples = min(samples, len(states))
+    with torch.no_grad():
+        model(states[:1], masks[:1])  # warm-up
+        start = time.perf_counter()
+        for i in range(samples):
+            model(states[i:i + 1], masks[i:i + 1])
+    return (time.perf_counter() - start) * 1000 / max(samples, 1)
+
+
+def load_eval_states(
+    trajectory_dir: Path = DEFAULT_TRAJECTORY_DIR,
+    limit: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Collect (states, action_masks) from stored trajectories.
+
+    Returns:
+        ([n, STATE_DIM] float32, [n, NUM_ACTIONS] bool) arrays
+    """
+    states, masks = [], []
+    for traj in load_trajectories_from_dir(Path(trajectory_dir)):
+        for exp in traj.experiences:
+            states.append(exp.state)
+            masks.append(exp.action_mask)
+            if limit and len(states) >= limit:
+                break
+        if limit and len(states) >= limit:
+            break
+
+    if not states:
+        return np.zeros((0, 0), dtype=np.float32), np.zeros((0, 0), dtype=bool)
+    return np.stack(states).astype(np.float32), np.stack(masks).astype(bool)
+
+
+def compare_models(
+    fp32_model: 'nn.Module',
+    int8_model: 'nn.Module',
+    states: np.ndarray,
+    masks: np.ndarray,
+    model_sha1: str = '',
+) -> QuantizationReport:
+    """
+    Compare argmax actions, confidences, latency and size of two models.
+
+    Args:
+        fp32_model: Reference model
+        int8_model: Quantized model
+        states: [n, STATE_DIM] encoded states
+        masks: [n, NUM_ACTIONS] valid-action masks
+        model_sha1: Hash of the fp32 weights file (stored in the report)
+    """
+    fp32_model.eval()
+    states_t = torch.from_numpy(states)
+    masks_t = torch.from_numpy(masks)
+
+    with torch.no_grad():
+        fp32_probs = F.softmax(fp32_model(states_t, masks_t)[0], dim=-1)
+        int8_probs = F.softmax(int8_model(states_t, masks_t)[0], dim=-1)
+
+    fp32_actions = fp32_probs.argmax(dim=-1)
+    int8_actions = int8_probs.argmax(dim=-1)
+    index = fp32_actions.unsqueeze(-1)
+    confidence_delta = (fp32_probs.gather(1, index) - int8_probs.gather(1, index)).abs()
+
+    return QuantizationReport(
+        model_sha1=model_sha1,
+        num_states=len(states),
+        action_agreement=(fp32_actions == int8_actions).float().mean().item(),
+        mean_confidence_delta=confidence_delta.mean().item(),
+        max_confidence_delta=confidence_delta.max().item(),
+        fp32_latency_ms=_mean_latency_ms(fp32_model, states_t, masks_t),
+        int8_latency_ms=_mean_latency_ms(int8_model, states_t, masks_t),
+        fp32_size_mb=_state_dict_size_mb(fp32_model),
+        int8_size_mb=_state_dict_size_mb(int8_model),
+    )
+
+
+def write_report(report: QuantizationReport, model_path: str) -> Path:
+    """Store a report next to its model."""
+    path = report_path_for(model_path)
+    with open(path, 'w') as f:
+        json.dump(asdict(report), f, indent=2)
+    return path
+
+
+def passes_accuracy_gate(model_path: str, min_agreement: float = DEFAULT_MIN_AGREEMENT) -> bool:
+    """
+    Check whether the stored report allows int8 inference for a model.
+
+    The report must exist, describe the current weights file (by SHA1)
+    and show argmax agreement of at least min_agreement.
+    """
+    path = report_path_for(model_path)
+    try:
+        with open(path, 'r') as f:
+            report = json.load(f)
+    except (OSError, ValueError):
+        logger.info(f"No quantization report at {path}, using fp32")
+        return False
+
+    if report.get('model_sha1') != file_sha1(model_path):
+        logger.info("Quantization report is for different weights, using fp32")
+        return False
+
+    agreement = report.get('action_agreement', 0.0)
+    if report.get('num_states', 0) == 0 or agreement < min_agreement:
+        logger.info(f"Int8 agreement {agreement:.3f} < {min_agreement}, using fp32")
+        return False
+
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Evaluate int8 quantized deploy policy')
+    parser.add_argument('model_path', nargs='?', default='models/deploy_planner.pt')
+    parser.add_argument('--trajectories', default=str(DEFAULT_TRAJECTORY_DIR),
+                        help='Directory of stored trajectories to evaluate on')
+    parser.add_argument('--limit', type=int, default=None,
+                        help='Maximum number of states to evaluate')
+    parser.add_argument('--min-agreement', type=float, default=DEFAULT_MIN_AGREEMENT)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    from .network import DeployPolicyNetwork
+
+    network = DeployPolicyNetwork()
+    network.load_state_dict(torch.load(args.model_path, map_location='cpu'))
+    network.eval()
+
+    states, masks = load_eval_states(Path(args.trajectories), limit=args.limit)
+    if len(states) == 0:
+        print(f"No trajectories found in {args.trajectories}")
+        return
+
+    report = compare_models(network, quantize_network(network), states, masks,
+                            model_sha1=file_sha1(args.model_path))
+    path = write_report(report, args.model_path)
+
+    verdict = 'PASS' if report.action_agreement >= args.min_agreement else 'FAIL'
+    print(f"States evaluated:   {report.num_states}")
+    print(f"Action agreement:   {report.action_agreement:.2%} ({verdict} @ {args.min_agreement:.0%})")
+    print(f"Confidence delta:   mean {report.mean_confidence_delta:.4f}, "
+          f"max {report.max_confidence_delta:.4f}")
+    print(f"Latency (1 state):  fp32 {report.fp32_latency_ms:.2f}ms, "
+          f"int8 {report.int8_latency_ms:.2f}ms ({report.speedup:.2f}x)")
+    print(f"Model size:         fp32 {report.fp32_size_mb:.2f}MB, "
+          f"int8 {report.int8_size_mb:.2f}MB (-{report.size_reduction:.0%})")
+    print(f"Report written to {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -58,6 +58,10 @@ class PPOConfig:
     weight_decay: float = 0.01
     target_kl: float = 0.015  # Early stopping if KL divergence too high
 
+    # Off-policy correction (async actor-learner training)
+    max_policy_lag: int = 4  # Drop trajectories more than N versions behind the learner
+    max_importance_weight: float = 1.0  # Truncation for behaviour->learner IS weights
+
     # Device
     device: str = 'cuda'  # 'cuda' or 'cpu'
 
@@ -118,10 +122,17 @@ class PPOTrainer:
         old_log_probs: np.ndarray,
         returns: np.ndarray,
         advantages: np.ndarray,
+        off_policy_correction: bool = False,
     ) -> Dict[str, float]:
         """
         Perform PPO update on a batch of experiences.
 
+        With off_policy_correction, the batch may come from older policy
+        versions (async collectors). The clipped ratio is then taken against
+        the learner's current policy instead of the behaviour policy, and
+        each sample is weighted by the truncated importance weight
+        min(max_importance_weight, pi_learner / pi_behaviour) (decoupled PPO).
+
         Args:
             states: [batch, 512] state features
             actions: [batch] action indices
@@ -129,6 +140,7 @@ class PPOTrainer:
             old_log_probs: [batch] log probs from rollout
             returns: [batch] computed returns (GAE)
             advantages: [batch] computed advantages (GAE)
+            off_policy_correction: Correct for data from stale policies
 
         Returns:
             Dictionary of training metrics
@@ -144,9 +156,29 @@ class PPOTrainer:
         # Normalize advantages
         advantages_t = (advantages_t - advantages_t.mean()) / (advantages_t.std() + 1e-8)
 
+        # Off-policy correction: anchor the clipped ratio on the current
+        # (proximal) policy and reweight by truncated behaviour IS weights
+        if off_policy_correction:
+            was_training = self.network.training
+            self.network.eval()
+            with torch.no_grad():
+                prox_log_probs_t, _, _ = self.network.evaluate_actions(
+                    states_t, actions_t, masks_t
+                )
+            self.network.train(was_training)
+
+            is_weights_t = torch.clamp(
+                torch.exp(prox_log_probs_t - old_log_probs_t),
+                max=self.config.max_importance_weight,
+            )
+            old_log_probs_t = prox_log_probs_t
+        else:
+            is_weights_t = torch.ones_like(advantages_t)
+
         # Create data loader for mini-batch training
         dataset = TensorDataset(
-            states_t, actions_t, masks_t, old_log_probs_t, returns_t, advantages_t
+            states_t, actions_t, masks_t, old_log_probs_t, returns_t, advantages_t,
+            is_weights_t,
         )
         loader = DataLoader(
             dataset,
@@ -164,7 +196,7 @@ class PPOTrainer:
         # Multiple epochs over the batch
         for epoch in range(self.config.ppo_epochs):
             for batch in loader:
-                mb_states, mb_actions, mb_masks, mb_old_lp, mb_returns, mb_advs = batch
+                mb_states, mb_actions, mb_masks, mb_old_lp, mb_returns, mb_advs, mb_w = batch
 
                 # Forward pass
                 new_log_probs, values, entropy = self.network.evaluate_actions(
@@ -173,12 +205,12 @@ class PPOTrainer:
 
                 # Policy loss (clipped surrogate)
                 ratio = torch.exp(new_log_probs - mb_old_lp)
-                surr1 = ratio * mb_advs
+                surr1 = ratio * mb_advs * mb_w
                 surr2 = torch.clamp(
                     ratio,
                     1.0 - self.config.clip_ratio,
                     1.0 + self.config.clip_ratio,
-                ) * mb_advs
+                ) * mb_advs * mb_w
                 policy_loss = -torch.min(surr1, surr2).mean()
 
                 # Value loss (clipped)
@@ -235,24 +267,27 @@ class PPOTrainer:
             'kl_divergence': total_kl / num_updates if num_updates > 0 else 0,
             'num_updates': num_updates,
             'total_timesteps': self.total_timesteps,
+            'mean_importance_weight': is_weights_t.mean().item(),
         }
 
-    def save(self, path: str) -> None:
+    def save(self, path: str, include_optimizer: bool = True) -> None:
         """
         Save model checkpoint.
 
         Args:
             path: Path to save checkpoint
+            include_optimizer: Also save optimizer state (needed to resume)
         """
         os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
 
         checkpoint = {
             'network_state_dict': self.network.state_dict(),
-            'optimizer_state_dict': self.optimizer.state_dict(),
             'update_count': self.update_count,
             'total_timesteps': self.total_timesteps,
             'config': self.config,
         }
+        if include_optimizer:
+            checkpoint['optimizer_state_dict'] = self.optimizer.state_dict()
 
         torch.save(checkpoint, path)
         logger.info(f"Saved checkpoint to {path}")
@@ -267,7 +302,8 @@ class PPOTrainer:
         checkpoint = torch.load(path, map_location=self.device)
 
         self.network.load_state_dict(checkpoint['network_state_dict'])
-        self.optimizer.load_state_dict(checkpoint['optimizer_state_dict'])
+        if 'optimizer_state_dict' in checkpoint:
+            self.optimizer.load_state_dict(checkpoint['optimizer_state_dict'])
         self.update_count = checkpoint.get('update_count', 0)
         self.total_timesteps = checkpoint.get('total_timesteps', 0)
 
@@ -286,6 +322,56 @@ class PPOTrainer:
         torch.save(self.network.state_dict(), path)
         logger.info(f"Saved model weights to {path}")
 
+    def save_to_registry(
+        self,
+        registry: 'CheckpointRegistry',
+        name: str,
+        metrics: Optional[Dict[str, float]] = None,
+    ) -> Dict:
+        """
+        Save a compact checkpoint into a CheckpointRegistry.
+
+        The registry stores fp16 weights and keeps optimizer state only
+        for its most recent checkpoints.
+
+        Args:
+            registry: Target registry
+            name: Checkpoint name
+            metrics: Metrics to index the checkpoint by
+
+        Returns:
+            Registry index entry
+        """
+        return registry.save(
+            name,
+            self.network.state_dict(),
+            metrics=metrics,
+            optimizer_state=self.optimizer.state_dict(),
+            step=self.update_count,
+            extra={'total_timesteps': self.total_timesteps},
+        )
+
+    def load_from_registry(self, registry: 'CheckpointRegistry', name: str) -> None:
+        """
+        Load weights (and optimizer state, if retained) from a registry.
+
+        Args:
+            registry: Source registry
+            name: Checkpoint name
+        """
+        entry = registry.get(name)
+        if entry is None:
+            raise KeyError(f"Unknown checkpoint {name!r}")
+
+        self.network.load_state_dict(registry.load_weights(name))
+        optimizer_state = registry.load_optimizer(name)
+        if optimizer_state is not None:
+            self.optimizer.load_state_dict(optimizer_state)
+        self.update_count = entry.get('step') or 0
+        self.total_timesteps = entry.get('extra', {}).get('total_timesteps', 0)
+
+        logger.info(f"Loaded registry checkpoint {name}")
+
 
 def create_trainer(
     hidden_dim: int = 256,
@@ -58,6 +58,7 @@ def save_trajectory(
             'opponent_type': trajectory.opponent_type,
             'game_length': trajectory.game_length,
             'my_side': trajectory.my_side,
+            'policy_version': trajectory.policy_version,
             'num_experiences': len(trajectory.experiences),
             'experiences': [
                 {
@@ -106,6 +107,7 @@ def load_trajectory(filepath: Path) -> Optional[GameTrajectory]:
             opponent_type=data.get('opponent_type', 'rules'),
             game_length=data.get('game_length', 0),
             my_side=data.get('my_side', ''),
+            policy_version=data.get('policy_version', 0),
         )
 
         for exp_data in data['experiences']:
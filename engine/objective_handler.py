@@ -12,6 +12,8 @@ import logging
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Set
 
+from .game_session import current_session
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -343,7 +345,10 @@ _objective_handler: Optional[ObjectiveHandler] = None
 
 
 def get_objective_handler() -> ObjectiveHandler:
-    """Get the global objective handler instance."""
+    """Get the objective handler for the current game session (or the global one)."""
+    session = current_session()
+    if session is not None:
+        return session.scoped('objective_handler', ObjectiveHandler)
     global _objective_handler
     if _objective_handler is None:
         _objective_handler = ObjectiveHandler()
@@ -352,6 +357,10 @@ def get_objective_handler() -> ObjectiveHandler:
 
 def reset_objective_handler() -> None:
     """Reset the objective handler for a new game."""
+    session = current_session()
+    if session is not None:
+        session.scoped('objective_handler', ObjectiveHandler).reset()
+        return
     global _objective_handler
     if _objective_handler is not None:
         _objective_handler.reset()
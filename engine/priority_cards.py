@@ -16,10 +16,13 @@ Card categories:
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional, Set, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
 
+from .title_index import normalize_title
+
 if TYPE_CHECKING:
     from .board_state import BoardState
 
@@ -599,6 +602,7 @@ def should_use_destiny_manipulation(
 # CARD TITLE PATTERN MATCHING (for cards we identify by title, not blueprint)
 # ============================================================================
 
+@lru_cache(maxsize=4096)
 def is_priority_card_by_title(card_title: str) -> bool:
     """
     Check if a card is high-priority based on its title.
@@ -608,7 +612,7 @@ def is_priority_card_by_title(card_title: str) -> bool:
     if not card_title:
         return False
 
-    title_lower = card_title.lower()
+    title_lower = normalize_title(card_title)
 
     # Phase 1: Critical interrupts
     # Damage cancel cards
@@ -647,6 +651,7 @@ def is_priority_card_by_title(card_title: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=4096)
 def get_protection_score_by_title(card_title: str) -> float:
     """
     Get protection score based on card title (fallback when no blueprint).
@@ -654,7 +659,7 @@ def get_protection_score_by_title(card_title: str) -> float:
     if not card_title:
         return 0.0
 
-    title_lower = card_title.lower()
+    title_lower = normalize_title(card_title)
 
     # Phase 1: Critical cards (highest priority - survival)
     if "houjix" in title_lower or "ghhhk" in title_lower:
@@ -12,6 +12,8 @@ from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+from .game_session import current_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -635,6 +637,13 @@ def get_shield_tracker(my_side: str = None) -> Optional[ShieldTracker]:
     IMPORTANT: If a side is provided and doesn't match the existing tracker's side,
     the tracker is reset. This handles cases where the side changed between games.
     """
+    session = current_session()
+    if session is not None:
+        tracker = session.get('shield_tracker')
+        if my_side and (tracker is None or tracker.my_side != my_side.lower()):
+            tracker = session.set('shield_tracker', ShieldTracker(my_side))
+        return tracker
+
     global _shield_tracker
     if _shield_tracker is None and my_side:
         _shield_tracker = ShieldTracker(my_side)
@@ -647,6 +656,10 @@ def get_shield_tracker(my_side: str = None) -> Optional[ShieldTracker]:
 
 def reset_shield_tracker():
     """Reset tracker for new game."""
+    session = current_session()
+    if session is not None:
+        session.set('shield_tracker', None)
+        return
     global _shield_tracker
     _shield_tracker = None
 
@@ -0,0 +1,389 @@
+"""
+Speculative Deploy Planning
+
+While the opponent takes their turn (and during our own Activate/Control
+phases) the bot only waits on game update long-polls. The speculative
+planner uses that idle time to run the DeployPhasePlanner on a projected
+snapshot of the BoardState, so that when our deploy phase starts the plan
+is usually ready.
+
+Flow:
+1. on_board_event() - board-changing events (PCIP, RCFP, MCIP, GS, ...)
+   mark the speculations dirty
+2. on_idle() - drops speculations whose inputs no longer match the board
+   and plans at most one missing projection; run_idle() repeats it within
+   a time budget and is run as a green task while the game long-poll waits
+3. take() - called by DeployPhasePlanner.create_plan at deploy phase
+   start; serves a plan only if it was made on identical planning inputs
+
+A snapshot projects the board to the start of our deploy phase: Force
+activated from the Reserve Deck, our turn number and phase. Since the
+Force we will actually activate is not known in advance, a few nearby
+Force totals are planned (config `force_offsets`).
+
+Validity is checked on two keys:
+- board key: hand, cards in play, locations, Force/life totals, the deck
+  tracker's projected reserve count and the planner's own board fields
+  (holds, crush plans, budgets)
+- strategy key: StrategicState mode flags and GamePlan goals, compared
+  after both have been updated for the deploy phase
+
+Example usage:
+    speculative = get_speculative_planner()
+    event_processor.register_board_changed_callback(speculative.on_board_event)
+    ...
+    speculative.run_idle(board_state, pause=lambda: socketio.sleep(0))  # green task
+"""
+
+import copy
+import logging
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .deck_tracker import get_deck_tracker
+from .game_session import current_session
+from .strategy_config import get_config
+from .tracing import quiet
+
+logger = logging.getLogger(__name__)
+
+# Events after which a speculation may no longer match the board
+BOARD_EVENT_TYPES = frozenset({'PCIP', 'RCIP', 'PCIPAR', 'RCFP', 'RLFP', 'MCIP', 'GS', 'TC', 'GPC'})
+
+# BoardState attributes create_plan writes; a served plan carries them over
+PLANNER_OUTPUT_ATTRS = ('consecutive_hold_turns', 'expensive_card_budget', 'hold_failed_last_turn',
+                        'last_hold_reason', 'next_turn_crush_plan')
+
+# BoardState references shared with (not copied into) snapshots
+_SHARED_ATTRS = ('strategy_controller', 'deploy_planner', 'current_deploy_plan', 'deploy_plan_summary')
+
+
+@dataclass
+class Speculation:
+    """A plan made on a projected snapshot, with the keys it is valid for."""
+    board_key: Tuple
+    strategy_key: Tuple
+    plan: Any                      # DeploymentPlan
+    outputs: Dict[str, Any]        # PLANNER_OUTPUT_ATTRS after planning
+    build_ms: float
+
+
+def _card_key(card) -> Tuple:
+    return (card.card_id, card.blueprint_id, card.zone, card.owner, card.location_index,
+            card.target_card_id, card.power, card.ability)
+
+
+def board_key(board_state, force_pile: int, turn_number: int) -> Tuple:
+    """
+    Everything create_plan reads from the board, with Force and turn given explicitly.
+
+    The deck tracker's reserve count drops when our Force is activated, so
+    it is keyed net of the projected activation: the key made while
+    speculating matches the one taken after the activation happened.
+    """
+    tracker = get_deck_tracker()
+    reserve = None
+    if tracker.deck_loaded:
+        activation = max(0, force_pile - board_state.force_pile)
+        reserve = max(0, tracker.get_reserve_count() - activation)
+    return (
+        turn_number,
+        board_state.my_side,
+        force_pile,
+        board_state.total_reserve_force(),
+        board_state.their_total_life_force(),
+        board_state.their_hand_size,
+        board_state.activation,
+        tuple(sorted((c.card_id, c.blueprint_id) for c in board_state.cards_in_hand)),
+        tuple(sorted(_card_key(c) for c in board_state.cards_in_play.values())),
+        tuple((loc.card_id, loc.blueprint_id, loc.my_icons, loc.their_icons) for loc in board_state.locations),
+        tuple(sorted(board_state.dark_power_at_locations.items())),
+        tuple(sorted(board_state.light_power_at_locations.items())),
+        reserve,
+        tuple(repr(getattr(board_state, attr, None)) for attr in PLANNER_OUTPUT_ATTRS),
+    )
+
+
+def strategy_key(board_state) -> Tuple:
+    """StrategicState flags and GamePlan goals the planner reads."""
+    strategic_state = getattr(board_state, 'strategic_state', None)
+    game_plan = getattr(board_state, 'game_plan', None)
+    strategic = None
+    if strategic_state:
+        strategic = (strategic_state.enabled, strategic_state.force_attack_mode,
+                     strategic_state.trajectory.current_drain_gap)
+    goals = None
+    if game_plan:
+        goals = (game_plan.enabled,
+                 tuple((g.goal_type, g.target, g.priority, g.turns_active) for g in game_plan.current_goals),
+                 tuple(game_plan.cards_to_save or ()))
+    return strategic, goals
+
+
+class SpeculativePlanner:
+    """
+    Precomputes deploy plans during idle time and serves them if still valid.
+    """
+
+    def __init__(self, config: Optional[Dict] = None):
+        """
+        Initialize with configuration.
+
+        Args:
+            config: Optional dict (strategy config 'speculative_planning' section) with keys:
+                - enabled: Speculate at all (default False)
+                - force_offsets: Force totals to plan around the projection (default [0, -1])
+                - quiet: Silence engine logging while speculating (default True)
+                - idle_budget_ms: Time run_idle() may spend per call (default 500)
+        """
+        config = config or {}
+        self.enabled = config.get('enabled', False)
+        self.force_offsets = list(config.get('force_offsets', [0, -1])) or [0]
+        self.quiet = config.get('quiet', True)
+        self.idle_budget_ms = config.get('idle_budget_ms', 500)
+
+        self._planner = None
+        self._planner_args: Optional[Tuple[int, int]] = None
+        self._speculations: Dict[Tuple, Speculation] = {}
+        self._queue: List[Tuple[int, int]] = []
+        self._dirty = True
+
+        # Statistics
+        self.speculations = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+        self.saved_ms = 0.0
+
+    # ========== Hooks ==========
+
+    def register_planner(self, deploy_threshold: int, battle_force_reserve: int):
+        """Plan with the same settings as the bot's DeployPhasePlanner."""
+        args = (deploy_threshold, battle_force_reserve)
+        if args != self._planner_args:
+            self._planner_args = args
+            self._planner = None
+            self._speculations.clear()
+            self._dirty = True
+
+    def on_board_event(self, event_type: str):
+        """EventProcessor callback: the board may have changed."""
+        if event_type in BOARD_EVENT_TYPES:
+            self._dirty = True
+
+    def on_idle(self, board_state) -> bool:
+        """
+        Do one unit of speculative work. Returns True if a plan was made.
+        """
+        if not self.enabled or board_state is None or not board_state.my_side:
+            return False
+        if self._planner_args is None:
+            return False
+
+        if self._dirty:
+            self._dirty = False
+            targets = self._projections(board_state)
+            keys = {board_key(board_state, force, turn): (force, turn) for force, turn in targets}
+            for key in [key for key in self._speculations if key not in keys]:
+                del self._speculations[key]
+                self.invalidated += 1
+            self._queue = [target for key, target in keys.items() if key not in self._speculations]
+
+        if not self._queue:
+            return False
+        force, turn = self._queue.pop(0)
+        return self._speculate(board_state, force, turn)
+
+    def run_idle(self, board_state, pause: Optional[Callable[[], None]] = None) -> int:
+        """
+        Plan missing projections until none are left or idle_budget_ms is spent.
+
+        A plan that has started always finishes, so the budget bounds when
+        the last plan may start. pause() is called between plans to let
+        other greenlets (the game poll, other sessions) run.
+
+        Returns:
+            Number of plans made
+        """
+        deadline = time.perf_counter() + self.idle_budget_ms / 1000
+        planned = 0
+        while self.on_idle(board_state):
+            planned += 1
+            if time.perf_counter() >= deadline:
+                break
+            if pause:
+                pause()
+        return planned
+
+    def take(self, board_state) -> Optional[Any]:
+        """
+        The precomputed plan for this deploy phase, if made on identical inputs.
+
+        Must be called after StrategicState.on_deploy_phase_start. On a hit
+        the planner's board outputs are copied onto board_state.
+        """
+        if not self.enabled:
+            return None
+        speculated = len(self._speculations)
+        spec = self._speculations.get(board_key(board_state, board_state.force_pile, board_state.turn_number))
+        self._speculations.clear()
+        self._queue = []
+        self._dirty = True
+
+        if spec is None or spec.strategy_key != strategy_key(board_state):
+            self.misses += 1
+            reason = "strategy changed" if spec else f"no match among {speculated} speculations"
+            logger.info(f"🔮 Speculative plan miss, {reason} ({self._summary()})")
+            return None
+
+        for attr, value in spec.outputs.items():
+            setattr(board_state, attr, value)
+        self.hits += 1
+        self.saved_ms += spec.build_ms
+        logger.info(f"🔮 Speculative plan hit: {spec.plan.strategy.value} - {spec.plan.reason} "
+                    f"(saved {spec.build_ms:.0f}ms; {self._summary()})")
+        return spec.plan
+
+    def stats(self) -> Dict[str, Any]:
+        served = self.hits + self.misses
+        return {
+            'speculations': self.speculations,
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidated': self.invalidated,
+            'hit_rate': self.hits / served if served else 0.0,
+            'saved_ms': self.saved_ms,
+        }
+
+    def _summary(self) -> str:
+        stats = self.stats()
+        return (f"hit rate {stats['hits']}/{stats['hits'] + stats['misses']}, "
+                f"{stats['speculations']} planned, {stats['invalidated']} invalidated, "
+                f"{stats['saved_ms']:.0f}ms saved")
+
+    # ========== Speculation ==========
+
+    def _projections(self, board_state) -> List[Tuple[int, int]]:
+        """(force_pile, turn_number) at the start of our next deploy phase, or [] if not idle."""
+        phase = (board_state.current_phase or '').lower()
+        total = board_state.force_pile + board_state.reserve_deck + board_state.used_pile
+        offsets = self.force_offsets
+
+        if board_state.current_turn_player and not board_state.is_my_turn():
+            # Opponent's turn: we activate our generation next. Dark Side
+            # goes first, so Light's turn N is followed by Dark's turn N+1.
+            generation = board_state.dark_generation if board_state.my_side == 'dark' else board_state.light_generation
+            projected = board_state.force_pile + generation
+            turn = board_state.turn_number + (1 if board_state.my_side == 'dark' else 0)
+        elif board_state.is_my_turn() and 'activate' in phase:
+            projected = board_state.force_pile + max(0, board_state.activation - board_state.force_activated_this_turn)
+            turn = board_state.turn_number
+        elif board_state.is_my_turn() and 'control' in phase:
+            projected = board_state.force_pile
+            turn = board_state.turn_number
+            offsets = [0]
+        else:
+            return []
+
+        forces = []
+        for offset in offsets:
+            force = max(0, min(total, projected + offset))
+            if force not in forces:
+                forces.append(force)
+        return [(force, turn) for force in forces]
+
+    def _snapshot(self, board_state, force_pile: int, turn_number: int):
+        """Deep copy of board_state projected to the start of our deploy phase."""
+        memo = {}
+        for attr in _SHARED_ATTRS:
+            value = getattr(board_state, attr, None)
+            if value is not None:
+                memo[id(value)] = value
+        snapshot = copy.deepcopy(board_state, memo)
+
+        # Activation moves cards from the Reserve Deck (then Used Pile) to the Force Pile
+        delta = force_pile - snapshot.force_pile
+        from_reserve = min(delta, snapshot.reserve_deck) if delta > 0 else delta
+        snapshot.reserve_deck -= from_reserve
+        snapshot.used_pile = max(0, snapshot.used_pile - (delta - from_reserve))
+        snapshot.force_pile = force_pile
+
+        # Same per-turn updates EventProcessor makes on TC/GPC
+        if turn_number != snapshot.turn_number:
+            snapshot.turn_number = turn_number
+            if snapshot.game_plan:
+                snapshot.game_plan.on_turn_started(snapshot)
+            if snapshot.strategic_state:
+                snapshot.strategic_state.on_turn_start(snapshot)
+        snapshot.current_turn_player = snapshot.my_player_name
+        snapshot.current_phase = f"Deploy (turn #{turn_number})"
+        if snapshot.game_plan:
+            snapshot.game_plan.on_deploy_phase_starting(snapshot)
+        return snapshot
+
+    def _speculate(self, board_state, force_pile: int, turn_number: int) -> bool:
+        start = time.perf_counter()
+        key = board_key(board_state, force_pile, turn_number)
+        try:
+            with quiet() if self.quiet else nullcontext():
+                snapshot = self._snapshot(board_state, force_pile, turn_number)
+                planner = self._get_planner()
+                planner.reset()
+                plan = planner.create_plan(snapshot)
+        except Exception as e:
+            logger.warning(f"🔮 Speculative planning failed: {e}")
+            return False
+
+        build_ms = (time.perf_counter() - start) * 1000
+        self._speculations[key] = Speculation(
+            board_key=key,
+            strategy_key=strategy_key(snapshot),
+            plan=plan,
+            outputs={attr: getattr(snapshot, attr, None) for attr in PLANNER_OUTPUT_ATTRS},
+            build_ms=build_ms,
+        )
+        self.speculations += 1
+        logger.debug(f"🔮 Speculative plan for force={force_pile}, turn={turn_number}: "
+                     f"{plan.strategy.value} ({build_ms:.0f}ms)")
+        return True
+
+    def _get_planner(self):
+        if self._planner is None:
+            from .deploy_planner import DeployPhasePlanner
+            self._planner = DeployPhasePlanner(*self._planner_args)
+            self._planner.use_speculation = False  # Plans for us, never from us
+        return self._planner
+
+
+# Global instance
+_speculative_planner: Optional[SpeculativePlanner] = None
+
+
+def get_speculative_planner() -> SpeculativePlanner:
+    """Get the speculative planner for the current game session (or the global one)."""
+    session = current_session()
+    if session is not None:
+        return session.scoped('speculative_planner',
+                              lambda: SpeculativePlanner(get_config().get_section('speculative_planning')))
+    global _speculative_planner
+    if _speculative_planner is None:
+        _speculative_planner = SpeculativePlanner(get_config().get_section('speculative_planning'))
+    return _speculative_planner
+
+
+def reset_speculative_planner() -> SpeculativePlanner:
+    """Reset for a new game (re-reads config)."""
+    global _speculative_planner
+    session = current_session()
+    previous = session.get('speculative_planner') if session is not None else _speculative_planner
+    if previous is not None and previous.hits + previous.misses:
+        logger.info(f"🔮 Speculative planning last game: {previous._summary()}")
+    planner = SpeculativePlanner(get_config().get_section('speculative_planning'))
+    if previous is not None and previous._planner_args is not None:
+        planner.register_planner(*previous._planner_args)
+    if session is not None:
+        return session.set('speculative_planner', planner)
+    _speculative_planner = planner
+    return planner
@@ -18,8 +18,9 @@ import logging
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, TYPE_CHECKING
 
-from engine.strategy_config import get_config
+from engine.strategy_config import section_reader, get_snapshot
 from engine.card_loader import get_card
+from engine.board_summary import get_board_summary
 
 if TYPE_CHECKING:
     from engine.board_state import BoardState
@@ -31,19 +32,16 @@ logger = logging.getLogger(__name__)
 # CONFIG-DRIVEN PARAMETERS
 # =============================================================================
 
-def _get_adaptive_config(key: str, default):
-    """Get adaptive strategy config value."""
-    return get_config().get('adaptive_strategy', key, default)
+# _get_adaptive_config(key, default) -> adaptive strategy config value
+_get_adaptive_config = section_reader('adaptive_strategy')
 
 
-def _get_goal_weight_config(key: str, default):
-    """Get goal weight config value."""
-    return get_config().get('goal_weights', key, default)
+# _get_goal_weight_config(key, default) -> goal weight config value
+_get_goal_weight_config = section_reader('goal_weights')
 
 
-def _get_threshold_config(key: str, default):
-    """Get threshold adjustment config value."""
-    return get_config().get('threshold_adjustments', key, default)
+# _get_threshold_config(key, default) -> threshold adjustment config value
+_get_threshold_config = section_reader('threshold_adjustments')
 
 
 # =============================================================================
@@ -412,78 +410,43 @@ class StrategicState:
         self.opponent.strongest_power = 0
         self.opponent.strongest_location = None
 
-        locations = getattr(board_state, 'locations', [])
-        low_enemy_threshold = 4  # From deploy_planner config
-        # Use same robust pattern as deploy_planner - default to 'dark' and handle None/empty
-        my_side = getattr(board_state, 'my_side', 'dark')
-        if not my_side:  # Handle None or empty string
-            my_side = 'dark'
-        my_side = my_side.lower()
+        summary = get_board_summary(board_state)
 
         # Debug: Log what we're working with
-        if len(locations) > 0:
-            logger.info(f"   Drain calc: {len(locations)} locations, my_side={my_side}")
+        if len(summary) > 0:
+            logger.info(f"   Drain calc: {len(summary)} locations, my_side={summary.my_side}")
 
-        for idx, loc in enumerate(locations):
-            if loc is None:
+        for loc in summary:
+            if not loc.blueprint_id or loc.blueprint_id == 'unknown':
                 continue
 
-            loc_name = getattr(loc, 'site_name', None) or getattr(loc, 'name', str(loc))
-            # Get location index - use the stored index or fall back to enumeration index
-            loc_index = getattr(loc, 'location_index', idx)
-            my_power = board_state.my_power_at_location(loc_index) if hasattr(board_state, 'my_power_at_location') else 0
-            their_power = board_state.their_power_at_location(loc_index) if hasattr(board_state, 'their_power_at_location') else 0
+            loc_name = loc.name
+            my_power = loc.my_power
+            their_power = loc.their_power
 
-            # Get location icons from card data
-            blueprint_id = getattr(loc, 'blueprint_id', None)
-            my_icons = 0
-            their_icons = 0
-            is_space = False
-
-            if not blueprint_id or blueprint_id == 'unknown':
-                continue
-
-            card_data = get_card(blueprint_id)
-            if card_data:
-                # Get icons based on our side (Card object uses attributes, not dict)
-                # my_side is guaranteed to be 'dark' or 'light' after normalization above
-                if my_side == 'dark':
-                    my_icons = getattr(card_data, 'dark_side_icons', 0) or 0
-                    their_icons = getattr(card_data, 'light_side_icons', 0) or 0
-                else:  # 'light'
-                    my_icons = getattr(card_data, 'light_side_icons', 0) or 0
-                    their_icons = getattr(card_data, 'dark_side_icons', 0) or 0
-
-                # Check if space location - use is_system like deploy_planner does
-                # has_space_icon only checks for 'space'/'starship' in icons, but systems don't have those
-                is_space = getattr(card_data, 'is_system', False) or 'System' in (getattr(card_data, 'sub_type', '') or '')
-
-                # Debug logging for drain calculation
-                if my_icons > 0 or their_icons > 0:
-                    logger.debug(f"   {loc_name}: my_pwr={my_power}, their_pwr={their_power}, my_icons={my_icons}, their_icons={their_icons}")
-            else:
-                logger.debug(f"   {loc_name}: No card data for blueprint {blueprint_id}")
+            # Debug logging for drain calculation
+            if loc.my_icons > 0 or loc.their_icons > 0:
+                logger.debug(f"   {loc_name}: my_pwr={my_power}, their_pwr={their_power}, "
+                             f"my_icons={loc.my_icons}, their_icons={loc.their_icons}")
 
             # Our drains (we control locations with opponent icons)
-            # We have presence, they don't, and location has THEIR icons
-            # Note: GEMP uses -1 for "no presence", so check <= 0
-            if my_power > 0 and their_power <= 0 and their_icons > 0:
-                self.trajectory.our_total_drain += their_icons
+            # Note: GEMP uses -1 for "no presence", see LocationSummary.i_control
+            if loc.my_drain > 0:
+                self.trajectory.our_total_drain += loc.my_drain
                 self.trajectory.our_drain_locations.append(loc_name)
 
             # Their drains (they control locations with our icons)
-            # Note: GEMP uses -1 for "no presence", so check <= 0
-            if their_power > 0 and my_power <= 0 and my_icons > 0:
-                self.trajectory.their_total_drain += my_icons
+            if loc.their_drain > 0:
+                self.trajectory.their_total_drain += loc.their_drain
                 self.trajectory.uncontested_opponent_drains.append(loc_name)
 
                 # Is this contestable? (low enemy power)
-                if their_power <= low_enemy_threshold:
+                if loc.contestable:
                     self.trajectory.contestable_drains.append(loc_name)
 
             # Track opponent presence
             if their_power > 0:
-                if is_space:
+                if loc.is_space:
                     self.opponent.total_space_power += their_power
                     if my_power == 0:
                         self.opponent.uncontested_space_locations += 1
@@ -559,47 +522,18 @@ class StrategicState:
         our_space_locations = 0
         bleeding_icons = 0
 
-        locations = getattr(board_state, 'locations', [])
-        my_side = getattr(board_state, 'my_side', 'dark')
-        if not my_side:
-            my_side = 'dark'
-        my_side = my_side.lower()
-
-        for idx, loc in enumerate(locations):
-            if loc is None:
-                continue
-
-            # Check if space location
-            blueprint_id = getattr(loc, 'blueprint_id', None)
-            if not blueprint_id:
-                continue
-
-            card_data = get_card(blueprint_id)
-            if not card_data:
-                continue
-
-            # Check if space location - use is_system like deploy_planner does
-            # has_space_icon only checks for 'space'/'starship' in icons, but systems don't have those
-            is_space = getattr(card_data, 'is_system', False) or 'System' in (getattr(card_data, 'sub_type', '') or '')
-            if not is_space:
+        for loc in get_board_summary(board_state):
+            # Only systems known from card metadata count
+            if not loc.has_metadata or not loc.is_space:
                 continue
 
-            # Get power at this location
-            loc_index = getattr(loc, 'location_index', idx)
-            my_power = board_state.my_power_at_location(loc_index) if hasattr(board_state, 'my_power_at_location') else 0
-            their_power = board_state.their_power_at_location(loc_index) if hasattr(board_state, 'their_power_at_location') else 0
-
             # Count presence
-            if their_power > 0 and my_power <= 0:
+            if loc.they_control:
                 opponent_space_locations += 1
                 # Count icons we're losing
-                if my_side == 'dark':
-                    my_icons = getattr(card_data, 'dark_side_icons', 0) or 0
-                else:
-                    my_icons = getattr(card_data, 'light_side_icons', 0) or 0
-                bleeding_icons += my_icons
+                bleeding_icons += loc.my_icons
 
-            if my_power > 0:
+            if loc.my_power > 0:
                 our_space_locations += 1
 
         # Space emergency: opponent has space presence, we have NONE
@@ -677,9 +611,10 @@ class StrategicState:
         urgency = self.get_strategic_urgency()
 
         # Default thresholds from config
-        base_deploy = get_config().get('deploy_strategy', 'deploy_threshold', 4)
-        base_contest = get_config().get('contest_strategy', 'min_contest_advantage', 2)
-        base_reserve = get_config().get('battle_strategy', 'force_reserve', 1)
+        config = get_snapshot()
+        base_deploy = config.value('deploy_strategy', 'deploy_threshold', 4)
+        base_contest = config.value('contest_strategy', 'min_contest_advantage', 2)
+        base_reserve = config.value('battle_strategy', 'force_reserve', 1)
 
         if urgency == "critical":
             return StrategicThresholds(
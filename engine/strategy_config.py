@@ -13,15 +13,32 @@ Usage:
     # Get evaluator weight
     bonus = get_config().get_weight('deploy', 'planned_target_bonus', default=200)
 
+    # Hot paths: fetch the compiled snapshot once, or bind a section reader
+    snapshot = get_snapshot()
+    threshold = snapshot.value('battle_strategy', 'favorable_threshold', 4)
+    chaos = snapshot.global_.chaos_percent  # AttributeError if the key is missing
+    _get_move_config = section_reader('move_strategy')
+
+Each load compiles the JSON into an immutable ConfigSnapshot. Entries
+that break the schema (metadata must be strings, sections objects, values
+JSON scalars or lists, evaluator weights numbers) are logged and dropped
+so the code defaults apply. reload() swaps the snapshot in one assignment
+and bumps its revision, so readers never see a half-loaded config and
+caches can key on `snapshot.revision`.
+
 Environment:
     STRATEGY_CONFIG - Path to JSON config file (default: configs/baseline.json)
 """
 
+import itertools
 import json
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional
+
+from .game_session import current_session, own_config_bound
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +47,162 @@ logger = logging.getLogger(__name__)
 DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / "configs" / "production.json"
 
 
+# Top-level keys that hold config metadata rather than sections
+METADATA_KEYS = ('name', 'version', 'description')
+
+# Sections whose values are themselves sections (evaluator -> weights)
+NESTED_SECTIONS = ('evaluator_weights',)
+
+# JSON types allowed as config values
+_SCALAR_TYPES = (bool, int, float, str, type(None))
+
+# Every compiled snapshot gets a new revision, across reloads and
+# set_config_path(), so caches keyed on it are invalidated by both
+_revisions = itertools.count(1)
+
+
+def _freeze(value: Any) -> Any:
+    """Lists become tuples so snapshot values cannot be mutated in place."""
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _valid_value(value: Any) -> bool:
+    if isinstance(value, list):
+        return all(_valid_value(v) for v in value)
+    return isinstance(value, _SCALAR_TYPES)
+
+
+class ConfigSection(Mapping):
+    """
+    Read-only view of one config section.
+
+    Supports both mapping access (section.get('key', default)) and
+    attribute access (section.key) for keys known to be present.
+    """
+
+    __slots__ = ('_name', '_values')
+
+    def __init__(self, name: str, values: Dict[str, Any]):
+        object.__setattr__(self, '_name', name)
+        object.__setattr__(self, '_values', MappingProxyType(values))
+
+    def __getattr__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            raise AttributeError(f"Config section '{self._name}' has no key '{key}'") from None
+
+    def __setattr__(self, key: str, value: Any):
+        raise AttributeError("ConfigSection is read-only")
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._values.get(key, default)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"ConfigSection({self._name}, {dict(self._values)})"
+
+
+_EMPTY_SECTION = ConfigSection('', {})
+
+
+class ConfigSnapshot:
+    """
+    Immutable, validated view of one loaded config file.
+
+    Sections are available as attributes (`snapshot.battle_strategy`;
+    `snapshot.global_` for the 'global' section). value() and weight()
+    read plain dicts built at compile time.
+    """
+
+    __slots__ = ('revision', 'name', 'version', 'sections', 'errors',
+                 '_values', '_weights', '_raw')
+
+    def __init__(self, raw: Dict[str, Any], revision: int):
+        sections: Dict[str, ConfigSection] = {}
+        values: Dict[str, Dict[str, Any]] = {}
+        weights: Dict[str, Dict[str, float]] = {}
+        errors = []
+
+        for section, data in raw.items():
+            if section in METADATA_KEYS:
+                if not isinstance(data, str):
+                    errors.append(f"'{section}' must be a string")
+                continue
+            if not isinstance(data, dict):
+                errors.append(f"section '{section}' must be an object")
+                continue
+
+            compiled: Dict[str, Any] = {}
+            for key, value in data.items():
+                if section in NESTED_SECTIONS:
+                    if not isinstance(value, dict):
+                        errors.append(f"'{section}.{key}' must be an object")
+                        continue
+                    nested = {}
+                    for weight_key, weight in value.items():
+                        if isinstance(weight, bool) or not isinstance(weight, (int, float)):
+                            errors.append(f"'{section}.{key}.{weight_key}' must be a number")
+                            continue
+                        nested[weight_key] = weight
+                    weights[key] = {k: float(v) for k, v in nested.items()}
+                    compiled[key] = ConfigSection(f"{section}.{key}", nested)
+                elif _valid_value(value):
+                    compiled[key] = _freeze(value)
+                else:
+                    errors.append(f"'{section}.{key}' has unsupported type {type(value).__name__}")
+
+            values[section] = compiled
+            sections[section] = ConfigSection(section, compiled)
+
+        object.__setattr__(self, 'revision', revision)
+        object.__setattr__(self, 'name', raw.get('name', 'default') if isinstance(raw.get('name'), str) else 'default')
+        object.__setattr__(self, 'version', raw.get('version', '0.0.0') if isinstance(raw.get('version'), str) else '0.0.0')
+        object.__setattr__(self, 'sections', MappingProxyType(sections))
+        object.__setattr__(self, 'errors', tuple(errors))
+        object.__setattr__(self, '_values', values)
+        object.__setattr__(self, '_weights', weights)
+        object.__setattr__(self, '_raw', raw)
+
+    def __getattr__(self, section: str) -> ConfigSection:
+        # Missing sections read as empty so .get() defaults keep working
+        if section.startswith('__'):
+            raise AttributeError(section)
+        return self.sections.get(section.rstrip('_'), _EMPTY_SECTION)
+
+    def __setattr__(self, key: str, value: Any):
+        raise AttributeError("ConfigSnapshot is read-only")
+
+    def value(self, section: str, key: str, default: Any = None) -> Any:
+        """Config value or default."""
+        values = self._values.get(section)
+        return default if values is None else values.get(key, default)
+
+    def weight(self, evaluator: str, key: str, default: float = 0.0) -> float:
+        """Evaluator weight as a float, or default."""
+        weights = self._weights.get(evaluator)
+        weight = None if weights is None else weights.get(key)
+        return float(default) if weight is None else weight
+
+    def section(self, section: str) -> ConfigSection:
+        """A whole section (empty if missing)."""
+        return self.sections.get(section, _EMPTY_SECTION)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The JSON this snapshot was compiled from (deep copy)."""
+        return json.loads(json.dumps(self._raw))
+
+
 class StrategyConfig:
     """
     Loads and provides access to strategy weights from JSON.
@@ -54,76 +227,98 @@ class StrategyConfig:
             else:
                 self.path = DEFAULT_CONFIG_PATH
 
-        self._config: Dict[str, Any] = {}
+        self._snapshot: ConfigSnapshot
         self._loaded = False
         self._load()
 
     def _load(self):
-        """Load configuration from JSON file."""
+        """Load configuration from JSON file and swap in a new snapshot."""
+        raw: Dict[str, Any] = {}
+        loaded = False
         try:
             if self.path.exists():
                 with open(self.path, 'r', encoding='utf-8') as f:
-                    self._config = json.load(f)
-                self._loaded = True
-                logger.info(f"Loaded strategy config from: {self.path}")
-                logger.info(f"  Config name: {self._config.get('name', 'unknown')}")
-                logger.info(f"  Config version: {self._config.get('version', 'unknown')}")
-                # Log key config values for verification
-                self._log_key_values()
+                    raw = json.load(f)
+                if not isinstance(raw, dict):
+                    logger.error(f"Strategy config {self.path} must be a JSON object")
+                    raw = {}
+                else:
+                    loaded = True
             else:
                 logger.warning(f"Strategy config not found: {self.path}, using defaults")
-                self._config = {}
-                self._loaded = False
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in strategy config {self.path}: {e}")
-            self._config = {}
-            self._loaded = False
         except Exception as e:
             logger.error(f"Error loading strategy config: {e}")
-            self._config = {}
-            self._loaded = False
+
+        snapshot = ConfigSnapshot(raw, next(_revisions))
+        for error in snapshot.errors:
+            logger.warning(f"Strategy config {self.path}: {error} (ignored, using default)")
+
+        # Single assignment: readers see either the old or the new snapshot
+        self._snapshot = snapshot
+        self._loaded = loaded
+
+        if loaded:
+            logger.info(f"Loaded strategy config from: {self.path}")
+            logger.info(f"  Config name: {snapshot.name}")
+            logger.info(f"  Config version: {snapshot.version} (revision {snapshot.revision})")
+            # Log key config values for verification
+            self._log_key_values()
 
     def _log_key_values(self):
         """Log key config values for verification."""
+        snapshot = self._snapshot
+
         # Deploy strategy
-        ds = self._config.get('deploy_strategy', {})
+        ds = snapshot.section('deploy_strategy')
         logger.info(f"  [deploy_strategy] early_game_threshold={ds.get('early_game_threshold')}, "
                    f"deploy_overkill_threshold={ds.get('deploy_overkill_threshold')}, "
                    f"early_game_turns={ds.get('early_game_turns')}")
 
         # Battle strategy
-        bs = self._config.get('battle_strategy', {})
+        bs = snapshot.section('battle_strategy')
         logger.info(f"  [battle_strategy] favorable_threshold={bs.get('favorable_threshold')}, "
                    f"power_diff_for_battle={bs.get('power_diff_for_battle')}, "
                    f"react_threat_threshold={bs.get('react_threat_threshold')}")
 
         # Move strategy
-        ms = self._config.get('move_strategy', {})
+        ms = snapshot.section('move_strategy')
         logger.info(f"  [move_strategy] attack_score_base={ms.get('attack_score_base')}, "
                    f"attack_power_advantage={ms.get('attack_power_advantage')}")
 
         # Draw strategy
-        drs = self._config.get('draw_strategy', {})
+        drs = snapshot.section('draw_strategy')
         logger.info(f"  [draw_strategy] target_hand_size={drs.get('target_hand_size')}, "
                    f"force_starved_activation={drs.get('force_starved_activation')}")
 
         # Global
-        gl = self._config.get('global', {})
+        gl = snapshot.section('global')
         logger.info(f"  [global] chaos_percent={gl.get('chaos_percent')}")
 
     def reload(self):
-        """Reload configuration from file."""
+        """Reload configuration from file (atomically replaces the snapshot)."""
         self._load()
 
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """The current immutable config snapshot."""
+        return self._snapshot
+
+    @property
+    def revision(self) -> int:
+        """Revision of the current snapshot; changes on every (re)load."""
+        return self._snapshot.revision
+
     @property
     def name(self) -> str:
         """Get config name."""
-        return self._config.get('name', 'default')
+        return self._snapshot.name
 
     @property
     def version(self) -> str:
         """Get config version."""
-        return self._config.get('version', '0.0.0')
+        return self._snapshot.version
 
     @property
     def is_loaded(self) -> bool:
@@ -142,8 +337,7 @@ class StrategyConfig:
         Returns:
             The config value or default
         """
-        section_data = self._config.get(section, {})
-        return section_data.get(key, default)
+        return self._snapshot.value(section, key, default)
 
     def get_weight(self, evaluator: str, key: str, default: float = 0.0) -> float:
         """
@@ -159,9 +353,7 @@ class StrategyConfig:
         Returns:
             The weight value as a float
         """
-        weights = self._config.get('evaluator_weights', {})
-        evaluator_weights = weights.get(evaluator, {})
-        return float(evaluator_weights.get(key, default))
+        return self._snapshot.weight(evaluator, key, default)
 
     def get_global(self, key: str, default: Any = None) -> Any:
         """
@@ -174,42 +366,101 @@ class StrategyConfig:
         Returns:
             The config value or default
         """
-        return self.get('global', key, default)
+        return self._snapshot.value('global', key, default)
 
-    def get_section(self, section: str) -> Dict[str, Any]:
+    def get_section(self, section: str) -> ConfigSection:
         """
-        Get an entire config section as a dict.
+        Get an entire config section as a read-only mapping.
 
         Args:
             section: Config section name (e.g., 'monte_carlo')
 
         Returns:
-            The section dict, or empty dict if not found
+            The section, or an empty section if not found
         """
-        return self._config.get(section, {})
+        return self._snapshot.section(section)
 
     def as_dict(self) -> Dict[str, Any]:
         """Get the full config as a dictionary."""
-        return self._config.copy()
+        return self._snapshot.as_dict()
 
 
 # Global singleton instance
 _config: Optional[StrategyConfig] = None
 
 
+def _session_config() -> Optional[StrategyConfig]:
+    """The bound game session's own config, if it has one."""
+    session = current_session()
+    if session is None or not session.strategy_config_path:
+        return None
+    return session.scoped('strategy_config', lambda: StrategyConfig(session.strategy_config_path))
+
+
 def get_config() -> StrategyConfig:
     """
-    Get the global strategy config singleton.
+    Get the strategy config singleton (or the game session's own config).
 
     Returns:
         The StrategyConfig instance
     """
     global _config
+    config = _session_config()
+    if config is not None:
+        return config
     if _config is None:
         _config = StrategyConfig()
     return _config
 
 
+def get_snapshot() -> ConfigSnapshot:
+    """
+    Get the current config snapshot.
+
+    Cheaper than get_config().get(...) in hot loops: fetch the snapshot
+    once and read values from it.
+    """
+    return _reader_config()._snapshot
+
+
+def _reader_config() -> StrategyConfig:
+    """
+    Config for section_reader()/weight_reader().
+
+    Sessions that share the process-wide config (the usual case) never
+    need the per-greenlet session lookup, so it only runs while a session
+    with its own config is bound somewhere in the process.
+    """
+    if own_config_bound():
+        config = _session_config()
+        if config is not None:
+            return config
+    return _config or get_config()
+
+
+def section_reader(section: str) -> Callable[..., Any]:
+    """
+    Build a `read(key, default)` function for one section.
+
+    The reader always sees the current snapshot but skips the
+    get_config()/get() call chain, so module-level getters can be
+    defined as `_get_battle_config = section_reader('battle_strategy')`.
+    """
+    def read(key: str, default: Any = None) -> Any:
+        values = _reader_config()._snapshot._values.get(section)
+        return default if values is None else values.get(key, default)
+    return read
+
+
+def weight_reader(evaluator: str) -> Callable[..., float]:
+    """Build a `read(key, default)` function for one evaluator's weights."""
+    def read(key: str, default: float = 0.0) -> float:
+        weights = _reader_config()._snapshot._weights.get(evaluator)
+        weight = None if weights is None else weights.get(key)
+        return float(default) if weight is None else weight
+    return read
+
+
 def set_config_path(path: str):
     """
     Set the config path and reload.
@@ -220,11 +471,17 @@ def set_config_path(path: str):
         path: Path to JSON config file
     """
     global _config
+    session = current_session()
+    if session is not None and session.strategy_config_path:
+        session.strategy_config_path = path
+        session.set('strategy_config', StrategyConfig(path) if path else None)
+        return
     _config = StrategyConfig(path)
 
 
 def reload_config():
     """Reload the current configuration from file."""
     global _config
-    if _config:
-        _config.reload()
+    config = _session_config() or _config
+    if config:
+        config.reload()
@@ -18,6 +18,8 @@ from enum import Enum
 from dataclasses import dataclass, field
 from typing import Optional, List, Set, TYPE_CHECKING
 
+from .game_session import current_session
+
 if TYPE_CHECKING:
     from .board_state import BoardState
 
@@ -336,6 +338,16 @@ def get_current_profile(bs: 'BoardState') -> StrategyProfile:
     if not bs:
         return PROFILES[StrategyMode.BALANCED]
 
+    session = current_session()
+    if session is not None:
+        # Each game session caches its own profile (turn/phase differ per game)
+        cache = session.scoped('strategy_profile', dict)
+        if (cache.get('turn') != bs.turn_number or cache.get('phase') != bs.current_phase
+                or cache.get('profile') is None):
+            cache.update(profile=get_strategy_profile(bs), turn=bs.turn_number, phase=bs.current_phase)
+            _log_profile(cache['profile'])
+        return cache['profile']
+
     # Recalculate at start of each phase or turn
     if (bs.turn_number != _cached_turn or
         bs.current_phase != _cached_phase or
@@ -345,19 +357,27 @@ def get_current_profile(bs: 'BoardState') -> StrategyProfile:
         _cached_turn = bs.turn_number
         _cached_phase = bs.current_phase
 
-        # Log the strategy decision
-        logger.info(f"📊 Strategy: {_cached_profile.mode.value.upper()} | "
-                   f"deploy×{_cached_profile.deploy_multiplier:.2f} "
-                   f"battle×{_cached_profile.battle_multiplier:.2f} "
-                   f"pass×{_cached_profile.pass_multiplier:.2f}")
-        logger.debug(f"   {_cached_profile.reason}")
+        _log_profile(_cached_profile)
 
     return _cached_profile
 
 
+def _log_profile(profile: StrategyProfile):
+    """Log a newly calculated strategy decision."""
+    logger.info(f"📊 Strategy: {profile.mode.value.upper()} | "
+               f"deploy×{profile.deploy_multiplier:.2f} "
+               f"battle×{profile.battle_multiplier:.2f} "
+               f"pass×{profile.pass_multiplier:.2f}")
+    logger.debug(f"   {profile.reason}")
+
+
 def reset_strategy_cache():
     """Reset the cached profile (call at game start)"""
     global _cached_profile, _cached_turn, _cached_phase
+    session = current_session()
+    if session is not None:
+        session.set('strategy_profile', None)
+        return
     _cached_profile = None
     _cached_turn = -1
     _cached_phase = ""
@@ -425,7 +445,11 @@ def set_deck_strategy(goals: 'StrategicGoals'):
     Call this at game start after analyzing the deck.
     """
     global _deck_strategy
-    _deck_strategy = goals
+    session = current_session()
+    if session is not None:
+        session.set('deck_strategy', goals)
+    else:
+        _deck_strategy = goals
     logger.info(f"🎯 Deck Strategy Set: {goals.archetype.value}")
     logger.info(f"   Domain: {goals.primary_domain}")
     logger.info(f"   Space×{goals.space_deploy_multiplier:.2f}, Ground×{goals.ground_deploy_multiplier:.2f}")
@@ -435,11 +459,18 @@ def set_deck_strategy(goals: 'StrategicGoals'):
 def clear_deck_strategy():
     """Clear the deck strategy (call at game end)."""
     global _deck_strategy
-    _deck_strategy = None
+    session = current_session()
+    if session is not None:
+        session.set('deck_strategy', None)
+    else:
+        _deck_strategy = None
 
 
 def get_deck_strategy() -> Optional['StrategicGoals']:
     """Get the current deck strategy (may be None if not set)."""
+    session = current_session()
+    if session is not None:
+        return session.get('deck_strategy')
     return _deck_strategy
 
 
@@ -472,35 +503,36 @@ def get_combined_profile(bs: 'BoardState') -> CombinedStrategyProfile:
     )
 
     # If deck strategy is set, combine with it
-    if _deck_strategy:
-        combined.deck_archetype = _deck_strategy.archetype.value
-        combined.primary_domain = _deck_strategy.primary_domain
+    deck_strategy = get_deck_strategy()
+    if deck_strategy:
+        combined.deck_archetype = deck_strategy.archetype.value
+        combined.primary_domain = deck_strategy.primary_domain
 
         # Domain multipliers from deck strategy
-        combined.space_deploy_multiplier = _deck_strategy.space_deploy_multiplier
-        combined.ground_deploy_multiplier = _deck_strategy.ground_deploy_multiplier
-        combined.space_location_bonus = _deck_strategy.space_location_bonus
-        combined.ground_location_bonus = _deck_strategy.ground_location_bonus
+        combined.space_deploy_multiplier = deck_strategy.space_deploy_multiplier
+        combined.ground_deploy_multiplier = deck_strategy.ground_deploy_multiplier
+        combined.space_location_bonus = deck_strategy.space_location_bonus
+        combined.ground_location_bonus = deck_strategy.ground_location_bonus
 
         # Combine battle aggression: deck × position
-        combined.battle_multiplier *= _deck_strategy.battle_aggression
+        combined.battle_multiplier *= deck_strategy.battle_aggression
 
         # Battle requirements from deck strategy
-        combined.battle_advantage_required = _deck_strategy.battle_advantage_required
-        combined.avoid_battles_unless_favorable = _deck_strategy.avoid_battles_unless_favorable
+        combined.battle_advantage_required = deck_strategy.battle_advantage_required
+        combined.avoid_battles_unless_favorable = deck_strategy.avoid_battles_unless_favorable
 
         # Adjust force reserve if deck says to save
         combined.force_reserve = max(
             combined.force_reserve,
-            _deck_strategy.save_force_threshold
+            deck_strategy.save_force_threshold
         )
 
         # Key cards from deck strategy
-        combined.key_cards = _deck_strategy.key_cards
-        combined.protect_cards = set(_deck_strategy.key_cards)
+        combined.key_cards = deck_strategy.key_cards
+        combined.protect_cards = set(deck_strategy.key_cards)
 
         combined.reason = (f"{position_profile.mode.value.upper()} + "
-                         f"{_deck_strategy.archetype.value} | {combined.reason}")
+                         f"{deck_strategy.archetype.value} | {combined.reason}")
 
     return combined
 
@@ -24,18 +24,29 @@ from pathlib import Path
 from typing import Optional, List, Callable
 from enum import Enum
 
+from .game_session import current_session
+
 logger = logging.getLogger(__name__)
 
 # File to persist current table info (survives restarts)
 TABLE_STATE_FILE = Path(__file__).parent.parent / 'data' / 'current_table.json'
 
 
+def _table_state_file() -> Path:
+    """The table state file for the bound game session (or the process)."""
+    session = current_session()
+    if session is None:
+        return TABLE_STATE_FILE
+    return TABLE_STATE_FILE.with_name(f'current_table_{session.name}.json')
+
+
 def _save_table_state(table_id: str, deck_name: str, welcome_sent: bool = False) -> None:
     """Persist current table info to survive restarts."""
     try:
-        TABLE_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        state_file = _table_state_file()
+        state_file.parent.mkdir(parents=True, exist_ok=True)
         data = {'table_id': table_id, 'deck_name': deck_name, 'welcome_sent': welcome_sent}
-        with open(TABLE_STATE_FILE, 'w') as f:
+        with open(state_file, 'w') as f:
             json.dump(data, f)
         logger.debug(f"Saved table state: {data}")
     except Exception as e:
@@ -45,8 +56,9 @@ def _save_table_state(table_id: str, deck_name: str, welcome_sent: bool = False)
 def _load_table_state() -> Optional[dict]:
     """Load persisted table info (if any)."""
     try:
-        if TABLE_STATE_FILE.exists():
-            with open(TABLE_STATE_FILE, 'r') as f:
+        state_file = _table_state_file()
+        if state_file.exists():
+            with open(state_file, 'r') as f:
                 data = json.load(f)
             logger.debug(f"Loaded table state: {data}")
             return data
@@ -58,8 +70,9 @@ def _load_table_state() -> Optional[dict]:
 def _clear_table_state() -> None:
     """Clear persisted table state (when game ends)."""
     try:
-        if TABLE_STATE_FILE.exists():
-            TABLE_STATE_FILE.unlink()
+        state_file = _table_state_file()
+        if state_file.exists():
+            state_file.unlink()
             logger.debug("Cleared table state file")
     except Exception as e:
         logger.warning(f"Failed to clear table state: {e}")
@@ -148,6 +161,9 @@ class TableManagerConfig:
     # Max games to play before stopping (0 = unlimited)
     max_games: int = 0
 
+    # Always play this deck (for reproducible testing); defaults to FIXED_DECK_NAME
+    fixed_deck_name: Optional[str] = field(default_factory=lambda: os.environ.get('FIXED_DECK_NAME') or None)
+
 
 @dataclass
 class TableManagerState:
@@ -515,12 +531,12 @@ class TableManager:
             required_side: If specified, only select decks of this side ('light' or 'dark')
 
         Priority:
-        1. FIXED_DECK_NAME environment variable (for testing)
+        1. config.fixed_deck_name / FIXED_DECK_NAME (for testing)
         2. User's personal decks (prefer_user_decks=True) - these are bot-optimized
         3. Library decks as fallback
         """
-        # Check for fixed deck from environment (for reproducible testing)
-        fixed_deck_name = os.environ.get('FIXED_DECK_NAME')
+        # Check for fixed deck (for reproducible testing)
+        fixed_deck_name = self.config.fixed_deck_name
         if fixed_deck_name:
             # Search all decks for the fixed deck
             all_decks = self.user_decks + self.library_decks
@@ -0,0 +1,147 @@
+"""
+Title Index
+
+Normalized card-title lookup structures built once when the CardDatabase
+loads, so title lookups no longer scan every card.
+
+Titles are normalized by stripping unique markers ("•"), lowercasing and
+collapsing whitespace. The index holds:
+- an exact map of normalized title -> cards
+- a prefix trie over normalized titles
+- a trigram posting index for substring search (candidates are verified
+  with a plain substring check, so results match a linear scan exactly)
+
+All results are returned in card load order, matching the ordering of the
+old linear scans over CardDatabase.cards.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .card_loader import Card
+
+# Substring queries shorter than this fall back to a scan of unique titles
+NGRAM_SIZE = 3
+
+# Key under which trie nodes store ids of titles ending at that node
+_TERMINAL = ''
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=8192)
+def normalize_title(title: str) -> str:
+    """
+    Normalize a card title for comparison.
+
+    "•Luke Skywalker, Jedi Knight" -> "luke skywalker, jedi knight"
+    """
+    if not title:
+        return ""
+    return _WHITESPACE_RE.sub(' ', title.replace('•', '')).strip().lower()
+
+
+def _ngrams(text: str) -> Set[str]:
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class TitleIndex:
+    """
+    Immutable title index over a sequence of cards.
+
+    Example usage:
+        index = TitleIndex(db.cards.values())
+        index.exact("•Luke Skywalker")      # -> [Card(...)]
+        index.prefix("luke sky")            # -> all Luke Skywalker versions
+        index.substring("skywalker")        # -> every title containing it
+    """
+
+    def __init__(self, cards: Iterable['Card']):
+        self._cards: List['Card'] = list(cards)
+
+        # Unique normalized titles; each maps to card positions in load order
+        self._titles: List[str] = []
+        self._title_cards: List[List[int]] = []
+        self._title_ids: Dict[str, int] = {}
+
+        for position, card in enumerate(self._cards):
+            normalized = normalize_title(card.title)
+            title_id = self._title_ids.get(normalized)
+            if title_id is None:
+                title_id = len(self._titles)
+                self._title_ids[normalized] = title_id
+                self._titles.append(normalized)
+                self._title_cards.append([])
+            self._title_cards[title_id].append(position)
+
+        self._trie: dict = {}
+        self._postings: Dict[str, List[int]] = {}
+        for title_id, normalized in enumerate(self._titles):
+            node = self._trie
+            for char in normalized:
+                node = node.setdefault(char, {})
+            node.setdefault(_TERMINAL, []).append(title_id)
+
+            for gram in _ngrams(normalized):
+                self._postings.setdefault(gram, []).append(title_id)
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    @property
+    def unique_titles(self) -> int:
+        return len(self._titles)
+
+    def exact(self, title: str) -> List['Card']:
+        """Cards whose normalized title equals the normalized query."""
+        title_id = self._title_ids.get(normalize_title(title))
+        if title_id is None:
+            return []
+        return [self._cards[p] for p in self._title_cards[title_id]]
+
+    def prefix(self, title: str) -> List['Card']:
+        """Cards whose normalized title starts with the normalized query."""
+        node = self._trie
+        for char in normalize_title(title):
+            node = node.get(char)
+            if node is None:
+                return []
+
+        title_ids = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for key, child in node.items():
+                if key == _TERMINAL:
+                    title_ids.extend(child)
+                else:
+                    stack.append(child)
+        return self._cards_for(title_ids)
+
+    def substring(self, title: str) -> List['Card']:
+        """Cards whose normalized title contains the normalized query."""
+        query = normalize_title(title)
+        if len(query) < NGRAM_SIZE:
+            candidates: Iterable[int] = range(len(self._titles))
+        else:
+            postings = []
+            for gram in _ngrams(query):
+                posting = self._postings.get(gram)
+                if posting is None:
+                    return []
+                postings.append(posting)
+            postings.sort(key=len)
+            candidate_set = set(postings[0])
+            for posting in postings[1:]:
+                candidate_set.intersection_update(posting)
+                if not candidate_set:
+                    return []
+            candidates = candidate_set
+
+        return self._cards_for(t for t in candidates if query in self._titles[t])
+
+    def _cards_for(self, title_ids: Iterable[int]) -> List['Card']:
+        positions = sorted(p for t in title_ids for p in self._title_cards[t])
+        return [self._cards[p] for p in positions]
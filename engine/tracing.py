@@ -0,0 +1,264 @@
+"""
+Sampled Tracing
+
+The deploy planner, the evaluators and the event loop log hundreds of INFO
+lines per plan or decision. Nearly all of them are only read when a game
+is being debugged, yet every one of them formats its f-string (emoji,
+joins, list comprehensions) and goes through the log handlers.
+
+This module puts those subsystems behind tracers:
+- per-subsystem levels: each subsystem's loggers get a configured level
+- per-game sampling: 1 in `sample_every` games gets the full trace; the
+  others keep only records at `summary_level` or above plus summaries
+- lazy messages: tracer.info(lambda: f"...") only builds the message if
+  the record will be kept, and tracer.enabled() guards whole blocks
+- quiet blocks: inside `with quiet():` the running greenlet (or thread)
+  keeps only warnings, e.g. while the speculative planner plans ahead
+
+Traced modules use a Tracer as their module logger. It keeps the Logger
+call interface, so plain logger.info(f"...") calls in an unsampled game
+return before a LogRecord is built; only the f-string itself is paid for,
+and hot loops avoid that too with a callable or an enabled() guard.
+TraceFilter, installed on the log handlers, applies the same sampling to
+records from plain loggers under the traced prefixes.
+
+Configured by the strategy config 'tracing' section:
+    sample_every: Full trace for 1 in N games (default 1 = every game)
+    summary_level: Lowest level kept in unsampled games (default WARNING)
+    <subsystem>_level: Logger level per subsystem, e.g. planner_level: "INFO"
+
+Example usage:
+    logger = get_tracer('planner', logging.getLogger(__name__))
+
+    logger.info(f"Planning {len(hand)} cards")
+    logger.info(lambda: f"Targets: {[loc.name for loc in targets]}")
+    if logger.enabled():
+        for card in hand:
+            logger.info(...)
+    logger.summary(f"FINAL PLAN: {plan.strategy.value}")
+"""
+
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+from .game_session import current_session, task_key
+from .strategy_config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Traced subsystems and the logger name prefixes they cover
+SUBSYSTEMS: Dict[str, Tuple[str, ...]] = {
+    'planner': ('engine.deploy_planner',),
+    'evaluators': ('engine.evaluators', 'brain.static_brain'),
+    'events': ('engine.event_processor', 'app.events'),
+}
+
+Message = Union[str, Callable[[], str]]
+
+# Lowest level kept in unsampled games (process-wide, from config)
+_summary_level = logging.WARNING
+
+# Greenlets/threads inside quiet() blocks -> nesting depth
+_quiet_tasks: Dict[Any, int] = {}
+
+# logger name -> subsystem (or None), filled on first use
+_subsystem_by_name: Dict[str, Optional[str]] = {}
+
+
+def subsystem_for(name: str) -> Optional[str]:
+    """The traced subsystem a logger name belongs to, or None."""
+    try:
+        return _subsystem_by_name[name]
+    except KeyError:
+        pass
+    found = None
+    for subsystem, prefixes in SUBSYSTEMS.items():
+        if any(name == prefix or name.startswith(prefix + '.') for prefix in prefixes):
+            found = subsystem
+            break
+    _subsystem_by_name[name] = found
+    return found
+
+
+# =============================================================================
+# PER-GAME SAMPLING
+# =============================================================================
+
+@dataclass
+class GameTrace:
+    """Whether the current game gets the full trace."""
+    game_id: str = ''
+    number: int = 0
+    full: bool = True
+
+
+class GameSampler:
+    """Counts games and picks which ones are traced in full."""
+
+    def __init__(self):
+        self.games = 0
+        self.current = GameTrace()
+
+    def begin_game(self, game_id: str, sample_every: int) -> GameTrace:
+        self.games += 1
+        full = sample_every <= 1 or (self.games - 1) % sample_every == 0
+        self.current = GameTrace(game_id=str(game_id), number=self.games, full=full)
+        return self.current
+
+
+_sampler = GameSampler()
+
+
+def _get_sampler() -> GameSampler:
+    session = current_session()
+    if session is not None:
+        return session.scoped('game_sampler', GameSampler)
+    return _sampler
+
+
+def current_game_trace() -> GameTrace:
+    """Sampling decision for the game being played (full trace outside games)."""
+    return _get_sampler().current
+
+
+@contextmanager
+def quiet() -> Iterator[None]:
+    """
+    Keep only warnings from engine logging in this greenlet/thread.
+
+    Other greenlets (game sessions) and threads keep logging normally;
+    logger levels are not touched.
+    """
+    key = task_key()
+    _quiet_tasks[key] = _quiet_tasks.get(key, 0) + 1
+    try:
+        yield
+    finally:
+        depth = _quiet_tasks.pop(key) - 1
+        if depth:
+            _quiet_tasks[key] = depth
+
+
+def is_quiet() -> bool:
+    """Is the running greenlet/thread inside a quiet() block?"""
+    return bool(_quiet_tasks) and task_key() in _quiet_tasks
+
+
+def configure_tracing(config: Dict[str, Any] = None) -> None:
+    """
+    Apply the per-subsystem levels and the summary level.
+
+    Args:
+        config: Optional dict (strategy config 'tracing' section); see module docstring
+    """
+    global _summary_level
+    config = config or {}
+    _summary_level = logging.getLevelName(str(config.get('summary_level', 'WARNING')).upper())
+    if not isinstance(_summary_level, int):
+        _summary_level = logging.WARNING
+    for subsystem, prefixes in SUBSYSTEMS.items():
+        level = config.get(f'{subsystem}_level')
+        if level is None:
+            continue
+        level = logging.getLevelName(str(level).upper())
+        if not isinstance(level, int):
+            logger.warning(f"⚠️  Invalid tracing level for {subsystem}: {config.get(f'{subsystem}_level')}")
+            continue
+        for prefix in prefixes:
+            logging.getLogger(prefix).setLevel(level)
+
+
+def begin_game(game_id: str) -> GameTrace:
+    """Start a game: re-read the tracing config and decide whether to trace it in full."""
+    config = get_config().get_section('tracing')
+    configure_tracing(config)
+    sample_every = int(config.get('sample_every', 1))
+    trace = _get_sampler().begin_game(game_id, sample_every)
+    if sample_every > 1:
+        mode = "full trace" if trace.full else "summaries only"
+        logger.info(f"🔍 Tracing game {trace.number} ({game_id}): {mode} (1 in {sample_every} games traced)")
+    return trace
+
+
+class TraceFilter(logging.Filter):
+    """
+    Handler filter: drop detail records of traced subsystems in unsampled
+    games, and engine records below WARNING inside quiet() blocks.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING and is_quiet() and \
+                (record.name == 'engine' or record.name.startswith('engine.')):
+            return False
+        if record.levelno >= _summary_level or getattr(record, 'trace_summary', False):
+            return True
+        if current_game_trace().full:
+            return True
+        return subsystem_for(record.name) is None
+
+
+# =============================================================================
+# TRACERS
+# =============================================================================
+
+class Tracer:
+    """
+    Lazy, sampled logging for one module of a traced subsystem.
+
+    Has the Logger call interface, so a traced module uses it as its module
+    logger: in an unsampled game its detail calls return before a LogRecord
+    is built or a handler runs.
+    """
+
+    def __init__(self, subsystem: str, log: logging.Logger):
+        self.subsystem = subsystem
+        self.logger = log
+        self.name = log.name
+
+    def enabled(self, level: int = logging.INFO) -> bool:
+        """Would a record at level be kept? Guard expensive logging blocks with this."""
+        if not self.logger.isEnabledFor(level):
+            return False
+        if level < logging.WARNING and is_quiet():
+            return False
+        return level >= _summary_level or current_game_trace().full
+
+    isEnabledFor = enabled
+
+    def debug(self, msg: Message, *args, **kwargs) -> None:
+        self._log(logging.DEBUG, msg, args, kwargs)
+
+    def info(self, msg: Message, *args, **kwargs) -> None:
+        self._log(logging.INFO, msg, args, kwargs)
+
+    def warning(self, msg: Message, *args, **kwargs) -> None:
+        self._log(logging.WARNING, msg, args, kwargs)
+
+    def error(self, msg: Message, *args, **kwargs) -> None:
+        self._log(logging.ERROR, msg, args, kwargs)
+
+    def exception(self, msg: Message, *args, exc_info=True, **kwargs) -> None:
+        self._log(logging.ERROR, msg, args, dict(kwargs, exc_info=exc_info))
+
+    def log(self, level: int, msg: Message, *args, **kwargs) -> None:
+        self._log(level, msg, args, kwargs)
+
+    def summary(self, msg: Message, *args) -> None:
+        """An INFO record kept in every game, sampled or not (but not in quiet() blocks)."""
+        if self.logger.isEnabledFor(logging.INFO) and not is_quiet():
+            self.logger.info(msg() if callable(msg) else msg, *args,
+                             extra={'trace_summary': True}, stacklevel=2)
+
+    def _log(self, level: int, msg: Message, args: tuple, kwargs: dict) -> None:
+        if not self.enabled(level):
+            return
+        self.logger.log(level, msg() if callable(msg) else msg, *args, stacklevel=3, **kwargs)
+
+
+def get_tracer(subsystem: str, log: logging.Logger = None) -> Tracer:
+    """Tracer for a module's logger (default: the subsystem's first logger)."""
+    if subsystem not in SUBSYSTEMS:
+        raise ValueError(f"Unknown tracing subsystem: {subsystem}")
+    return Tracer(subsystem, log or logging.getLogger(SUBSYSTEMS[subsystem][0]))
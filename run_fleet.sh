@@ -0,0 +1,16 @@
+#!/bin/bash
+# Run all bot accounts from configs/fleet.json under one supervisor
+# (replaces run_bot1.sh..run_bot10.sh).
+#
+#   ./run_fleet.sh                          # all 10 bots
+#   ./run_fleet.sh --only rando_cal randoblu   # one bot pair
+#
+# Fleet admin: http://<host>:5000/health
+cd /mnt/ubuntu-lv/swccg/gemp/rando_cal_working/new_rando
+source venv/bin/activate
+export GEMP_PASSWORD="${GEMP_PASSWORD:-battmann}"
+
+# Strategy config (use baseline.json by default, or set to experimental.json for testing)
+export STRATEGY_CONFIG="${STRATEGY_CONFIG:-configs/baseline.json}"
+
+python supervisor.py "$@"
@@ -0,0 +1,628 @@
+#!/usr/bin/env python3
+"""
+Rando Cal - Fleet Supervisor
+
+Runs every bot account from one process tree instead of one
+run_botN.sh / app.py process per account.
+
+The supervisor warms up the shared read-only state once (card database,
+title index, combo data, gametext parses, the engine modules and
+optionally the neural deploy model), freezes it out of the garbage
+collector and then forks one worker per bot. Workers share those pages
+copy-on-write; each applies its own environment (GEMP_USERNAME, BOT_PORT,
+table prefix, deck...) and runs app.py exactly as `python app.py` would,
+with its own Flask/SocketIO server on its own port.
+
+The supervisor restarts workers that exit according to the fleet's
+restart policy, and serves one admin endpoint for the whole fleet.
+The supervisor stays single-threaded: it forks workers at any time
+(restarts), and a fork while another thread holds a lock (logging, the
+admin server) could deadlock the child. The admin endpoint is answered
+from the supervise loop instead of a server thread.
+
+Usage:
+    python supervisor.py                              # every bot in configs/fleet.json
+    python supervisor.py --only rando_cal randoblu    # one bot pair
+    python supervisor.py --fleet my_fleet.json --admin-port 5100
+
+Admin endpoint:
+    GET /health  - supervisor status plus, per bot: pid, state, restarts,
+                   uptime, startup time, memory (RSS/PSS in MB) and the
+                   bot's own /health response
+"""
+
+import argparse
+import errno
+import gc
+import importlib
+import json
+import logging
+import os
+import selectors
+import signal
+import socket
+import sys
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_FLEET_PATH = os.path.join(BASE_DIR, 'configs', 'fleet.json')
+
+# Modules that read os.environ at import time. Workers reload them (if the
+# warm-up imported them) after applying their own environment.
+ENV_DEPENDENT_MODULES = ('settings', 'engine.game_state_logger', 'engine.decision_logger')
+
+# Imported during warm-up so workers share the loaded code
+DEFAULT_WARM_MODULES = [
+    'engine.board_state',
+    'engine.event_processor',
+    'engine.deploy_planner',
+    'engine.decision_handler',
+    'engine.strategy_controller',
+    'engine.evaluators',
+    'brain',
+    'persistence',
+    'flask',
+]
+
+RESTART_POLICIES = ('on-failure', 'always', 'never')
+
+# Overall deadlines for probing the bots' own /health endpoints (all bots
+# are probed at once, so these bound the whole probe, not each bot)
+READY_PROBE_SECONDS = 0.2
+STATUS_PROBE_SECONDS = 1.0
+
+logger = logging.getLogger('supervisor')
+
+
+# =============================================================================
+# FLEET SPEC
+# =============================================================================
+
+@dataclass
+class BotSpec:
+    """One bot account: a name and the environment app.py runs with."""
+    name: str
+    env: Dict[str, str]
+
+    @property
+    def port(self) -> int:
+        return int(self.env.get('BOT_PORT', '5001'))
+
+
+@dataclass
+class FleetSpec:
+    """Bots to run plus supervisor settings (see configs/fleet.json)."""
+    bots: List[BotSpec]
+    admin_host: str = '127.0.0.1'
+    admin_port: int = 5000
+    restart_policy: str = 'on-failure'
+    max_restarts: int = 5
+    restart_backoff: float = 5.0
+    stop_timeout: float = 10.0
+    warm_gametext: bool = True
+    warm_modules: List[str] = field(default_factory=lambda: list(DEFAULT_WARM_MODULES))
+    preload_model: Optional[str] = None
+
+
+def load_fleet(path: str, only: Optional[List[str]] = None) -> FleetSpec:
+    """
+    Load a fleet file.
+
+    The top-level "env" applies to every bot; each bot's "env" overrides
+    it. A bot's name defaults to its GEMP_USERNAME. Values are passed to
+    the worker as strings, and anything not set falls through from the
+    supervisor's own environment (e.g. GEMP_PASSWORD).
+
+    Args:
+        path: Fleet JSON file
+        only: Bot names to keep (default: all)
+
+    Raises:
+        ValueError: Unknown/duplicate bot names, duplicate ports or a bad
+            restart policy
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        raw = json.load(f)
+
+    shared_env = {k: str(v) for k, v in raw.get('env', {}).items()}
+    bots = []
+    for entry in raw.get('bots', []):
+        env = dict(shared_env)
+        env.update({k: str(v) for k, v in entry.get('env', {}).items()})
+        name = entry.get('name') or env.get('GEMP_USERNAME')
+        if not name:
+            raise ValueError(f"Bot without a name or GEMP_USERNAME in {path}")
+        env.setdefault('GEMP_USERNAME', name)
+        bots.append(BotSpec(name=name, env=env))
+
+    names = [bot.name for bot in bots]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate bot names in {path}")
+    ports = [bot.port for bot in bots]
+    if len(set(ports)) != len(ports):
+        raise ValueError(f"Duplicate BOT_PORT values in {path}")
+
+    if only:
+        unknown = set(only) - set(names)
+        if unknown:
+            raise ValueError(f"Unknown bots: {sorted(unknown)}")
+        bots = [bot for bot in bots if bot.name in only]
+
+    restart = raw.get('restart', {})
+    warm = raw.get('warm', {})
+    fleet = FleetSpec(
+        bots=bots,
+        admin_host=raw.get('admin_host', '127.0.0.1'),
+        admin_port=int(raw.get('admin_port', 5000)),
+        restart_policy=restart.get('policy', 'on-failure'),
+        max_restarts=int(restart.get('max_restarts', 5)),
+        restart_backoff=float(restart.get('backoff_seconds', 5.0)),
+        stop_timeout=float(raw.get('stop_timeout_seconds', 10.0)),
+        warm_gametext=bool(warm.get('gametext', True)),
+        warm_modules=list(warm.get('modules', DEFAULT_WARM_MODULES)),
+        preload_model=warm.get('preload_model'),
+    )
+    if fleet.restart_policy not in RESTART_POLICIES:
+        raise ValueError(f"Unknown restart policy '{fleet.restart_policy}' "
+                         f"(expected one of {RESTART_POLICIES})")
+    return fleet
+
+
+def should_restart(policy: str, exit_code: int, restarts: int, max_restarts: int) -> bool:
+    """Whether a worker that exited with exit_code gets restarted."""
+    if restarts >= max_restarts:
+        return False
+    if policy == 'always':
+        return True
+    if policy == 'on-failure':
+        return exit_code != 0
+    return False
+
+
+# =============================================================================
+# WARM-UP (parent) AND BOT ENTRY (worker)
+# =============================================================================
+
+def warm_up(fleet: FleetSpec) -> Dict[str, Any]:
+    """
+    Load the shared read-only state before forking.
+
+    Nothing here may start threads, open sockets or read per-bot
+    environment; workers inherit the result.
+
+    Returns:
+        Timings and counts for the startup log
+    """
+    stats: Dict[str, Any] = {}
+    start = time.perf_counter()
+
+    from engine.card_loader import get_card_database
+    db = get_card_database()
+    _ = db.title_index, db.combo_data
+    stats['cards'] = len(db.cards)
+
+    if fleet.warm_gametext:
+        for card in db.cards.values():
+            _ = card.parsed
+        stats['gametext_parsed'] = len(db.cards)
+
+    for module_name in fleet.warm_modules:
+        importlib.import_module(module_name)
+    stats['modules'] = len(fleet.warm_modules)
+
+    if fleet.preload_model:
+        try:
+            from engine.neural_planner.neural_deploy_planner import preload_network
+            stats['model_preloaded'] = preload_network(fleet.preload_model)
+        except ImportError as e:
+            logger.warning(f"⚠️ Neural planner not available, skipping model preload ({e})")
+            stats['model_preloaded'] = False
+
+    # Move everything loaded so far out of the GC's reach: collections in the
+    # workers would otherwise write to these objects' headers and un-share pages
+    gc.collect()
+    gc.freeze()
+
+    stats['seconds'] = round(time.perf_counter() - start, 2)
+    return stats
+
+
+def run_bot(spec: BotSpec):
+    """
+    Worker entry point: apply the bot's environment and run app.py.
+
+    Runs in the forked child; only returns when the bot's server stops.
+    """
+    os.chdir(BASE_DIR)
+    os.environ.update(spec.env)
+
+    # app.py configures logging with basicConfig(), which is a no-op while
+    # the supervisor's handlers are still installed
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+    from config import config
+    config.reload_env()
+    for module_name in ENV_DEPENDENT_MODULES:
+        if module_name in sys.modules:
+            importlib.reload(sys.modules[module_name])
+
+    from engine import strategy_config
+    strategy_config.set_config_path(os.environ.get('STRATEGY_CONFIG'))
+
+    import runpy
+    runpy.run_module('app', run_name='__main__', alter_sys=True)
+
+
+# =============================================================================
+# SUPERVISOR
+# =============================================================================
+
+@dataclass
+class BotProcess:
+    """Lifecycle state of one worker."""
+    spec: BotSpec
+    pid: Optional[int] = None
+    state: str = 'pending'          # pending, starting, running, exited, failed, stopped
+    restarts: int = 0
+    exit_code: Optional[int] = None
+    started_at: float = 0.0
+    startup_seconds: Optional[float] = None
+    restart_at: Optional[float] = None
+
+
+class Supervisor:
+    """
+    Forks, watches and restarts bot workers.
+
+    Example usage:
+        fleet = load_fleet('configs/fleet.json')
+        warm_up(fleet)
+        Supervisor(fleet).run()
+    """
+
+    def __init__(self, fleet: FleetSpec, target: Callable[[BotSpec], Any] = run_bot):
+        self.fleet = fleet
+        self.target = target
+        self.bots = {spec.name: BotProcess(spec) for spec in fleet.bots}
+        self.started_at = time.monotonic()
+        self.fleet_ready_seconds: Optional[float] = None
+        self._stopping = False
+        self._admin_server: Optional[HTTPServer] = None
+
+    # --- lifecycle ---
+
+    def spawn(self, bot: BotProcess):
+        """Fork a worker for one bot."""
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                if self._admin_server:
+                    self._admin_server.socket.close()
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                self.target(bot.spec)
+                exit_code = 0
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except BaseException:
+                logger.exception(f"❌ Bot {bot.spec.name} crashed")
+            finally:
+                os._exit(exit_code)
+
+        bot.pid = pid
+        bot.state = 'starting'
+        bot.exit_code = None
+        bot.started_at = time.monotonic()
+        bot.startup_seconds = None
+        bot.restart_at = None
+        logger.info(f"🚀 Started {bot.spec.name} (pid {pid}, port {bot.spec.port})")
+
+    def start(self):
+        """Fork every worker."""
+        for bot in self.bots.values():
+            self.spawn(bot)
+
+    def reap(self):
+        """Collect exited workers and schedule restarts."""
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            bot = next((b for b in self.bots.values() if b.pid == pid), None)
+            if bot is None:
+                continue
+            self._on_exit(bot, os.waitstatus_to_exitcode(status))
+
+    def _on_exit(self, bot: BotProcess, exit_code: int):
+        bot.pid = None
+        bot.exit_code = exit_code
+        if self._stopping:
+            bot.state = 'stopped'
+            return
+
+        bot.state = 'failed' if exit_code != 0 else 'exited'
+        if should_restart(self.fleet.restart_policy, exit_code, bot.restarts, self.fleet.max_restarts):
+            delay = self.fleet.restart_backoff * (2 ** bot.restarts)
+            bot.restart_at = time.monotonic() + delay
+            logger.warning(f"⚠️ {bot.spec.name} exited with code {exit_code}, restarting in {delay:.1f}s")
+        else:
+            logger.info(f"🛑 {bot.spec.name} exited with code {exit_code} (restarts={bot.restarts}), not restarting")
+
+    def restart_due(self):
+        """Re-fork workers whose restart backoff has elapsed."""
+        now = time.monotonic()
+        for bot in self.bots.values():
+            if bot.pid is None and bot.restart_at is not None and now >= bot.restart_at:
+                bot.restarts += 1
+                self.spawn(bot)
+
+    def check_ready(self):
+        """Record startup time of workers whose server started answering."""
+        starting = [b for b in self.bots.values() if b.state == 'starting' and b.pid is not None]
+        health = _probe_health([b.spec.port for b in starting], READY_PROBE_SECONDS)
+        for bot in starting:
+            if health[bot.spec.port]:
+                bot.state = 'running'
+                bot.startup_seconds = round(time.monotonic() - bot.started_at, 2)
+                logger.info(f"✅ {bot.spec.name} ready in {bot.startup_seconds}s")
+
+        if self.fleet_ready_seconds is None and self.bots and \
+                all(b.startup_seconds is not None for b in self.bots.values()):
+            self.fleet_ready_seconds = round(time.monotonic() - self.started_at, 2)
+            logger.info(f"✅ Fleet ready: {len(self.bots)} bots in {self.fleet_ready_seconds}s")
+
+    def active(self) -> bool:
+        """Whether any worker is running or waiting to be restarted."""
+        return any(b.pid is not None or b.restart_at is not None for b in self.bots.values())
+
+    def stop(self):
+        """SIGTERM every worker, then SIGKILL those still alive after stop_timeout."""
+        self._stopping = True
+        for bot in self.bots.values():
+            bot.restart_at = None
+            if bot.pid is not None:
+                _signal(bot.pid, signal.SIGTERM)
+
+        deadline = time.monotonic() + self.fleet.stop_timeout
+        while time.monotonic() < deadline and any(b.pid is not None for b in self.bots.values()):
+            self.reap()
+            time.sleep(0.1)
+
+        for bot in self.bots.values():
+            if bot.pid is not None:
+                logger.warning(f"⚠️ {bot.spec.name} did not stop, killing pid {bot.pid}")
+                _signal(bot.pid, signal.SIGKILL)
+        self.reap()
+
+    def run(self, poll_interval: float = 0.5):
+        """Start the fleet and supervise it until every worker is done or we are signalled."""
+        def _request_stop(signum, frame):
+            logger.info(f"🛑 Received signal {signum}, stopping fleet")
+            self._stopping = True
+
+        signal.signal(signal.SIGTERM, _request_stop)
+        signal.signal(signal.SIGINT, _request_stop)
+
+        self.start()
+        self.serve_admin()
+        try:
+            while not self._stopping and self.active():
+                self.reap()
+                self.restart_due()
+                self.check_ready()
+                self.wait(poll_interval)
+        finally:
+            self.stop()
+            if self._admin_server:
+                self._admin_server.server_close()
+        logger.info("👋 Supervisor stopped")
+
+    # --- admin endpoint ---
+
+    def status(self) -> Dict[str, Any]:
+        """Aggregated fleet status for the admin endpoint."""
+        now = time.monotonic()
+        health = _probe_health([b.spec.port for b in self.bots.values() if b.state == 'running'],
+                               STATUS_PROBE_SECONDS)
+        bots = {}
+        for name, bot in self.bots.items():
+            bots[name] = {
+                'pid': bot.pid,
+                'port': bot.spec.port,
+                'state': bot.state,
+                'restarts': bot.restarts,
+                'exit_code': bot.exit_code,
+                'uptime_seconds': round(now - bot.started_at, 1) if bot.pid else None,
+                'startup_seconds': bot.startup_seconds,
+                'memory_mb': _process_memory_mb(bot.pid) if bot.pid else {},
+                'health': health.get(bot.spec.port) if bot.state == 'running' else None,
+            }
+        return {
+            'status': 'ok',
+            'pid': os.getpid(),
+            'uptime_seconds': round(now - self.started_at, 1),
+            'fleet_ready_seconds': self.fleet_ready_seconds,
+            'restart_policy': self.fleet.restart_policy,
+            'bots': bots,
+        }
+
+    def serve_admin(self):
+        """Open the GET /health endpoint; wait() answers its requests."""
+        supervisor = self
+
+        class AdminHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip('/') not in ('', '/health'):
+                    self.send_error(404)
+                    return
+                body = json.dumps(supervisor.status(), indent=2).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        try:
+            self._admin_server = HTTPServer((self.fleet.admin_host, self.fleet.admin_port), AdminHandler)
+        except OSError as e:
+            logger.error(f"❌ Admin endpoint unavailable on port {self.fleet.admin_port}: {e}")
+            return
+        logger.info(f"📊 Fleet admin: http://{self.fleet.admin_host}:{self.fleet.admin_port}/health")
+
+    def wait(self, timeout: float):
+        """Sleep for timeout seconds, answering admin requests meanwhile."""
+        if self._admin_server is None:
+            time.sleep(timeout)
+            return
+        deadline = time.monotonic() + timeout
+        while not self._stopping:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            self._admin_server.timeout = remaining
+            self._admin_server.handle_request()
+
+
+def _signal(pid: int, signum: int):
+    try:
+        os.kill(pid, signum)
+    except ProcessLookupError:
+        pass
+
+
+def _probe_health(ports: List[int], timeout: float) -> Dict[int, Optional[Dict[str, Any]]]:
+    """
+    Each bot's own /health response by port (None if it doesn't answer).
+
+    Every port is probed at once over non-blocking sockets with one
+    deadline, so the supervise loop (which also answers the admin
+    endpoint) is held up for at most timeout seconds however many bots
+    are slow.
+    """
+    results: Dict[int, Optional[Dict[str, Any]]] = {port: None for port in ports}
+    request = b'GET /health HTTP/1.0\r\nHost: 127.0.0.1\r\n\r\n'
+    selector = selectors.DefaultSelector()
+    for port in ports:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        if sock.connect_ex(('127.0.0.1', port)) not in (0, errno.EINPROGRESS):
+            sock.close()
+            continue
+        selector.register(sock, selectors.EVENT_WRITE, (port, bytearray()))
+
+    deadline = time.monotonic() + timeout
+    try:
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in selector.select(remaining):
+                sock, (port, received) = key.fileobj, key.data
+                try:
+                    if key.events == selectors.EVENT_WRITE:
+                        if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) or \
+                                sock.send(request) != len(request):
+                            raise OSError("health request not sent")
+                        selector.modify(sock, selectors.EVENT_READ, key.data)
+                        continue
+                    chunk = sock.recv(65536)
+                    if chunk:
+                        received += chunk
+                        continue
+                    results[port] = _parse_health(bytes(received))
+                except OSError:
+                    pass
+                selector.unregister(sock)
+                sock.close()
+    finally:
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+        selector.close()
+    return results
+
+
+def _parse_health(response: bytes) -> Optional[Dict[str, Any]]:
+    """JSON body of a 2xx HTTP response, or None."""
+    head, _, body = response.partition(b'\r\n\r\n')
+    status = head.split(b' ', 2)
+    if len(status) < 2 or not status[1].startswith(b'2'):
+        return None
+    try:
+        return json.loads(body.decode('utf-8'))
+    except ValueError:
+        return None
+
+
+def _process_memory_mb(pid: int) -> Dict[str, float]:
+    """
+    RSS and PSS of a process in MB (Linux only, {} elsewhere).
+
+    PSS splits shared pages between the processes sharing them, so it is
+    the per-bot cost once the warm-up state is shared.
+    """
+    memory = {}
+    try:
+        with open(f'/proc/{pid}/smaps_rollup', 'r') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key in ('Rss', 'Pss'):
+                    memory[key.lower()] = round(int(value.split()[0]) / 1024, 1)
+    except (OSError, ValueError, IndexError):
+        return {}
+    return memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a fleet of bots from one supervisor process')
+    parser.add_argument('--fleet', type=str, default=DEFAULT_FLEET_PATH,
+                        help='Fleet JSON file (default: configs/fleet.json)')
+    parser.add_argument('--only', nargs='+', default=None,
+                        help='Only run these bots (by name)')
+    parser.add_argument('--admin-port', type=int, default=None,
+                        help='Port for the fleet admin endpoint (overrides the fleet file)')
+
+    args = parser.parse_args()
+
+    os.makedirs(os.path.join(BASE_DIR, 'logs'), exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(os.path.join(BASE_DIR, 'logs', 'supervisor.log')),
+            logging.StreamHandler()
+        ]
+    )
+
+    sys.path.insert(0, BASE_DIR)
+    fleet = load_fleet(args.fleet, args.only)
+    if args.admin_port is not None:
+        fleet.admin_port = args.admin_port
+    if not fleet.bots:
+        logger.error("❌ No bots in fleet")
+        sys.exit(1)
+
+    logger.info('=' * 60)
+    logger.info(f'🤖 Rando Cal Fleet Supervisor: {len(fleet.bots)} bots')
+    logger.info('=' * 60)
+
+    stats = warm_up(fleet)
+    logger.info(f"🔥 Warm-up done in {stats['seconds']}s: {stats}")
+
+    Supervisor(fleet).run()
+
+
+if __name__ == '__main__':
+    main()
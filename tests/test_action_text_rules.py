@@ -0,0 +1,88 @@
+"""
+Action Text Rule Dispatch Test Suite
+
+Tests the precompiled rule table used by ActionTextEvaluator:
+1. TextRuleMatcher picks the same rule as checking every rule in order
+2. Anchors that overlap (e.g. "cancel" / "cancel your") are all detected
+3. Per-rule hit counters
+
+Run with: python -m pytest tests/test_action_text_rules.py -v
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from engine.evaluators.action_text_evaluator import (
+    ACTION_TEXT_RULES,
+    ActionTextEvaluator,
+    TextRuleMatcher,
+)
+from engine.evaluators.base import DecisionContext
+from engine.board_state import BoardState
+
+
+SAMPLE_TEXTS = [
+    "Activate Force", "Force drain", "Draw race destiny", "Play a card", "Fire Blaster Rifle",
+    "Add 1 to battle destiny", "+1 to battle destiny", "Add 2 to weapon destiny",
+    "Prevent opponent from canceling battle destiny draws", "Prevent battle destiny",
+    "Take Admiral Ackbar into hand", "Substitute destiny", "React", "Steal weapon",
+    "Play Sabacc", "Cancel your Effect", "Cancel Sense", "Cancel and redraw destiny",
+    "Cancel weapon target", "Make immune to attrition", "Protect forfeit", "Re-target weapon",
+    "Cancel alien's game text", "Cancel", "Use to cancel", "Cancel all remaining battle damage",
+    "Take card into hand", "Prevent Han from battling or moving", "LOST: Reveal opponent's hand",
+    "Stardust", "Draw card into hand from Force Pile", "Move using landspeed", "Take off", "Land",
+    "Make opponent lose 1 Force", "Deploy docking bay", "Deploy from Reserve Deck",
+    "Lock s-foils", "Place card from hand in Used Pile", "Embark", "Disembark", "Ship-dock",
+    "Place in Lost Pile", "'Grab' Sense", "Break cover", "Place out of play to retrieve Force",
+    "Play a Defensive Shield", "USED: Peek at top of Reserve Deck", "Add to power",
+    "Cancel Force drain", "Peek at top of opponent's Reserve Deck", "Use 3 Force to draw",
+    "Lose 1 Force", "Something nobody has seen before",
+]
+
+
+def _linear_match(action_text, board_state):
+    text_lower = action_text.lower()
+    for rule in ACTION_TEXT_RULES:
+        if rule.condition(action_text, text_lower, board_state):
+            return rule
+    return None
+
+
+class TestTextRuleMatcher:
+
+    @pytest.mark.parametrize("board_state", [None, BoardState("me")])
+    def test_matches_linear_scan(self, board_state):
+        matcher = TextRuleMatcher(ACTION_TEXT_RULES)
+        for text in SAMPLE_TEXTS + [t.upper() for t in SAMPLE_TEXTS]:
+            expected = _linear_match(text, board_state)
+            assert matcher.match(text, text.lower(), board_state) is expected, text
+
+    def test_anchors_are_necessary(self):
+        # A rule whose condition holds must always be among the candidates
+        matcher = TextRuleMatcher(ACTION_TEXT_RULES)
+        for text in SAMPLE_TEXTS:
+            candidates = matcher.candidates(text.lower())
+            for rule in ACTION_TEXT_RULES:
+                if rule.condition(text, text.lower(), BoardState("me")):
+                    assert rule in candidates, (rule.name, text)
+
+    def test_overlapping_anchors(self):
+        matcher = TextRuleMatcher(ACTION_TEXT_RULES)
+        names = {rule.name for rule in matcher.candidates("cancel your effect")}
+        assert {'cancel_own_card', 'cancel_opponent_card', 'cancel_generic'} <= names
+
+
+class TestRuleHitCounters:
+
+    def test_counts_rules(self):
+        evaluator = ActionTextEvaluator()
+        texts = ["Draw race destiny", "Draw race destiny", "Stardust", "Something odd"]
+        context = DecisionContext(
+            board_state=None, decision_type='CARD_ACTION_CHOICE', decision_text='',
+            decision_id='1', phase='DEPLOY', turn_number=1, is_my_turn=True,
+            action_ids=[str(i) for i in range(len(texts))], action_texts=texts,
+        )
+        evaluator.evaluate(context)
+        assert evaluator.get_rule_stats() == {'race_destiny': 2, 'dangerous_card': 1, 'unknown': 1}
@@ -0,0 +1,153 @@
+"""
+Battle Odds Test Suite
+
+Tests the exact battle outcome distribution engine:
+1. Destiny totals of N draws match brute-force enumeration
+2. Win/tie/lose and expected margin match brute-force enumeration
+3. Attrition, forfeit coverage and attrition immunity
+4. Destiny keys and caching
+5. MonteCarloSimulator reports the exact win probability
+
+Run with: python -m pytest tests/test_battle_odds.py -v
+"""
+
+import sys
+import os
+import itertools
+import random
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from engine.battle_odds import (
+    DEFAULT_DESTINY,
+    BattleSide,
+    ForfeitCard,
+    battle_destiny_draws,
+    battle_odds,
+    destiny_key,
+    destiny_total_distribution,
+    _resolve_losses,
+)
+from engine.monte_carlo import MonteCarloSimulator
+
+
+def _brute_force(us, them):
+    """Enumerate every combination of individual draws."""
+    win = tie = lose = margin_sum = 0.0
+    our_attrition = 0.0
+    for ours in itertools.product(us.destiny, repeat=us.draws):
+        for theirs in itertools.product(them.destiny, repeat=them.draws):
+            p = 1.0
+            for _, prob in ours + theirs:
+                p *= prob
+            our_destiny = sum(value for value, _ in ours)
+            their_destiny = sum(value for value, _ in theirs)
+            margin = (us.power + our_destiny) - (them.power + their_destiny)
+            margin_sum += margin * p
+            our_attrition += their_destiny * p
+            if margin > 0:
+                win += p
+            elif margin < 0:
+                lose += p
+            else:
+                tie += p
+    return win, tie, lose, margin_sum, our_attrition
+
+
+class TestConvolution:
+
+    @pytest.mark.parametrize("draws", [0, 1, 2, 3])
+    def test_totals_match_enumeration(self, draws):
+        expected = {}
+        for combo in itertools.product(DEFAULT_DESTINY, repeat=draws):
+            p = 1.0
+            for _, prob in combo:
+                p *= prob
+            total = sum(value for value, _ in combo)
+            expected[total] = expected.get(total, 0.0) + p
+        result = dict(destiny_total_distribution(DEFAULT_DESTINY, draws))
+        assert result.keys() == expected.keys()
+        for total, p in expected.items():
+            assert result[total] == pytest.approx(p)
+        assert sum(result.values()) == pytest.approx(1.0)
+
+    def test_draws_follow_ability_test(self):
+        assert battle_destiny_draws(False, 2) == 0
+        assert battle_destiny_draws(True) == 1
+        assert battle_destiny_draws(True, 1) == 2
+
+
+class TestOutcomeDistribution:
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_brute_force(self, seed):
+        rng = random.Random(seed)
+        destiny = destiny_key({v: rng.random() for v in rng.sample(range(0, 8), rng.randint(1, 5))})
+        us = BattleSide(power=rng.randint(0, 12), draws=rng.randint(0, 2), destiny=destiny)
+        them = BattleSide(power=rng.randint(0, 12), draws=rng.randint(0, 2))
+        win, tie, lose, margin, attrition = _brute_force(us, them)
+        odds = battle_odds(us, them)
+        assert odds.win == pytest.approx(win)
+        assert odds.tie == pytest.approx(tie)
+        assert odds.lose == pytest.approx(lose)
+        assert odds.expected_margin == pytest.approx(margin)
+        assert odds.our_losses.attrition == pytest.approx(attrition)
+        assert odds.win + odds.tie + odds.lose == pytest.approx(1.0)
+
+    def test_no_destiny_is_power_comparison(self):
+        odds = battle_odds(BattleSide(power=8), BattleSide(power=5))
+        assert (odds.win, odds.tie, odds.lose) == (1.0, 0.0, 0.0)
+        assert odds.their_losses.damage == 3
+        assert odds.our_losses.attrition == 0
+        assert odds.probability_margin_at_least(3) == 1.0
+        assert odds.probability_margin_at_least(4) == 0.0
+
+
+class TestLosses:
+
+    def test_forfeit_covers_attrition_and_damage(self):
+        cards = (ForfeitCard(forfeit=3, power=2), ForfeitCard(forfeit=5, power=6))
+        # Weakest card first; its forfeit 3 covers attrition 2 and 3 of the 5 damage
+        assert _resolve_losses(cards, 2, 5) == (1, 2, 2)
+        # Attrition 4 needs both cards; their forfeit 8 covers all damage
+        assert _resolve_losses(cards, 4, 6) == (2, 8, 0)
+
+    def test_attrition_immunity(self):
+        cards = (ForfeitCard(forfeit=4, power=5, immune_below=4),)
+        assert _resolve_losses(cards, 3, 3) == (0, 0, 3)   # immune: attrition 3 < 4
+        assert _resolve_losses(cards, 4, 0) == (1, 5, 0)   # not immune to 4
+
+    def test_expected_losses(self):
+        # We draw nothing, they always draw a 3: attrition 3 every time, we lose by 1
+        us = BattleSide(power=5, cards=(ForfeitCard(forfeit=2, power=3), ForfeitCard(forfeit=2, power=4)))
+        them = BattleSide(power=3, draws=1, destiny=((3, 1.0),))
+        odds = battle_odds(us, them)
+        assert odds.lose == 1.0
+        assert odds.our_losses.attrition == 3
+        assert odds.our_losses.cards_forfeited == 2
+        assert odds.our_losses.power_lost == 7
+        assert odds.our_losses.force_lost == 0
+        assert odds.their_losses == type(odds.their_losses)()
+
+
+class TestKeys:
+
+    def test_destiny_key_normalizes(self):
+        assert destiny_key({3: 2, 1: 2}) == ((1, 0.5), (3, 0.5))
+        assert destiny_key({}) == ((0, 1.0),)
+
+    def test_equal_sides_share_cache(self):
+        battle_odds.cache_clear()
+        battle_odds(BattleSide(power=5, draws=1), BattleSide(power=4, draws=1))
+        battle_odds(BattleSide(power=5, draws=1), BattleSide(power=4, draws=1))
+        assert battle_odds.cache_info().hits == 1
+
+
+class TestSimulatorIntegration:
+
+    def test_resolve_battle_reports_win_probability(self):
+        sim = MonteCarloSimulator()
+        result = sim._resolve_battle({'our_power': 8, 'their_power': 5})
+        expected = battle_odds(BattleSide(power=8, draws=1), BattleSide(power=5, draws=1)).win
+        assert result['win_probability'] == pytest.approx(expected)
+        assert 0.5 < result['win_probability'] < 1.0
@@ -0,0 +1,120 @@
+"""
+Board Query Cache Test Suite
+
+Tests memoization of derived BoardState queries on the board version:
+1. Attribute assignments, card/location changes and events bump the version
+2. Repeated queries with no change in between are cache hits
+3. Any change recomputes; arguments are part of the key
+4. Mutable results are copied so callers cannot corrupt the cache
+
+Run with: python -m pytest tests/test_board_query_cache.py -v
+"""
+
+import sys
+import os
+import xml.etree.ElementTree as ET
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from engine import card_loader
+from engine import game_state_logger
+from engine.board_state import (
+    BoardState,
+    CardInPlay,
+    LocationInPlay,
+    query_cache_stats,
+    reset_query_cache_stats,
+)
+from engine.event_processor import EventProcessor
+
+CARDS = {
+    "bp_trooper": SimpleNamespace(title="Trooper", power_value=3, deploy_value=2, is_starship=False,
+                                  is_pilot=False, is_warrior=True, has_permanent_pilot=False),
+    "bp_vader": SimpleNamespace(title="Vader", power_value=6, deploy_value=6, is_starship=False,
+                                is_pilot=True, is_warrior=True, has_permanent_pilot=False),
+}
+
+
+@pytest.fixture(autouse=True)
+def no_game_state_log(monkeypatch):
+    """Keep EventProcessor from writing the recorded game in logs/."""
+    monkeypatch.setattr(game_state_logger, 'log_game_event', lambda event, event_type: None)
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    calls = []
+
+    def get_card(blueprint_id):
+        calls.append(blueprint_id)
+        return CARDS.get(blueprint_id)
+
+    monkeypatch.setattr(card_loader, 'get_card', get_card)
+    reset_query_cache_stats()
+    return calls
+
+
+def _board():
+    bs = BoardState("bot")
+    bs.my_side = "dark"
+    bs.force_pile = 9
+    bs.cards_in_hand = [CardInPlay(card_id="h1", blueprint_id="bp_trooper", zone="HAND", owner="bot"),
+                        CardInPlay(card_id="h2", blueprint_id="bp_vader", zone="HAND", owner="bot")]
+    return bs
+
+
+class TestVersion:
+
+    def test_changes_bump_version(self):
+        bs = _board()
+        version = bs.version
+        bs.force_pile = 4
+        assert bs.version > version
+
+        version = bs.version
+        bs.deploy_plan_summary = "plan"  # planner bookkeeping is not board state
+        bs._topology = None
+        assert bs.version == version
+
+        bs.add_location(LocationInPlay(card_id="l0", blueprint_id="bp_loc", owner="bot", location_index=0))
+        assert bs.version > version
+
+        version = bs.version
+        EventProcessor(bs).process_event(ET.fromstring('<ge type="TC" participantId="bot" />'))
+        assert bs.version > version
+
+
+class TestQueryCache:
+
+    def test_repeated_queries_hit(self, lookups):
+        bs = _board()
+        assert bs.total_hand_deployable_ground_power() == 9
+        calls = len(lookups)
+        for _ in range(3):
+            assert bs.total_hand_deployable_ground_power() == 9
+            assert bs.should_concede() == (False, "")
+            assert bs.should_concede() == (False, "")
+        assert len(lookups) == calls
+        stats = query_cache_stats()
+        assert stats['total_hand_deployable_ground_power'] == {'hits': 3, 'misses': 1}
+        assert stats['should_concede'] == {'hits': 5, 'misses': 1}
+
+    def test_change_recomputes(self, lookups):
+        bs = _board()
+        assert bs.total_hand_deployable_ground_power() == 9
+        bs.force_pile = 4  # 3 Force to spend: only the Trooper
+        assert bs.total_hand_deployable_ground_power() == 3
+        bs.cards_in_hand.pop(0)
+        bs.mark_changed()
+        assert bs.total_hand_deployable_ground_power() == 0
+        # Arguments are part of the key
+        bs.force_pile = 9
+        assert bs.total_hand_deployable_ground_power("h2") == 0
+        assert bs.total_hand_deployable_ground_power() == 6
+
+    def test_mutable_results_are_copies(self):
+        bs = _board()
+        first = bs.analyze_flee_options(5)
+        first['reason'] = "changed by caller"
+        assert bs.analyze_flee_options(5)['reason'] == "Invalid location"
@@ -0,0 +1,128 @@
+"""
+Board Summary Test Suite
+
+Tests the per-turn location summary shared by the turn-start consumers:
+1. Power, icons, control and drain values per location
+2. Cached per board version, rebuilt when power or locations change
+3. StrategicState, GamePlan, GameStrategy and the deploy planner agree
+4. One metadata lookup per location for the whole turn-start pipeline
+
+Run with: python -m pytest tests/test_board_summary.py -v
+"""
+
+import sys
+import os
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from engine import card_loader
+from engine.board_state import BoardState, LocationInPlay
+from engine.board_summary import get_board_summary
+from engine.deploy_planner import DeployPhasePlanner
+from engine.game_plan import GamePlan
+from engine.game_strategy import GameStrategy
+from engine.strategic_state import StrategicState
+
+LOCATIONS = {
+    "bp_base": SimpleNamespace(dark_side_icons=1, light_side_icons=2, sub_type="Site",
+                               is_interior=True, is_exterior=False),
+    "bp_plains": SimpleNamespace(dark_side_icons=2, light_side_icons=1, sub_type="Site",
+                                 is_interior=False, is_exterior=True),
+    "bp_system": SimpleNamespace(dark_side_icons=1, light_side_icons=1, sub_type="System",
+                                 is_interior=False, is_exterior=False),
+}
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    calls = []
+
+    def get_card(blueprint_id):
+        calls.append(blueprint_id)
+        return LOCATIONS.get(blueprint_id)
+
+    monkeypatch.setattr(card_loader, 'get_card', get_card)
+    return calls
+
+
+def _board():
+    bs = BoardState("bot")
+    bs.my_side = "dark"
+    bs.force_pile = 5
+    names = [("bp_base", "Hoth: Echo Base"), ("bp_plains", "Hoth: Ice Plains"), ("bp_system", "Hoth")]
+    for idx, (blueprint_id, name) in enumerate(names):
+        bs.add_location(LocationInPlay(card_id=f"l{idx}", blueprint_id=blueprint_id, owner="bot",
+                                       location_index=idx, system_name="Hoth",
+                                       site_name=name if ":" in name else "",
+                                       is_site=":" in name, is_ground=":" in name))
+    # We hold Echo Base, they hold Ice Plains with 3 power, contested space
+    bs.dark_power_at_locations = {0: 4, 1: -1, 2: 2}
+    bs.light_power_at_locations = {0: -1, 1: 3, 2: 5}
+    return bs
+
+
+class TestSummary:
+
+    def test_locations(self, lookups):
+        summary = get_board_summary(_board())
+        base, plains, system = summary.locations
+        assert (base.my_icons, base.their_icons, base.is_ground, base.is_interior) == (1, 2, True, True)
+        assert base.i_control and base.my_drain == 2 and base.their_drain == 0
+        assert plains.they_control and plains.their_drain == 2 and plains.contestable
+        assert system.is_space and system.contested and system.my_drain == system.their_drain == 0
+        assert (summary.my_drain_total, summary.their_drain_total) == (2, 2)
+        assert [s.name for s in summary.contestable_drains()] == ["Hoth: Ice Plains"]
+
+    def test_cached_per_board_version(self, lookups):
+        bs = _board()
+        summary = get_board_summary(bs)
+        assert get_board_summary(bs) is summary
+        assert len(lookups) == 3
+
+        bs.light_power_at_locations[1] = 6
+        assert get_board_summary(bs) is summary  # in-place change, not yet marked
+        bs.mark_changed()
+        changed = get_board_summary(bs)
+        assert changed is not summary and not changed.at(1).contestable
+
+        bs.clear()
+        assert len(get_board_summary(bs)) == 0
+
+    def test_icon_fallback_without_metadata(self, lookups):
+        bs = _board()
+        bs.locations[0].blueprint_id = "bp_missing"
+        bs.locations[0].my_icons, bs.locations[0].their_icons = "1", "2*"
+        base = get_board_summary(bs).at(0)
+        assert not base.has_metadata
+        assert (base.my_icons, base.their_icons) == (1, 2)
+
+
+class TestConsumers:
+
+    def test_consumers_agree(self, lookups):
+        bs = _board()
+        bs.turn_number = 3
+
+        state = StrategicState()
+        state._calculate_drain_totals(bs)
+        assert state.trajectory.our_drain_locations == ["Hoth: Echo Base"]
+        assert state.trajectory.contestable_drains == ["Hoth: Ice Plains"]
+        assert state.opponent.total_space_power == 5 and state.opponent.strongest_location == "Hoth"
+
+        plan = GamePlan()
+        assert plan._calculate_my_drain_potential(bs) == state.trajectory.our_total_drain
+        assert plan._calculate_their_drain_potential(bs) == state.trajectory.their_total_drain
+
+        strategy = GameStrategy("dark")
+        strategy._update_location_priorities(bs)
+        # Icons from metadata: Ice Plains (2 of ours) outranks Echo Base (1)
+        assert [p.location_index for p in strategy.location_priorities][:2] == [1, 0]
+
+        analysis = DeployPhasePlanner()._analyze_locations(bs)
+        assert [(a.my_power, a.their_power, a.my_icons, a.their_icons) for a in analysis] == \
+            [(4, 0, 1, 2), (0, 3, 2, 1), (2, 5, 1, 1)]
+        assert [a.is_space for a in analysis] == [False, False, True]
+
+        # The whole pipeline resolved each location once
+        assert len(lookups) == 3
@@ -0,0 +1,88 @@
+"""
+Combo Scorer Test Suite
+
+Tests combo data built during CardDatabase.load():
+1. Combo strings are parsed into bidirectional partner bitsets
+2. get_combo_partners() returns normalized partner titles
+3. score_combo_potential() scores board, hand and same-location partners
+
+Run with: python -m pytest tests/test_combo_scorer.py -v
+"""
+
+import sys
+import os
+import json
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from engine import card_loader
+from engine.card_loader import CardDatabase
+from engine.combo_scorer import (
+    COMBO_BONUS_ON_BOARD,
+    COMBO_BONUS_IN_HAND,
+    COMBO_BONUS_SAME_LOCATION,
+    get_combo_partners,
+    has_combo_partners,
+    score_combo_potential,
+)
+
+
+LIGHT_CARDS = [
+    {'gempId': '1_19', 'front': {'title': '•Luke Skywalker', 'type': 'Character'},
+     'combo': ["•Luke Skywalker + •Luke's Lightsaber", "•Luke Skywalker + •Leia + •Han Two battle destinies"]},
+    {'gempId': '1_20', 'front': {'title': "•Luke's Lightsaber", 'type': 'Weapon'}},
+    {'gempId': '1_17', 'front': {'title': '•Leia', 'type': 'Character'}},
+    {'gempId': '1_11', 'front': {'title': '•Han', 'type': 'Character'}},
+]
+
+
+@pytest.fixture
+def card_db(tmp_path, monkeypatch):
+    (tmp_path / "Dark.json").write_text(json.dumps({'cards': []}))
+    (tmp_path / "Light.json").write_text(json.dumps({'cards': LIGHT_CARDS}))
+    db = CardDatabase(str(tmp_path))
+    db.load()
+    monkeypatch.setattr(card_loader, '_card_db', db)
+    return db
+
+
+class TestComboData:
+
+    def test_combo_data_built_at_load(self, card_db):
+        data = card_db.combo_data
+        assert data.cards_with_combos == 1
+        assert data.total_combos == 2
+        assert set(data.names) == {"luke skywalker", "luke's lightsaber", "leia", "han"}
+
+    def test_partners_are_bidirectional(self, card_db):
+        assert get_combo_partners(blueprint_id='1_19') == {"luke's lightsaber", "leia", "han"}
+        assert get_combo_partners(card_title="•Leia") == {"luke skywalker", "han"}
+        assert has_combo_partners(card_title="Han")
+        assert not has_combo_partners(card_title="Chewbacca", blueprint_id='9_99')
+
+
+class TestScoreComboPotential:
+
+    def test_no_partners(self, card_db):
+        assert score_combo_potential("Chewbacca", "9_99", ["•Leia"], []) == (0.0, "")
+
+    def test_board_and_hand_partners(self, card_db):
+        score, reason = score_combo_potential(
+            "•Luke Skywalker", "1_19",
+            cards_on_board=["•Leia", "Stormtrooper"],
+            cards_in_hand=["•Han", "•Leia"],
+        )
+        # Leia on board, Han in hand; Leia in hand is not double counted
+        assert score == COMBO_BONUS_ON_BOARD + COMBO_BONUS_IN_HAND
+        assert "Combo with leia on board" in reason
+        assert "Combo partner han in hand" in reason
+
+    def test_same_location_bonus(self, card_db):
+        score, reason = score_combo_potential(
+            "Luke's Lightsaber", "1_20",
+            cards_on_board=["•Luke Skywalker"],
+            cards_in_hand=[],
+            same_location_cards=["•Luke Skywalker"],
+        )
+        assert score == COMBO_BONUS_ON_BOARD + COMBO_BONUS_SAME_LOCATION
+        assert "at location!" in reason
@@ -0,0 +1,109 @@
+"""
+Decision Fast Path Test Suite
+
+Tests answering trivial decisions without the brain:
+1. Optional prompts with nothing to choose pass immediately
+2. Single forced choices and single deploy targets pick the only option
+3. Deploy/move actions, real choices and blocked responses go to the brain
+4. handle_decision skips the brain for fast-pathed decisions and counts them
+
+Run with: python -m pytest tests/test_decision_fast_path.py -v
+"""
+
+import sys
+import os
+import xml.etree.ElementTree as ET
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from engine.board_state import BoardState
+from engine.decision_fast_path import DecisionFastPath, get_decision_fast_path
+from engine.decision_handler import DecisionHandler
+from engine.decision_safety import DecisionSafety
+from engine.game_session import GameSession, use_session
+
+
+def _decision(decision_type, text="Choose", actions=(), cards=(), selectable=None, **params):
+    """Build a <ge type="D"> element; params become <parameter> children."""
+    element = ET.Element('ge', {'type': 'D', 'decisionType': decision_type, 'id': '7', 'text': text})
+    for action_id, action_text in actions:
+        ET.SubElement(element, 'parameter', {'name': 'actionId', 'value': action_id})
+        ET.SubElement(element, 'parameter', {'name': 'actionText', 'value': action_text})
+    for i, card_id in enumerate(cards):
+        ET.SubElement(element, 'parameter', {'name': 'cardId', 'value': card_id})
+        is_selectable = selectable[i] if selectable else True
+        ET.SubElement(element, 'parameter', {'name': 'selectable', 'value': str(is_selectable).lower()})
+    for name, value in params.items():
+        ET.SubElement(element, 'parameter', {'name': name, 'value': str(value).lower()})
+    return element
+
+
+def _answer(element, blocked=None, board_state=None):
+    fast_path = DecisionFastPath()
+    answer = fast_path.try_answer(element, DecisionSafety.parse_decision_params(element), board_state, blocked)
+    return answer and (answer.rule, answer.value)
+
+
+class RecordingBrain:
+    def __init__(self):
+        self.calls = 0
+
+    def make_decision(self, context):
+        self.calls += 1
+        return SimpleNamespace(choice=context.decision_request.options[0].option_id, reasoning="first")
+
+
+class TestRules:
+
+    def test_nothing_to_choose(self):
+        assert _answer(_decision('CARD_ACTION_CHOICE', noPass=False)) == ('nothing_to_choose', '')
+        assert _answer(_decision('ARBITRARY_CARDS', cards=['1', '2'], min=0, max=0)) == ('nothing_to_choose', '')
+        assert _answer(_decision('CARD_SELECTION', cards=['1'], selectable=[False])) == ('nothing_to_choose', '')
+        # Must choose but nothing to pick is not trivial
+        assert _answer(_decision('CARD_ACTION_CHOICE', noPass=True)) is None
+
+    def test_single_choices(self):
+        assert _answer(_decision('CARD_SELECTION', cards=['5', '6'], selectable=[False, True], noPass=True)) == \
+            ('single_forced_choice', '6')
+        assert _answer(_decision('ARBITRARY_CARDS', cards=['5'], min=1, max=1)) == ('single_forced_choice', '5')
+        assert _answer(_decision('CARD_ACTION_CHOICE', actions=[('a1', 'Activate Force')], noPass=True)) == \
+            ('single_forced_choice', 'a1')
+
+        planner = SimpleNamespace(recorded=[], record_deployment=lambda bp: planner.recorded.append(bp))
+        text = "Choose where to deploy <div class='cardHint' value='109_8'>•Boba Fett In Slave I</div>"
+        element = _decision('CARD_SELECTION', text=text, cards=['40'])
+        assert _answer(element, board_state=SimpleNamespace(deploy_planner=planner)) == \
+            ('single_deploy_target', '40')
+        assert planner.recorded == ['109_8']
+
+    def test_left_to_the_brain(self):
+        assert _answer(_decision('CARD_SELECTION', cards=['5', '6'], noPass=True)) is None
+        assert _answer(_decision('CARD_SELECTION', cards=['5'], noPass=False)) is None       # choose or pass
+        assert _answer(_decision('ARBITRARY_CARDS', cards=['5', '6'], min=2, max=2)) is None
+        assert _answer(_decision('CARD_ACTION_CHOICE', actions=[('a1', 'Deploy Vader')], noPass=True)) is None
+        assert _answer(_decision('CARD_SELECTION', cards=['5'], noPass=True), blocked={'5'}) is None
+        assert _answer(_decision('MULTIPLE_CHOICE', noPass=True)) is None
+        assert DecisionFastPath({'enabled': False}).try_answer(
+            _decision('CARD_ACTION_CHOICE'), DecisionSafety.parse_decision_params(_decision('CARD_ACTION_CHOICE'))) is None
+
+
+class TestHandleDecision:
+
+    def test_skips_brain_and_counts(self):
+        brain = RecordingBrain()
+        board_state = BoardState(my_player_name="rando_cal")
+        with use_session(GameSession("fast")):
+            DecisionHandler.reset_tracker()
+            result = DecisionHandler.handle_decision(
+                _decision('CARD_SELECTION', cards=['5'], noPass=True), board_state=board_state, brain=brain)
+            assert (result.decision_id, result.value, brain.calls) == ('7', '5', 0)
+
+            result = DecisionHandler.handle_decision(
+                _decision('CARD_SELECTION', cards=['5', '6'], noPass=True), board_state=board_state, brain=brain)
+            assert (result.value, brain.calls) == ('5', 1)
+
+            stats = get_decision_fast_path().stats()
+            assert (stats['seen'], stats['handled'], stats['by_rule']) == (2, 1, {'single_forced_choice': 1})
+            DecisionHandler.reset_tracker()
+            assert get_decision_fast_path().seen == 0
@@ -0,0 +1,174 @@
+"""
+Deck Profile Test Suite
+
+Tests precomputed deck profiles served at game start:
+1. A profile carries the deck list, card stats, composition and archetype
+2. Profiles persist by content hash; edited decks and new card data rebuild
+3. Warm-up profiles each deck once and skips missing ones; missing
+   names don't rescan the deck directory; under eventlet it never runs on
+   a green background thread
+4. initialize_deck_tracker loads the cached profile without card lookups
+
+Run with: python -m pytest tests/test_deck_profiles.py -v
+"""
+
+import sys
+import os
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from engine import deck_analyzer, deck_profiles, deck_tracker
+from engine.archetype_detector import DeckArchetype
+from engine.deck_profiles import DeckProfileCache
+
+
+def _card(title, card_type, **extra):
+    flags = {f'is_{kind}': card_type.lower() == kind
+             for kind in ('character', 'starship', 'vehicle', 'location', 'weapon', 'effect')}
+    return SimpleNamespace(title=title, card_type=card_type, side="Dark", destiny="3", deploy="4",
+                           power="5", forfeit="2", is_unique=True, is_pilot=True,
+                           power_value=5, ability_value=2, sub_type="", **flags, **extra)
+
+
+CARDS = {
+    '1_1': _card("Star Destroyer", "Starship"),
+    '1_2': _card("TIE Fighter", "Starship"),
+    '1_3': _card("Tarkin", "Character"),
+    '1_4': _card("Vader", "Character"),
+}
+
+
+def _deck_xml(*blueprints):
+    cards = "".join(f'<card blueprintId="{bp}" title="{CARDS[bp].title if bp in CARDS else bp}"/>'
+                    for bp in blueprints)
+    return f'<?xml version="1.0"?><deck>{cards}</deck>'
+
+
+SPACE_DECK = _deck_xml(*['1_1'] * 3, *['1_2'] * 3, '1_3', '1_4')
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    """Fake card data; counts card lookups."""
+    calls = []
+
+    def get_card(blueprint_id):
+        calls.append(blueprint_id)
+        return CARDS.get(blueprint_id)
+
+    monkeypatch.setattr(deck_tracker, 'get_card', get_card)
+    monkeypatch.setattr(deck_analyzer, 'get_card', get_card)
+    monkeypatch.setattr(deck_profiles, 'card_data_signature', lambda: "cards-v1")
+    return calls
+
+
+@pytest.fixture
+def decks(tmp_path):
+    decks_dir = tmp_path / "decks"
+    decks_dir.mkdir()
+    (decks_dir / "Space_Deck.txt").write_text(SPACE_DECK)
+    return decks_dir
+
+
+def _cache(decks, **kwargs):
+    return DeckProfileCache(decks_dir=decks, cache_file=decks.parent / "profiles.json", **kwargs)
+
+
+class TestProfile:
+
+    def test_profile_contents(self, decks, lookups):
+        cache = _cache(decks)
+        profile = cache.get("space_deck")        # case-insensitive, like find_deck_file
+        assert profile.deck_list == {'1_1': 3, '1_2': 3, '1_3': 1, '1_4': 1} and profile.total_cards == 8
+        assert profile.card_stats['1_3'].power == 5 and profile.complete
+        assert profile.composition.ship_count == 6 and profile.composition.pilot_count == 2
+        assert isinstance(profile.archetype, DeckArchetype) and profile.goals.archetype == profile.archetype
+        assert profile.strategy_goals() == profile.goals and profile.strategy_goals() is not profile.goals
+
+        lookups.clear()
+        assert cache.get("space_deck") is profile and not lookups
+        assert (cache.hits, cache.built) == (1, 1)
+        assert cache.get("missing_deck") is None
+
+
+class TestPersistence:
+
+    def test_reload_and_invalidation(self, decks, lookups, monkeypatch):
+        cache = _cache(decks)
+        cache.get("Space_Deck")
+        cache.save()
+
+        lookups.clear()
+        reloaded = _cache(decks)
+        profile = reloaded.get("Space_Deck")
+        assert reloaded.built == 0 and not lookups
+        assert profile.archetype == cache.get("Space_Deck").archetype
+        assert profile.card_stats == cache.get("Space_Deck").card_stats
+
+        # An edited deck is analyzed again
+        (decks / "Space_Deck.txt").write_text(_deck_xml('1_3', '1_4', '1_1'))
+        assert reloaded.get("Space_Deck").total_cards == 3 and reloaded.built == 1
+
+        # New card data discards the saved profiles
+        monkeypatch.setattr(deck_profiles, 'card_data_signature', lambda: "cards-v2")
+        assert _cache(decks).get("Space_Deck") is not None and lookups
+
+    def test_incomplete_profiles_not_saved(self, decks, lookups):
+        (decks / "Unknown.txt").write_text(_deck_xml('1_1', '9_99'))
+        cache = _cache(decks)
+        assert not cache.get("Unknown").complete
+        cache.save()
+        assert _cache(decks)._profiles == {}
+
+
+class TestWarmup:
+
+    def test_warm(self, decks, lookups):
+        for i in range(5):
+            (decks / f"deck_{i}.txt").write_text(_deck_xml('1_3', '1_4', *['1_1'] * i))
+        cache = _cache(decks)
+        stats = cache.warm([f"deck_{i}" for i in range(5)] + ["Space_Deck", "not_a_deck", "deck_0"])
+        assert (stats['decks'], stats['profiled'], stats['built']) == (7, 6, 6)
+        assert (decks.parent / "profiles.json").exists()
+        assert _cache(decks).warm(["deck_3"])['built'] == 0
+
+    def test_missing_decks_scan_once(self, decks, lookups, monkeypatch):
+        listdir = os.listdir
+        scans = []
+        monkeypatch.setattr(os, 'listdir', lambda path: scans.append(path) or listdir(path))
+        cache = _cache(decks)
+        for name in ("Server Deck A", "Server Deck B", "Server Deck A", "space_deck"):
+            cache.get(name)
+        assert len(scans) == 1 and cache.get("space_deck") is not None
+
+        # A deck file added later is found
+        (decks / "Server Deck A.TXT").write_text(SPACE_DECK)
+        assert cache.get("server deck a") is not None and len(scans) == 2
+
+    def test_green_threads(self, decks, lookups, monkeypatch):
+        (decks / "Other.txt").write_text(_deck_xml('1_3', '1_4'))
+        cache = _cache(decks)
+        monkeypatch.setattr(deck_profiles, '_cache', cache)
+        monkeypatch.setattr(deck_profiles, 'green_threads', lambda: True)
+        assert deck_profiles.warm_deck_profiles(["Space_Deck"]) is None and cache.built == 0
+
+        # Warmed up front instead: every local deck, in the calling thread
+        deck_profiles.warm_deck_profiles(background=False)
+        assert cache.built == 2 and cache.get("Other") is not None
+
+
+class TestDeckTracker:
+
+    def test_initialize_from_profile(self, decks, lookups, monkeypatch):
+        monkeypatch.setattr(deck_tracker, 'DECK_BASE_PATH', str(decks))
+        monkeypatch.setattr(deck_profiles, '_cache', _cache(decks))
+        deck_profiles.get_deck_profile("Space_Deck")
+
+        lookups.clear()
+        assert deck_tracker.initialize_deck_tracker("Space_Deck", "Dark")
+        tracker = deck_tracker.get_deck_tracker()
+        assert tracker.deck_loaded and tracker.my_side == "dark" and not lookups
+        assert tracker.deck_list == {'1_1': 3, '1_2': 3, '1_3': 1, '1_4': 1}
+        assert tracker.probability_draw_type('Starship') == pytest.approx(6 / 8)
+        deck_tracker.reset_deck_tracker()
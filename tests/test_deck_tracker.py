@@ -0,0 +1,176 @@
+"""
+DeckTracker Test Suite
+
+Tests the incrementally maintained reserve counts and multi-draw queries:
+1. Reserve counts match a full recount after random zone transitions
+2. Single-draw probabilities match the pool they are computed from
+3. Hypergeometric "at least N of a type in the next K draws"
+4. Exact distribution of the sum of several destiny draws
+5. Known top cards are taken into account
+
+Run with: python -m pytest tests/test_deck_tracker.py -v
+"""
+
+import sys
+import os
+import itertools
+import random
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from engine import deck_tracker as deck_tracker_module
+from engine.deck_tracker import DeckTracker
+
+
+TYPES = ["Character", "Starship", "Vehicle", "Location", "Interrupt", "Effect"]
+
+# Fake card database: 12 blueprints with varied type, destiny and cost
+CARDS = {
+    f"bp{i}": SimpleNamespace(title=f"Card {i}", card_type=TYPES[i % len(TYPES)],
+                              destiny=str(i % 7), deploy=str(i % 5), power=str(i % 4),
+                              forfeit="2", is_unique=False)
+    for i in range(12)
+}
+CARDS["bp11"].destiny = "*"  # non-numeric stats count as 0
+
+
+@pytest.fixture(autouse=True)
+def fake_cards(monkeypatch):
+    monkeypatch.setattr(deck_tracker_module, 'get_card', CARDS.get)
+
+
+def _tracker():
+    tracker = DeckTracker()
+    deck = [f"bp{i}" for i in range(12) for _ in range(1 + i % 3)] + ["unknown_bp"]
+    tracker.load_deck_from_list(deck, "light")
+    return tracker
+
+
+def _recount(tracker):
+    """The original full recount of the remaining reserve."""
+    remaining = dict(tracker.deck_list)
+    for zone in (tracker.hand, tracker.in_play, tracker.lost_pile, tracker.used_pile):
+        for bp, count in zone.cards.items():
+            remaining[bp] = max(0, remaining.get(bp, 0) - count)
+    return {bp: count for bp, count in remaining.items() if count > 0}
+
+
+def _pool(tracker):
+    """Remaining cards expanded into a list of blueprint ids."""
+    return [bp for bp, count in _recount(tracker).items() for _ in range(count)]
+
+
+class TestIncrementalCounts:
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_matches_recount(self, seed):
+        rng = random.Random(seed)
+        tracker = _tracker()
+        blueprints = list(tracker.deck_list)
+        for _ in range(60):
+            bp = rng.choice(blueprints)
+            op = rng.randrange(6)
+            if op == 0:
+                tracker.card_drawn(bp)
+            elif op == 1:
+                tracker.card_deployed(bp)
+            elif op == 2:
+                tracker.card_lost(bp, from_zone=rng.choice(["hand", "in_play", "reserve"]))
+            elif op == 3:
+                tracker.card_used(bp, from_zone=rng.choice(["hand", "in_play"]))
+            elif op == 4 and rng.random() < 0.2:
+                tracker.force_recirculated()
+            else:
+                tracker.hand.remove(bp)
+
+            remaining = _recount(tracker)
+            assert tracker.get_remaining_in_reserve() == remaining
+            total = sum(remaining.values())
+            assert tracker.get_reserve_count() == max(0, total - tracker.force_pile_count)
+
+            if total:
+                characters = sum(c for bp2, c in remaining.items()
+                                 if bp2 in CARDS and CARDS[bp2].card_type == "Character")
+                assert tracker.probability_draw_type("Character") == pytest.approx(characters / total)
+                high = sum(c for bp2, c in remaining.items()
+                           if bp2 in CARDS and tracker._card_stats[bp2].destiny >= 5)
+                assert tracker.probability_destiny_at_least(5) == pytest.approx(high / total)
+                destiny_sum = sum(tracker._card_stats[bp2].destiny * c for bp2, c in remaining.items()
+                                  if bp2 in CARDS)
+                assert tracker.expected_destiny() == pytest.approx(destiny_sum / total)
+                deployable = sum(c for bp2, c in remaining.items()
+                                 if bp2 in CARDS and tracker._card_stats[bp2].card_type in
+                                 ("Character", "Starship", "Vehicle", "Device", "Weapon")
+                                 and tracker._card_stats[bp2].deploy_cost <= 2)
+                assert tracker.probability_draw_deployable(2) == pytest.approx(deployable / total)
+
+    def test_reload_resets_counts(self):
+        tracker = _tracker()
+        tracker.card_drawn("bp3")
+        tracker.load_deck_from_list(["bp1", "bp2"], "dark")
+        assert tracker.get_remaining_in_reserve() == {"bp1": 1, "bp2": 1}
+        assert tracker.get_remaining_composition() == {"Starship": 1, "Vehicle": 1}
+
+    def test_average_remaining_power(self):
+        tracker = _tracker()
+        # Characters: bp0 (power 0, x1), bp6 (power 2, x1)
+        assert tracker.average_remaining_power("Character") == pytest.approx(1.0)
+        assert tracker.average_remaining_power("Weapon") is None
+
+
+class TestMultiDrawQueries:
+
+    @pytest.mark.parametrize("draws,at_least", [(1, 1), (3, 1), (3, 2), (5, 1)])
+    def test_type_in_draws_matches_enumeration(self, draws, at_least):
+        tracker = _tracker()
+        tracker.card_drawn("bp0")
+        tracker.card_deployed("bp6")
+        pool = _pool(tracker)
+        hits = [CARDS.get(bp) is not None and CARDS[bp].card_type in ("Character", "Vehicle")
+                for bp in pool]
+        combos = list(itertools.combinations(range(len(pool)), draws))
+        expected = sum(1 for combo in combos if sum(hits[i] for i in combo) >= at_least) / len(combos)
+        result = tracker.probability_type_in_draws(["Character", "Vehicle"], draws, at_least)
+        assert result == pytest.approx(expected)
+
+    def test_single_draw_equals_probability_draw_type(self):
+        tracker = _tracker()
+        assert tracker.probability_type_in_draws("Starship", 1) == \
+            pytest.approx(tracker.probability_draw_type("Starship"))
+
+    @pytest.mark.parametrize("draws", [1, 2, 3])
+    def test_destiny_sum_matches_enumeration(self, draws):
+        tracker = _tracker()
+        tracker.card_lost("bp4", from_zone="reserve")
+        pool = [tracker._card_stats[bp].destiny for bp in _pool(tracker) if bp in CARDS]
+        combos = list(itertools.combinations(pool, draws))
+        expected = {}
+        for combo in combos:
+            expected[sum(combo)] = expected.get(sum(combo), 0) + 1 / len(combos)
+        result = tracker.destiny_sum_distribution(draws)
+        assert result.keys() == expected.keys()
+        for total, p in expected.items():
+            assert result[total] == pytest.approx(p)
+        if draws == 1:
+            for destiny, p in tracker.get_destiny_distribution().items():
+                assert result[destiny] == pytest.approx(p * tracker._remaining_total / len(pool))
+
+    def test_too_many_draws(self):
+        tracker = DeckTracker()
+        tracker.load_deck_from_list([], "light")
+        assert tracker.destiny_sum_distribution(2) == {}
+        assert tracker.probability_type_in_draws("Character", 3) == 0.0
+
+
+class TestKnownTopCards:
+
+    def test_known_cards_are_fixed(self):
+        tracker = _tracker()
+        tracker.observe_reserve_cards(["bp5", "bp0"])  # Effect (destiny 5), Character (destiny 0)
+        assert tracker.probability_type_in_draws("Character", 1) == 0.0
+        assert tracker.probability_type_in_draws("Character", 2) == 1.0
+        assert tracker.destiny_sum_distribution(2) == {5: 1.0}
+        three = tracker.destiny_sum_distribution(3)
+        assert min(three) >= 5
+        assert sum(three.values()) == pytest.approx(1.0)
@@ -0,0 +1,127 @@
+"""
+Evaluator Dispatch Test Suite
+
+Tests the dispatch index and lazy decision context:
+1. Evaluator declarations are never stricter than can_evaluate()
+2. CombinedEvaluator.evaluators_for() keeps registration order
+3. DecisionContext memoizes owner/metadata lookups per decision
+4. LazyCardInfo only reads card metadata when a field is used
+
+Run with: python -m pytest tests/test_evaluator_dispatch.py -v
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from brain import StaticBrain, LazyCardInfo
+from engine.board_state import BoardState, CardInPlay
+from engine.evaluators.base import CombinedEvaluator, DecisionContext
+
+
+DECISION_TYPES = ['CARD_ACTION_CHOICE', 'ACTION_CHOICE', 'CARD_SELECTION', 'ARBITRARY_CARDS',
+                  'INTEGER', 'MULTIPLE_CHOICE']
+PHASES = ['Deploy (turn #3)', 'Draw (turn #3)', 'Battle (turn #3)', '']
+ACTION_TEXTS = ['Deploy •Luke Skywalker', 'Initiate battle', 'Move using landspeed',
+                'Draw card into hand from Force Pile', 'Cancel']
+
+
+def _board(my_turn):
+    bs = BoardState("me")
+    bs.current_turn_player = "me" if my_turn else "them"
+    return bs
+
+
+def _contexts():
+    for decision_type in DECISION_TYPES:
+        for phase in PHASES:
+            for my_turn in (True, False):
+                yield DecisionContext(
+                    board_state=_board(my_turn), decision_type=decision_type,
+                    decision_text='Choose capacity slot' if decision_type == 'MULTIPLE_CHOICE' else 'Battle action',
+                    decision_id='1', phase=phase, turn_number=3, is_my_turn=my_turn,
+                    action_ids=[str(i) for i in range(len(ACTION_TEXTS))], action_texts=ACTION_TEXTS,
+                    no_pass=False,
+                )
+
+
+class TestDispatchIndex:
+
+    def test_declarations_never_skip_applicable_evaluators(self):
+        brain = StaticBrain()
+        combined = brain.combined_evaluator
+        for context in _contexts():
+            indexed = combined.evaluators_for(context.decision_type)
+            for evaluator in brain.evaluators:
+                if evaluator.can_evaluate(context):
+                    assert evaluator in indexed, (evaluator.name, context.decision_type)
+                    assert evaluator.may_evaluate(context), (evaluator.name, context.phase)
+
+    def test_index_keeps_registration_order(self):
+        brain = StaticBrain()
+        names = [e.name for e in brain.combined_evaluator.evaluators_for('CARD_ACTION_CHOICE')]
+        assert names == ['Deploy', 'Battle', 'Move', 'Draw', 'ActionText', 'Pass']
+        names = [e.name for e in brain.combined_evaluator.evaluators_for('INTEGER')]
+        assert names == ['Deploy', 'ForceActivation', 'Pass']
+
+    def test_index_rebuilt_when_evaluators_change(self):
+        brain = StaticBrain()
+        combined = CombinedEvaluator(list(brain.evaluators[:2]))
+        assert len(combined.evaluators_for('INTEGER')) == 1
+        combined.evaluators.append(brain.evaluators[-1])
+        assert len(combined.evaluators_for('INTEGER')) == 2
+
+
+class TestLazyContext:
+
+    def test_owner_lookup_is_memoized(self):
+        bs = _board(True)
+        bs.cards_in_play['42'] = CardInPlay(card_id='42', blueprint_id='1_19', zone='HAND', owner='me')
+        context = DecisionContext(board_state=bs, decision_type='CARD_ACTION_CHOICE',
+                                  decision_text='', decision_id='1', phase='', turn_number=1,
+                                  is_my_turn=True)
+        assert context.card_owner('42') == 'me'
+        del bs.cards_in_play['42']
+        assert context.card_owner('42') == 'me'
+        assert context.card_owner('99') is None
+
+    def test_no_board(self):
+        context = DecisionContext(board_state=None, decision_type='INTEGER', decision_text='',
+                                  decision_id='1', phase='', turn_number=1, is_my_turn=True)
+        assert context.board_is_my_turn()
+        assert context.card_owner('42') is None
+        assert context.card_metadata('') is None
+
+
+class _Meta:
+    reads = 0
+    title = '•Luke Skywalker'
+    card_type = 'Character'
+    ability_value = 4
+    deploy_value = 5
+    icons = ['Pilot', 'Warrior']
+
+    @property
+    def power_value(self):
+        _Meta.reads += 1
+        return 3
+
+
+class TestLazyCardInfo:
+
+    def test_metadata_loaded_on_first_field_access(self):
+        _Meta.reads = 0
+        info = LazyCardInfo('42', '1_19', _Meta())
+        assert (info.card_id, info.blueprint_id) == ('42', '1_19')
+        assert _Meta.reads == 0
+        assert info.title == '•Luke Skywalker'
+        assert (info.power, info.ability, info.deploy_cost) == (3, 4, 5)
+        assert info.icons == ['Pilot', 'Warrior']
+        assert info.zone == 'UNKNOWN'
+        assert _Meta.reads == 1
+
+    def test_unknown_attribute(self):
+        info = LazyCardInfo('42', '1_19', _Meta())
+        with pytest.raises(AttributeError):
+            info.not_a_field
@@ -0,0 +1,101 @@
+"""
+GS Event Coalescing Test Suite
+
+Tests skipping GS events that a later GS in the same update overwrites:
+1. Only GS events followed by a covering GS across transparent events coalesce
+2. Coalesced and fully applied batches end in the same board state
+3. The DeckTracker sees the same Force activations and recirculations
+
+Run with: python -m pytest tests/test_event_coalescing.py -v
+"""
+
+import sys
+import os
+import xml.etree.ElementTree as ET
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from engine import event_processor as event_processor_module
+from engine import game_state_logger
+from engine.board_state import BoardState
+from engine.event_processor import EventProcessor, find_superseded_gs
+
+
+@pytest.fixture(autouse=True)
+def no_game_state_log(monkeypatch):
+    """Keep EventProcessor from writing the recorded game in logs/."""
+    monkeypatch.setattr(game_state_logger, 'log_game_event', lambda event, event_type: None)
+
+
+def _gs(force, used, power=None, generation=True):
+    attrs = 'darkForceGeneration="3" lightForceGeneration="2"' if generation else ''
+    power_xml = ''
+    if power is not None:
+        power_xml = (f'<darkPowerAtLocations _0="{power}" locationIndex1="-1" />'
+                     f'<lightPowerAtLocations _0="2" />')
+    return ET.fromstring(
+        f'<ge type="GS" {attrs}>'
+        f'<playerZones name="bot" FORCE_PILE="{force}" USED_PILE="{used}" RESERVE_DECK="{30 - force}" HAND="6" />'
+        f'<playerZones name="opponent" FORCE_PILE="1" USED_PILE="0" RESERVE_DECK="40" HAND="8" />'
+        f'{power_xml}</ge>')
+
+
+def _event(event_type):
+    return ET.fromstring(f'<ge type="{event_type}" />')
+
+
+def _board():
+    bs = BoardState("bot")
+    bs.my_side = "dark"
+    return bs
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    calls = []
+    fake = SimpleNamespace(deck_loaded=True,
+                           force_activated=lambda n: calls.append(('activated', n)),
+                           force_recirculated=lambda: calls.append(('recirculated',)))
+    monkeypatch.setattr(event_processor_module, 'get_deck_tracker', lambda: fake)
+    return calls
+
+
+class TestFindSuperseded:
+
+    def test_transparent_events_between(self):
+        events = [_gs(1, 0, 4), _event('M'), _event('PCIP'), _gs(2, 0, 5), _gs(3, 0, 6)]
+        assert find_superseded_gs(events) == {0, 3}
+
+    def test_barriers(self):
+        # Decisions and phase changes read the board, so every GS before them applies
+        assert find_superseded_gs([_gs(1, 0, 4), _event('D'), _gs(2, 0, 5)]) == set()
+        assert find_superseded_gs([_gs(1, 0, 4), _event('GPC'), _gs(2, 0, 5)]) == set()
+
+    def test_later_gs_must_cover(self):
+        # A GS without power elements or generation does not overwrite those
+        assert find_superseded_gs([_gs(1, 0, 4), _gs(2, 0)]) == set()
+        assert find_superseded_gs([_gs(1, 0, 4), _gs(2, 0, 5, generation=False)]) == set()
+        assert find_superseded_gs([_gs(1, 0), _gs(2, 0, 5)]) == {0}
+
+
+class TestProcessEvents:
+
+    def test_same_state_and_deck_tracking(self, tracker):
+        batch = [_gs(2, 4, 3), _event('M'), _gs(5, 4, 6), _gs(5, 1, 7), _event('IP'), _gs(6, 1, 8)]
+
+        processor = EventProcessor(_board())
+        processor.coalesce_gs = False
+        processor.process_events(batch)
+        expected_calls = list(tracker)
+        tracker.clear()
+
+        coalesced = EventProcessor(_board())
+        coalesced.process_events(batch)
+        assert (coalesced.gs_applied, coalesced.gs_coalesced) == (1, 3)
+        assert tracker == expected_calls == [('activated', 2), ('activated', 3), ('recirculated',), ('activated', 1)]
+
+        for bs in (processor.board_state, coalesced.board_state):
+            assert (bs.force_pile, bs.used_pile, bs.reserve_deck, bs.activation) == (6, 1, 24, 3)
+            assert bs.dark_power_at_locations == {0: 8, 1: -1}
+            assert bs.their_force_pile == 1 and bs.their_hand_size == 8
@@ -0,0 +1,106 @@
+"""
+Fake GEMP Server Test Suite
+
+Tests the local GEMP stand-in and the load-test harness:
+1. GEMPClient logs in, lists decks and finds the table it created
+2. Scripted game streams advance per player and wait for decision answers
+3. Injected 409/404/410 responses drive the client's error paths
+4. Concurrent simulated bots finish their games and reconnect after 409s
+
+Run with: python -m pytest tests/test_fake_gemp.py -v
+"""
+
+import sys
+import os
+import xml.etree.ElementTree as ET
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from engine.client import GEMPClient
+from tools.fake_gemp import FakeGempServer, synthetic_batches
+from tools.load_test import run_load_test
+
+
+@pytest.fixture
+def server():
+    with FakeGempServer() as fake:
+        fake.script_game(synthetic_batches(turns=2), decision_every=2)
+        yield fake
+
+
+def _logged_in(server, name="rando_cal"):
+    client = GEMPClient(server.url)
+    assert client.login(name, "pw")
+    return client
+
+
+class TestLobby:
+
+    def test_login_decks_and_tables(self, server):
+        client = _logged_in(server)
+        assert [(d.name, d.side) for d in client.get_library_decks()] == [
+            ("dark_baseline", "dark"), ("light_baseline", "light")]
+
+        table_id = client.create_table("dark_baseline", "Bot Table: Test")
+        table = client.get_hall_tables()[0]
+        assert table.table_id == table_id and table.status == "playing" and table.game_id
+        assert [(p.name, p.side) for p in table.players] == [("rando_cal", "dark"), (f"opponent_{table_id}", "light")]
+
+        with FakeGempServer(accounts={"rando_cal": "secret"}) as locked:
+            assert not GEMPClient(locked.url).login("rando_cal", "wrong")
+            assert GEMPClient(locked.url).login("rando_cal", "secret")
+
+
+class TestGameStream:
+
+    def test_updates_and_decisions(self, server):
+        client = _logged_in(server)
+        client.create_table("dark_baseline", "Bot Table: Test")
+        game_id = client.get_hall_tables()[0].game_id
+
+        state = ET.fromstring(client.join_game(game_id))
+        assert (state.tag, state.get("cn")) == ("gameState", "1")
+        update = ET.fromstring(client.get_game_update(game_id, 1))
+        decision = update.find("ge[@type='D']")
+        assert update.get("cn") == "2" and decision is not None
+
+        # The stream waits for the decision answer
+        assert len(ET.fromstring(client.get_game_update(game_id, 2))) == 0
+        answered = ET.fromstring(client.post_decision(game_id, 2, decision.get("id"), "0"))
+        assert [e.get("type") for e in answered] == ["TC"]
+
+        # Another player reads the same game from the start
+        other = _logged_in(server, "watcher")
+        assert ET.fromstring(other.join_game(game_id)).get("cn") == "1"
+
+
+class TestFailureInjection:
+
+    def test_injected_statuses(self, server):
+        client = _logged_in(server)
+        client.create_table("dark_baseline", "Bot Table: Test")
+        game_id = client.get_hall_tables()[0].game_id
+        client.join_game(game_id)
+
+        server.fail("/game/", 409, method="POST")
+        assert client.get_game_update(game_id, 1) == "SESSION_EXPIRED" and not client.logged_in
+        client.login("rando_cal", "pw")
+        assert client.get_game_update(game_id, 1).startswith("<update")
+
+        server.fail("/hall", 404)
+        assert client.get_hall_tables() == []
+        server.fail("/chat/", 410)
+        assert client.get_chat_messages(game_id, 0) == ([], 0)      # re-registers
+        assert client.get_game_update("999", 1) is None             # unknown game -> 404
+        assert server.statuses[409] == 1 and server.statuses[404] == 2
+
+
+class TestLoadHarness:
+
+    def test_concurrent_clients(self, server):
+        server.fail("/game/", 409, times=3, method="POST")
+        results = run_load_test(server, 6, timeout=30)
+        assert results["completed"] == 6 and not results["errors"]
+        assert results["reconnects"] == 3 and results["rate_limited"] == 0
+        assert results["decisions"] == 6 * 2
+        assert results["server_requests"]["POST /login"] == 6 + 3
@@ -0,0 +1,141 @@
+"""
+Game Session Test Suite
+
+Tests per-account game sessions for several games in one process:
+1. Without a bound session the module getters return the process-wide objects
+2. Bound sessions get their own trackers, planner, strategy caches and logs
+3. A session with its own strategy config reads it through every accessor;
+   sessions sharing the process config skip the session lookup
+4. Account settings and the table state file follow the session
+
+Run with: python -m pytest tests/test_game_session.py -v
+"""
+
+import sys
+import os
+import json
+import threading
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from engine import strategy_config, table_manager
+from engine.decision_handler import _get_decision_tracker
+from engine.deck_tracker import get_deck_tracker, reset_deck_tracker
+from engine.game_session import AccountSettings, GameSession, current_session, use_session
+from engine.game_state_logger import get_game_state_log
+from engine.decision_logger import get_decision_log
+from engine.shield_strategy import get_shield_tracker
+from engine.speculative_planner import get_speculative_planner
+from engine.strategy_config import StrategyConfig, get_config, get_snapshot, section_reader
+from engine.strategy_profile import get_deck_strategy, set_deck_strategy, clear_deck_strategy
+
+
+def _per_game_objects():
+    return (get_deck_tracker(), get_shield_tracker('dark'), _get_decision_tracker(),
+            get_speculative_planner(), get_game_state_log(), get_decision_log())
+
+
+class TestBinding:
+
+    def test_no_session_uses_globals(self):
+        assert current_session() is None
+        assert get_deck_tracker() is get_deck_tracker()
+        assert get_game_state_log() is get_game_state_log()
+
+    def test_sessions_are_isolated(self):
+        default = _per_game_objects()
+        alpha, beta = GameSession("alpha"), GameSession("beta")
+        with use_session(alpha):
+            alpha_objects = _per_game_objects()
+            assert _per_game_objects() == alpha_objects
+            with use_session(beta):
+                beta_objects = _per_game_objects()
+            assert current_session() is alpha
+        assert current_session() is None
+
+        for a, b, d in zip(alpha_objects, beta_objects, default):
+            assert a is not b and a is not d and b is not d
+        assert alpha_objects[4].username == "alpha" and beta_objects[5].username == "beta"
+
+        # Resetting inside a session leaves the process-wide tracker alone
+        with use_session(alpha):
+            fresh = reset_deck_tracker()
+            assert get_deck_tracker() is fresh is not alpha_objects[0]
+        assert get_deck_tracker() is default[0]
+
+    def test_binding_is_per_thread(self):
+        session = GameSession("threaded")
+        seen = []
+        with use_session(session):
+            worker = threading.Thread(target=lambda: seen.append(current_session()))
+            worker.start()
+            worker.join()
+        assert seen == [None]
+
+    def test_deck_strategy_per_session(self):
+        goals = SimpleNamespace(archetype=SimpleNamespace(value='space_control'), primary_domain='space',
+                                space_deploy_multiplier=1.5, ground_deploy_multiplier=0.5, key_cards=[])
+        with use_session(GameSession("alpha")):
+            set_deck_strategy(goals)
+            assert get_deck_strategy() is goals
+        assert get_deck_strategy() is not goals
+        with use_session(GameSession("beta")):
+            assert get_deck_strategy() is None
+            clear_deck_strategy()
+
+
+class TestStrategyConfig:
+
+    def test_session_config(self, tmp_path, monkeypatch):
+        shared_path, own_path = tmp_path / "shared.json", tmp_path / "own.json"
+        shared_path.write_text(json.dumps({'battle_strategy': {'favorable_threshold': 4}}))
+        own_path.write_text(json.dumps({'battle_strategy': {'favorable_threshold': 9}}))
+        monkeypatch.setattr(strategy_config, '_config', StrategyConfig(str(shared_path)))
+        read = section_reader('battle_strategy')
+
+        with use_session(GameSession("own", strategy_config_path=str(own_path))):
+            assert read('favorable_threshold') == 9
+            assert get_snapshot().battle_strategy.favorable_threshold == 9
+            assert get_config().get('battle_strategy', 'favorable_threshold') == 9
+        with use_session(GameSession("shared")):
+            assert read('favorable_threshold') == 4
+            assert get_config() is strategy_config._config
+        assert read('favorable_threshold') == 4
+
+    def test_shared_config_skips_session_lookup(self, tmp_path, monkeypatch):
+        path = tmp_path / "shared.json"
+        path.write_text(json.dumps({'battle_strategy': {'favorable_threshold': 4}}))
+        monkeypatch.setattr(strategy_config, '_config', StrategyConfig(str(path)))
+        read = section_reader('battle_strategy')
+
+        def lookup():
+            raise AssertionError("session lookup on the reader path")
+
+        monkeypatch.setattr(strategy_config, 'current_session', lookup)
+        with use_session(GameSession("shared")):
+            assert read('favorable_threshold') == 4
+            assert get_snapshot().battle_strategy.favorable_threshold == 4
+
+
+class TestAccountSettings:
+
+    def test_from_env(self):
+        settings = AccountSettings.from_env({
+            'GEMP_USERNAME': 'randoblu', 'GEMP_PASSWORD': 'pw', 'BOT_JOINER_MODE': 'True',
+            'BOT_JOINER_TARGET': 'BotA', 'MAX_GAMES': '3', 'FIXED_DECK_NAME': 'light_baseline',
+        }, default_table_prefix='Bot Table')
+        assert (settings.username, settings.password, settings.table_prefix) == ('randoblu', 'pw', 'Bot Table')
+        assert (settings.joiner_mode, settings.joiner_target, settings.max_games) == (True, 'BotA', 3)
+        assert (settings.fixed_deck_name, settings.strategy_config) == ('light_baseline', None)
+        assert AccountSettings.from_env({}, default_username='rando_cal').username == 'rando_cal'
+
+    def test_table_state_per_session(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(table_manager, 'TABLE_STATE_FILE', tmp_path / 'current_table.json')
+        table_manager._save_table_state('t1', 'dark_baseline')
+        with use_session(GameSession("randoblu")):
+            assert table_manager._load_table_state() is None
+            table_manager._save_table_state('t2', 'light_baseline')
+            assert table_manager._load_table_state()['table_id'] == 't2'
+        assert table_manager._load_table_state()['table_id'] == 't1'
+        assert (tmp_path / 'current_table_randoblu.json').exists()
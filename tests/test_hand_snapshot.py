@@ -0,0 +1,149 @@
+"""
+Hand Snapshot Test Suite
+
+Tests the resolved hand shared by the deploy planner and evaluators:
+1. Effective cost/power and pilot flags per card, unresolved cards kept apart
+2. Cached per board version, rebuilt when the hand changes
+3. Planner helpers and the deploy evaluator share one metadata lookup per card
+4. Sorted views and memoized pilot matches feed the planner and evaluator
+
+Run with: python -m pytest tests/test_hand_snapshot.py -v
+"""
+
+import sys
+import os
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from engine import card_loader
+from engine.board_state import BoardState, CardInPlay, LocationInPlay
+from engine.deploy_planner import DeployPhasePlanner
+from engine.evaluators.deploy_evaluator import DeployEvaluator
+from engine.deploy_planner import _pilot_score_for_ship
+from engine.hand_snapshot import get_hand_snapshot, is_matching_pair
+
+
+def _meta(title, deploy, power, **flags):
+    fields = dict(title=title, deploy_value=deploy, power_value=power, ability_value=2,
+                  is_unique=False, is_character=False, is_starship=False, is_vehicle=False,
+                  is_location=False, is_weapon=False, is_device=False, is_pilot=False,
+                  is_warrior=False, has_permanent_pilot=False,
+                  has_attrition_immunity=False, immune_attrition_threshold=0, draws_extra_destiny=0,
+                  parsed=SimpleNamespace(deploy_reduction=0, force_drain_bonus=0))
+    fields.update(flags)
+    return SimpleNamespace(**fields)
+
+
+CARDS = {
+    "bp_pilot": _meta("Pilot", 3, 2, is_character=True, is_pilot=True),
+    "bp_trooper": _meta("Trooper", 2, 3, is_character=True, is_warrior=True),
+    "bp_fighter": _meta("Fighter", 4, 5, is_starship=True),
+    "bp_cruiser": _meta("Cruiser", 8, 7, is_starship=True, has_permanent_pilot=True,
+                        parsed=SimpleNamespace(deploy_reduction=2, force_drain_bonus=1)),
+}
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    calls = []
+
+    def get_card(blueprint_id):
+        calls.append(blueprint_id)
+        return CARDS.get(blueprint_id)
+
+    monkeypatch.setattr(card_loader, 'get_card', get_card)
+    return calls
+
+
+def _board():
+    bs = BoardState("bot")
+    bs.my_side = "dark"
+    bs.force_pile = 7
+    blueprints = ["bp_fighter", "bp_pilot", "bp_cruiser", "bp_trooper", "bp_missing", ""]
+    bs.cards_in_hand = [CardInPlay(card_id=f"h{i}", blueprint_id=bp, zone="HAND", owner="bot")
+                        for i, bp in enumerate(blueprints)]
+    return bs
+
+
+class TestSnapshot:
+
+    def test_resolved_cards(self, lookups):
+        hand = get_hand_snapshot(_board())
+        assert [c.name for c in hand] == ["Fighter", "Pilot", "Cruiser", "Trooper"]
+        assert [reason for _, reason in hand.unresolved] == ["no metadata found", "no blueprint_id"]
+
+        fighter, pilot, cruiser, trooper = hand.cards
+        assert fighter.needs_pilot and fighter.power == 0 and fighter.base_power == 5
+        assert (cruiser.cost, cruiser.power, cruiser.force_drain_bonus) == (6, 7, 1)
+        assert pilot.is_pure_pilot and pilot.pilot_power(2) == 2 and trooper.pilot_power(2) == 0
+        assert hand.pilots == [pilot]
+        assert [c.name for c in hand.by_cost] == ["Trooper", "Pilot", "Fighter", "Cruiser"]
+
+    def test_cached_per_board_version(self, lookups):
+        bs = _board()
+        hand = get_hand_snapshot(bs)
+        assert get_hand_snapshot(bs) is hand
+        assert len(lookups) == 5
+
+        bs.cards_in_hand.pop(0)
+        assert get_hand_snapshot(bs) is hand  # in-place change, not yet marked
+        bs.mark_changed()
+        changed = get_hand_snapshot(bs)
+        assert changed is not hand and [c.name for c in changed.starships] == ["Cruiser"]
+
+        bs.clear()
+        assert len(get_hand_snapshot(bs)) == 0
+
+
+class TestConsumers:
+
+    def test_consumers_share_lookups(self, lookups):
+        bs = _board()
+        planner = DeployPhasePlanner()
+        planner.battle_force_reserve = 0
+
+        deployable = planner._get_all_deployable_cards(bs)
+        assert [c['name'] for c in deployable] == ["Fighter", "Pilot", "Cruiser", "Trooper"]
+        assert deployable[0]['power'] == 0 and deployable[1]['pilot_adds_power'] == 1
+
+        all_cards = planner._get_all_hand_cards_as_dicts(bs)
+        assert [c['cost'] for c in all_cards] == [4, 3, 6, 2]
+
+        alternative = planner._find_cheaper_alternative(bs, "starship", 5)
+        assert alternative['name'] == "Fighter"
+        assert planner._find_cheaper_alternative(bs, "starship", 5, {"bp_fighter"}) is None
+
+        pilots = DeployEvaluator()._find_pilots_in_hand(bs)
+        assert [(card.card_id, meta.title) for card, meta in pilots] == [("h1", "Pilot")]
+
+        # The whole pipeline resolved each hand card once
+        assert len(lookups) == 5
+
+    def test_sorted_views_and_matching(self, lookups, monkeypatch):
+        pairs = []
+
+        def is_matching(pilot, ship):
+            pairs.append((pilot.title, ship.title))
+            return ship.title == "Fighter"
+
+        monkeypatch.setattr(card_loader, 'is_matching_pilot_ship', is_matching)
+        bs = _board()
+        hand = get_hand_snapshot(bs)
+        assert [c.name for c in hand.matching_pilots("bp_fighter")] == ["Pilot"]
+        assert hand.matching_pilots("bp_cruiser") == []
+        assert is_matching_pair("bp_pilot", "bp_fighter") and not is_matching_pair("bp_pilot", "")
+
+        # Planner pilot scoring reuses the memoized pairs
+        pilot, fighter = {'blueprint_id': "bp_pilot", 'power': 2}, {'blueprint_id': "bp_fighter"}
+        assert _pilot_score_for_ship(pilot, fighter) > _pilot_score_for_ship(pilot, {'blueprint_id': "bp_cruiser"})
+        assert pairs == [("Pilot", "Fighter"), ("Pilot", "Cruiser")]
+
+        evaluator = DeployEvaluator()
+        ok, pilot_meta, total, _ = evaluator._check_can_deploy_with_pilot(CARDS["bp_fighter"], bs)
+        assert (ok, pilot_meta.title, total) == (True, "Pilot", 7)
+
+        # Effective power, highest first: Cruiser (7 for 6) fits in 7 Force
+        space = LocationInPlay(card_id="s1", blueprint_id="", owner="bot", location_index=0,
+                               system_name="Hoth", is_space=True)
+        assert evaluator._calculate_deployable_power(bs, space, reserve_for_battle=False) == 7
@@ -0,0 +1,209 @@
+"""
+Location Topology Test Suite
+
+Tests the precomputed topology behind BoardState movement queries:
+1. System names, same-system and adjacency queries match the original scans
+2. Hyperspeed destinations match the original parsec scan
+3. The topology is rebuilt when locations are added, inserted or cleared
+4. Parsec-distance matrix
+
+Run with: python -m pytest tests/test_location_topology.py -v
+"""
+
+import sys
+import os
+import random
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from engine import board_state as board_state_module
+from engine.board_state import BoardState, CardInPlay, LocationInPlay
+
+
+SYSTEMS = ["Tatooine", "Naboo", "Hoth", "Endor", "Kessel"]
+SITES = ["Cantina", "Docking Bay", "Swamp", "Palace", "Forest"]
+
+# Fake card metadata: location blueprints carry parsecs, ship blueprints hyperspeed
+METADATA = {}
+for i, system in enumerate(SYSTEMS):
+    METADATA[f"sys_{system}"] = SimpleNamespace(parsec=str(i * 2), is_starship=False, hyperspeed=None)
+METADATA["sys_unknown"] = SimpleNamespace(parsec="*", is_starship=False, hyperspeed=None)
+for speed in range(0, 6):
+    METADATA[f"ship_{speed}"] = SimpleNamespace(parsec=None, is_starship=True, hyperspeed=str(speed))
+
+
+@pytest.fixture(autouse=True)
+def fake_metadata(monkeypatch):
+    monkeypatch.setattr(board_state_module, '_get_card_metadata', METADATA.get)
+
+
+# ----- Reference implementations (the original linear scans) -----
+
+def _ref_system_name(bs, idx):
+    if idx < 0 or idx >= len(bs.locations):
+        return ""
+    loc = bs.locations[idx]
+    if not loc:
+        return ""
+    name = loc.site_name or loc.system_name or ""
+    return name.split(":")[0].strip() if ":" in name else name.strip()
+
+
+def _ref_same_system(bs, idx):
+    system = _ref_system_name(bs, idx)
+    if not system:
+        return []
+    return [i for i, loc in enumerate(bs.locations)
+            if i != idx and loc and _ref_system_name(bs, i) == system]
+
+
+def _ref_adjacent(bs, idx):
+    system = _ref_system_name(bs, idx)
+    if not system:
+        return []
+    result = []
+    for other in (idx - 1, idx + 1):
+        if 0 <= other < len(bs.locations) and bs.locations[other] \
+                and _ref_system_name(bs, other) == system:
+            result.append(other)
+    return result
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _ref_hyperspeed(bs, idx):
+    if idx < 0 or idx >= len(bs.locations):
+        return []
+    loc = bs.locations[idx]
+    if not loc or not loc.is_space:
+        return []
+    meta = METADATA.get(loc.blueprint_id)
+    parsec = _int(meta.parsec) if meta else None
+    if parsec is None:
+        return []
+    speed = max([_int(METADATA[c.blueprint_id].hyperspeed) or 0 for c in loc.my_cards
+                 if c.blueprint_id in METADATA and METADATA[c.blueprint_id].is_starship] or [0])
+    if speed == 0:
+        return []
+    result = []
+    for i, other in enumerate(bs.locations):
+        if i == idx or not other or not other.is_space:
+            continue
+        other_meta = METADATA.get(other.blueprint_id)
+        other_parsec = _int(other_meta.parsec) if other_meta else None
+        if other_parsec is not None and abs(other_parsec - parsec) <= speed:
+            result.append(i)
+    return result
+
+
+# ----- Board generation -----
+
+def _random_location(rng, index):
+    system = rng.choice(SYSTEMS)
+    if rng.random() < 0.4:
+        blueprint = rng.choice([f"sys_{system}", "sys_unknown", ""])
+        loc = LocationInPlay(card_id=f"loc{index}", blueprint_id=blueprint, owner="me",
+                             location_index=index, system_name=system, site_name=system,
+                             is_space=True)
+        for n in range(rng.randint(0, 2)):
+            loc.my_cards.append(CardInPlay(card_id=f"s{index}_{n}", blueprint_id=f"ship_{rng.randint(0, 5)}",
+                                           zone="AT_LOCATION", owner="me", location_index=index))
+        return loc
+    site = f"{system}: {rng.choice(SITES)}"
+    return LocationInPlay(card_id=f"loc{index}", blueprint_id=f"site_{index}", owner="me",
+                          location_index=index, system_name=system, site_name=site,
+                          is_site=True, is_ground=True)
+
+
+def _random_board(seed):
+    rng = random.Random(seed)
+    bs = BoardState("me")
+    for index in range(rng.randint(0, 12)):
+        bs.add_location(_random_location(rng, index))
+    # Occasionally insert in the middle (shifts indices) or clear a slot
+    if bs.locations and rng.random() < 0.5:
+        bs.add_location(_random_location(rng, rng.randrange(len(bs.locations))))
+    if bs.locations and rng.random() < 0.5:
+        victim = rng.choice(bs.locations)
+        bs.cards_in_play[victim.card_id] = CardInPlay(card_id=victim.card_id, blueprint_id=victim.blueprint_id,
+                                                      zone="LOCATIONS", owner="me")
+        bs.remove_card(victim.card_id)
+    return bs
+
+
+class TestMatchesOriginalScans:
+
+    @pytest.mark.parametrize("seed", range(40))
+    def test_random_boards(self, seed):
+        bs = _random_board(seed)
+        for idx in range(-1, len(bs.locations) + 1):
+            assert bs.get_system_name(idx) == _ref_system_name(bs, idx)
+            assert bs.find_same_system_locations(idx) == _ref_same_system(bs, idx)
+            assert bs.find_adjacent_locations(idx) == _ref_adjacent(bs, idx)
+            assert bs.find_hyperspeed_destinations(idx) == _ref_hyperspeed(bs, idx)
+
+    def test_placeholder_slots(self):
+        bs = BoardState("me")
+        bs._ensure_location_exists(2)
+        bs.add_location(LocationInPlay(card_id="a", blueprint_id="site_a", owner="me", location_index=0,
+                                       system_name="Hoth", site_name="Hoth: Echo Base"))
+        for idx in range(len(bs.locations)):
+            assert bs.find_same_system_locations(idx) == _ref_same_system(bs, idx)
+            assert bs.find_adjacent_locations(idx) == _ref_adjacent(bs, idx)
+
+
+class TestInvalidation:
+
+    def _site(self, index, name):
+        return LocationInPlay(card_id=f"c{index}_{name}", blueprint_id="site", owner="me",
+                              location_index=index, system_name=name.split(":")[0], site_name=name)
+
+    def test_add_and_insert(self):
+        bs = BoardState("me")
+        bs.add_location(self._site(0, "Hoth: Echo Base"))
+        bs.add_location(self._site(1, "Naboo: Swamp"))
+        assert bs.find_adjacent_locations(0) == []
+        bs.add_location(self._site(1, "Hoth: Ice Plains"))  # inserted, Naboo shifts to 2
+        assert bs.find_adjacent_locations(0) == [1]
+        assert bs.find_same_system_locations(2) == []
+
+    def test_clear_slot(self):
+        bs = BoardState("me")
+        bs.add_location(self._site(0, "Hoth: Echo Base"))
+        bs.add_location(self._site(1, "Hoth: Ice Plains"))
+        assert bs.find_adjacent_locations(0) == [1]
+        bs.cards_in_play["c1_Hoth: Ice Plains"] = CardInPlay(card_id="c1_Hoth: Ice Plains", blueprint_id="site",
+                                                             zone="LOCATIONS", owner="me")
+        bs.remove_card("c1_Hoth: Ice Plains")
+        assert bs.find_adjacent_locations(0) == []
+
+    def test_locations_list_replaced(self):
+        bs = BoardState("me")
+        bs.add_location(self._site(0, "Hoth: Echo Base"))
+        assert bs.find_adjacent_locations(0) == []
+        bs.locations = [self._site(0, "Endor: Forest"), self._site(1, "Endor: Bunker")]
+        assert bs.find_adjacent_locations(0) == [1]
+
+
+class TestParsecDistances:
+
+    def test_distance_matrix(self):
+        bs = BoardState("me")
+        for index, system in enumerate(["Tatooine", "Hoth", "Kessel"]):
+            bs.add_location(LocationInPlay(card_id=f"l{index}", blueprint_id=f"sys_{system}", owner="me",
+                                           location_index=index, system_name=system, is_space=True))
+        bs.add_location(LocationInPlay(card_id="l3", blueprint_id="site_x", owner="me", location_index=3,
+                                       system_name="Hoth", site_name="Hoth: Echo Base"))
+        topology = bs.topology
+        assert topology.parsecs == [0, 4, 8, None]
+        assert topology.parsec_distance(0, 2) == 8
+        assert topology.parsec_distance(2, 1) == 4
+        assert topology.parsec_distance(0, 3) is None
+        assert topology.within_parsecs(1, 4) == [0, 2]
+        assert topology.within_parsecs(0, 3) == []
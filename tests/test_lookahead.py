@@ -0,0 +1,160 @@
+"""
+Lookahead Search Test Suite
+
+Tests the two-turn search over the lightweight board model:
+1. Legal actions keep the deploy -> battle -> move phase order
+2. Applying actions is copy-on-write and states are transposition keys
+3. Turn horizon: opponent reply, drains and our next turn
+4. Search finds the obvious good line within its budget
+5. Root action statistics and the board adapter
+
+Run with: python -m pytest tests/test_lookahead.py -v
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.lookahead import (
+    BATTLE,
+    DEPLOY,
+    END_TURN_ACTION,
+    MOVE,
+    PHASE_BATTLE,
+    LookaheadSearch,
+    SearchAction,
+    SearchCard,
+    SearchLocation,
+    SearchParams,
+    SearchState,
+    apply_action,
+    build_search_state,
+    is_terminal,
+    legal_actions,
+)
+from engine.board_state import BoardState, CardInPlay, LocationInPlay
+
+
+def _state(**overrides):
+    locations = (
+        SearchLocation("Hoth: Echo Base", False, my_power=5, their_power=2, my_ability=4,
+                       my_icons=1, their_icons=2, neighbours=(1,)),
+        SearchLocation("Hoth: Ice Plains", False, my_icons=1, their_icons=1, neighbours=(0,)),
+        SearchLocation("Hoth", True, their_power=3, my_icons=1, their_icons=1),
+    )
+    hand = (SearchCard("a", "Trooper", 2, 1, 1), SearchCard("b", "Trooper", 2, 1, 1),
+            SearchCard("c", "X-wing", 3, 2, 0, is_space=True))
+    values = dict(locations=locations, hand=hand, my_force=4, their_force=3, their_hand=4,
+                  my_life=30, their_life=30, my_activation=3, their_activation=4)
+    values.update(overrides)
+    return SearchState(**values)
+
+
+class TestModel:
+
+    def test_legal_actions(self):
+        state = _state()
+        actions = legal_actions(state)
+        deploys = [a for a in actions if a.kind == DEPLOY]
+        # Identical Troopers are deduplicated: Trooper x 2 ground + X-wing x 1 space
+        assert len(deploys) == 3
+        assert SearchAction(BATTLE, location=0) in actions
+        assert SearchAction(MOVE, location=1, source=0) in actions
+        assert actions[-1] == END_TURN_ACTION
+
+        after_battle = apply_action(state, SearchAction(BATTLE, location=0), SearchParams(), random.Random(1))
+        assert after_battle.phase == PHASE_BATTLE
+        assert not [a for a in legal_actions(after_battle) if a.kind == DEPLOY]
+        assert SearchAction(BATTLE, location=0) not in legal_actions(after_battle)
+
+    def test_copy_on_write(self):
+        state = _state()
+        deploy = SearchAction(DEPLOY, location=2, card=2)
+        after = apply_action(state, deploy, SearchParams(), random.Random(0))
+        assert after.locations[2].my_power == 3
+        assert after.my_force == 2 and len(after.hand) == 2
+        assert after.locations[0] is state.locations[0]
+        assert state.locations[2].my_power == 0  # parent untouched
+        assert apply_action(state, deploy, SearchParams(), random.Random(5)) == after
+        assert len({after, apply_action(state, deploy, SearchParams(), random.Random(5))}) == 1
+
+    def test_horizon(self):
+        params = SearchParams(turns=2)
+        end = apply_action(_state(), END_TURN_ACTION, params, random.Random(0))
+        assert is_terminal(end, params)
+        assert end.my_life <= 30
+
+        params = SearchParams(turns=3)
+        state = _state(their_hand=0).with_location(0, their_power=0)  # opponent cannot respond
+        next_turn = apply_action(state, END_TURN_ACTION, params, random.Random(0))
+        assert not is_terminal(next_turn, params)
+        assert next_turn.my_force == state.my_force + state.my_activation
+        # We control Echo Base (2 opponent icons) and drain at the start of our turn
+        assert next_turn.their_life == 30 - 2
+        assert next_turn.phase == 0 and next_turn.turn == 2
+
+
+class TestSearch:
+
+    def test_prefers_winning_line(self):
+        # Our 8 power vs their 1 with 3 of their icons: battling is clearly best
+        locations = (
+            SearchLocation("Endor: Bunker", False, my_power=8, their_power=1, my_ability=4,
+                           their_icons=3),
+            SearchLocation("Endor: Forest", False, my_icons=1),
+        )
+        state = SearchState(locations=locations, my_force=3, their_force=0, their_hand=0,
+                            my_life=20, their_life=20, phase=PHASE_BATTLE)
+        search = LookaheadSearch({'time_budget_ms': 200, 'max_iterations': 3000})
+        result = search.search(state)
+        assert result.best_line[0] == SearchAction(BATTLE, location=0)
+        assert result.value > 0
+        assert result.advantage(lambda a: a.kind == BATTLE) > 0
+
+    def test_iteration_cap_and_table_reuse(self):
+        search = LookaheadSearch({'time_budget_ms': 10000, 'max_iterations': 200})
+        first = search.search(_state())
+        assert first.iterations == 200
+        nodes = len(search._table)
+        search.search(_state())
+        assert len(search._table) >= nodes
+
+    def test_evaluate_line(self):
+        search = LookaheadSearch({'time_budget_ms': 10000, 'max_iterations': 100})
+        line = [SearchAction(DEPLOY, location=2, card=2)]
+        result = search.evaluate_line(_state(), line)
+        assert result.best_line[0] == line[0]
+        assert -1.0 <= result.value <= 1.0
+
+    def test_root_statistics(self):
+        search = LookaheadSearch({'time_budget_ms': 10000, 'max_iterations': 100})
+        result = search.search(_state())
+        assert result.iterations == 100
+        # The first iteration expands the root without visiting an action
+        assert sum(visits for visits, _ in result.root_actions.values()) == 99
+
+
+class TestBoardAdapter:
+
+    def test_build_search_state(self):
+        bs = BoardState("me")
+        bs.my_side = "light"
+        bs.force_pile = 5
+        bs.their_hand_size = 6
+        for idx, name in enumerate(["Hoth: Echo Base", "Hoth: Ice Plains"]):
+            loc = LocationInPlay(card_id=f"l{idx}", blueprint_id="", owner="me", location_index=idx,
+                                 system_name="Hoth", site_name=name, is_site=True, is_ground=True,
+                                 my_icons="1", their_icons="2")
+            bs.add_location(loc)
+        card = CardInPlay(card_id="c1", blueprint_id="", zone="AT_LOCATION", owner="me", location_index=0)
+        card.power, card.ability = 4, 3
+        bs.locations[0].my_cards.append(card)
+        bs.light_power_at_locations = {0: 4}
+
+        state = build_search_state(bs, hand=[])
+        assert state.my_force == 5 and state.their_hand == 6
+        assert [loc.neighbours for loc in state.locations] == [(1,), (0,)]
+        assert state.locations[0].my_power == 4 and state.locations[0].my_ability == 3
+        assert (state.locations[0].my_icons, state.locations[0].their_icons) == (1, 2)
+        assert state.my_activation == 2 and state.their_activation == 4
@@ -369,5 +369,281 @@ class TestNetworkArchitecture:
         print(f"Network has {params:,} parameters (~{params * 4 / 1024 / 1024:.1f}MB)")
 
 
+class TestAsyncTraining:
+    """Tests for versioned policy broadcast and trajectory tagging."""
+
+    def test_trajectory_policy_version_round_trip(self, tmp_path):
+        """policy_version survives save/load and reaches the batch."""
+        from pathlib import Path
+        from engine.neural_planner.experience import Experience, GameTrajectory, ExperienceBatch
+        from engine.neural_planner.trajectory_io import save_trajectory, load_trajectory
+
+        traj = GameTrajectory(policy_version=7)
+        traj.add_experience(Experience(
+            state=np.zeros(STATE_DIM, dtype=np.float32),
+            action=0,
+            action_mask=np.ones(NUM_ACTIONS, dtype=bool),
+            reward=0.0,
+            done=False,
+            value=0.0,
+            log_prob=-1.0,
+        ))
+        traj.finalize(won=True)
+
+        path = save_trajectory(traj, output_dir=Path(tmp_path))
+        loaded = load_trajectory(path)
+
+        assert loaded.policy_version == 7
+        batch = ExperienceBatch.from_trajectories([loaded])
+        assert list(batch.policy_versions) == [7]
+
+    @pytest.mark.skipif(
+        not os.environ.get('TEST_TORCH'),
+        reason="PyTorch tests disabled (set TEST_TORCH=1 to enable)"
+    )
+    def test_subscriber_picks_up_new_versions(self, tmp_path):
+        """Subscriber loads each newly published version exactly once."""
+        from engine.neural_planner.network import DeployPolicyNetwork
+        from engine.neural_planner.policy_broadcast import (
+            PolicyPublisher, PolicySubscriber, read_policy_version,
+        )
+
+        model_path = str(tmp_path / 'deploy_planner.pt')
+        learner = DeployPolicyNetwork()
+        publisher = PolicyPublisher(model_path, keep_versions=2)
+        subscriber = PolicySubscriber(model_path)
+        collector = DeployPolicyNetwork()
+
+        assert subscriber.sync(collector) is False
+
+        publisher.publish(learner.state_dict())
+        assert subscriber.sync(collector) is True
+        assert subscriber.version == 1
+        assert subscriber.sync(collector) is False
+
+        publisher.publish(learner.state_dict())
+        publisher.publish(learner.state_dict())
+        assert read_policy_version(model_path) == 3
+        assert subscriber.sync(collector) is True
+        assert subscriber.version == 3
+        # Only the retention window of versioned files is kept
+        assert sorted(p.name for p in tmp_path.glob('deploy_planner.v*.pt')) == [
+            'deploy_planner.v2.pt', 'deploy_planner.v3.pt',
+        ]
+
+
+    @pytest.mark.skipif(
+        not os.environ.get('TEST_TORCH'),
+        reason="PyTorch tests disabled (set TEST_TORCH=1 to enable)"
+    )
+    def test_learner_stops_when_collectors_die(self, tmp_path, monkeypatch):
+        """Failing collectors log and stop; the learner raises instead of hanging."""
+        import training.train_vs_rules as train_vs_rules
+
+        monkeypatch.setattr(train_vs_rules, 'COLLECTOR_POLL_SECONDS', 0.1)
+        arena = train_vs_rules.TrainingArena(model_dir=str(tmp_path / 'models'),
+                                             results_dir=str(tmp_path / 'results'),
+                                             games_per_batch=2, device='cpu')
+
+        def broken_game(pair_index, neural_is_creator=True):
+            raise RuntimeError("bot crashed")
+
+        monkeypatch.setattr(arena, '_play_game', broken_game)
+        with pytest.raises(RuntimeError, match="All collectors have stopped"):
+            arena.run_async_training(num_learner_steps=1, num_collectors=2)
+
+    @pytest.mark.skipif(
+        not os.environ.get('TEST_TORCH'),
+        reason="PyTorch tests disabled (set TEST_TORCH=1 to enable)"
+    )
+    def test_play_game_reads_bot_trajectory(self, tmp_path, monkeypatch):
+        """A game's trajectory comes from the neural bot's trajectory directory."""
+        from pathlib import Path
+        import training.train_vs_rules as train_vs_rules
+        from engine.neural_planner.experience import Experience, GameTrajectory
+        from engine.neural_planner.trajectory_io import save_trajectory
+
+        arena = train_vs_rules.TrainingArena(model_dir=str(tmp_path / 'models'),
+                                             results_dir=str(tmp_path / 'results'),
+                                             games_per_batch=1, device='cpu')
+        games = []
+
+        def fake_game(**kwargs):
+            # What the neural bot does at game end
+            games.append(kwargs)
+            traj = GameTrajectory(policy_version=3)
+            traj.add_experience(Experience(
+                state=np.zeros(STATE_DIM, dtype=np.float32), action=0,
+                action_mask=np.ones(NUM_ACTIONS, dtype=bool), reward=0.0,
+                done=False, value=0.0, log_prob=-1.0,
+            ))
+            traj.finalize(won=True)
+            save_trajectory(traj, output_dir=Path(kwargs['trajectory_dir']))
+            return {'completed': True, 'error': None}
+
+        monkeypatch.setattr(train_vs_rules, 'run_single_game', fake_game)
+        traj = arena._play_game(2, neural_is_creator=False)
+        assert traj.won and traj.policy_version == 3
+        assert games[0]['pair_index'] == 2 and games[0]['model_path'] == str(arena.latest_path)
+        assert not list(Path(games[0]['trajectory_dir']).glob('traj_*.json'))
+
+        monkeypatch.setattr(train_vs_rules, 'run_single_game',
+                            lambda **kwargs: {'completed': False, 'error': 'timeout'})
+        with pytest.raises(RuntimeError, match="saved no trajectory"):
+            arena._play_game(0)
+
+
+class TestCheckpointRegistry:
+    """Tests for the compact checkpoint registry."""
+
+    @pytest.mark.skipif(
+        not os.environ.get('TEST_TORCH'),
+        reason="PyTorch tests disabled (set TEST_TORCH=1 to enable)"
+    )
+    def test_fp16_dedup_and_retention(self, tmp_path):
+        """Unchanged tensors are stored once; retention keeps last + best."""
+        import torch
+        from engine.neural_planner.network import DeployPolicyNetwork
+        from engine.neural_planner.checkpoint_registry import CheckpointRegistry
+
+        network = DeployPolicyNetwork()
+        registry = CheckpointRegistry(str(tmp_path), keep_last=2, keep_best=1,
+                                      keep_optimizer=1)
+        optimizer_state = {'state': {}, 'param_groups': []}
+
+        registry.save('a', network.state_dict(), metrics={'win_rate': 0.9},
+                      optimizer_state=optimizer_state)
+        blobs_after_first = len(list((tmp_path / 'blobs').glob('*.pt')))
+        registry.save('b', network.state_dict(), metrics={'win_rate': 0.1},
+                      optimizer_state=optimizer_state)
+        # Identical weights add no new blobs
+        assert len(list((tmp_path / 'blobs').glob('*.pt'))) == blobs_after_first
+
+        with torch.no_grad():
+            network.policy[-1].bias.add_(1.0)
+        registry.save('c', network.state_dict(), metrics={'win_rate': 0.2},
+                      optimizer_state=optimizer_state)
+        registry.save('d', network.state_dict(), metrics={'win_rate': 0.3},
+                      optimizer_state=optimizer_state)
+
+        # 'b' falls out (not last 2, not best); 'a' is kept as best
+        assert [e['name'] for e in registry.list()] == ['a', 'c', 'd']
+        assert registry.best('win_rate')['name'] == 'a'
+        assert registry.load_optimizer('d') is not None
+        assert registry.load_optimizer('c') is None
+
+        # Reopened registry loads weights lazily, still fp16 until copied into a module
+        reopened = CheckpointRegistry(str(tmp_path))
+        weights = reopened.load_weights('d')
+        assert weights['policy.2.bias'].dtype == torch.float16
+        assert reopened.load_weights('d', dtype=torch.float32)['policy.2.bias'].dtype == torch.float32
+        restored = DeployPolicyNetwork()
+        restored.load_state_dict(weights)
+        assert torch.allclose(restored.policy[-1].bias, network.policy[-1].bias, atol=1e-2)
+
+    def test_train_neural_checkpoints(self, tmp_path, monkeypatch):
+        """Stats JSON is still written; only newly trained weights go to the registry."""
+        import json
+        from training import train_neural
+
+        class Registry:
+            def __init__(self):
+                self.saved = []
+
+            def save(self, name, state_dict, **kwargs):
+                self.saved.append((name, state_dict, kwargs['step']))
+
+        monkeypatch.setattr(train_neural, 'CHECKPOINT_DIR', tmp_path)
+        stats = train_neural.TrainingStats()
+        stats.record_game(won=True, game_length=6, num_experiences=10)
+        registry = Registry()
+
+        train_neural.save_checkpoint(stats, 1, registry, {'w': 1})
+        train_neural.save_checkpoint(stats, 2, registry, None)
+
+        assert [(step, weights) for _, weights, step in registry.saved] == [(1, {'w': 1})]
+        stats_files = sorted(tmp_path.glob('stats_*.json'))
+        assert len(stats_files) == 2
+        assert stats_files[0].name.replace('stats_', 'checkpoint_')[:-len('.json')] == registry.saved[0][0]
+        assert json.loads(stats_files[0].read_text())['total_wins'] == 1
+
+
+class TestQuantization:
+    """Tests for int8 quantization and its accuracy gate."""
+
+    @pytest.mark.skipif(
+        not os.environ.get('TEST_TORCH'),
+        reason="PyTorch tests disabled (set TEST_TORCH=1 to enable)"
+    )
+    def test_accuracy_gate(self, tmp_path):
+        """Int8 is only enabled for a matching report with enough agreement."""
+        import torch
+        from engine.neural_planner.network import DeployPolicyNetwork
+        from engine.neural_planner.neural_deploy_planner import NeuralDeployPlanner
+        from engine.neural_planner.quantization import (
+            compare_models, file_sha1, quantize_network, write_report,
+        )
+
+        model_path = str(tmp_path / 'deploy_planner.pt')
+        network = DeployPolicyNetwork().eval()
+        torch.save(network.state_dict(), model_path)
+
+        # No report yet: stays fp32
+        planner = NeuralDeployPlanner(model_path=model_path, quantize=True)
+        assert planner.quantized is False
+
+        states = np.random.randn(32, STATE_DIM).astype(np.float32)
+        masks = np.ones((32, NUM_ACTIONS), dtype=bool)
+        report = compare_models(network, quantize_network(network), states, masks,
+                                model_sha1=file_sha1(model_path))
+        assert report.num_states == 32
+        assert report.int8_size_mb < report.fp32_size_mb
+        write_report(report, model_path)
+
+        planner = NeuralDeployPlanner(model_path=model_path, quantize=True,
+                                      quantize_min_agreement=0.0)
+        assert planner.quantized is True
+
+        planner = NeuralDeployPlanner(model_path=model_path, quantize=True,
+                                      quantize_min_agreement=1.01)
+        assert planner.quantized is False
+
+
+class TestDistillation:
+    """Tests for recording rules-planner decisions for behaviour cloning."""
+
+    def test_recorder_records_new_plans_only(self, tmp_path):
+        """Cached plans are not re-recorded; samples round-trip to disk."""
+        from pathlib import Path
+        from engine.neural_planner.distillation import (
+            DistillationRecorder, load_distillation_samples,
+        )
+
+        class CachingPlanner:
+            current_plan = None
+
+            def create_plan(self, board_state):
+                if self.current_plan is None:
+                    self.current_plan = DeploymentPlan(
+                        strategy=DeployStrategy.HOLD_BACK, reason="test",
+                    )
+                return self.current_plan
+
+        recorder = DistillationRecorder(CachingPlanner(), output_dir=Path(tmp_path))
+        recorder.start_game('dark')
+
+        board_state = MockBoardState()
+        recorder.create_plan(board_state)
+        recorder.create_plan(board_state)
+        assert len(recorder.samples) == 1
+        assert recorder.samples[0]['action'] == 0
+
+        assert recorder.finalize_game(won=True) is None
+        states, masks, actions, planner_ms = load_distillation_samples(Path(tmp_path))
+        assert states.shape == (1, STATE_DIM)
+        assert masks.shape == (1, NUM_ACTIONS)
+        assert list(actions) == [0]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,236 @@
+"""
+Speculative Planner Test Suite
+
+Tests deploy plans precomputed during the opponent's turn:
+1. Projection of Force and turn number to our next deploy phase
+2. A plan made on identical inputs is served, with the planner's board outputs
+3. Board changes invalidate speculations; different Force is a miss
+4. DeployPhasePlanner.create_plan serves the speculative plan
+5. EventProcessor notifies board-changing events
+6. A loaded deck tracker's reserve count is keyed net of Force activation
+7. Speculative runs log no engine INFO, even with a configured planner level
+8. run_idle() plans within its time budget, pausing between plans
+
+Run with: python -m pytest tests/test_speculative_planner.py -v
+"""
+
+import sys
+import os
+import logging
+import xml.etree.ElementTree as ET
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from engine import deck_tracker as deck_tracker_module
+from engine import game_state_logger
+from engine import speculative_planner as speculative_module
+from engine.board_state import BoardState, CardInPlay, LocationInPlay
+from engine.deploy_planner import DeployPhasePlanner
+from engine.event_processor import EventProcessor
+from engine.speculative_planner import SpeculativePlanner, board_key
+from engine.tracing import TraceFilter, configure_tracing
+
+
+@pytest.fixture(autouse=True)
+def no_game_state_log(monkeypatch):
+    """Keep EventProcessor from writing the recorded game in logs/."""
+    monkeypatch.setattr(game_state_logger, 'log_game_event', lambda event, event_type: None)
+
+
+def _board(turn_player="opponent"):
+    bs = BoardState("bot")
+    bs.opponent_name = "opponent"
+    bs.my_side = "dark"
+    bs.current_turn_player = turn_player
+    bs.current_phase = "Deploy (turn #3)"
+    bs.turn_number = 3
+    bs.force_pile = 4
+    bs.reserve_deck = 20
+    bs.used_pile = 2
+    bs.dark_generation = 3
+    bs.activation = 3
+    for idx, name in enumerate(["Tatooine: Cantina", "Tatooine: Docking Bay 94"]):
+        bs.add_location(LocationInPlay(card_id=f"loc{idx}", blueprint_id=f"bp_loc{idx}", owner="bot",
+                                       location_index=idx, system_name="Tatooine", site_name=name,
+                                       is_site=True, is_ground=True, my_icons="1", their_icons="2"))
+    bs.cards_in_hand = [CardInPlay(card_id="h1", blueprint_id="bp_trooper", zone="HAND", owner="bot")]
+    return bs
+
+
+def _start_our_turn(bs, activated=3):
+    """What the server does between the speculation and our deploy phase."""
+    bs.current_turn_player = "bot"
+    bs.turn_number = 4
+    bs.current_phase = "Deploy (turn #4)"
+    bs.force_pile += activated
+    bs.reserve_deck -= activated
+
+
+@pytest.fixture
+def speculative(monkeypatch):
+    planner = SpeculativePlanner({'enabled': True, 'force_offsets': [0, -1]})
+    planner.register_planner(4, 1)
+    monkeypatch.setattr(speculative_module, '_speculative_planner', planner)
+    return planner
+
+
+class TestProjection:
+
+    def test_opponent_turn(self, speculative):
+        # Dark goes first: during Light's turn 3 our next turn is 4
+        assert speculative._projections(_board()) == [(7, 4), (6, 4)]
+        bs = _board()
+        bs.my_side = "light"
+        bs.light_generation = 2
+        assert speculative._projections(bs) == [(6, 3), (5, 3)]
+
+    def test_our_turn(self, speculative):
+        bs = _board(turn_player="bot")
+        bs.current_phase = "Activate (turn #3)"
+        bs.force_activated_this_turn = 1
+        assert speculative._projections(bs) == [(6, 3), (5, 3)]
+        bs.current_phase = "Control (turn #3)"
+        assert speculative._projections(bs) == [(4, 3)]
+        bs.current_phase = "Battle (turn #3)"
+        assert speculative._projections(bs) == []
+
+    def test_snapshot_is_isolated(self, speculative):
+        bs = _board()
+        snapshot = speculative._snapshot(bs, 7, 4)
+        assert (snapshot.force_pile, snapshot.reserve_deck, snapshot.used_pile) == (7, 17, 2)
+        assert snapshot.is_my_turn() and snapshot.turn_number == 4
+        assert snapshot.total_reserve_force() == bs.total_reserve_force()
+        assert (bs.force_pile, bs.turn_number, bs.current_turn_player) == (4, 3, "opponent")
+        assert snapshot.locations[0] is not bs.locations[0]
+
+
+class TestServe:
+
+    def test_hit_matches_fresh_plan(self, speculative):
+        bs = _board()
+        assert speculative.on_idle(bs)
+        assert speculative.on_idle(bs)
+        assert not speculative.on_idle(bs)  # both offsets planned
+        assert speculative.speculations == 2
+
+        _start_our_turn(bs)
+        fresh = DeployPhasePlanner(4, 1)
+        fresh.use_speculation = False
+        expected = fresh.create_plan(speculative._snapshot(bs, bs.force_pile, bs.turn_number))
+
+        plan = speculative.take(bs)
+        assert plan is not None
+        assert (plan.strategy, plan.reason, plan.instructions) == \
+            (expected.strategy, expected.reason, expected.instructions)
+        assert speculative.stats()['hits'] == 1 and speculative.saved_ms > 0
+
+    def test_run_idle_budget(self, speculative):
+        pauses = []
+        assert speculative.run_idle(_board(), pause=lambda: pauses.append(1)) == 2
+        assert len(pauses) == 2 and speculative.run_idle(_board()) == 0
+
+        speculative.idle_budget_ms = 0
+        speculative.on_board_event('GS')
+        speculative._speculations.clear()
+        assert speculative.run_idle(_board()) == 1  # budget spent after one plan
+
+    def test_board_change_invalidates(self, speculative):
+        bs = _board()
+        speculative.on_idle(bs)
+        speculative.on_idle(bs)
+
+        # An unrelated GS that changes nothing keeps the speculations
+        speculative.on_board_event('GS')
+        assert not speculative.on_idle(bs)
+        assert speculative.invalidated == 0
+
+        enemy = CardInPlay(card_id="e1", blueprint_id="bp_enemy", zone="AT_LOCATION",
+                           owner="opponent", location_index=0, power=5)
+        bs.cards_in_play["e1"] = enemy
+        bs.locations[0].their_cards.append(enemy)
+        speculative.on_board_event('PCIP')
+        assert speculative.on_idle(bs)
+        assert speculative.invalidated == 2
+
+    def test_different_force_is_miss(self, speculative):
+        bs = _board()
+        speculative.on_idle(bs)
+        speculative.on_idle(bs)
+        _start_our_turn(bs, activated=1)  # planned for 7 and 6 Force, have 5
+        assert speculative.take(bs) is None
+        assert speculative.misses == 1
+        assert speculative.take(bs) is None  # speculations are single-use
+
+    def test_loaded_deck_tracker(self, speculative, monkeypatch):
+        tracker = deck_tracker_module.DeckTracker()
+        tracker.load_deck_from_list(['bp_x'] * 30, 'dark')
+        monkeypatch.setattr(speculative_module, 'get_deck_tracker', lambda: tracker)
+        bs = _board()
+        speculative.on_idle(bs)
+        speculative.on_idle(bs)
+
+        # EventProcessor reports the activation to the tracker at turn start
+        _start_our_turn(bs)
+        tracker.force_activated(3)
+        assert speculative.take(bs) is not None
+        assert (speculative.hits, speculative.misses) == (1, 0)
+
+        # Reserve cards leaving before our turn are a real change
+        bs = _board()
+        speculative.on_idle(bs)
+        tracker.force_activated(1)
+        _start_our_turn(bs)
+        tracker.force_activated(3)
+        assert speculative.take(bs) is None
+
+    def test_disabled(self):
+        planner = SpeculativePlanner()
+        planner.register_planner(4, 1)
+        assert not planner.on_idle(_board())
+        assert planner.take(_board()) is None
+
+
+class TestIntegration:
+
+    def test_create_plan_serves_speculation(self, speculative):
+        bs = _board()
+        speculative.on_idle(bs)
+        _start_our_turn(bs)
+        spec_plan = speculative._speculations[board_key(bs, bs.force_pile, bs.turn_number)].plan
+
+        planner = DeployPhasePlanner(4, 1)
+        assert planner.create_plan(bs) is spec_plan
+        assert planner.current_plan is spec_plan
+        assert speculative.hits == 1
+
+    def test_event_processor_notifies(self):
+        events = []
+        processor = EventProcessor(_board())
+        processor.register_board_changed_callback(events.append)
+        processor.process_event(ET.fromstring('<ge type="GS"/>'))
+        processor.process_event(ET.fromstring('<ge type="M" message="hello"/>'))
+        assert events == ['GS']
+
+    def test_speculation_is_quiet(self, speculative, caplog):
+        planner_logger = logging.getLogger('engine.deploy_planner')
+        level = planner_logger.level
+        configure_tracing({'planner_level': 'INFO'})
+        caplog.set_level(logging.DEBUG)
+        caplog.handler.addFilter(TraceFilter())
+        try:
+            bs = _board()
+            caplog.clear()
+            assert speculative.on_idle(bs)
+            # Only the speculative planner's own report
+            assert [r.name for r in caplog.records if r.levelno < logging.WARNING] == \
+                ['engine.speculative_planner']
+
+            # The same planning outside a speculation is logged
+            _start_our_turn(bs)
+            fresh = DeployPhasePlanner(4, 1)
+            fresh.use_speculation = False
+            fresh.create_plan(bs)
+            assert any(r.name == 'engine.deploy_planner' and r.levelno == logging.INFO
+                       for r in caplog.records)
+        finally:
+            planner_logger.setLevel(level)
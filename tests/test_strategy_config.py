@@ -0,0 +1,104 @@
+"""
+Strategy Config Snapshot Test Suite
+
+Tests the compiled config snapshot:
+1. Values are read-only and reachable by mapping and attribute access
+2. Schema violations are dropped so code defaults apply
+3. reload() swaps the snapshot and bumps the revision
+4. section_reader()/weight_reader() follow the current snapshot
+
+Run with: python -m pytest tests/test_strategy_config.py -v
+"""
+
+import sys
+import os
+import json
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from engine import strategy_config
+from engine.strategy_config import StrategyConfig, section_reader, weight_reader
+
+
+CONFIG = {
+    'name': 'test',
+    'version': '1.2.3',
+    'battle_strategy': {'favorable_threshold': 5, 'bad_value': {'nested': 1}},
+    'monte_carlo': {'enabled': True, 'power_response_high': [4, 6]},
+    'global': {'chaos_percent': 10},
+    'evaluator_weights': {'battle': {'initiate_bonus': 30, 'label': 'x'}},
+    'broken_section': 7,
+}
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(CONFIG))
+    return path
+
+
+@pytest.fixture
+def config(config_file, monkeypatch):
+    cfg = StrategyConfig(str(config_file))
+    monkeypatch.setattr(strategy_config, '_config', cfg)
+    return cfg
+
+
+class TestSnapshot:
+
+    def test_values(self, config):
+        snapshot = config.snapshot
+        assert (snapshot.name, snapshot.version) == ('test', '1.2.3')
+        assert config.get('battle_strategy', 'favorable_threshold', 4) == 5
+        assert snapshot.battle_strategy.favorable_threshold == 5
+        assert snapshot.global_.chaos_percent == 10
+        assert config.get_weight('battle', 'initiate_bonus') == 30.0
+        assert config.get_section('monte_carlo')['power_response_high'] == (4, 6)
+
+    def test_missing_values_use_defaults(self, config):
+        assert config.get('battle_strategy', 'missing', 3) == 3
+        assert config.get('no_such_section', 'key', 'd') == 'd'
+        assert config.get_weight('move', 'bonus', 7) == 7.0
+        assert config.snapshot.no_such_section.get('key', 1) == 1
+        with pytest.raises(AttributeError):
+            config.snapshot.battle_strategy.missing
+
+    def test_read_only(self, config):
+        with pytest.raises(AttributeError):
+            config.snapshot.battle_strategy.favorable_threshold = 1
+        with pytest.raises(TypeError):
+            config.get_section('battle_strategy')['favorable_threshold'] = 1
+        with pytest.raises(AttributeError):
+            config.snapshot.revision = 0
+
+    def test_schema_violations_dropped(self, config):
+        assert config.get('battle_strategy', 'bad_value', 'default') == 'default'
+        assert config.get_weight('battle', 'label', 2.0) == 2.0
+        assert config.get_section('broken_section') == {}
+        assert len(config.snapshot.errors) == 3
+
+
+class TestReload:
+
+    def test_reload_swaps_snapshot(self, config, config_file):
+        old = config.snapshot
+        read_threshold = section_reader('battle_strategy')
+        read_weight = weight_reader('battle')
+        assert read_threshold('favorable_threshold', 4) == 5
+
+        updated = dict(CONFIG, battle_strategy={'favorable_threshold': 2},
+                       evaluator_weights={'battle': {'initiate_bonus': 45}})
+        config_file.write_text(json.dumps(updated))
+        config.reload()
+
+        assert config.revision > old.revision
+        assert old.battle_strategy.favorable_threshold == 5
+        assert read_threshold('favorable_threshold', 4) == 2
+        assert read_weight('initiate_bonus', 0.0) == 45.0
+
+    def test_missing_file(self, tmp_path):
+        cfg = StrategyConfig(str(tmp_path / "missing.json"))
+        assert not cfg.is_loaded
+        assert cfg.get('battle_strategy', 'favorable_threshold', 4) == 4
+        assert cfg.name == 'default'
@@ -0,0 +1,184 @@
+"""
+Fleet Supervisor Test Suite
+
+Tests the multi-bot supervisor that replaces the run_botN.sh scripts:
+1. Fleet files merge shared and per-bot env and reject clashing bots
+2. Restart policies and the restart limit
+3. Forked workers are reaped and restarted until they exit cleanly
+4. The admin endpoint is answered without a server thread (workers are
+   forked from a single-threaded parent); bot health probes share one
+   deadline and the shipped fleet binds it to localhost
+5. Config.reload_env picks up a worker's own environment
+
+Run with: python -m pytest tests/test_supervisor.py -v
+"""
+
+import sys
+import os
+import json
+import socket
+import threading
+import time
+import urllib.request
+from dataclasses import fields
+from http.server import BaseHTTPRequestHandler, HTTPServer
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import supervisor as supervisor_module
+from config import config
+from supervisor import Supervisor, load_fleet, should_restart, DEFAULT_FLEET_PATH
+
+
+def _write_fleet(tmp_path, bots, **extra):
+    path = tmp_path / "fleet.json"
+    path.write_text(json.dumps(dict(env={"LOCAL_FAST_MODE": "true", "MAX_GAMES": 1}, bots=bots, **extra)))
+    return str(path)
+
+
+class TestFleetSpec:
+
+    def test_env_merge_and_only(self, tmp_path):
+        path = _write_fleet(tmp_path, [
+            {"name": "alpha", "env": {"BOT_PORT": "5101", "MAX_GAMES": "3"}},
+            {"env": {"GEMP_USERNAME": "beta", "BOT_PORT": 5102}},
+        ], restart={"policy": "always", "max_restarts": 2})
+        fleet = load_fleet(path)
+        alpha, beta = fleet.bots
+        assert alpha.env == {"LOCAL_FAST_MODE": "true", "MAX_GAMES": "3",
+                             "BOT_PORT": "5101", "GEMP_USERNAME": "alpha"}
+        assert beta.name == "beta" and beta.port == 5102 and beta.env["MAX_GAMES"] == "1"
+        assert (fleet.restart_policy, fleet.max_restarts) == ("always", 2)
+
+        assert [b.name for b in load_fleet(path, only=["beta"]).bots] == ["beta"]
+        with pytest.raises(ValueError):
+            load_fleet(path, only=["gamma"])
+
+    def test_rejects_clashes(self, tmp_path):
+        with pytest.raises(ValueError):
+            load_fleet(_write_fleet(tmp_path, [{"name": "a", "env": {"BOT_PORT": "5101"}},
+                                               {"name": "b", "env": {"BOT_PORT": "5101"}}]))
+        with pytest.raises(ValueError):
+            load_fleet(_write_fleet(tmp_path, [{"name": "a", "env": {"BOT_PORT": "5101"}}],
+                                    restart={"policy": "sometimes"}))
+
+    def test_shipped_fleet(self):
+        fleet = load_fleet(DEFAULT_FLEET_PATH)
+        assert len(fleet.bots) == 10
+        assert sorted(b.port for b in fleet.bots) == list(range(5001, 5011))
+        assert fleet.admin_host == "127.0.0.1"
+
+
+class TestRestarts:
+
+    def test_policies(self):
+        assert should_restart("on-failure", 1, 0, 3) and not should_restart("on-failure", 0, 0, 3)
+        assert should_restart("always", 0, 2, 3) and not should_restart("always", 0, 3, 3)
+        assert not should_restart("never", 1, 0, 3)
+
+    def test_workers_restart_until_clean_exit(self, tmp_path):
+        fleet = load_fleet(_write_fleet(tmp_path, [{"name": "a", "env": {"BOT_PORT": "5101"}},
+                                                   {"name": "b", "env": {"BOT_PORT": "5102"}}],
+                                        restart={"backoff_seconds": 0}))
+
+        def target(spec):
+            # Bot "a" fails on its first run; every other run exits cleanly
+            marker = tmp_path / f"{spec.name}.runs"
+            runs = int(marker.read_text()) if marker.exists() else 0
+            marker.write_text(str(runs + 1))
+            if spec.name == "a" and runs == 0:
+                sys.exit(3)
+
+        supervisor = Supervisor(fleet, target=target)
+        supervisor.start()
+        deadline = time.monotonic() + 10
+        while supervisor.active() and time.monotonic() < deadline:
+            supervisor.reap()
+            supervisor.restart_due()
+            time.sleep(0.01)
+
+        a, b = supervisor.bots["a"], supervisor.bots["b"]
+        assert (a.restarts, a.exit_code, a.state) == (1, 0, "exited")
+        assert (b.restarts, b.exit_code, b.state) == (0, 0, "exited")
+        assert (tmp_path / "a.runs").read_text() == "2"
+        assert supervisor.status()["bots"]["a"]["pid"] is None
+
+
+class TestAdmin:
+
+    def test_served_without_thread(self, tmp_path):
+        fleet = load_fleet(_write_fleet(tmp_path, [{"name": "a", "env": {"BOT_PORT": "5101"}}],
+                                        admin_port=0))
+        supervisor = Supervisor(fleet)
+        threads = threading.active_count()
+        supervisor.serve_admin()
+        try:
+            assert threading.active_count() == threads
+            port = supervisor._admin_server.server_address[1]
+            responses = []
+            client = threading.Thread(target=lambda: responses.append(json.loads(
+                urllib.request.urlopen(f'http://127.0.0.1:{port}/health', timeout=5).read())))
+            client.start()
+            deadline = time.monotonic() + 5
+            while not responses and time.monotonic() < deadline:
+                supervisor.wait(0.1)
+            client.join(5)
+            assert responses[0]["bots"]["a"]["state"] == "pending"
+        finally:
+            supervisor._admin_server.server_close()
+
+
+    def test_health_probes_share_one_deadline(self, tmp_path, monkeypatch):
+        class HealthHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps({"status": "ok"}).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        healthy = HTTPServer(('127.0.0.1', 0), HealthHandler)
+        server = threading.Thread(target=healthy.serve_forever, daemon=True)
+        server.start()
+        hung = socket.socket()  # accepts connections, never answers
+        hung.bind(('127.0.0.1', 0))
+        hung.listen(8)
+        closed = socket.socket()  # bound but not listening: refuses connections
+        closed.bind(('127.0.0.1', 0))
+        try:
+            ports = [healthy.server_address[1], hung.getsockname()[1], closed.getsockname()[1]]
+            fleet = load_fleet(_write_fleet(tmp_path, [{"name": f"b{i}", "env": {"BOT_PORT": str(port)}}
+                                                       for i, port in enumerate(ports)]))
+            supervisor = Supervisor(fleet)
+            for bot in supervisor.bots.values():
+                bot.state, bot.pid = "running", os.getpid()
+            monkeypatch.setattr(supervisor_module, 'STATUS_PROBE_SECONDS', 0.5)
+
+            start = time.monotonic()
+            bots = supervisor.status()["bots"]
+            assert time.monotonic() - start < 1.0
+            assert bots["b0"]["health"] == {"status": "ok"}
+            assert bots["b1"]["health"] is None and bots["b2"]["health"] is None
+        finally:
+            healthy.shutdown()
+            healthy.server_close()
+            hung.close()
+            closed.close()
+
+
+class TestConfigReload:
+
+    def test_reload_env(self, monkeypatch):
+        saved = {f.name: getattr(config, f.name) for f in fields(config)}
+        monkeypatch.setenv("GEMP_USERNAME", "worker_bot")
+        monkeypatch.setenv("BOT_PORT", "5107")
+        monkeypatch.setenv("LOCAL_FAST_MODE", "true")
+        try:
+            config.reload_env()
+            assert (config.GEMP_USERNAME, config.PORT, config.GAME_POLL_INTERVAL) == ("worker_bot", 5107, 0.05)
+        finally:
+            for name, value in saved.items():
+                setattr(config, name, value)
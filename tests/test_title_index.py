@@ -0,0 +1,103 @@
+"""
+Card Title Index Test Suite
+
+Tests the normalized title index built by CardDatabase.load():
+1. normalize_title() - strips unique markers, case and extra whitespace
+2. Exact, prefix and substring lookups
+3. Substring search agrees with a linear scan and keeps load order
+4. find_card_by_title() - exact match preferred over partial matches
+
+Run with: python -m pytest tests/test_title_index.py -v
+"""
+
+import sys
+import os
+import json
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from engine.card_loader import CardDatabase
+from engine.title_index import normalize_title
+
+
+def _card_json(gemp_id, title, card_type="Character"):
+    return {'gempId': gemp_id, 'front': {'title': title, 'type': card_type}}
+
+
+DARK_CARDS = [
+    _card_json("1_168", "•Darth Vader"),
+    _card_json("1_171", "•Grand Moff Tarkin"),
+    _card_json("9_113", "•Darth Vader, Dark Lord Of The Sith"),
+    _card_json("1_305", "Imperial Barrier", "Interrupt"),
+    _card_json("1_301", "Ghhhk", "Interrupt"),
+]
+
+LIGHT_CARDS = [
+    _card_json("1_19", "•Luke Skywalker"),
+    _card_json("9_34", "•Luke Skywalker, Jedi Knight"),
+    _card_json("1_108", "Rebel Barrier", "Interrupt"),
+    _card_json("1_281", "Houjix", "Interrupt"),
+    _card_json("1_143", "•Millennium Falcon", "Starship"),
+]
+
+
+@pytest.fixture
+def card_db(tmp_path):
+    (tmp_path / "Dark.json").write_text(json.dumps({'cards': DARK_CARDS}))
+    (tmp_path / "Light.json").write_text(json.dumps({'cards': LIGHT_CARDS}))
+    db = CardDatabase(str(tmp_path))
+    db.load()
+    return db
+
+
+class TestNormalizeTitle:
+
+    def test_strips_unique_marker_and_case(self):
+        assert normalize_title("•Luke Skywalker") == "luke skywalker"
+
+    def test_collapses_whitespace(self):
+        assert normalize_title("  •Han   Solo ") == "han solo"
+
+    def test_empty(self):
+        assert normalize_title("") == ""
+        assert normalize_title(None) == ""
+
+
+class TestTitleLookups:
+
+    def test_exact(self, card_db):
+        cards = card_db.find_by_exact_title("darth vader")
+        assert [c.blueprint_id for c in cards] == ["1_168"]
+        assert card_db.find_by_exact_title("•DARTH VADER") == cards
+        assert card_db.find_by_exact_title("vader") == []
+
+    def test_prefix(self, card_db):
+        cards = card_db.search_by_prefix("•Luke Sky")
+        assert [c.blueprint_id for c in cards] == ["1_19", "9_34"]
+        assert card_db.search_by_prefix("yoda") == []
+
+    def test_substring_matches_linear_scan(self, card_db):
+        queries = ["vader", "barrier", "luke", "al", "x", "sith", "jedi knight",
+                   "millennium falcon", "nothing matches", ""]
+        for query in queries:
+            expected = [c for c in card_db.cards.values()
+                        if normalize_title(query) in normalize_title(c.title)]
+            assert card_db.search_by_title(query) == expected, query
+
+    def test_substring_ignores_unique_marker_in_query(self, card_db):
+        cards = card_db.search_by_title("•Darth Vader")
+        assert [c.blueprint_id for c in cards] == ["1_168", "9_113"]
+
+    def test_find_card_prefers_exact_match(self, card_db):
+        # "Darth Vader" is a substring of both Vaders but an exact match for one
+        assert card_db.find_card_by_title("Darth Vader").blueprint_id == "1_168"
+        assert card_db.find_card_by_title("•Luke Skywalker, Jedi Knight").blueprint_id == "9_34"
+
+    def test_find_card_falls_back_to_partial_match(self, card_db):
+        assert card_db.find_card_by_title("Tarkin").blueprint_id == "1_171"
+        assert card_db.find_card_by_title("Boba Fett") is None
+
+    def test_index_rebuilt_when_cards_added(self, card_db):
+        extra = card_db.find_by_exact_title("houjix")[0]
+        card_db.cards["test_copy"] = extra
+        assert len(card_db.find_by_exact_title("houjix")) == 2
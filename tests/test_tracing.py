@@ -0,0 +1,154 @@
+"""
+Sampled Tracing Test Suite
+
+Tests lazy, sampled logging for the planner, evaluators and event loop:
+1. Logger names map to traced subsystems by prefix
+2. 1 in N games is traced in full; the others keep summaries and warnings
+3. Lazy messages are only built when the record will be kept
+4. Per-subsystem levels come from config and sampling is per game session
+5. Traced modules log through tracers, so unsampled detail builds no record
+6. quiet() keeps only warnings in its own thread/greenlet
+
+Run with: python -m pytest tests/test_tracing.py -v
+"""
+
+import sys
+import os
+import json
+import logging
+import threading
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from engine import deploy_planner, event_processor, strategy_config, tracing
+from engine.evaluators import base as evaluators_base, deploy_evaluator
+from engine.game_session import GameSession, use_session
+from engine.strategy_config import StrategyConfig
+from engine.tracing import (GameSampler, TraceFilter, Tracer, begin_game, current_game_trace, get_tracer,
+                            quiet, subsystem_for)
+
+
+@pytest.fixture
+def tracing_config(tmp_path, monkeypatch):
+    """Point the strategy config at a 'tracing' section; restore levels afterwards."""
+    monkeypatch.setattr(tracing, '_sampler', GameSampler())
+
+    def use(section):
+        path = tmp_path / "tracing.json"
+        path.write_text(json.dumps({'tracing': section}))
+        monkeypatch.setattr(strategy_config, '_config', StrategyConfig(str(path)))
+
+    yield use
+    tracing.configure_tracing({})
+    for prefixes in tracing.SUBSYSTEMS.values():
+        for prefix in prefixes:
+            logging.getLogger(prefix).setLevel(logging.NOTSET)
+
+
+def _record(name, level=logging.INFO, **extra):
+    record = logging.LogRecord(name, level, __file__, 1, "msg", None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestSubsystems:
+
+    def test_prefix_mapping(self):
+        assert subsystem_for('engine.deploy_planner') == 'planner'
+        assert subsystem_for('engine.evaluators.base.DeployEvaluator') == 'evaluators'
+        assert subsystem_for('app.events') == 'events'
+        assert subsystem_for('engine.deploy_planner_extra') is None
+        assert subsystem_for('engine.client') is None
+        with pytest.raises(ValueError):
+            get_tracer('network')
+
+
+class TestSampling:
+
+    def test_one_in_n_games(self, tracing_config):
+        tracing_config({'sample_every': 3})
+        assert [begin_game(f"g{i}").full for i in range(1, 8)] == [True, False, False, True, False, False, True]
+
+    def test_filter_in_unsampled_game(self, tracing_config):
+        tracing_config({'sample_every': 2})
+        trace_filter = TraceFilter()
+        begin_game("g1")
+        assert trace_filter.filter(_record('engine.deploy_planner'))
+
+        begin_game("g2")
+        assert not current_game_trace().full
+        assert not trace_filter.filter(_record('engine.deploy_planner'))
+        assert not trace_filter.filter(_record('engine.evaluators.battle_evaluator', logging.DEBUG))
+        assert trace_filter.filter(_record('engine.deploy_planner', logging.WARNING))
+        assert trace_filter.filter(_record('engine.deploy_planner', trace_summary=True))
+        assert trace_filter.filter(_record('engine.client'))
+
+    def test_sessions_sample_independently(self, tracing_config):
+        tracing_config({'sample_every': 2})
+        begin_game("g1")
+        begin_game("g2")
+        with use_session(GameSession("alpha")):
+            assert begin_game("a1").full and current_game_trace().game_id == "a1"
+        assert not current_game_trace().full
+
+
+class TestTracer:
+
+    def test_lazy_messages_and_levels(self, tracing_config, caplog):
+        tracing_config({'sample_every': 2, 'planner_level': 'INFO', 'evaluators_level': 'WARNING'})
+        trace = get_tracer('planner', logging.getLogger('engine.deploy_planner'))
+        built = []
+
+        def message():
+            built.append(1)
+            return "detail"
+
+        begin_game("g1")
+        assert logging.getLogger('engine.evaluators').level == logging.WARNING
+        assert not get_tracer('evaluators').enabled()
+        with caplog.at_level(logging.INFO, logger='engine.deploy_planner'):
+            trace.info(message)
+            begin_game("g2")
+            trace.info(message)
+            trace.summary("FINAL PLAN")
+        assert len(built) == 1
+        assert [r.getMessage() for r in caplog.records if r.name == 'engine.deploy_planner'] == ["detail", "FINAL PLAN"]
+
+    def test_module_loggers_are_tracers(self, tracing_config):
+        tracing_config({'sample_every': 2})
+        for module in (deploy_planner, deploy_evaluator, evaluators_base, event_processor):
+            assert isinstance(module.logger, Tracer)
+
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        planner_logger = deploy_planner.logger.logger
+        planner_logger.addHandler(handler)
+        planner_logger.setLevel(logging.INFO)    # reset by the fixture
+        try:
+            begin_game("g1")
+            deploy_planner.logger.info("kept")
+            begin_game("g2")
+            deploy_planner.logger.info("dropped before a record is built")
+            deploy_planner.logger.warning("warnings are kept")
+        finally:
+            planner_logger.removeHandler(handler)
+        assert [r.getMessage() for r in records] == ["kept", "warnings are kept"]
+        assert records[0].funcName == 'test_module_loggers_are_tracers'
+
+    def test_quiet_is_per_task(self, tracing_config):
+        tracing_config({'planner_level': 'INFO'})
+        begin_game("g1")
+        trace = get_tracer('planner')
+        record = logging.LogRecord('engine.board_state', logging.INFO, __file__, 0, "detail", None, None)
+        seen = {}
+        with quiet():
+            with quiet():
+                pass
+            assert not trace.enabled() and trace.enabled(logging.WARNING)
+            assert not TraceFilter().filter(record)
+            other = threading.Thread(target=lambda: seen.update(enabled=trace.enabled()))
+            other.start()
+            other.join()
+        assert seen == {'enabled': True}
+        assert trace.enabled() and TraceFilter().filter(record)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Replay recorded decisions through the brain and measure decision latency.
+
+Reads the decision XML logs written by engine/decision_logger.py
+(logs/*_decisions.log), rebuilds a minimal BoardState for each entry from
+its Turn/Phase/MyTurn header and times DecisionHandler._use_brain() with a
+fresh StaticBrain.
+
+Usage:
+    python tools/bench_decisions.py logs/rando_decisions.log
+    python tools/bench_decisions.py logs/ --repeat 20 --json
+
+Metrics reported (overall and per decision type):
+- count, mean, p50, p95 and max latency in microseconds
+"""
+
+import argparse
+import json
+import logging
+import re
+import statistics
+import sys
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+ENTRY_HEADER = re.compile(r'^=== DECISION (\S*) @ ')
+TURN_LINE = re.compile(r'^Turn: (\d+), Phase: (.*), MyTurn: (True|False)$')
+
+
+def parse_decision_log(log_path: Path) -> List[Dict[str, Any]]:
+    """
+    Parse one decision log into entries.
+
+    Returns:
+        List of dicts with id, type, turn, phase, my_turn and the XML element
+    """
+    entries = []
+    current = None
+    xml_lines: List[str] = []
+
+    with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
+        for raw in f:
+            line = raw.rstrip('\n')
+            header = ENTRY_HEADER.match(line)
+            if header:
+                current = {'id': header.group(1), 'type': '', 'turn': 0,
+                           'phase': '', 'my_turn': True}
+                xml_lines = []
+                continue
+            if current is None:
+                continue
+
+            if line.startswith('Type: ') and not current['type']:
+                current['type'] = line[len('Type: '):]
+            elif TURN_LINE.match(line) and not xml_lines:
+                turn, phase, my_turn = TURN_LINE.match(line).groups()
+                current.update(turn=int(turn), phase=phase, my_turn=my_turn == 'True')
+            elif line.startswith('Chosen: '):
+                try:
+                    current['xml'] = ET.fromstring('\n'.join(xml_lines))
+                    entries.append(current)
+                except ET.ParseError:
+                    pass
+                current = None
+            elif line.lstrip().startswith('<') or xml_lines:
+                if line.strip():
+                    xml_lines.append(line)
+
+    return entries
+
+
+def _board_for(entry: Dict[str, Any]):
+    from engine.board_state import BoardState
+
+    bs = BoardState('me')
+    bs.opponent_name = 'opponent'
+    bs.turn_number = entry['turn']
+    bs.current_phase = entry['phase']
+    bs.current_turn_player = 'me' if entry['my_turn'] else 'opponent'
+    return bs
+
+
+def replay(entries: List[Dict[str, Any]], repeat: int = 1) -> Dict[str, List[float]]:
+    """
+    Time each entry through DecisionHandler._use_brain().
+
+    Returns:
+        Dict of decision type -> latencies in microseconds
+    """
+    from brain import StaticBrain
+    from engine.decision_handler import DecisionHandler
+
+    brain = StaticBrain()
+    timings: Dict[str, List[float]] = {}
+
+    for _ in range(repeat):
+        for entry in entries:
+            bs = _board_for(entry)
+            start = time.perf_counter()
+            DecisionHandler._use_brain(entry['xml'], bs, entry['turn'], brain)
+            elapsed = (time.perf_counter() - start) * 1e6
+            timings.setdefault(entry['type'] or 'UNKNOWN', []).append(elapsed)
+
+    return timings
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        'count': len(ordered),
+        'mean_us': round(statistics.fmean(ordered), 1),
+        'p50_us': round(ordered[len(ordered) // 2], 1),
+        'p95_us': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1),
+        'max_us': round(ordered[-1], 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure decision latency on recorded decisions')
+    parser.add_argument('paths', nargs='+', type=str,
+                        help='Decision log files or directories containing *_decisions.log')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Times to replay every decision (default: 5)')
+    parser.add_argument('--json', action='store_true',
+                        help='Output as JSON instead of human-readable')
+
+    args = parser.parse_args()
+
+    log_files: List[Path] = []
+    for path in map(Path, args.paths):
+        if path.is_dir():
+            log_files.extend(sorted(path.glob('*_decisions.log')))
+        elif path.exists():
+            log_files.append(path)
+
+    entries = [e for log in log_files for e in parse_decision_log(log)]
+    if not entries:
+        print("ERROR: No decisions found")
+        sys.exit(1)
+
+    # Evaluators log heavily at INFO; keep that out of the measurement
+    logging.disable(logging.CRITICAL)
+    timings = replay(entries, args.repeat)
+    logging.disable(logging.NOTSET)
+
+    results = {
+        'decisions': len(entries),
+        'repeat': args.repeat,
+        'overall': summarize([t for samples in timings.values() for t in samples]),
+        'by_type': {t: summarize(samples) for t, samples in sorted(timings.items())},
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print("=" * 60)
+    print(f"DECISION LATENCY ({results['decisions']} decisions x {args.repeat})")
+    print("=" * 60)
+    for label, stats in [('ALL', results['overall'])] + list(results['by_type'].items()):
+        print(f"{label:<20} n={stats['count']:<6} mean={stats['mean_us']:>9.1f}us "
+              f"p50={stats['p50_us']:>9.1f}us p95={stats['p95_us']:>9.1f}us")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Replay recorded game events through the EventProcessor and measure how
+many events are fully processed per update, with and without GS coalescing.
+
+Reads the game state XML logs written by engine/game_state_logger.py
+(logs/*_gamestate.xml). The log has no update boundaries, so events logged
+in the same millisecond are treated as one update batch (they were
+processed back to back from one server response).
+
+Usage:
+    python tools/bench_events.py logs/rando_gamestate.xml --player rando_cal
+    python tools/bench_events.py logs/ --repeat 20 --json
+
+Metrics reported (coalescing off and on):
+- updates, events and GS events fully applied per update
+- GS events coalesced
+- replay time in milliseconds (best of --repeat)
+- whether both runs end in the same board state
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+import xml.etree.ElementTree as ET
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def parse_game_state_log(log_path: Path) -> List[List[ET.Element]]:
+    """
+    Parse one game state log into update batches.
+
+    Returns:
+        List of batches, each a list of <ge> elements in log order
+    """
+    try:
+        root = ET.parse(log_path).getroot()
+    except ET.ParseError:
+        # Logs of unfinished games lack the closing tag
+        text = log_path.read_text(encoding='utf-8', errors='ignore')
+        root = ET.fromstring(text + '\n</game_log>')
+
+    events: List[Tuple[str, ET.Element]] = []
+    for entry in root.iter('event'):
+        ge = entry.find('ge')
+        if ge is not None:
+            events.append((entry.get('t', ''), ge))
+    return [[ge for _, ge in batch] for _, batch in groupby(events, key=lambda e: e[0])]
+
+
+def _guess_player(batches: List[List[ET.Element]]) -> str:
+    """Our player name: participantId of the first P event."""
+    for batch in batches:
+        for event in batch:
+            if event.get('type') == 'P' and event.get('participantId'):
+                return event.get('participantId')
+    return ''
+
+
+def replay(batches: List[List[ET.Element]], player: str, coalesce: bool) -> Dict[str, Any]:
+    """Replay every batch through a fresh EventProcessor."""
+    from engine.board_state import BoardState
+    from engine.event_processor import EventProcessor
+
+    board_state = BoardState(player)
+    processor = EventProcessor(board_state)
+    processor.coalesce_gs = coalesce
+
+    events = 0
+    start = time.perf_counter()
+    for batch in batches:
+        processor.process_events(batch)
+        events += len(batch)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        'updates': len(batches),
+        'events': events,
+        'gs_applied': processor.gs_applied,
+        'gs_coalesced': processor.gs_coalesced,
+        'time_ms': elapsed_ms,
+        'final_state': _fingerprint(board_state),
+    }
+
+
+def _fingerprint(board_state) -> Tuple:
+    return (board_state.force_pile, board_state.used_pile, board_state.reserve_deck,
+            board_state.their_force_pile, board_state.activation,
+            tuple(sorted(board_state.dark_power_at_locations.items())),
+            tuple(sorted(board_state.light_power_at_locations.items())))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure GS coalescing on recorded game events')
+    parser.add_argument('paths', nargs='+', type=str,
+                        help='Game state logs or directories containing *_gamestate.xml')
+    parser.add_argument('--player', type=str, default=None,
+                        help='Our player name (default: first participant in each log)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Times to replay every log (default: 5)')
+    parser.add_argument('--json', action='store_true',
+                        help='Output as JSON instead of human-readable')
+
+    args = parser.parse_args()
+
+    log_files: List[Path] = []
+    for path in map(Path, args.paths):
+        if path.is_dir():
+            log_files.extend(sorted(path.glob('*_gamestate.xml')))
+        elif path.exists():
+            log_files.append(path)
+
+    games = [batches for batches in map(parse_game_state_log, log_files) if batches]
+    if not games:
+        print("ERROR: No events found")
+        sys.exit(1)
+
+    # The replay must not overwrite the game state log it is reading
+    from engine import game_state_logger
+    game_state_logger.get_game_state_log().disable()
+
+    logging.disable(logging.CRITICAL)
+    results: Dict[str, Any] = {'logs': len(games), 'repeat': args.repeat}
+    for label, coalesce in (('before', False), ('after', True)):
+        best_ms = None
+        for _ in range(args.repeat):
+            runs = [replay(batches, args.player or _guess_player(batches), coalesce) for batches in games]
+            elapsed = sum(r['time_ms'] for r in runs)
+            best_ms = elapsed if best_ms is None else min(best_ms, elapsed)
+
+        totals: Dict[str, Any] = {key: sum(r[key] for r in runs)
+                                  for key in ('updates', 'events', 'gs_applied', 'gs_coalesced')}
+        updates = max(1, totals['updates'])
+        totals['events_applied_per_update'] = round((totals['events'] - totals['gs_coalesced']) / updates, 2)
+        totals['gs_applied_per_update'] = round(totals['gs_applied'] / updates, 2)
+        totals['time_ms'] = round(best_ms, 1)
+        totals['final_states'] = [r['final_state'] for r in runs]
+        results[label] = totals
+    logging.disable(logging.NOTSET)
+
+    results['same_final_state'] = results['before'].pop('final_states') == results['after'].pop('final_states')
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print("=" * 60)
+    print(f"GS COALESCING ({results['logs']} logs, {results['before']['updates']} updates)")
+    print("=" * 60)
+    for label in ('before', 'after'):
+        stats = results[label]
+        print(f"{label:<8} events/update={stats['events_applied_per_update']:<6} "
+              f"GS/update={stats['gs_applied_per_update']:<6} coalesced={stats['gs_coalesced']:<5} "
+              f"time={stats['time_ms']:.1f}ms")
+    print(f"Same final board state: {results['same_final_state']}")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
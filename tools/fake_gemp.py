@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the GEMP server, for transport and load testing.
+
+Serves the endpoints GEMPClient uses, with the same paths and XML shapes,
+from in-memory state:
+
+    POST /login                      any username (or the configured accounts)
+    GET  /hall, POST /hall/update    hall tables, <hall channelNumber="...">
+    POST /hall                       create a table
+    POST /hall/{tableId}             join a table, or action=drop to leave it
+    GET  /deck/libraryList, /deck/list
+    GET  /game/{gameId}              initial <gameState cn="..."> with the first batch
+    POST /game/{gameId}              next scripted <update cn="..."> batch, or a decision answer
+    POST /game/{gameId}/concede, GET /game/{gameId}/cardInfo
+    GET/POST /chat/Game{gameId}      register, poll and post chat messages
+
+Games are scripted: every game replays one list of event batches (for
+example a recorded logs/*_gamestate.xml), optionally with a synthetic
+INTEGER decision every N batches that must be answered before the stream
+continues. With auto_opponent, a created table is joined by a scripted
+opponent and its game starts at once.
+
+Failures and latency are injectable:
+
+    server = FakeGempServer(latency=0.02, jitter=0.01)
+    server.script_game(load_game_batches('logs/rando_gamestate.xml'), decision_every=5)
+    server.fail('/game/', 409, times=2, method='POST')   # next two game updates -> 409
+    server.start()
+    client = GEMPClient(server.url)
+
+Usage:
+    python tools/fake_gemp.py --port 8082 --game logs/rando_gamestate.xml
+    GEMP_SERVER_URL=http://localhost:8082/gemp-swccg-server python app.py
+"""
+
+import argparse
+import itertools
+import logging
+import random
+import re
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logger = logging.getLogger(__name__)
+
+# Path prefix of the real server (GEMP_SERVER_URL ends with it)
+BASE_PATH = '/gemp-swccg-server'
+
+DEFAULT_LIBRARY_DECKS = {'dark': ['dark_baseline'], 'light': ['light_baseline']}
+
+
+def load_game_batches(log_path: str) -> List[List[ET.Element]]:
+    """Event batches of a recorded game state log (see tools/bench_events.py)."""
+    from tools.bench_events import parse_game_state_log
+    return parse_game_state_log(Path(log_path))
+
+
+def synthetic_batches(turns: int = 3, player: str = 'rando_cal') -> List[List[ET.Element]]:
+    """A minimal game: a turn change and a force/power update per turn."""
+    batches = []
+    for turn in range(1, turns + 1):
+        gs = ET.Element('ge', type='GS', darkForceGeneration='3', lightForceGeneration='2')
+        ET.SubElement(gs, 'playerZones', name=player, FORCE_PILE=str(turn), USED_PILE='0',
+                      RESERVE_DECK=str(40 - turn), HAND='8')
+        batches.append([ET.Element('ge', type='TC', participantId=player)])
+        batches.append([ET.Element('ge', type='GPC', phase='Deploy'), gs])
+    return batches
+
+
+@dataclass
+class FakeTable:
+    """A hall table."""
+    table_id: str
+    name: str
+    players: List[Tuple[str, str]]          # (name, side)
+    status: str = 'WAITING'
+    game_id: str = ''
+    game_format: str = 'Open'
+
+    def to_xml(self) -> ET.Element:
+        return ET.Element('table', id=self.table_id, format=self.game_format, gameId=self.game_id,
+                          players=','.join(f"{name} ({side.upper()})" for name, side in self.players),
+                          status=self.status, statusDescription=self.status.title(),
+                          tournament=f"Casual - {self.name}", watchable='false')
+
+
+@dataclass
+class GameStream:
+    """One player's position in a scripted game."""
+    cn: int = 0
+    next_batch: int = 0
+    pending_decision: str = ''
+    decisions_answered: int = 0
+
+
+@dataclass
+class FakeGame:
+    """A scripted game; every player reads the same batches."""
+    game_id: str
+    table: FakeTable
+    batches: List[str]                       # serialized <ge> elements per batch
+    decision_every: int = 0
+    streams: Dict[str, GameStream] = field(default_factory=dict)
+    chat: List[Tuple[int, str, str]] = field(default_factory=list)   # (msg_id, from, text)
+    finished: bool = False
+
+
+@dataclass
+class FailureRule:
+    """Answer the next `times` requests under path_prefix with status."""
+    path_prefix: str
+    status: int
+    times: int
+    method: str = ''        # '' = any method
+
+
+class FakeGempServer:
+    """In-memory GEMP server on a background thread."""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0,
+                 jitter: float = 0.0, accounts: Optional[Dict[str, str]] = None,
+                 library_decks: Optional[Dict[str, Sequence[str]]] = None,
+                 auto_opponent: bool = True):
+        """
+        Args:
+            host/port: Where to listen (port 0 picks a free port)
+            latency: Seconds added to every response
+            jitter: Extra random latency, uniform in [0, jitter]
+            accounts: username -> password; None accepts any login
+            library_decks: side -> deck names for /deck/libraryList and /deck/list
+            auto_opponent: Seat a scripted opponent at every new table
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.accounts = accounts
+        self.library_decks = library_decks or DEFAULT_LIBRARY_DECKS
+        self.auto_opponent = auto_opponent
+
+        self.tables: Dict[str, FakeTable] = {}
+        self.games: Dict[str, FakeGame] = {}
+        self.hall_channel = 0
+        self.requests: Counter = Counter()    # "METHOD /endpoint" -> count
+        self.statuses: Counter = Counter()    # HTTP status -> count
+
+        self._script: List[str] = [self._serialize(batch) for batch in synthetic_batches()]
+        self._decision_every = 0
+        self._failures: List[FailureRule] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    # =========================================================================
+    # Scripting
+    # =========================================================================
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{BASE_PATH}"
+
+    def script_game(self, batches: List[List[ET.Element]], decision_every: int = 0):
+        """Event batches every new game replays, with a decision every N batches (0 = none)."""
+        with self._lock:
+            self._script = [self._serialize(batch) for batch in batches]
+            self._decision_every = decision_every
+
+    def fail(self, path_prefix: str, status: int, times: int = 1, method: str = ''):
+        """Answer the next `times` requests under path_prefix (e.g. '/game/') with status."""
+        with self._lock:
+            self._failures.append(FailureRule(path_prefix, status, times, method.upper()))
+
+    def add_table(self, name: str, owner: str, side: str = 'dark') -> FakeTable:
+        """Open a waiting table hosted by someone else (for joiner bots)."""
+        with self._lock:
+            table = FakeTable(table_id=str(next(self._ids)), name=name, players=[(owner, side)])
+            self.tables[table.table_id] = table
+            self.hall_channel += 1
+            return table
+
+    def say(self, game_id: str, from_user: str, message: str):
+        """Post a chat message into a game as from_user."""
+        with self._lock:
+            game = self.games[game_id]
+            game.chat.append((len(game.chat) + 1, from_user, message))
+
+    def start(self) -> 'FakeGempServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='fake-gemp', daemon=True)
+        self._thread.start()
+        logger.info(f"🧪 Fake GEMP server listening on {self.url}")
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> 'FakeGempServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @staticmethod
+    def _serialize(batch: List[ET.Element]) -> str:
+        return ''.join(ET.tostring(event, encoding='unicode') for event in batch)
+
+    # =========================================================================
+    # Request handling (called on server threads)
+    # =========================================================================
+
+    def handle(self, method: str, path: str, params: Dict[str, str],
+               user: Optional[str]) -> Tuple[int, str, Dict[str, str]]:
+        """Route one request. Returns (status, body, extra headers)."""
+        endpoint = re.sub(r'/\d+', '/{id}', re.sub(r'/chat/Game\d+', '/chat/{game}', path))
+        with self._lock:
+            self.requests[f"{method} {endpoint}"] += 1
+            status = self._injected_failure(method, path)
+        if status is None:
+            delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+            if delay > 0:
+                time.sleep(delay)
+            with self._lock:
+                status, body, headers = self._route(method, path, params, user)
+        else:
+            body, headers = f"<error>Injected HTTP {status}</error>", {}
+        with self._lock:
+            self.statuses[status] += 1
+        return status, body, headers
+
+    def _injected_failure(self, method: str, path: str) -> Optional[int]:
+        for rule in self._failures:
+            if rule.times > 0 and path.startswith(rule.path_prefix) and rule.method in ('', method):
+                rule.times -= 1
+                return rule.status
+        return None
+
+    def _route(self, method: str, path: str, params: Dict[str, str],
+               user: Optional[str]) -> Tuple[int, str, Dict[str, str]]:
+        if path == '/login' and method == 'POST':
+            return self._login(params)
+        if not user:
+            return 401, '<error>Not logged in</error>', {}
+
+        parts = path.strip('/').split('/')
+        if parts[0] == 'hall':
+            if len(parts) == 1:
+                return (200, self._hall_xml(), {}) if method == 'GET' else self._create_table(user, params)
+            if parts[1] == 'update':
+                if int(params.get('channelNumber', '0') or 0) > self.hall_channel:
+                    return 409, '<error>Stale channel</error>', {}
+                return 200, self._hall_xml(), {}
+            return self._table_action(user, parts[1], params)
+        if parts[0] == 'deck' and len(parts) == 2 and parts[1] in ('libraryList', 'list'):
+            return 200, self._decks_xml(), {}
+        if parts[0] == 'game' and len(parts) >= 2:
+            game = self.games.get(parts[1])
+            if game is None:
+                return 404, '<error>Game not found</error>', {}
+            if len(parts) == 3 and parts[2] == 'concede':
+                self._finish(game)
+                return 200, '<ok/>', {}
+            if len(parts) == 3 and parts[2] == 'cardInfo':
+                return 200, f"<div>Fake card info {params.get('cardId', '')}</div>", {}
+            if method == 'GET':
+                return 200, self._join_game(game, user), {}
+            return 200, self._game_update(game, user, params), {}
+        if parts[0].startswith('chat') and len(parts) == 2 and parts[1].startswith('Game'):
+            game = self.games.get(parts[1][len('Game'):])
+            if game is None:
+                return 404, '<error>Chat room not found</error>', {}
+            return 200, self._chat(game, user, method, params), {}
+        return 404, f'<error>Unknown endpoint {path}</error>', {}
+
+    def _login(self, params: Dict[str, str]) -> Tuple[int, str, Dict[str, str]]:
+        username = params.get('login', '')
+        if not username or (self.accounts is not None and self.accounts.get(username) != params.get('password')):
+            return 401, '', {}
+        return 200, 'OK', {'Set-Cookie': f"loggedUser={username}; Path=/"}
+
+    def _hall_xml(self) -> str:
+        hall = ET.Element('hall', channelNumber=str(self.hall_channel))
+        for table in self.tables.values():
+            hall.append(table.to_xml())
+        return ET.tostring(hall, encoding='unicode')
+
+    def _decks_xml(self) -> str:
+        decks = ET.Element('decks')
+        for side in ('dark', 'light'):
+            for name in self.library_decks.get(side, ()):
+                ET.SubElement(decks, f"{side}Deck").text = name
+        return ET.tostring(decks, encoding='unicode')
+
+    def _create_table(self, user: str, params: Dict[str, str]) -> Tuple[int, str, Dict[str, str]]:
+        deck = params.get('deckName', '')
+        side = 'light' if deck in self.library_decks.get('light', ()) else 'dark'
+        table = FakeTable(table_id=str(next(self._ids)), name=params.get('tableDesc', 'Table'),
+                          players=[(user, side)], game_format=params.get('format', 'open').title())
+        self.tables[table.table_id] = table
+        self.hall_channel += 1
+        if self.auto_opponent:
+            table.players.append((f"opponent_{table.table_id}", 'light' if side == 'dark' else 'dark'))
+            self._start_game(table)
+        return 200, '<ok/>', {}
+
+    def _table_action(self, user: str, table_id: str, params: Dict[str, str]) -> Tuple[int, str, Dict[str, str]]:
+        table = self.tables.get(table_id)
+        if table is None:
+            return 404, '<error>Table not found</error>', {}
+        if params.get('action') == 'drop':
+            del self.tables[table_id]
+            self.hall_channel += 1
+            return 200, '<ok/>', {}
+        if len(table.players) >= 2:
+            return 200, '<error>Table is full</error>', {}
+        deck = params.get('deckName', '')
+        table.players.append((user, 'light' if deck in self.library_decks.get('light', ()) else 'dark'))
+        self._start_game(table)
+        return 200, '<ok/>', {}
+
+    def _start_game(self, table: FakeTable):
+        game = FakeGame(game_id=str(next(self._ids)), table=table, batches=list(self._script),
+                        decision_every=self._decision_every)
+        self.games[game.game_id] = game
+        table.game_id = game.game_id
+        table.status = 'PLAYING'
+        self.hall_channel += 1
+
+    def _finish(self, game: FakeGame):
+        if not game.finished:
+            game.finished = True
+            game.table.status = 'FINISHED'
+            self.hall_channel += 1
+
+    def _join_game(self, game: FakeGame, user: str) -> str:
+        stream = game.streams.setdefault(user, GameStream())
+        events = self._next_events(game, stream)
+        return f'<gameState cn="{stream.cn}">{events}</gameState>'
+
+    def _game_update(self, game: FakeGame, user: str, params: Dict[str, str]) -> str:
+        stream = game.streams.setdefault(user, GameStream())
+        decision_id = params.get('decisionId')
+        if decision_id is not None:
+            if decision_id != stream.pending_decision:
+                return f'<error>Unknown decision {decision_id}</error>'
+            stream.pending_decision = ''
+            stream.decisions_answered += 1
+        events = '' if stream.pending_decision else self._next_events(game, stream)
+        return f'<update cn="{stream.cn}">{events}</update>'
+
+    def _next_events(self, game: FakeGame, stream: GameStream) -> str:
+        """The next batch of the script (plus a decision, if one is due)."""
+        if stream.next_batch >= len(game.batches):
+            self._finish(game)
+            return ''
+        events = game.batches[stream.next_batch]
+        stream.next_batch += 1
+        stream.cn += 1
+        if game.decision_every and stream.next_batch % game.decision_every == 0:
+            stream.pending_decision = str(next(self._ids))
+            events += (f'<ge type="D" id="{stream.pending_decision}" decisionType="INTEGER" '
+                       f'text="Fake decision {stream.pending_decision}">'
+                       '<parameter name="min" value="0"/><parameter name="max" value="1"/>'
+                       '<parameter name="defaultValue" value="0"/>'
+                       '<parameter name="noLongDelay" value="true"/></ge>')
+        return events
+
+    def _chat(self, game: FakeGame, user: str, method: str, params: Dict[str, str]) -> str:
+        if method == 'POST' and 'message' in params:
+            game.chat.append((len(game.chat) + 1, user, params['message']))
+        chat = ET.Element('chat')
+        for name, _side in game.table.players:
+            ET.SubElement(chat, 'user').text = name
+        latest = int(params.get('latestMsgIdRcvd', '0') or 0)
+        for msg_id, from_user, text in game.chat:
+            if msg_id > latest:
+                ET.SubElement(chat, 'message', {'from': from_user, 'msgId': str(msg_id)}).text = text
+        return ET.tostring(chat, encoding='unicode')
+
+
+def _make_handler(server: FakeGempServer):
+    """Request handler class bound to one FakeGempServer."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Headers and body go out in separate writes; don't let Nagle hold the body
+        disable_nagle_algorithm = True
+
+        def _dispatch(self, method: str):
+            url = urlparse(self.path)
+            path = url.path[len(BASE_PATH):] if url.path.startswith(BASE_PATH) else url.path
+            params = {k: v[-1] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+            length = int(self.headers.get('Content-Length', 0) or 0)
+            if length:
+                body = self.rfile.read(length).decode('utf-8', errors='replace')
+                params.update({k: v[-1] for k, v in parse_qs(body, keep_blank_values=True).items()})
+            cookies = dict(part.strip().split('=', 1) for part in self.headers.get('Cookie', '').split(';')
+                           if '=' in part)
+
+            status, body, headers = server.handle(method, path, params, cookies.get('loggedUser'))
+            data = body.encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/xml; charset=UTF-8')
+            self.send_header('Content-Length', str(len(data)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            self._dispatch('GET')
+
+        def do_POST(self):
+            self._dispatch('POST')
+
+        def log_message(self, format, *args):
+            logger.debug(f"fake GEMP: {format % args}")
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a local fake GEMP server')
+    parser.add_argument('--host', type=str, default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8082)
+    parser.add_argument('--game', type=str, default=None,
+                        help='Game state log to replay in every game (default: a short synthetic game)')
+    parser.add_argument('--decision-every', type=int, default=5,
+                        help='Send a decision every N batches (0 = never, default: 5)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Random extra latency (seconds)')
+    parser.add_argument('--no-opponent', action='store_true',
+                        help='Do not seat a scripted opponent at new tables')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+
+    server = FakeGempServer(args.host, args.port, latency=args.latency, jitter=args.jitter,
+                            auto_opponent=not args.no_opponent)
+    batches = load_game_batches(args.game) if args.game else synthetic_batches()
+    server.script_game(batches, decision_every=args.decision_every)
+    server.start()
+    print(f"Fake GEMP server: {server.url} ({len(batches)} batches per game)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Drive many GEMP clients against the fake GEMP server and measure the
+transport: NetworkCoordinator pacing, reconnects and throughput.
+
+Each simulated bot runs the bot's network lifecycle through its own
+GEMPClient + NetworkCoordinator: login, deck lists, hall, create a table
+(the fake server seats an opponent), join the game, poll updates until the
+scripted game ends, answer every decision, poll chat, and re-login when a
+game update reports an expired session (HTTP 409).
+
+Usage:
+    python tools/load_test.py --clients 20
+    python tools/load_test.py --clients 50 --game logs/rando_gamestate.xml --latency 0.02
+    python tools/load_test.py --clients 10 --fail POST:/game/:409:5 --fail /chat/:410:3 --json
+    python tools/load_test.py --clients 4 --pacing real --delay-scale 0.01
+
+Metrics reported:
+- games completed, wall time, requests and requests/second
+- request latency p50/p95/p99 and max (milliseconds)
+- failed requests, reconnects and clients stopped by the rate-limit failsafe
+- server-side request counts per endpoint and per HTTP status
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.fake_gemp import FakeGempServer, load_game_batches, synthetic_batches
+
+
+@dataclass
+class ClientResult:
+    """What one simulated bot did."""
+    name: str
+    completed: bool = False
+    events: int = 0
+    decisions: int = 0
+    chat_polls: int = 0
+    failed_requests: int = 0
+    reconnects: int = 0
+    rate_limited: bool = False
+    error: str = ''
+    durations: List[float] = field(default_factory=list)
+
+
+def _pacing_config(pacing: str, delay_scale: float) -> Optional[SimpleNamespace]:
+    """NetworkCoordinator config: production delays scaled by delay_scale."""
+    if pacing != 'real':
+        return None
+    from engine.network_coordinator import NetworkCoordinator as NC
+    return SimpleNamespace(
+        NETWORK_DELAY_QUICK=NC.DEFAULT_DELAY_QUICK * delay_scale,
+        NETWORK_DELAY_NORMAL=NC.DEFAULT_DELAY_NORMAL * delay_scale,
+        NETWORK_DELAY_BACKGROUND=NC.DEFAULT_DELAY_BACKGROUND * delay_scale,
+        NETWORK_DELAY_MIN=NC.DEFAULT_DELAY_MIN * delay_scale,
+    )
+
+
+def run_client(url: str, name: str, pacing: str = 'fast', delay_scale: float = 0.01,
+               chat_every: int = 5, timeout: float = 60.0) -> ClientResult:
+    """Play one scripted game as `name`; never raises."""
+    from engine.client import GEMPClient
+    from engine.network_coordinator import NetworkCoordinator
+
+    result = ClientResult(name)
+    client = GEMPClient(url)
+    coordinator = NetworkCoordinator(client, config=_pacing_config(pacing, delay_scale))
+    coordinator.local_fast_mode = pacing == 'fast'
+    # Time runs delay_scale times faster, so the failsafe's budget per minute scales up
+    coordinator.MAX_REQUESTS_PER_MINUTE /= delay_scale
+    coordinator.request_history = deque()      # keep every sample, not just the last 100
+    deadline = time.monotonic() + timeout
+
+    try:
+        if not coordinator.login(name, 'password'):
+            raise RuntimeError("login failed")
+        decks = coordinator.get_library_decks()
+        coordinator.get_hall_initial()
+        coordinator.create_table(decks[0].name if decks else 'dark_baseline', f"Load {name}")
+
+        # Wait for the game to start at our table
+        game_id = None
+        hall_cn = 0
+        while game_id is None:
+            if time.monotonic() > deadline:
+                raise RuntimeError("no game started")
+            tables, hall_cn = coordinator.update_hall(hall_cn)
+            game_id = next((t.game_id for t in tables if t.game_id and
+                            any(p.name == name for p in t.players)), None)
+
+        root = ET.fromstring(coordinator.join_game(game_id) or '<gameState/>')
+        cn = int(root.get('cn', 0))
+        _, last_msg_id = coordinator.register_chat(game_id)
+        events = root.findall('.//ge')
+        result.events += len(events)
+        idle = 0
+        polls = 0
+
+        while not coordinator.rate_limit_exceeded:
+            if time.monotonic() > deadline:
+                raise RuntimeError("game did not finish")
+
+            # Answer the pending decision; its update carries the next events
+            decision = next((e for e in reversed(events) if e.get('type') == 'D'), None)
+            if decision is not None:
+                xml = coordinator.post_decision(game_id, cn, decision.get('id'), '0', no_long_delay=True)
+            else:
+                xml = coordinator.get_game_update(game_id, cn)
+            polls += 1
+
+            if xml == 'SESSION_EXPIRED':
+                result.reconnects += 1
+                coordinator.login(name, 'password')
+                continue
+            if xml is None:
+                continue        # retry the same poll / decision
+            if decision is not None:
+                result.decisions += 1
+
+            update = ET.fromstring(xml)
+            cn = int(update.get('cn', cn))
+            events = update.findall('.//ge')
+            result.events += len(events)
+            if chat_every and polls % chat_every == 0:
+                _, last_msg_id = coordinator.get_chat_messages(game_id, last_msg_id)
+                result.chat_polls += 1
+
+            # An empty update may mean the game is over; the hall says so
+            idle = 0 if events else idle + 1
+            if idle >= 2:
+                tables, hall_cn = coordinator.update_hall(hall_cn)
+                if any(t.game_id == game_id and t.status == 'finished' for t in tables):
+                    result.completed = True
+                    break
+
+        result.rate_limited = coordinator.rate_limit_exceeded
+    except Exception as e:
+        result.error = str(e)
+    finally:
+        result.durations = [r['duration'] for r in coordinator.request_history]
+        result.failed_requests = sum(1 for r in coordinator.request_history if not r['success'])
+        client.session.close()
+    return result
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run_load_test(server: FakeGempServer, clients: int, **client_options) -> Dict[str, Any]:
+    """Run `clients` simulated bots concurrently against server and summarize."""
+    results: List[ClientResult] = [None] * clients
+
+    def worker(i: int):
+        results[i] = run_client(server.url, f"load_bot_{i + 1}", **client_options)
+
+    threads = [threading.Thread(target=worker, args=(i,), name=f"load-{i + 1}") for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+
+    durations = [d * 1000 for r in results for d in r.durations]
+    return {
+        'clients': clients,
+        'completed': sum(r.completed for r in results),
+        'wall_s': wall,
+        'requests': len(durations),
+        'requests_per_s': len(durations) / wall if wall > 0 else 0.0,
+        'latency_ms': {
+            'mean': statistics.fmean(durations) if durations else 0.0,
+            'p50': _percentile(durations, 50),
+            'p95': _percentile(durations, 95),
+            'p99': _percentile(durations, 99),
+            'max': max(durations, default=0.0),
+        },
+        'events': sum(r.events for r in results),
+        'decisions': sum(r.decisions for r in results),
+        'failed_requests': sum(r.failed_requests for r in results),
+        'reconnects': sum(r.reconnects for r in results),
+        'rate_limited': sum(r.rate_limited for r in results),
+        'errors': {r.name: r.error for r in results if r.error},
+        'server_requests': dict(server.requests),
+        'server_statuses': {str(k): v for k, v in sorted(server.statuses.items())},
+    }
+
+
+def _parse_failure(spec: str):
+    """--fail [METHOD:]PATH:STATUS:TIMES"""
+    rest, status, times = spec.rsplit(':', 2)
+    method, _, path = rest.rpartition(':')
+    return path, int(status), int(times), method
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test the GEMP transport against a fake server')
+    parser.add_argument('--clients', type=int, default=10, help='Concurrent simulated bots (default: 10)')
+    parser.add_argument('--game', type=str, default=None,
+                        help='Game state log every game replays (default: a short synthetic game)')
+    parser.add_argument('--decision-every', type=int, default=3,
+                        help='Decision every N batches (default: 3)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Server latency per request (seconds)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Random extra server latency (seconds)')
+    parser.add_argument('--fail', action='append', default=[], metavar='[METHOD:]PATH:STATUS:TIMES',
+                        help='Inject failures, e.g. POST:/game/:409:5 (repeatable)')
+    parser.add_argument('--pacing', choices=['fast', 'real'], default='fast',
+                        help='fast = LOCAL_FAST_MODE (no delays); real = coordinator delays')
+    parser.add_argument('--delay-scale', type=float, default=0.01,
+                        help='Scale for the real pacing delays (default: 0.01)')
+    parser.add_argument('--timeout', type=float, default=120.0, help='Per-client timeout (seconds)')
+    parser.add_argument('--json', action='store_true',
+                        help='Output as JSON instead of human-readable')
+
+    args = parser.parse_args()
+
+    # Clients log every request at INFO; keep that out of the measurement
+    logging.disable(logging.CRITICAL)
+    server = FakeGempServer(latency=args.latency, jitter=args.jitter)
+    server.script_game(load_game_batches(args.game) if args.game else synthetic_batches(),
+                       decision_every=args.decision_every)
+    for spec in args.fail:
+        server.fail(*_parse_failure(spec))
+
+    with server:
+        results = run_load_test(server, args.clients, pacing=args.pacing,
+                                delay_scale=args.delay_scale, timeout=args.timeout)
+    logging.disable(logging.NOTSET)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    latency = results['latency_ms']
+    print("=" * 60)
+    print(f"LOAD TEST ({results['clients']} clients, pacing={args.pacing})")
+    print("=" * 60)
+    print(f"Games completed:  {results['completed']}/{results['clients']} in {results['wall_s']:.2f}s")
+    print(f"Requests:         {results['requests']} ({results['requests_per_s']:.1f}/s)")
+    print(f"Latency (ms):     mean={latency['mean']:.1f} p50={latency['p50']:.1f} "
+          f"p95={latency['p95']:.1f} p99={latency['p99']:.1f} max={latency['max']:.1f}")
+    print(f"Events/decisions: {results['events']}/{results['decisions']}")
+    print(f"Failed requests:  {results['failed_requests']}, reconnects: {results['reconnects']}, "
+          f"rate-limited clients: {results['rate_limited']}")
+    for name, error in results['errors'].items():
+        print(f"  {name}: {error}")
+    print("-" * 60)
+    for endpoint, count in sorted(results['server_requests'].items()):
+        print(f"{endpoint:<30} {count}")
+    print(f"HTTP statuses: {results['server_statuses']}")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
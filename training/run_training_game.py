@@ -64,6 +64,8 @@ def run_single_game(
     timeout: int = 600,
     pair_index: int = 0,
     stagger_delay: float = 0,
+    trajectory_dir: Optional[str] = None,
+    model_path: Optional[str] = None,
 ) -> Dict:
     """
     Run a single training game.
@@ -77,6 +79,10 @@ def run_single_game(
         timeout: Game timeout in seconds
         pair_index: Which bot pair to use (0-4)
         stagger_delay: Seconds to wait before starting (for parallel runs)
+        trajectory_dir: Where the neural bot saves its trajectory
+            (default: training_data/trajectories)
+        model_path: Weights the neural bot follows (default: the neural
+            config's model_path)
 
     Returns:
         Dict with game result info
@@ -108,6 +114,12 @@ def run_single_game(
     base_env['DARK_DECK'] = dark_deck
     base_env['LIGHT_DECK'] = light_deck
 
+    neural_env = {}
+    if trajectory_dir:
+        neural_env['NEURAL_TRAJECTORY_DIR'] = str(trajectory_dir)
+    if model_path:
+        neural_env['NEURAL_MODEL_PATH'] = str(model_path)
+
     # Creator environment (neural if neural_is_creator)
     creator_env = base_env.copy()
     creator_env['GEMP_USERNAME'] = creator_user
@@ -118,6 +130,7 @@ def run_single_game(
     if neural_is_creator:
         creator_env['NEURAL_TRAINING_MODE'] = '1'
         creator_env['NEURAL_DEVICE'] = 'cpu'
+        creator_env.update(neural_env)
 
     # Joiner environment - must use JOINER_MODE and JOINER_TARGET
     joiner_env = base_env.copy()
@@ -130,6 +143,7 @@ def run_single_game(
     if not neural_is_creator:
         joiner_env['NEURAL_TRAINING_MODE'] = '1'
         joiner_env['NEURAL_DEVICE'] = 'cpu'
+        joiner_env.update(neural_env)
 
     result = {
         'neural_user': neural_user,
@@ -35,7 +35,7 @@ import time
 from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -58,6 +58,7 @@ PROJECT_DIR = Path(__file__).parent.parent
 MODELS_DIR = PROJECT_DIR / "models"
 LOGS_DIR = PROJECT_DIR / "training_logs"
 CHECKPOINT_DIR = MODELS_DIR / "checkpoints"
+REGISTRY_DIR = MODELS_DIR / "registry"
 
 
 class TrainingStats:
@@ -253,10 +254,10 @@ def train_batch(
     trajectories: List,
     device: str = 'cuda',
     model_path: str = 'models/deploy_planner.pt',
-) -> Dict:
-    """Train on collected trajectories and return metrics."""
+) -> Tuple[Dict, Optional[Dict]]:
+    """Train on collected trajectories; returns (metrics, updated network weights)."""
     if not trajectories:
-        return {}
+        return {}, None
 
     import torch
     from engine.neural_planner.network import DeployPolicyNetwork
@@ -280,7 +281,7 @@ def train_batch(
     # Create batch from trajectories
     batch = ExperienceBatch.from_trajectories(trajectories)
     if len(batch) == 0:
-        return {}
+        return {}, None
 
     batch.normalize_advantages()
 
@@ -297,20 +298,22 @@ def train_batch(
     # Save updated model
     trainer.save_model_only(model_path)
 
-    return metrics
+    return metrics, trainer.network.state_dict()
 
 
-def save_checkpoint(stats: TrainingStats, batch_num: int, model_path: str):
-    """Save a training checkpoint."""
+def save_checkpoint(stats: TrainingStats, batch_num: int, registry=None,
+                    weights: Optional[Dict] = None):
+    """
+    Save a training checkpoint.
+
+    The stats go to CHECKPOINT_DIR/stats_<timestamp>_batch<N>.json as
+    before; the weights trained since the last checkpoint (if any) go into
+    the compact checkpoint registry under the matching checkpoint name.
+    """
     CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
 
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    checkpoint_path = CHECKPOINT_DIR / f"checkpoint_{timestamp}_batch{batch_num}.pt"
-
-    # Copy current model to checkpoint
-    import shutil
-    if os.path.exists(model_path):
-        shutil.copy(model_path, checkpoint_path)
+    name = f"checkpoint_{timestamp}_batch{batch_num}"
 
     # Save stats
     stats_path = CHECKPOINT_DIR / f"stats_{timestamp}_batch{batch_num}.json"
@@ -326,7 +329,27 @@ def save_checkpoint(stats: TrainingStats, batch_num: int, model_path: str):
             'entropy_history': stats.entropy_history[-20:],
         }, f, indent=2)
 
-    logger.info(f"Saved checkpoint: {checkpoint_path.name}")
+    if registry is None or weights is None:
+        logger.info(f"Saved checkpoint stats: {stats_path.name} (no new weights)")
+        return
+
+    registry.save(
+        name,
+        weights,
+        metrics={
+            'win_rate': stats.win_rate,
+            'recent_win_rate': stats.recent_win_rate,
+            'total_games': stats.total_games,
+            'total_wins': stats.total_wins,
+            'total_experiences': stats.total_experiences,
+            'policy_loss': stats.avg_policy_loss,
+            'value_loss': stats.avg_value_loss,
+            'entropy': stats.avg_entropy,
+        },
+        step=batch_num,
+    )
+
+    logger.info(f"Saved checkpoint: {name} ({stats_path.name})")
 
 
 def main():
@@ -380,6 +403,12 @@ def main():
     print(f"Model: {args.model_path}")
     print()
 
+    # One registry for the whole run; checkpoints store the weights trained
+    # since the previous checkpoint, straight from memory
+    from engine.neural_planner.checkpoint_registry import CheckpointRegistry
+    registry = CheckpointRegistry(str(REGISTRY_DIR))
+    weights = None
+
     try:
         game_num = 0
         for batch_num in range(1, total_batches + 1):
@@ -462,11 +491,12 @@ def main():
                 total_exp = sum(len(t.experiences) for t in trajectories)
                 stats.total_experiences += total_exp  # Update experience count from trajectories
                 print(f"\n  Training on {len(trajectories)} trajectories ({total_exp} experiences)...")
-                metrics = train_batch(
+                metrics, trained = train_batch(
                     trajectories,
                     device=args.device,
                     model_path=args.model_path,
                 )
+                weights = trained or weights
                 stats.record_training(metrics)
 
                 if metrics:
@@ -479,11 +509,12 @@ def main():
 
             # Checkpoint
             if batch_num % args.checkpoint_interval == 0:
-                save_checkpoint(stats, batch_num, args.model_path)
+                save_checkpoint(stats, batch_num, registry, weights)
+                weights = None
 
     except KeyboardInterrupt:
         print("\n\nTraining interrupted by user.")
-        save_checkpoint(stats, batch_num, args.model_path)
+        save_checkpoint(stats, batch_num, registry, weights)
 
     # Final summary
     print("\n" + "=" * 70)
@@ -3,12 +3,18 @@
 Training Script: Neural Deploy Planner vs Rules Bot
 
 Trains the neural deploy planner by playing games against the
-rules-based bot. Uses the existing batch runner infrastructure
-for parallel game execution.
+rules-based bot. Games are real bot games: run_training_game starts a
+neural bot (NEURAL_TRAINING_MODE) and a rules bot against the GEMP server,
+and the neural bot saves its trajectory when the game ends.
 
 Usage:
     python training/train_vs_rules.py --games-per-batch 20 --iterations 100
 
+    # Asynchronous actor-learner mode: one collector per bot pair keeps
+    # playing while the learner trains, and the bots pick up new weights
+    # between games without restarting
+    python training/train_vs_rules.py --async-collectors 4 --iterations 200
+
 Requirements:
     - GEMP server running locally
     - Bot credentials configured
@@ -19,16 +25,15 @@ import argparse
 import json
 import logging
 import os
-import random
+import queue
 import subprocess
 import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-import numpy as np
-
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -36,8 +41,12 @@ import torch
 
 from engine.neural_planner.network import DeployPolicyNetwork, count_parameters
 from engine.neural_planner.trainer import PPOTrainer, PPOConfig
-from engine.neural_planner.experience import ExperienceBatch, GameTrajectory, Experience
+from engine.neural_planner.experience import ExperienceBatch, GameTrajectory
 from engine.neural_planner.state_encoder import StateEncoder
+from engine.neural_planner.policy_broadcast import PolicyPublisher
+from engine.neural_planner.checkpoint_registry import CheckpointRegistry
+from engine.neural_planner.trajectory_io import load_trajectories_from_dir
+from training.run_training_game import BOT_PAIRS, run_single_game
 
 logging.basicConfig(
     level=logging.INFO,
@@ -45,12 +54,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Seconds the learner waits for a trajectory before checking its collectors
+# (a game takes minutes)
+COLLECTOR_POLL_SECONDS = 60.0
+# Consecutive failed games after which a collector stops
+COLLECTOR_MAX_FAILURES = 3
+
 
 class TrainingArena:
     """
     Manages game collection and neural network training.
 
-    Uses subprocess to run bot games (same as batch_runner.py),
+    Uses subprocess to run bot games (run_training_game.run_single_game),
     then trains the network on collected trajectories.
     """
 
@@ -60,6 +75,9 @@ class TrainingArena:
         results_dir: str = 'training_results',
         games_per_batch: int = 20,
         device: str = 'cuda',
+        neural_config: str = 'neural.json',
+        rules_config: str = 'production.json',
+        game_timeout: int = 600,
     ):
         """
         Initialize training arena.
@@ -69,10 +87,16 @@ class TrainingArena:
             results_dir: Directory to save training results
             games_per_batch: Games to play per training iteration
             device: 'cuda' or 'cpu'
+            neural_config: Strategy config of the neural bot (in configs/)
+            rules_config: Strategy config of the rules bot (in configs/)
+            game_timeout: Seconds before a game is abandoned
         """
         self.model_dir = Path(model_dir)
         self.results_dir = Path(results_dir)
         self.games_per_batch = games_per_batch
+        self.neural_config = neural_config
+        self.rules_config = rules_config
+        self.game_timeout = game_timeout
 
         # Create directories
         self.model_dir.mkdir(exist_ok=True)
@@ -84,14 +108,26 @@ class TrainingArena:
             device = 'cpu'
         self.device = device
 
+        # Compact checkpoint storage (fp16, retention, metrics index)
+        self.registry = CheckpointRegistry(str(self.model_dir / 'registry'))
+
         # Create network and trainer
         self.network = DeployPolicyNetwork()
         self.config = PPOConfig(device=device)
         self.trainer = PPOTrainer(self.network, self.config)
 
+        # Weights the neural bots play with; they pick up each published
+        # version between games
+        self.latest_path = (self.model_dir / 'deploy_planner.pt').resolve()
+        self.publisher = PolicyPublisher(str(self.latest_path))
+        self.trajectory_root = self.results_dir / 'trajectories'
+
         logger.info(f"Created network with {count_parameters(self.network):,} parameters")
         logger.info(f"Training on device: {device}")
 
+        # Checkpoints are named per run, so runs sharing model_dir don't collide
+        self.run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+
         # Training statistics
         self.iteration = 0
         self.total_games = 0
@@ -99,6 +135,11 @@ class TrainingArena:
         self.losses = 0
         self.win_rate_history: List[float] = []
 
+        # Throughput statistics (filled in by run_async_training)
+        self.games_per_hour = 0.0
+        self.learner_steps_per_hour = 0.0
+        self.stale_dropped = 0
+
         # State encoder for collecting experiences
         self.state_encoder = StateEncoder()
 
@@ -179,90 +220,283 @@ class TrainingArena:
         logger.info(f"\nTraining complete in {total_time/3600:.1f} hours")
         logger.info(f"Final win rate: {overall_win_rate:.1%}")
 
-    def _collect_games(self) -> Tuple[List[GameTrajectory], List[str]]:
+    def run_async_training(
+        self,
+        num_learner_steps: int = 100,
+        num_collectors: int = 4,
+        min_games_per_step: Optional[int] = None,
+        target_win_rate: float = 0.6,
+        save_every: int = 10,
+    ) -> None:
         """
-        Collect games by running neural bot vs rules bot.
+        Run asynchronous actor-learner training.
+
+        Each collector owns one bot pair (run_training_game.BOT_PAIRS) and
+        plays games on it back to back. The neural bot follows the weights
+        the learner publishes, picks up a new version between games and
+        tags its trajectory with the version that played it. The learner
+        consumes trajectories as they arrive, drops any more than
+        PPOConfig.max_policy_lag versions old, trains with off-policy
+        correction and publishes the new weights, while the games go on.
+
+        The games run in the bot processes. A collector thread only starts
+        them, waits for them and reads the saved trajectory, so threads
+        are enough here. A collector that keeps failing logs its errors
+        and stops; the learner stops with an error once no collector is
+        left.
+
+        Args:
+            num_learner_steps: Number of learner updates to run
+            num_collectors: Number of concurrent games (at most one per bot pair)
+            min_games_per_step: Games to gather before each update
+                (defaults to games_per_batch)
+            target_win_rate: Stop when this win rate is achieved
+            save_every: Save checkpoint every N learner steps
+        """
+        min_games = min_games_per_step or self.games_per_batch
+        if num_collectors > len(BOT_PAIRS):
+            logger.warning(f"Only {len(BOT_PAIRS)} bot pairs, using {len(BOT_PAIRS)} collectors")
+            num_collectors = len(BOT_PAIRS)
+
+        logger.info(f"Starting async training: {num_collectors} collectors, "
+                    f"{num_learner_steps} learner steps, {min_games} games/step")
+
+        publisher = self.publisher
+        publisher.publish(self.network.state_dict())
+
+        trajectory_queue: 'queue.Queue[GameTrajectory]' = queue.Queue(
+            maxsize=min_games * num_collectors * 4
+        )
+        stop_event = threading.Event()
+
+        collectors = [
+            threading.Thread(
+                target=self._collector_loop,
+                args=(i, trajectory_queue, stop_event),
+                name=f"collector-{i}",
+                daemon=True,
+            )
+            for i in range(num_collectors)
+        ]
+        for thread in collectors:
+            thread.start()
+
+        start_time = time.time()
+        overall_win_rate = 0.0
+
+        try:
+            for step in range(num_learner_steps):
+                self.iteration = step + 1
+
+                trajectories = [self._next_trajectory(trajectory_queue, collectors)]
+                while len(trajectories) < min_games:
+                    trajectories.append(self._next_trajectory(trajectory_queue, collectors))
+                # Also take anything else that is already waiting
+                while True:
+                    try:
+                        trajectories.append(trajectory_queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                wins = sum(1 for t in trajectories if t.won)
+                self.wins += wins
+                self.losses += len(trajectories) - wins
+                self.total_games += len(trajectories)
+                self.win_rate_history.append(wins / len(trajectories))
+                overall_win_rate = self.wins / self.total_games
+
+                fresh = [
+                    t for t in trajectories
+                    if publisher.version - t.policy_version <= self.config.max_policy_lag
+                ]
+                self.stale_dropped += len(trajectories) - len(fresh)
+
+                metrics = {}
+                if fresh:
+                    batch = ExperienceBatch.from_trajectories(fresh)
+                    if len(batch) > 0:
+                        batch.normalize_advantages()
+                        metrics = self.trainer.update(
+                            states=batch.states,
+                            actions=batch.actions,
+                            action_masks=batch.action_masks,
+                            old_log_probs=batch.log_probs,
+                            returns=batch.returns,
+                            advantages=batch.advantages,
+                            off_policy_correction=True,
+                        )
+
+                version = publisher.publish(self.network.state_dict(), metrics=metrics)
+
+                elapsed_hours = (time.time() - start_time) / 3600
+                self.games_per_hour = self.total_games / elapsed_hours
+                self.learner_steps_per_hour = self.iteration / elapsed_hours
+
+                mean_lag = (
+                    sum(publisher.version - 1 - t.policy_version for t in trajectories)
+                    / len(trajectories)
+                )
+                logger.info(
+                    f"Step {self.iteration}/{num_learner_steps} (policy v{version}): "
+                    f"{len(fresh)}/{len(trajectories)} games used, mean lag {mean_lag:.1f}, "
+                    f"win rate {overall_win_rate:.1%}"
+                )
+                if metrics:
+                    logger.info(f"Training: policy_loss={metrics['policy_loss']:.4f}, "
+                                f"value_loss={metrics['value_loss']:.4f}, "
+                                f"is_weight={metrics['mean_importance_weight']:.3f}")
+                logger.info(f"Throughput: {self.games_per_hour:.0f} games/h, "
+                            f"{self.learner_steps_per_hour:.0f} learner steps/h")
+
+                if self.iteration % save_every == 0:
+                    self._save_checkpoint()
+
+                if overall_win_rate >= target_win_rate and self.total_games >= 50:
+                    logger.info(f"Target win rate {target_win_rate:.0%} achieved!")
+                    break
+        finally:
+            stop_event.set()
+            # Unblock collectors waiting on a full queue
+            while True:
+                try:
+                    trajectory_queue.get_nowait()
+                except queue.Empty:
+                    break
+            for thread in collectors:
+                thread.join(timeout=5)
+
+        self._save_checkpoint()
+        self._save_training_summary()
+
+        total_time = time.time() - start_time
+        logger.info(f"\nAsync training complete in {total_time/3600:.1f} hours")
+        logger.info(f"Final win rate: {overall_win_rate:.1%} "
+                    f"({self.stale_dropped} stale games dropped)")
 
-        For now, this generates synthetic trajectories since we don't
-        have full integration with the game loop yet.
+    def _collector_loop(
+        self,
+        pair_index: int,
+        trajectory_queue: 'queue.Queue[GameTrajectory]',
+        stop_event: threading.Event,
+    ) -> None:
+        """Play games on one bot pair until stopped."""
+        name = threading.current_thread().name
+        failures = 0
+        games = 0
+        while not stop_event.is_set():
+            try:
+                # Alternate sides for balance
+                traj = self._play_game(pair_index, neural_is_creator=(games % 2 == 0))
+                games += 1
+            except Exception as e:
+                failures += 1
+                logger.exception(f"{name}: game failed ({failures}/{COLLECTOR_MAX_FAILURES}): {e}")
+                if failures >= COLLECTOR_MAX_FAILURES:
+                    logger.error(f"{name}: stopping after {failures} consecutive failures")
+                    return
+                continue
+            failures = 0
+
+            while not stop_event.is_set():
+                try:
+                    trajectory_queue.put(traj, timeout=1.0)
+                    break
+                except queue.Full:
+                    continue
+
+    def _next_trajectory(
+        self,
+        trajectory_queue: 'queue.Queue[GameTrajectory]',
+        collectors: List[threading.Thread],
+    ) -> GameTrajectory:
+        """Wait for the next trajectory; raise if every collector has stopped."""
+        while True:
+            try:
+                return trajectory_queue.get(timeout=COLLECTOR_POLL_SECONDS)
+            except queue.Empty:
+                alive = sum(1 for thread in collectors if thread.is_alive())
+                if not alive:
+                    raise RuntimeError("All collectors have stopped (see collector errors above)")
+                logger.warning(f"No trajectory in {COLLECTOR_POLL_SECONDS:.0f}s "
+                               f"({alive}/{len(collectors)} collectors alive)")
 
-        In production, this would:
-        1. Start bot processes with neural planner enabled
-        2. Collect (state, action, reward) tuples during play
-        3. Return trajectories when games complete
+    def _collect_games(self) -> Tuple[List[GameTrajectory], List[str]]:
+        """
+        Collect games by running neural bot vs rules bot, one at a time.
 
         Returns:
             (trajectories, results) tuple
         """
-        # TODO: Hook into actual game infrastructure
-        # For now, generate synthetic data for testing the training loop
+        self.publisher.publish(self.network.state_dict())
 
         trajectories = []
         results = []
 
         for game_idx in range(self.games_per_batch):
-            traj = GameTrajectory()
-
-            # Simulate 10-20 deploy decisions per game
-            num_decisions = random.randint(10, 20)
-
-            for step in range(num_decisions):
-                # Generate random state
-                state = np.random.randn(512).astype(np.float32) * 0.1
-
-                # Generate action mask (hold back + some random locations)
-                mask = np.zeros(21, dtype=bool)
-                mask[0] = True  # HOLD_BACK always valid
-                for j in range(1, min(6, 17)):  # 5 random locations
-                    if random.random() > 0.3:
-                        mask[j] = True
-
-                # Get action from network
-                with torch.no_grad():
-                    state_t = torch.FloatTensor(state).unsqueeze(0).to(self.device)
-                    mask_t = torch.BoolTensor(mask).unsqueeze(0).to(self.device)
-
-                    action, log_prob, value = self.network.get_action(
-                        state_t, mask_t, deterministic=False
-                    )
-
-                    action = action.item()
-                    log_prob = log_prob.item()
-                    value = value.item()
+            try:
+                traj = self._play_game(0, neural_is_creator=(game_idx % 2 == 0))
+            except RuntimeError as e:
+                logger.warning(f"Game {game_idx + 1} failed: {e}")
+                continue
+            trajectories.append(traj)
+            results.append('win' if traj.won else 'loss')
 
-                # Small shaped reward
-                reward = random.uniform(-0.1, 0.1)
+        return trajectories, results
 
-                traj.add_experience(Experience(
-                    state=state,
-                    action=action,
-                    action_mask=mask,
-                    reward=reward,
-                    done=False,
-                    value=value,
-                    log_prob=log_prob,
-                ))
+    def _play_game(self, pair_index: int, neural_is_creator: bool = True) -> GameTrajectory:
+        """
+        Play one neural vs rules game on a bot pair and return its trajectory.
 
-            # Game outcome (slightly favor the network as training progresses)
-            win_prob = 0.3 + min(0.3, self.total_games / 500)
-            won = random.random() < win_prob
+        Args:
+            pair_index: Bot pair to play on (index into BOT_PAIRS)
+            neural_is_creator: Neural bot creates the table (plays Dark)
 
-            traj.finalize(won=won)
-            trajectories.append(traj)
-            results.append('win' if won else 'loss')
+        Returns:
+            The neural bot's finalized GameTrajectory
 
-        return trajectories, results
+        Raises:
+            RuntimeError: If the game saved no trajectory
+        """
+        trajectory_dir = self.trajectory_root / f'pair{pair_index}'
+        trajectory_dir.mkdir(parents=True, exist_ok=True)
+        # Leftovers from a game that was cut off
+        for stale in trajectory_dir.glob('traj_*.json'):
+            stale.unlink()
+
+        result = run_single_game(
+            neural_config=self.neural_config,
+            rules_config=self.rules_config,
+            neural_is_creator=neural_is_creator,
+            timeout=self.game_timeout,
+            pair_index=pair_index,
+            trajectory_dir=str(trajectory_dir),
+            model_path=str(self.latest_path),
+        )
+
+        trajectories = load_trajectories_from_dir(trajectory_dir)
+        for path in trajectory_dir.glob('traj_*.json'):
+            path.unlink()
+        if not trajectories:
+            raise RuntimeError(f"Game on bot pair {pair_index} saved no trajectory "
+                               f"(completed={result['completed']}, error={result['error']})")
+        return trajectories[-1]
 
     def _save_checkpoint(self) -> None:
         """Save training checkpoint."""
-        checkpoint_path = self.model_dir / f'checkpoint_iter{self.iteration}.pt'
-        self.trainer.save(str(checkpoint_path))
+        name = f'checkpoint_{self.run_id}_iter{self.iteration}'
+        if self.registry.get(name) is None:
+            self.trainer.save_to_registry(self.registry, name, metrics={
+                'win_rate': self.wins / self.total_games if self.total_games > 0 else 0.0,
+                'recent_win_rate': self.win_rate_history[-1] if self.win_rate_history else 0.0,
+                'total_games': self.total_games,
+            })
+            logger.info(f"Saved checkpoint {name} to {self.registry.root}")
+        else:
+            # The final save right after a periodic save of the same iteration
+            logger.info(f"Checkpoint {name} already saved")
 
         # Also save as 'latest'
-        latest_path = self.model_dir / 'deploy_planner.pt'
-        self.trainer.save_model_only(str(latest_path))
-
-        logger.info(f"Saved checkpoint to {checkpoint_path}")
+        self.trainer.save_model_only(str(self.latest_path))
 
     def _save_training_summary(self) -> None:
         """Save training summary to JSON."""
@@ -273,6 +507,10 @@ class TrainingArena:
             'losses': self.losses,
             'final_win_rate': self.wins / self.total_games if self.total_games > 0 else 0,
             'win_rate_history': self.win_rate_history,
+            'games_per_hour': self.games_per_hour,
+            'learner_steps_per_hour': self.learner_steps_per_hour,
+            'stale_games_dropped': self.stale_dropped,
+            'run_id': self.run_id,
             'timestamp': datetime.now().isoformat(),
         }
 
@@ -299,6 +537,14 @@ def main():
                        help='Directory to save models')
     parser.add_argument('--results-dir', type=str, default='training_results',
                        help='Directory to save results')
+    parser.add_argument('--async-collectors', type=int, default=0,
+                       help='Run asynchronous actor-learner training with N collectors')
+    parser.add_argument('--neural-config', type=str, default='neural.json',
+                       help='Config file for neural bot')
+    parser.add_argument('--rules-config', type=str, default='production.json',
+                       help='Config file for rules bot')
+    parser.add_argument('--timeout', type=int, default=600,
+                       help='Game timeout in seconds')
 
     args = parser.parse_args()
 
@@ -308,14 +554,25 @@ def main():
         results_dir=args.results_dir,
         games_per_batch=args.games_per_batch,
         device=args.device,
+        neural_config=args.neural_config,
+        rules_config=args.rules_config,
+        game_timeout=args.timeout,
     )
 
     # Run training
-    arena.run_training(
-        num_iterations=args.iterations,
-        target_win_rate=args.target_win_rate,
-        save_every=args.save_every,
-    )
+    if args.async_collectors > 0:
+        arena.run_async_training(
+            num_learner_steps=args.iterations,
+            num_collectors=args.async_collectors,
+            target_win_rate=args.target_win_rate,
+            save_every=args.save_every,
+        )
+    else:
+        arena.run_training(
+            num_iterations=args.iterations,
+            target_win_rate=args.target_win_rate,
+            save_every=args.save_every,
+        )
 
 
 if __name__ == '__main__':